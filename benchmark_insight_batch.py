@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark InsightGenerator.batch_generate throughput versus concurrency.
+
+Runs a batch of distinct insight prompts against a local fake LLM provider
+that answers after a fixed latency (plus jitter), so the numbers show the
+effect of concurrency alone, without network or rate limits.
+
+    python benchmark_insight_batch.py --items 64 --latency-ms 200 --concurrency 1 2 4 8 16 32
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from src.analytics.intelligence.insight_generator import InsightGenerator
+from src.infrastructure.llm.llm_client_v2 import LLMClientV2, LLMProvider, RequestSpec, ResponseEnvelope
+
+
+class FakeLatencyProvider(LLMProvider):
+    """Answers every request with a small JSON insight after latency_ms (± jitter)."""
+
+    def __init__(self, latency_ms: float, jitter: float = 0.2, seed: int = 7):
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def arun(self, spec: RequestSpec) -> ResponseEnvelope:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        latency = self.latency_ms * self.rng.uniform(1 - self.jitter, 1 + self.jitter)
+        try:
+            await asyncio.sleep(latency / 1000)
+        finally:
+            self.in_flight -= 1
+        return ResponseEnvelope(
+            text=json.dumps({'summary': 'volume is stable', 'confidence': 0.8}),
+            parsed=None,
+            messages=list(spec.messages),
+            usage=None,
+            response_id=None,
+            latency_ms=latency,
+            raw=None
+        )
+
+
+def batch(items: int):
+    audiences = ['leadership', 'operations', 'marketing']
+    return [
+        {
+            'prompt_name': 'forecast_summary',
+            'context': {'forecast': {'forecast_type': 'call_volume_daily', 'segment': i},
+                        'audience': audiences[i % len(audiences)], 'date': '2026-01-01'}
+        }
+        for i in range(items)
+    ]
+
+
+async def run(items: int, latency_ms: float, levels):
+    prompts = batch(items)
+    rows = []
+    for concurrency in levels:
+        provider = FakeLatencyProvider(latency_ms)
+        generator = InsightGenerator(LLMClientV2(provider=provider))
+        started = time.perf_counter()
+        results = await generator.batch_generate(prompts, parallel=True, max_concurrency=concurrency,
+                                                 item_timeout_seconds=60)
+        elapsed = time.perf_counter() - started
+        rows.append({
+            'concurrency': concurrency,
+            'seconds': round(elapsed, 2),
+            'items_per_s': round(items / elapsed, 1),
+            'max_in_flight': provider.max_in_flight,
+            'failed': sum(1 for r in results if not r['success'])
+        })
+
+    print(f"{items} items, fake LLM latency {latency_ms:.0f} ms\n")
+    print(f"{'concurrency':>12}{'seconds':>10}{'items/s':>10}{'in flight':>11}{'failed':>8}")
+    for r in rows:
+        print(f"{r['concurrency']:>12}{r['seconds']:>10}{r['items_per_s']:>10}{r['max_in_flight']:>11}{r['failed']:>8}")
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--items', type=int, default=64)
+    parser.add_argument('--latency-ms', type=float, default=200)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    asyncio.run(run(args.items, args.latency_ms, args.concurrency))
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark InsightsPatternStore.get_matching_patterns at scale.
+
+Loads N synthetic learned patterns (default 1M) into a scratch database and
+times the previous LIKE full scan against the FTS5 and posting-list indexes.
+
+    python benchmark_pattern_index.py --patterns 1000000 --queries 50
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+
+from src.storage.insights_pattern_store import InsightsPatternStore
+
+METRICS = ['churn', 'delinquency', 'escalation', 'compliance', 'empathy', 'sentiment', 'hardship',
+           'refinance', 'forbearance', 'resolution', 'handle', 'transfer', 'complaint', 'retention']
+DIMENSIONS = ['advisor', 'segment', 'queue', 'region', 'product', 'channel', 'tenure', 'cohort']
+PERIODS = ['today', 'week', 'month', 'quarter', 'year', 'trend', 'forecast', 'variance']
+ROLES = ['VP', 'CCO', 'COO', 'Director', 'Manager']
+
+SCHEMA = '''
+    CREATE TABLE insight_patterns (
+        pattern_id TEXT PRIMARY KEY,
+        pattern_type TEXT NOT NULL,
+        query_pattern TEXT NOT NULL,
+        successful_approach TEXT NOT NULL,
+        effectiveness_score REAL,
+        usage_count INTEGER DEFAULT 0,
+        executive_roles TEXT,
+        focus_areas TEXT,
+        created_at TIMESTAMP,
+        last_used TIMESTAMP,
+        updated_at TIMESTAMP
+    )
+'''
+
+# get_matching_patterns before the index
+LIKE_SCAN = '''
+    SELECT * FROM insight_patterns
+    WHERE (query_pattern LIKE ? OR ? LIKE query_pattern OR query_pattern = 'GENERAL')
+    AND (executive_roles LIKE ? OR executive_roles = "[]")
+    ORDER BY effectiveness_score DESC, usage_count DESC
+    LIMIT ?
+'''
+
+
+def pattern_text(rng: random.Random) -> str:
+    # Common business terms plus a long tail of entity names (campaigns, products)
+    return (f"{rng.choice(METRICS)} {rng.choice(METRICS)} by {rng.choice(DIMENSIONS)} "
+            f"{rng.choice(PERIODS)} campaign{rng.randrange(20000)}")
+
+
+def load_patterns(db_path: str, count: int, seed: int) -> float:
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    conn = sqlite3.connect(db_path)
+    conn.execute(SCHEMA)
+    now = '2026-01-01 00:00:00'
+    batch = []
+    for _ in range(count):
+        batch.append((
+            str(uuid.UUID(int=rng.getrandbits(128))), 'data_strategy', pattern_text(rng),
+            json.dumps({'tools': ['analysis']}), round(rng.uniform(40, 100), 2), rng.randrange(50),
+            json.dumps(rng.sample(ROLES, rng.randrange(3))), '[]', now, now, now
+        ))
+        if len(batch) == 50000:
+            conn.executemany('INSERT INTO insight_patterns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', batch)
+            batch.clear()
+    conn.executemany('INSERT INTO insight_patterns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', batch)
+    conn.commit()
+    conn.close()
+    return time.perf_counter() - started
+
+
+def timed(fn, queries):
+    durations, hits = [], 0
+    for query, role in queries:
+        started = time.perf_counter()
+        hits += len(fn(query, role))
+        durations.append((time.perf_counter() - started) * 1000)
+    durations.sort()
+    return {
+        'p50_ms': round(statistics.median(durations), 2),
+        'p95_ms': round(durations[int(len(durations) * 0.95) - 1], 2),
+        'avg_results': round(hits / len(queries), 2)
+    }
+
+
+def run(patterns: int, query_count: int, seed: int, db_path: str):
+    print(f"Loading {patterns:,} patterns into {db_path} ...")
+    print(f"  loaded in {load_patterns(db_path, patterns, seed):.1f}s")
+
+    rng = random.Random(seed + 1)
+    queries = [(f"show me {rng.choice(METRICS)} by {rng.choice(DIMENSIONS)} this {rng.choice(PERIODS)}",
+                rng.choice(ROLES)) for _ in range(query_count)]
+
+    def like_scan(query, role):
+        conn = sqlite3.connect(db_path)
+        try:
+            return conn.execute(LIKE_SCAN, (f'%{query.lower()}%', query.lower(), f'%"{role}"%', 5)).fetchall()
+        finally:
+            conn.close()
+
+    results = {'like_scan': timed(like_scan, queries)}
+    for backend in ('fts5', 'python'):
+        started = time.perf_counter()
+        store = InsightsPatternStore(db_path, index_backend=backend)
+        store.get_matching_patterns('warmup')  # python backend builds its posting lists on first use
+        build_s = time.perf_counter() - started
+        results[backend] = {
+            'index_build_s': round(build_s, 1),
+            **timed(lambda query, role: store.get_matching_patterns(query, executive_role=role), queries)
+        }
+
+    print(f"\n{'backend':<12}{'build s':>10}{'p50 ms':>10}{'p95 ms':>10}{'results':>10}")
+    for name, r in results.items():
+        print(f"{name:<12}{r.get('index_build_s', '-'):>10}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['avg_results']:>10}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--patterns', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        run(args.patterns, args.queries, args.seed, os.path.join(tmp, 'patterns.db'))
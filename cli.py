@@ -300,18 +300,75 @@ class CLIRestClient:
         return self._make_request('GET', '/api/v1/metrics')
 
     # Orchestration operations
-    def orchestrate_run(self, transcript_ids: List[str], auto_approve: bool = False) -> Dict[str, Any]:
+    def orchestrate_run(self, transcript_ids: List[str], auto_approve: bool = False,
+                        max_concurrent: Optional[int] = None,
+                        stage_limits: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """Start orchestration pipeline via POST /api/v1/orchestrate/run."""
         json_data = {
             'transcript_ids': transcript_ids,
             'auto_approve': auto_approve
         }
+        if max_concurrent is not None:
+            json_data['max_concurrent'] = max_concurrent
+        if stage_limits:
+            json_data['stage_limits'] = stage_limits
         return self._make_request('POST', '/api/v1/orchestrate/run', json_data=json_data, timeout=10)
 
+    def cancel_orchestration_run(self, run_id: str) -> Dict[str, Any]:
+        """Cancel orchestration run via POST /api/v1/orchestrate/cancel/{run_id}."""
+        return self._make_request('POST', f'/api/v1/orchestrate/cancel/{run_id}')
+
     def get_orchestration_status(self, run_id: str) -> Dict[str, Any]:
         """Get orchestration run status via GET /api/v1/orchestrate/status/{run_id}."""
         return self._make_request('GET', f'/api/v1/orchestrate/status/{run_id}')
 
+    def stream_orchestration_events(self, run_id: str, last_event_id: Optional[int] = None):
+        """Yield orchestration events from GET /api/v1/orchestrate/events/{run_id} (Server-Sent Events).
+
+        Dropped connections are resumed with Last-Event-ID, so no event is missed.
+        """
+        url = urljoin(self.api_url, f'api/v1/orchestrate/events/{run_id}')
+        reconnects = 0
+
+        while True:
+            headers = {'Accept': 'text/event-stream'}
+            if last_event_id is not None:
+                headers['Last-Event-ID'] = str(last_event_id)
+
+            if self.verbose:
+                console.print(f"[dim]Streaming events from: {url}[/dim]")
+
+            try:
+                with self.session.get(url, headers=headers, stream=True, timeout=(10, 60)) as response:
+                    if response.status_code == 404:
+                        raise CLIError(f"Not found: run {run_id}")
+                    elif response.status_code >= 400:
+                        raise CLIError(f"API error ({response.status_code}): {response.text}")
+
+                    for line in response.iter_lines(decode_unicode=True):
+                        if not line or not line.startswith('data: '):
+                            continue
+                        event = json.loads(line[len('data: '):])
+                        if event.get('id') is not None:
+                            last_event_id = event['id']
+                        reconnects = 0
+                        yield event
+                        if event.get('type') in ('run_finished', 'error'):
+                            return
+            except requests.exceptions.ConnectionError:
+                if last_event_id is None or reconnects >= 3:
+                    raise CLIError(f"Connection failed. Is the server running at {self.api_url}?")
+            except requests.exceptions.Timeout:
+                if reconnects >= 3:
+                    raise CLIError("Event stream timed out")
+            except requests.exceptions.RequestException as e:
+                raise CLIError(f"Request failed: {str(e)}")
+
+            # Stream ended without run_finished - resume where we left off
+            reconnects += 1
+            if reconnects > 3:
+                raise CLIError(f"Event stream for {run_id} closed before the run finished")
+
     def list_orchestration_runs(self, limit: Optional[int] = None, status: Optional[str] = None) -> Dict[str, Any]:
         """List orchestration runs via GET /api/v1/orchestrate/runs."""
         params = {}
@@ -358,6 +415,66 @@ class CLIRestClient:
         """Get leadership service health and component status."""
         return self._make_request('GET', '/api/v1/leadership/status')
 
+    # ===============================================
+    # INTELLIGENCE METHODS
+    # ===============================================
+
+    def ask_intelligence(self, question: str, persona: Optional[str] = None,
+                         context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Ask the intelligence layer via POST /api/v1/intelligence/ask."""
+        payload = {"question": question, "persona": persona, "context": context or {}}
+        return self._make_request('POST', '/api/v1/intelligence/ask', json_data=payload, timeout=120)
+
+    def stream_intelligence_answer(self, question: str, persona: Optional[str] = None,
+                                   context: Optional[Dict[str, Any]] = None):
+        """Yield answer events from POST /api/v1/intelligence/ask/stream (Server-Sent Events)."""
+        url = urljoin(self.api_url, 'api/v1/intelligence/ask/stream')
+        payload = {"question": question, "persona": persona, "context": context or {}}
+
+        if self.verbose:
+            console.print(f"[dim]Streaming answer from: {url}[/dim]")
+
+        try:
+            with self.session.post(url, json=payload, headers={'Accept': 'text/event-stream'},
+                                   stream=True, timeout=(10, 120)) as response:
+                if response.status_code >= 400:
+                    raise CLIError(f"API error ({response.status_code}): {response.text}")
+
+                for line in response.iter_lines(decode_unicode=True):
+                    if not line or not line.startswith('data: '):
+                        continue
+                    event = json.loads(line[len('data: '):])
+                    if event.get('type') == 'error':
+                        raise CLIError(event.get('error', 'Streaming failed'))
+                    yield event
+                    if event.get('type') == 'completed':
+                        return
+        except requests.exceptions.ConnectionError:
+            raise CLIError(f"Connection failed. Is the server running at {self.api_url}?")
+        except requests.exceptions.Timeout:
+            raise CLIError("Answer stream timed out")
+        except requests.exceptions.RequestException as e:
+            raise CLIError(f"Request failed: {str(e)}")
+
+        raise CLIError("Answer stream closed before the answer completed")
+
+    # ===============================================
+    # FORECAST METHODS
+    # ===============================================
+
+    def get_forecast_accuracy(self, forecast_type: Optional[str] = None) -> Dict[str, Any]:
+        """Get forecast accuracy via GET /api/v1/forecasts/accuracy."""
+        params = {}
+        if forecast_type:
+            params["forecast_type"] = forecast_type
+        return self._make_request('GET', '/api/v1/forecasts/accuracy', params=params)
+
+    def run_forecast_backtests(self, forecast_types: Optional[List[str]] = None,
+                               horizon_days: Optional[int] = None, folds: Optional[int] = None) -> Dict[str, Any]:
+        """Run rolling-origin backtests via POST /api/v1/forecasts/accuracy/backtest."""
+        payload = {"forecast_types": forecast_types, "horizon_days": horizon_days, "folds": folds}
+        return self._make_request('POST', '/api/v1/forecasts/accuracy/backtest', json_data=payload, timeout=600)
+
 
 def get_client() -> CLIRestClient:
     """Get configured REST client instance."""
@@ -411,6 +528,8 @@ execution_app = typer.Typer(name="execution", help="Execution operations")
 system_app = typer.Typer(name="system", help="System operations")
 orchestrate_app = typer.Typer(name="orchestrate", help="Core orchestration operations")
 leadership_app = typer.Typer(name="leadership", help="Leadership insights operations")
+forecast_app = typer.Typer(name="forecast", help="Forecast operations")
+intelligence_app = typer.Typer(name="intelligence", help="Cross-persona intelligence operations")
 
 # Add subapps to main app
 app.add_typer(transcript_app)
@@ -421,6 +540,8 @@ app.add_typer(workflow_app)
 app.add_typer(execution_app)
 app.add_typer(orchestrate_app)
 app.add_typer(leadership_app)
+app.add_typer(forecast_app)
+app.add_typer(intelligence_app)
 app.add_typer(system_app)
 
 
@@ -1893,69 +2014,102 @@ def execution_stats():
 # ORCHESTRATE COMMANDS (Core subset)
 # ====================================================================
 
+def _print_orchestration_stage(status: Dict[str, Any], prefix: str = ""):
+    """Display a user-friendly message for a pipeline stage transition."""
+    current_stage = status.get("stage", "")
+    if current_stage == "ANALYSIS_COMPLETED":
+        analysis_id = status.get("analysis_id", "N/A")
+        console.print(f"{prefix}✅ [bold green]Analysis Completed[/bold green] (ID: {analysis_id})")
+    elif current_stage == "PLAN_COMPLETED":
+        plan_id = status.get("plan_id", "N/A")
+        console.print(f"{prefix}✅ [bold green]Plan Completed[/bold green] (ID: {plan_id})")
+    elif current_stage == "WORKFLOWS_COMPLETED":
+        workflow_count = status.get("workflow_count", 0)
+        console.print(f"{prefix}✅ [bold green]Workflows Generated[/bold green] ({workflow_count} items)")
+    elif current_stage == "EXECUTION_COMPLETED":
+        executed = status.get("executed_count", 0)
+        failed = status.get("failed_count", 0)
+        console.print(f"{prefix}✅ [bold green]Execution Completed[/bold green] ({executed} successful, {failed} failed)")
+    elif current_stage == "COMPLETE":
+        console.print(f"{prefix}🎉 [bold green]Pipeline Complete![/bold green]")
+    elif current_stage:
+        console.print(f"{prefix}🔄 [dim]Stage: {current_stage}[/dim]")
+
+
 @orchestrate_app.command("run")
 def orchestrate_run(
-    transcript_id: str = typer.Argument(..., help="Transcript ID to process through pipeline"),
+    transcript_ids: List[str] = typer.Argument(..., help="Transcript ID(s) to process through pipeline"),
     auto_approve: bool = typer.Option(False, "--auto-approve", "-a", help="Auto-approve all workflows"),
+    max_concurrent: Optional[int] = typer.Option(None, "--max-concurrent", "-c", help="Pipelines to run at once (server default if omitted)"),
+    analysis_limit: Optional[int] = typer.Option(None, "--analysis-limit", help="Max pipelines in the analysis stage at once"),
+    plan_limit: Optional[int] = typer.Option(None, "--plan-limit", help="Max pipelines in the plan stage at once"),
+    workflows_limit: Optional[int] = typer.Option(None, "--workflows-limit", help="Max pipelines extracting workflows at once"),
+    execution_limit: Optional[int] = typer.Option(None, "--execution-limit", help="Max pipelines executing workflows at once"),
     verbose: bool = typer.Option(DEFAULT_VERBOSE, "--verbose", "-v", help="Enable verbose output")
 ):
     """Run complete orchestration pipeline: Transcript → Analysis → Plan → Workflows → Execution."""
     try:
         client = get_client()
 
-        console.print(f"🚀 [bold cyan]Starting orchestration pipeline for transcript: {transcript_id}[/bold cyan]")
+        console.print(f"🚀 [bold cyan]Starting orchestration pipeline for {len(transcript_ids)} transcript(s): {', '.join(transcript_ids)}[/bold cyan]")
 
         if verbose:
             console.print("🔄 Pipeline stages: Transcript → Analysis → Plan → Workflows → Execution")
 
+        stage_limits = {
+            stage: limit for stage, limit in {
+                "analysis": analysis_limit,
+                "plan": plan_limit,
+                "workflows": workflows_limit,
+                "execution": execution_limit
+            }.items() if limit is not None
+        }
+
         # Start orchestration via API
-        start_result = client.orchestrate_run([transcript_id], auto_approve)
+        start_result = client.orchestrate_run(transcript_ids, auto_approve, max_concurrent, stage_limits)
         run_id = start_result["run_id"]
 
         console.print(f"📝 [bold blue]Run ID: {run_id}[/bold blue]")
         console.print(f"🚀 Status: {start_result['status']}")
-
-        # Poll for completion with progress updates
-        import time
-        last_stage = ""
-        while True:
-            status = client.get_orchestration_status(run_id)
-
-            current_stage = status.get("stage", "")
-            if current_stage != last_stage:
-                # Display user-friendly stage messages
-                if current_stage == "ANALYSIS_COMPLETED":
-                    analysis_id = status.get("analysis_id", "N/A")
-                    console.print(f"✅ [bold green]Analysis Completed[/bold green] (ID: {analysis_id})")
-                elif current_stage == "PLAN_COMPLETED":
-                    plan_id = status.get("plan_id", "N/A")
-                    console.print(f"✅ [bold green]Plan Completed[/bold green] (ID: {plan_id})")
-                elif current_stage == "WORKFLOWS_COMPLETED":
-                    workflow_count = status.get("workflow_count", 0)
-                    console.print(f"✅ [bold green]Workflows Generated[/bold green] ({workflow_count} items)")
-                elif current_stage == "EXECUTION_COMPLETED":
-                    executed = status.get("executed_count", 0)
-                    failed = status.get("failed_count", 0)
-                    console.print(f"✅ [bold green]Execution Completed[/bold green] ({executed} successful, {failed} failed)")
-                elif current_stage == "COMPLETE":
-                    console.print(f"🎉 [bold green]Pipeline Complete![/bold green]")
-                elif verbose:
-                    console.print(f"🔄 [dim]Stage: {current_stage}[/dim]")
-                last_stage = current_stage
-
-            if status["status"] == "COMPLETED":
-                break
-            elif status["status"] == "FAILED":
-                print_error("Pipeline failed!")
+        concurrency = start_result.get("concurrency", {})
+        if concurrency:
+            limits = ", ".join(f"{stage}={limit}" for stage, limit in concurrency.get("stage_limits", {}).items())
+            console.print(f"⚙️  Concurrency: {concurrency.get('max_concurrent')} pipelines ({limits})")
+
+        # Follow the run's event stream with per-transcript progress updates
+        multi = len(transcript_ids) > 1
+        total = len(transcript_ids)
+        finished = 0
+        for event in client.stream_orchestration_events(run_id):
+            event_type = event.get("type")
+            transcript_id = event.get("transcript_id")
+            prefix = f"[cyan]{transcript_id}[/cyan] " if multi and transcript_id else ""
+
+            if event_type == "snapshot":
+                progress = event.get("progress", {})
+                finished = progress.get("processed", 0)
+                if verbose:
+                    console.print(f"⏳ Progress: {finished}/{total}, {progress.get('running', 0)} running")
+            elif event_type == "job_started" and verbose:
+                console.print(f"{prefix}🔄 [dim]Started (attempt {event.get('attempt')})[/dim]")
+            elif event_type == "stage":
+                _print_orchestration_stage(event, prefix)
+            elif event_type == "workflow_executed" and verbose:
+                console.print(f"{prefix}   ⚙️  Workflow {event.get('workflow_id')} {event.get('status')} ({event.get('execution_duration_ms')}ms)")
+            elif event_type == "workflow_failed":
+                console.print(f"{prefix}   ⚠️  Workflow {event.get('workflow_id')} failed: {event.get('error')}")
+            elif event_type == "job_finished":
+                finished += 1
+                if event.get("status") == "FAILED":
+                    console.print(f"{prefix}❌ [bold red]Failed[/bold red]: {event.get('error') or 'unknown error'}")
+                elif event.get("status") == "CANCELLED":
+                    console.print(f"{prefix}🛑 [yellow]Cancelled[/yellow]")
+                if multi:
+                    console.print(f"⏳ Progress: {finished / total * 100:.1f}% ({finished}/{total})")
+            elif event_type == "error":
+                print_error(event.get("error", "Event stream failed"))
                 raise typer.Exit(1)
 
-            # Show progress if available
-            progress = status.get("progress", {})
-            if progress.get("percentage") is not None:
-                console.print(f"⏳ Progress: {progress['percentage']:.1f}% ({progress['processed']}/{progress['total']})")
-
-            time.sleep(2)  # Poll every 2 seconds
-
         # Get final results
         final_status = client.get_orchestration_status(run_id)
 
@@ -1965,7 +2119,7 @@ def orchestrate_run(
         table.add_column("Result", style="green")
 
         table.add_row("Run ID", run_id)
-        table.add_row("Transcript ID", transcript_id)
+        table.add_row("Transcript IDs", ", ".join(transcript_ids))
         table.add_row("Status", final_status["status"])
         table.add_row("Final Stage", final_status["stage"])
 
@@ -1976,6 +2130,8 @@ def orchestrate_run(
 
         table.add_row("Successful Results", str(len(results)))
         table.add_row("Failed Results", str(len(errors)))
+        if summary.get("cancelled"):
+            table.add_row("Cancelled", str(summary["cancelled"]))
 
         if summary:
             table.add_row("Success Rate", f"{summary.get('success_rate', 0)*100:.0f}%")
@@ -2000,7 +2156,9 @@ def orchestrate_run(
                 console.print(f"   Transcript {error.get('transcript_id')}: {error.get('error')}")
 
         # Final status message
-        if summary:
+        if final_status["status"] == "CANCELLED":
+            print_warning(f"Pipeline run {run_id} was cancelled")
+        elif summary:
             success_rate = summary.get('success_rate', 0)
             if success_rate == 1.0:
                 print_success(f"Pipeline completed successfully! Success rate: 100%")
@@ -2020,6 +2178,23 @@ def orchestrate_run(
         raise typer.Exit(1)
 
 
+@orchestrate_app.command("cancel")
+def orchestrate_cancel(
+    run_id: str = typer.Argument(..., help="Orchestration run ID to cancel")
+):
+    """Cancel a running orchestration: queued transcripts are dropped, running pipelines stopped."""
+    try:
+        client = get_client()
+        result = client.cancel_orchestration_run(run_id)
+        print_success(
+            f"Cancelling run {run_id}: {result.get('queued_cancelled', 0)} queued, "
+            f"{result.get('running_cancelled', 0)} running transcript(s) cancelled"
+        )
+    except CLIError as e:
+        print_error(f"Cancel failed: {str(e)}")
+        raise typer.Exit(1)
+
+
 @orchestrate_app.command("execute-approved")
 def orchestrate_execute_approved(
     executed_by: str = typer.Option("cli_user", "--executed-by", help="Name of executor")
@@ -2378,6 +2553,129 @@ def leadership_status():
         raise typer.Exit(1)
 
 
+# ====================================================================
+# INTELLIGENCE COMMANDS
+# ====================================================================
+
+@intelligence_app.command("ask")
+def intelligence_ask(
+    question: str = typer.Argument(..., help="Question for the intelligence layer"),
+    persona: Optional[str] = typer.Option(None, "--persona", "-p", help="Persona (leadership, servicing, marketing, ...)"),
+    stream: bool = typer.Option(True, "--stream/--no-stream", help="Render the answer as it is generated")
+):
+    """Ask a natural language question across persona intelligence."""
+    try:
+        console.print("🧠 [bold blue]Intelligence[/bold blue]")
+        console.print(f"Question: [cyan]{question}[/cyan]")
+        console.print()
+
+        client = get_client()
+        if not stream:
+            response = client.ask_intelligence(question, persona)
+            console.print(Panel(
+                response.get('answer') or 'No answer generated',
+                title=f"[bold green]Answer ({response.get('persona', 'N/A')})[/bold green]",
+                border_style="green"
+            ))
+            return
+
+        for event in client.stream_intelligence_answer(question, persona):
+            event_type = event.get('type')
+            if event_type == 'snapshot_ready':
+                console.print(f"📊 Persona: [yellow]{event.get('persona')}[/yellow] "
+                              f"[dim](snapshot {event.get('snapshot_build_ms', 'N/A')}ms, "
+                              f"{event.get('cached_insights', 0)} cached insights)[/dim]")
+            elif event_type == 'strategy':
+                strategy = event.get('strategy') or {}
+                console.print(f"🧭 Strategy: [yellow]{strategy.get('strategy_type', 'N/A')}[/yellow] "
+                              f"[dim]{strategy.get('reasoning', '')}[/dim]")
+                console.print()
+            elif event_type == 'token':
+                console.print(event.get('text', ''), end="", markup=False, highlight=False)
+            elif event_type == 'completed':
+                timing = event.get('timing', {})
+                console.print()
+                console.print(f"\n⏱️  First token: [blue]{timing.get('time_to_first_token_ms', 'N/A')}ms[/blue], "
+                              f"total: [blue]{timing.get('total_ms', 'N/A')}ms[/blue]")
+
+    except CLIError as e:
+        print_error(f"Intelligence question failed: {str(e)}")
+        raise typer.Exit(1)
+
+
+# ====================================================================
+# FORECAST COMMANDS
+# ====================================================================
+
+def _format_metric(value: Optional[float], percent: bool = False) -> str:
+    """Format an accuracy metric for display ('-' when unavailable)."""
+    if value is None:
+        return "-"
+    return f"{value:.1%}" if percent else f"{value:.3f}"
+
+
+@forecast_app.command("accuracy")
+def forecast_accuracy(
+    forecast_type: Optional[str] = typer.Option(None, "--type", "-t", help="Forecast type (all when omitted)"),
+    backtest: bool = typer.Option(False, "--backtest", help="Run rolling-origin backtests first"),
+    folds: Optional[int] = typer.Option(None, "--folds", help="Backtest folds per type"),
+    horizon: Optional[int] = typer.Option(None, "--horizon", help="Backtest periods per fold")
+):
+    """Show forecast accuracy (backtests and scored past forecasts)."""
+    try:
+        client = get_client()
+
+        if backtest:
+            console.print("🧪 [bold magenta]Running forecast backtests...[/bold magenta]")
+            run = client.run_forecast_backtests(
+                forecast_types=[forecast_type] if forecast_type else None,
+                horizon_days=horizon, folds=folds
+            )
+            console.print(f"Backtested in [cyan]{run.get('duration_ms', 0)} ms[/cyan] ({run.get('folds')} folds)")
+            for ft, result in run.get('results', {}).items():
+                if result.get('status') != 'completed':
+                    print_warning(f"{ft}: {result.get('status')} - {result.get('detail')}")
+
+        accuracy = client.get_forecast_accuracy(forecast_type)
+
+        if GLOBAL_FORMAT == "json":
+            console.print_json(json.dumps(accuracy))
+            return
+
+        backtests = accuracy.get('backtests', {})
+        if backtests:
+            table = Table(title="Backtest Accuracy")
+            for column in ("Type", "Engine", "Folds", "MAE", "RMSE", "MAPE", "Coverage", "Fit (ms)", "Run At"):
+                table.add_column(column)
+            for ft, result in backtests.items():
+                table.add_row(
+                    ft, result['engine'], f"{result['folds']}×{result['horizon']}",
+                    _format_metric(result['mae']), _format_metric(result['rmse']),
+                    _format_metric(result['mape'], percent=True), _format_metric(result['coverage'], percent=True),
+                    f"{result['fit_ms']:.0f}", result['run_at'][:19]
+                )
+            console.print(table)
+        else:
+            print_warning("No backtests yet. Run with --backtest")
+
+        live = accuracy.get('live', {})
+        if live:
+            table = Table(title="Live Accuracy (past forecasts vs actuals)")
+            for column in ("Type", "Forecasts Scored", "MAE", "MAPE", "Coverage", "Last Scored"):
+                table.add_column(column)
+            for ft, result in live.items():
+                table.add_row(
+                    ft, str(result['forecasts_scored']), _format_metric(result['mae']),
+                    _format_metric(result['mape'], percent=True), _format_metric(result['coverage'], percent=True),
+                    (result.get('last_scored_at') or '-')[:19]
+                )
+            console.print(table)
+
+    except CLIError as e:
+        print_error(f"Failed to get forecast accuracy: {str(e)}")
+        raise typer.Exit(1)
+
+
 # ====================================================================
 # MAIN ENTRY POINT
 # ====================================================================
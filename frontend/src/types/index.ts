@@ -464,6 +464,8 @@ export interface ForecastGenerateRequest {
   end_date?: string;
   use_cache?: boolean;
   ttl_hours?: number;
+  wait?: boolean;
+  wait_timeout_seconds?: number;
 }
 
 export interface ForecastReadiness {
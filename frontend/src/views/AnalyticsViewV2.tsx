@@ -334,6 +334,7 @@ export function AnalyticsViewV2() {
       forecastApi.generate({
         forecast_type: selectedType!,
         use_cache: true,
+        wait: true,
       }),
     enabled: Boolean(selectedType),
     staleTime: 1000 * 60,
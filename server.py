@@ -53,7 +53,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 # NOW import everything else
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -72,6 +72,7 @@ from src.services.system_service import SystemService
 from src.services.leadership_insights_service import LeadershipInsightsService
 from src.services.advisor_service import AdvisorService
 from src.services.forecasting_service import ForecastingService, ForecastingServiceError
+from src.infrastructure.config.config_loader import get_forecasting_config, get_precompute_config, get_intelligence_config
 
 # Import execution models for step-by-step workflow execution
 from src.models.execution_models import (
@@ -98,6 +99,10 @@ system_service = SystemService(api_key=api_key)
 advisor_service = AdvisorService(db_path=db_path)
 forecasting_service = ForecastingService(db_path=db_path)
 
+# Durable orchestration runs - pipeline jobs survive restarts and are resumed in lifespan
+from src.storage.pipeline_job_store import PipelineJobStore
+pipeline_job_store = PipelineJobStore(db_path)
+
 # Initialize intelligence services (Prophet + GenAI hybrid)
 from src.storage.insight_store import InsightStore
 from src.analytics.intelligence.hybrid_analyzer import HybridAnalyzer
@@ -105,7 +110,12 @@ from src.services.intelligence_service import IntelligenceService
 from src.infrastructure.llm.llm_client_v2 import LLMClientV2
 
 llm_client = LLMClientV2()
-insight_store = InsightStore(db_path=db_path)
+insight_store = InsightStore(
+    db_path=db_path,
+    l1_size=get_intelligence_config('insight_l1_size', 256),
+    access_flush_seconds=get_intelligence_config('insight_access_flush_seconds', 30),
+    access_flush_hits=get_intelligence_config('insight_access_flush_hits', 100)
+)
 hybrid_analyzer = HybridAnalyzer(
     forecasting_service=forecasting_service,
     llm_client=llm_client,
@@ -117,6 +127,18 @@ intelligence_service = IntelligenceService(
     db_path=db_path
 )
 
+# Background cache warming for forecasts and insights (started in lifespan)
+from src.services.precompute_scheduler import PrecomputeScheduler
+precompute_scheduler = PrecomputeScheduler.for_services(forecasting_service, intelligence_service)
+
+# Data-change invalidation of cached insights (subscribed with the event handlers below)
+from src.services.insight_invalidator import InsightInvalidator
+insight_invalidator = InsightInvalidator(
+    insight_store=insight_store,
+    request_refresh=intelligence_service.request_refresh,
+    mode=get_intelligence_config('insight_invalidation', 'refresh')
+)
+
 print("✅ All services initialized successfully")
 
 # Initialize knowledge event handling system
@@ -156,6 +178,17 @@ except Exception as e:
     import logging
     logging.getLogger(__name__).error(f"Graph event handlers initialization failed: {e}")
 
+# Cached insights follow the data they were computed from
+try:
+    insight_invalidator.subscribe()
+    intelligence_service.insight_invalidator = insight_invalidator
+    print("✅ Insight invalidation subscribed to transcript/analysis/workflow events")
+except Exception as e:
+    print(f"❌ Failed to subscribe insight invalidation: {e}")
+    # NO FALLBACK: Continue with degraded functionality (insights expire by TTL only)
+    import logging
+    logging.getLogger(__name__).error(f"Insight invalidation subscription failed: {e}")
+
 # Initialize prediction cleanup system
 # NO FALLBACK: Proper background task management with FastAPI lifecycle
 background_tasks = set()
@@ -238,6 +271,28 @@ async def lifespan(app: FastAPI):
     else:
         print("⚠️  Prediction cleanup not available - skipping background task")
 
+    # Refresh forecasts and cached insights ahead of their TTL expiry
+    if get_precompute_config('enabled', True):
+        import asyncio
+
+        intelligence_service.precompute_scheduler = precompute_scheduler
+        precompute_task = asyncio.create_task(precompute_scheduler.run())
+        background_tasks.add(precompute_task)
+        precompute_task.add_done_callback(lambda t: background_tasks.discard(t))
+        print(f"✅ Forecast/insight precompute started ({len(precompute_scheduler.targets)} targets)")
+    else:
+        print("⚠️  Forecast/insight precompute disabled")
+
+    # Forecast jobs abandoned by a previous server must not be joined by new requests
+    abandoned_jobs = forecasting_service.recover_interrupted_jobs()
+    if abandoned_jobs:
+        print(f"⚠️  Marked {abandoned_jobs} abandoned forecast job(s) as failed")
+
+    # Resume orchestration runs interrupted by a previous shutdown or crash
+    resumed_runs = _resume_orchestration_runs()
+    if resumed_runs:
+        print(f"✅ Resumed {resumed_runs} unfinished orchestration run(s)")
+
     yield  # Application runs here
 
     # Shutdown
@@ -255,6 +310,12 @@ async def lifespan(app: FastAPI):
 
     print("✅ All background tasks shut down")
 
+    # Stop forecast training processes
+    forecasting_service.shutdown()
+
+    # Write buffered insight access statistics
+    insight_store.flush()
+
 app = FastAPI(
     title="Customer Call Center Analytics API",
     description="AI-powered system for generating and analyzing call center transcripts",
@@ -335,6 +396,24 @@ class ForecastGenerateRequest(BaseModel):
     end_date: Optional[str] = None
     use_cache: bool = True
     ttl_hours: int = 24
+    wait: bool = False  # Block until the training job finishes (up to wait_timeout_seconds)
+    wait_timeout_seconds: Optional[float] = None
+
+
+class HierarchicalForecastRequest(BaseModel):
+    hierarchy: str  # 'intent_volume_daily' | 'advisor_call_volume_daily'
+    horizon_days: Optional[int] = None
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    method: str = 'mint'  # 'mint' | 'bottom_up'
+    max_children: Optional[int] = None
+    ttl_hours: int = 24
+
+
+class ForecastBacktestRequest(BaseModel):
+    forecast_types: Optional[List[str]] = None  # All types when omitted
+    horizon_days: Optional[int] = None  # Periods per fold (default: each type's horizon)
+    folds: Optional[int] = None
 
 
 class IntelligenceQueryRequest(BaseModel):
@@ -1055,18 +1134,116 @@ async def get_execution_statistics():
 # ORCHESTRATION ENDPOINTS
 # ===============================================
 
-# In-memory storage for orchestration runs (NO FALLBACK - fails if not found)
-orchestration_runs: Dict[str, Dict] = {}
+# Schedulers of runs executing in this process, kept for cancellation
+orchestration_schedulers: Dict[str, Any] = {}
+
+
+def _start_orchestration_scheduler(scheduler) -> None:
+    """Run a scheduler in the background and forget it once it returns."""
+    import asyncio
+
+    async def run_pipelines():
+        try:
+            await scheduler.run()
+        except Exception as e:
+            logger.error(f"Orchestration run {scheduler.run_id} stopped: {e}")
+        finally:
+            orchestration_schedulers.pop(scheduler.run_id, None)
+
+    orchestration_schedulers[scheduler.run_id] = scheduler
+    task = asyncio.create_task(run_pipelines())
+    background_tasks.add(task)
+    task.add_done_callback(lambda t: background_tasks.discard(t))
+
+
+def _resume_orchestration_runs() -> int:
+    """Start schedulers for runs left unfinished by a previous server process."""
+    from src.services.orchestration.pipeline_scheduler import PipelineScheduler
+
+    resumed = 0
+    for run in pipeline_job_store.list_unfinished_runs():
+        if run["id"] in orchestration_schedulers:
+            continue
+        concurrency = run.get("concurrency") or {}
+        scheduler = PipelineScheduler(
+            run["id"],
+            pipeline_job_store,
+            max_concurrent=concurrency.get("max_concurrent"),
+            stage_limits=concurrency.get("stage_limits")
+        )
+        _start_orchestration_scheduler(scheduler)
+        resumed += 1
+    return resumed
+
+
+def _build_run_status(run: Dict[str, Any], include_jobs: bool = True) -> Dict[str, Any]:
+    """Shape a stored run and its jobs into the orchestration status payload."""
+    jobs = pipeline_job_store.get_jobs(run["id"])
+
+    transcripts = {}
+    results = []
+    errors = []
+    for job in jobs:
+        transcripts[job["transcript_id"]] = {
+            "status": job["status"],
+            "stage": job["stage"],
+            "position": job["position"],
+            "attempts": job["attempts"],
+            "analysis_id": job["analysis_id"],
+            "plan_id": job["plan_id"],
+            "workflow_count": job["workflow_count"],
+            "executed_count": job["executed_count"],
+            "failed_count": job["failed_count"],
+            "started_at": job["started_at"],
+            "completed_at": job["completed_at"],
+            "error": job["error"]
+        }
+        if job["status"] == "COMPLETED" and job["result"] is not None:
+            results.append(job["result"])
+        elif job["status"] == "FAILED":
+            errors.append({
+                "transcript_id": job["transcript_id"],
+                "error": job["error"],
+                "timestamp": job["completed_at"]
+            })
+
+    # Run-level stage mirrors the most recently updated transcript (single-transcript clients)
+    latest = max(jobs, key=lambda job: job["updated_at"]) if jobs else None
+    if run["status"] == "COMPLETED":
+        stage = "COMPLETE"
+    elif run["status"] in ("CANCELLED", "CANCELLING"):
+        stage = run["status"]
+    else:
+        stage = (latest or {}).get("stage") or "INITIALIZING"
+
+    status = {
+        **run,
+        "stage": stage,
+        "results": results,
+        "errors": errors
+    }
+    for field in ("analysis_id", "plan_id", "workflow_count", "executed_count", "failed_count"):
+        if latest is not None and latest[field] is not None:
+            status[field] = latest[field]
+    if include_jobs:
+        status["transcripts"] = transcripts
+    return status
+
 
 @app.post("/api/v1/orchestrate/run")
 async def orchestrate_run(request: Dict):
     """Run orchestration pipeline for transcripts - NO FALLBACK.
 
     Pipeline stages: Transcript → Analysis → Plan → Workflows → Execution
+
+    Transcripts are persisted as pipeline jobs and processed concurrently by a
+    bounded worker pool; each completed stage is checkpointed, so runs resume
+    after a server restart. Optional request fields:
+        max_concurrent: Pipelines running at once (default from config/system.yaml)
+        stage_limits: Per-stage limits, e.g. {"analysis": 4, "workflows": 2, "execution": 4}
     """
     import uuid
-    import asyncio
-    from src.services.orchestration.simple_pipeline import run_simple_pipeline
+    from src.services.orchestration.pipeline_scheduler import resolve_concurrency, PipelineScheduler
 
     # Extract parameters (fail fast if missing)
     transcript_ids = request.get("transcript_ids", [])
@@ -1075,106 +1252,142 @@ async def orchestrate_run(request: Dict):
     if not transcript_ids:
         raise HTTPException(status_code=400, detail="transcript_ids required - NO FALLBACK")
 
+    # Each transcript is tracked individually, so duplicates are processed once
+    transcript_ids = list(dict.fromkeys(transcript_ids))
+
+    try:
+        concurrency = resolve_concurrency(request.get("max_concurrent"), request.get("stage_limits"))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     # Generate run ID
     run_id = f"RUN_{uuid.uuid4().hex[:8].upper()}"
 
-    # Initialize run status
-    orchestration_runs[run_id] = {
-        "id": run_id,
-        "transcript_ids": transcript_ids,
-        "auto_approve": auto_approve,
-        "status": "RUNNING",
-        "stage": "INITIALIZING",
-        "started_at": datetime.now(timezone.utc).isoformat(),
-        "results": [],
-        "errors": []
-    }
-
-    # Run pipeline asynchronously for each transcript
-    async def run_pipelines():
-        for transcript_id in transcript_ids:
-            try:
-                orchestration_runs[run_id]["stage"] = f"PROCESSING_{transcript_id}"
-                # Pass the status dict so SimplePipeline can update it in real-time
-                result = await run_simple_pipeline(
-                    transcript_id,
-                    auto_approve,
-                    status_dict=orchestration_runs[run_id]
-                )
-                orchestration_runs[run_id]["results"].append(result)
-            except Exception as e:
-                # NO FALLBACK - record failure and continue
-                orchestration_runs[run_id]["errors"].append({
-                    "transcript_id": transcript_id,
-                    "error": str(e),
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                })
-
-        # Update final status
-        orchestration_runs[run_id]["status"] = "COMPLETED"
-        orchestration_runs[run_id]["stage"] = "COMPLETE"
-        orchestration_runs[run_id]["completed_at"] = datetime.now(timezone.utc).isoformat()
-
-        # Calculate summary
-        total_results = len(orchestration_runs[run_id]["results"])
-        total_errors = len(orchestration_runs[run_id]["errors"])
-        orchestration_runs[run_id]["summary"] = {
-            "total_transcripts": len(transcript_ids),
-            "successful": total_results,
-            "failed": total_errors,
-            "success_rate": total_results / len(transcript_ids) if transcript_ids else 0
-        }
+    pipeline_job_store.create_run(run_id, transcript_ids, auto_approve, concurrency=concurrency)
+    scheduler = PipelineScheduler(
+        run_id,
+        pipeline_job_store,
+        max_concurrent=concurrency["max_concurrent"],
+        stage_limits=concurrency["stage_limits"]
+    )
 
-    # Start pipeline in background
-    asyncio.create_task(run_pipelines())
+    # Run pipelines concurrently in the background
+    _start_orchestration_scheduler(scheduler)
 
     return {
         "run_id": run_id,
         "status": "STARTED",
         "transcript_count": len(transcript_ids),
-        "auto_approve": auto_approve
+        "auto_approve": auto_approve,
+        "concurrency": concurrency
     }
 
 @app.get("/api/v1/orchestrate/status/{run_id}")
 async def get_orchestration_status(run_id: str):
     """Get orchestration run status - NO FALLBACK."""
-    if run_id not in orchestration_runs:
+    run = pipeline_job_store.get_run(run_id)
+    if run is None:
         raise HTTPException(status_code=404, detail=f"Run {run_id} not found - NO FALLBACK")
 
-    run = orchestration_runs[run_id]
+    status = _build_run_status(run)
 
     # Calculate current progress
     total_transcripts = len(run["transcript_ids"])
-    processed = len(run["results"]) + len(run["errors"])
+    transcripts = status["transcripts"]
+    processed = sum(
+        1 for entry in transcripts.values()
+        if entry["status"] in ("COMPLETED", "FAILED", "CANCELLED")
+    )
+    running = sum(1 for entry in transcripts.values() if entry["status"] == "RUNNING")
     progress_percentage = (processed / total_transcripts * 100) if total_transcripts > 0 else 0
 
     return {
-        **run,
+        **status,
         "progress": {
             "total": total_transcripts,
             "processed": processed,
+            "running": running,
             "percentage": round(progress_percentage, 2)
         }
     }
 
-@app.get("/api/v1/orchestrate/runs")
-async def list_orchestration_runs(
-    limit: Optional[int] = Query(None, description="Limit the number of results"),
-    status: Optional[str] = Query(None, description="Filter by status (RUNNING, COMPLETED)")
+@app.get("/api/v1/orchestrate/events/{run_id}")
+async def stream_orchestration_events(
+    run_id: str,
+    request: Request,
+    last_event_id: Optional[int] = Query(None, description="Replay events after this id (or send a Last-Event-ID header)")
 ):
-    """List all orchestration runs."""
-    runs = list(orchestration_runs.values())
+    """Stream orchestration progress as Server-Sent Events - NO FALLBACK.
 
-    # Filter by status if provided
-    if status:
-        runs = [r for r in runs if r["status"] == status]
+    The first event is a ``snapshot`` (same payload as the status endpoint),
+    followed by ``job_started``, ``stage`` (ANALYSIS_COMPLETED, PLAN_COMPLETED,
+    WORKFLOWS_COMPLETED, EXECUTION_COMPLETED, COMPLETE), ``workflow_executed`` /
+    ``workflow_failed``, ``job_finished`` and finally ``run_finished``. Jobs interrupted
+    by a server shutdown are reported as ``job_requeued`` and resume after the restart.
+    """
+    from src.services.orchestration.run_events import stream_run_events
+
+    snapshot = await get_orchestration_status(run_id)  # 404 for unknown runs
+
+    header_event_id = request.headers.get("last-event-id")
+    if last_event_id is None and header_event_id and header_event_id.isdigit():
+        last_event_id = int(header_event_id)
+
+    async def generate_events():
+        if last_event_id is None:
+            yield f"data: {json.dumps({'type': 'snapshot', 'run_id': run_id, **snapshot}, default=str)}\n\n"
+        try:
+            async for event in stream_run_events(run_id, pipeline_job_store, last_event_id=last_event_id):
+                if event.get("id") is not None:
+                    yield f"id: {event['id']}\ndata: {json.dumps(event, default=str)}\n\n"
+                else:
+                    yield f"data: {json.dumps(event, default=str)}\n\n"
+        except Exception as e:
+            error_event = {"type": "error", "run_id": run_id, "error": f"Event stream failed: {str(e)}"}
+            yield f"data: {json.dumps(error_event)}\n\n"
+
+    return StreamingResponse(
+        generate_events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+    )
 
-    # Sort by started_at descending (most recent first)
-    runs.sort(key=lambda x: x["started_at"], reverse=True)
+@app.post("/api/v1/orchestrate/cancel/{run_id}")
+async def cancel_orchestration_run(run_id: str):
+    """Cancel an orchestration run - queued transcripts are dropped, running pipelines cancelled."""
+    if pipeline_job_store.get_run(run_id) is None:
+        raise HTTPException(status_code=404, detail=f"Run {run_id} not found - NO FALLBACK")
 
-    # Apply limit if provided
-    if limit:
-        runs = runs[:limit]
+    try:
+        scheduler = orchestration_schedulers.get(run_id)
+        if scheduler is not None:
+            cancelled = scheduler.cancel()
+        else:
+            # Run is executing in another process - its workers stop on their next lease renewal
+            cancelled = {"queued_cancelled": pipeline_job_store.cancel_run(run_id), "running_cancelled": 0}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "run_id": run_id,
+        "status": "CANCELLING",
+        **cancelled
+    }
+
+@app.get("/api/v1/orchestrate/runs")
+async def list_orchestration_runs(
+    limit: Optional[int] = Query(None, description="Limit the number of results"),
+    status: Optional[str] = Query(None, description="Filter by status (RUNNING, CANCELLING, COMPLETED, CANCELLED)")
+):
+    """List all orchestration runs (most recent first)."""
+    runs = [
+        _build_run_status(run, include_jobs=False)
+        for run in pipeline_job_store.list_runs(status=status, limit=limit)
+    ]
 
     return {
         "runs": runs,
@@ -1302,28 +1515,148 @@ async def generate_forecast(request: ForecastGenerateRequest):
     """Generate time-series forecast using Prophet.
 
     Generates forecasts for call volume, sentiment, risk scores, etc.
-    Uses cached forecasts when available.
+    Uses cached forecasts when available. Otherwise training is queued as a
+    job on the forecasting process pool and a job handle is returned at once
+    (202); poll GET /api/v1/forecasts/jobs/{job_id}. With wait=true the
+    request blocks until the forecast is ready (or the wait times out, in
+    which case the job handle is returned).
     """
     try:
-        result = await forecasting_service.generate_forecast(
+        if request.use_cache:
+            cached = forecasting_service.get_cached_forecast(request.forecast_type)
+            if cached:
+                return cached
+
+        job = await forecasting_service.submit_forecast_job(
             forecast_type=request.forecast_type,
             horizon_days=request.horizon_days,
             start_date=request.start_date,
             end_date=request.end_date,
-            use_cache=request.use_cache,
             ttl_hours=request.ttl_hours
         )
-        return result
+
+        if request.wait:
+            timeout = request.wait_timeout_seconds or get_forecasting_config('job_wait_timeout_seconds', 120)
+            job = await forecasting_service.wait_for_forecast_job(job['id'], timeout=timeout)
+            if job['status'] == 'COMPLETED':
+                return await forecasting_service.get_forecast_job_result(job)
+            if job['status'] == 'FAILED':
+                raise HTTPException(status_code=500, detail=f"Forecast generation failed: {job['error']}")
+
+        return JSONResponse(status_code=202, content=job)
     except ForecastingServiceError as exc:
         return {
             "status": "insufficient_data",
             "forecast_type": request.forecast_type,
             "detail": str(exc),
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Forecast generation failed: {str(e)}")
 
 
+@app.post("/api/v1/forecasts/hierarchical")
+async def generate_hierarchical_forecast(request: HierarchicalForecastRequest):
+    """Forecast total volume and its split by intent or advisor.
+
+    Child series are fitted in parallel on the forecasting process pool and
+    reconciled so they add up to the total (MinT or bottom-up).
+    """
+    try:
+        return await forecasting_service.generate_hierarchical_forecast(
+            hierarchy=request.hierarchy,
+            horizon_days=request.horizon_days,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            method=request.method,
+            max_children=request.max_children,
+            ttl_hours=request.ttl_hours
+        )
+    except ForecastingServiceError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Hierarchical forecast failed: {str(e)}")
+
+
+@app.get("/api/v1/forecasts/models")
+async def list_fitted_forecast_models():
+    """List fitted models in the registry (training watermark, last fit mode and duration)."""
+    try:
+        return await forecasting_service.list_fitted_models()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to list forecast models: {str(e)}")
+
+
+@app.get("/api/v1/forecasts/jobs")
+async def list_forecast_jobs(status: Optional[str] = None, limit: int = Query(20, ge=1, le=100)):
+    """List forecast generation jobs, most recent first."""
+    try:
+        return await forecasting_service.list_forecast_jobs(status=status, limit=limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to list forecast jobs: {str(e)}")
+
+
+@app.get("/api/v1/forecasts/jobs/{job_id}")
+async def get_forecast_job(job_id: str, wait: bool = False,
+                           timeout_seconds: Optional[float] = Query(None, ge=0, le=600)):
+    """Get a forecast job, optionally waiting for it to finish.
+
+    A completed job includes its forecast under ``forecast``.
+    """
+    try:
+        if wait:
+            timeout = timeout_seconds if timeout_seconds is not None else get_forecasting_config('job_wait_timeout_seconds', 120)
+            job = await forecasting_service.wait_for_forecast_job(job_id, timeout=timeout)
+        else:
+            job = await forecasting_service.get_forecast_job(job_id)
+            if job is None:
+                raise HTTPException(status_code=404, detail=f"Forecast job {job_id} not found")
+
+        if job['status'] == 'COMPLETED':
+            job['forecast'] = await forecasting_service.get_forecast_job_result(job)
+        return job
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ForecastingServiceError as e:
+        raise HTTPException(status_code=410, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to retrieve forecast job: {str(e)}")
+
+
+@app.get("/api/v1/forecasts/accuracy")
+async def get_forecast_accuracy(forecast_type: Optional[str] = None):
+    """Forecast accuracy per type.
+
+    Returns the latest rolling-origin backtest (MAE/MAPE/coverage overall and
+    per horizon step) and the live accuracy of past forecasts, which are
+    scored against actuals as they arrive.
+    """
+    try:
+        return await forecasting_service.get_forecast_accuracy(forecast_type)
+    except ForecastingServiceError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Accuracy retrieval failed: {str(e)}")
+
+
+@app.post("/api/v1/forecasts/accuracy/backtest")
+async def run_forecast_backtests(request: ForecastBacktestRequest):
+    """Run rolling-origin backtests for forecast types in parallel on the training process pool."""
+    try:
+        return await forecasting_service.run_backtests(
+            forecast_types=request.forecast_types,
+            horizon_days=request.horizon_days,
+            folds=request.folds
+        )
+    except ForecastingServiceError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Backtest failed: {str(e)}")
+
+
 @app.get("/api/v1/forecasts/statistics")
 async def get_forecast_statistics():
     """Get statistics about stored forecasts."""
@@ -1732,6 +2065,41 @@ async def ask_intelligence_question(request: IntelligenceQueryRequest):
         raise HTTPException(status_code=500, detail=f"Failed to answer intelligence question: {str(e)}")
 
 
+@app.post("/api/v1/intelligence/ask/stream")
+async def ask_intelligence_question_stream(request: IntelligenceQueryRequest):
+    """Streaming version of /api/v1/intelligence/ask.
+
+    Streams Server-Sent Events as the answer is produced:
+    - snapshot_ready: persona data gathered
+    - strategy: how the question will be answered
+    - token: next piece of the answer text
+    - completed: full result (same shape as /ask) with timing
+    """
+    async def generate_events():
+        """Generate SSE events from the streaming answer."""
+        try:
+            async for event in intelligence_service.ask_stream(
+                question=request.question,
+                persona=request.persona,
+                context=request.context
+            ):
+                yield f"data: {json.dumps(event, default=str)}\n\n"
+
+        except Exception as e:
+            error_event = {"type": "error", "error": f"Failed to answer intelligence question: {str(e)}"}
+            yield f"data: {json.dumps(error_event)}\n\n"
+
+    return StreamingResponse(
+        generate_events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        }
+    )
+
+
 @app.get("/api/v1/intelligence/insights")
 async def get_cached_insights(
     persona: Optional[str] = Query(None),
@@ -1782,6 +2150,8 @@ async def get_intelligence_health():
         - Cache hit rates
         - Recent insight generation stats
         - Available personas and capabilities
+        - Precompute schedule: next refresh and last-refresh latency per
+          forecast type and precomputed insight
     """
     try:
         return await intelligence_service.get_health()
@@ -0,0 +1,161 @@
+"""Rolling-origin backtests and forecast accuracy metrics.
+
+Each fold trains on the history up to a cutoff and scores the next
+``horizon`` periods, so engines and forecast types are compared on the same
+out-of-sample windows for accuracy (per horizon step) and fit time.
+``score_predictions`` applies the same metrics to a stored forecast once
+its actuals have arrived.
+"""
+import time
+from typing import Dict, Any, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .forecast_types import FORECAST_TYPES, FREQUENCIES, ForecastGenerator
+from .prophet_service import create_model_service
+
+
+def accuracy_metrics(actual: np.ndarray, predicted: np.ndarray,
+                     lower: np.ndarray, upper: np.ndarray) -> Dict[str, Any]:
+    """MAE, RMSE, MAPE and interval coverage of aligned arrays.
+
+    MAPE is computed over non-zero actuals only and is None when every
+    actual is zero.
+    """
+    errors = actual - predicted
+    nonzero = actual != 0
+    return {
+        'mae': float(np.mean(np.abs(errors))),
+        'rmse': float(np.sqrt(np.mean(errors ** 2))),
+        'mape': float(np.mean(np.abs(errors[nonzero] / actual[nonzero]))) if nonzero.any() else None,
+        'coverage': float(np.mean((actual >= lower) & (actual <= upper)))
+    }
+
+
+def rolling_origin_backtest(df: pd.DataFrame, engine: str = 'prophet', model_type: str = 'daily',
+                            prophet_kwargs: Optional[Dict[str, Any]] = None, horizon: int = 7,
+                            folds: int = 3, freq: str = 'D') -> Dict[str, Any]:
+    """Backtest one engine over rolling forecast origins.
+
+    Args:
+        df: Historical data with 'ds' and 'y' columns
+        engine: 'prophet' or 'ets'
+        model_type: 'daily', 'weekly', or 'hourly'
+        prophet_kwargs: Additional Prophet parameters
+        horizon: Periods scored after each cutoff
+        folds: Number of cutoffs, the last one ``horizon`` periods before the end
+        freq: Frequency ('D', 'H', 'W')
+
+    Returns:
+        MAE, RMSE, MAPE and coverage over all folds, the same metrics per
+        horizon step (``by_horizon``) and the mean fit time
+
+    Raises:
+        ValueError: If the history is too short for the folds (NO FALLBACK)
+    """
+    df = df.sort_values('ds').reset_index(drop=True)
+    min_train = len(df) - folds * horizon
+    if folds < 1 or horizon < 1 or min_train < 2:
+        raise ValueError(f"Need more than {folds * horizon + 1} data points for {folds} folds of {horizon}")
+
+    # (folds × horizon) arrays
+    actual, predicted, lower, upper, fit_ms = [], [], [], [], []
+    for fold in range(folds):
+        cutoff = min_train + fold * horizon
+        train, test = df.iloc[:cutoff], df.iloc[cutoff:cutoff + horizon]
+
+        service = create_model_service(model_type, engine=engine, **(prophet_kwargs or {}))
+        start = time.perf_counter()
+        service.train(train)
+        fit_ms.append((time.perf_counter() - start) * 1000)
+
+        forecast = service.predict(horizon, freq).tail(horizon)
+        actual.append(test['y'].values)
+        predicted.append(forecast['yhat'].values)
+        lower.append(forecast['yhat_lower'].values)
+        upper.append(forecast['yhat_upper'].values)
+
+    actual, predicted, lower, upper = (np.array(a, dtype=float) for a in (actual, predicted, lower, upper))
+
+    by_horizon: List[Dict[str, Any]] = [
+        {'step': step + 1, **accuracy_metrics(actual[:, step], predicted[:, step], lower[:, step], upper[:, step])}
+        for step in range(horizon)
+    ]
+
+    return {
+        'engine': engine,
+        'folds': folds,
+        'horizon': horizon,
+        **accuracy_metrics(actual.ravel(), predicted.ravel(), lower.ravel(), upper.ravel()),
+        'by_horizon': by_horizon,
+        'fit_ms': float(np.mean(fit_ms))
+    }
+
+
+def compare_engines(df: pd.DataFrame, engines: Iterable[str] = ('prophet', 'ets'),
+                    **backtest_kwargs) -> Dict[str, Dict[str, Any]]:
+    """Run the same rolling-origin backtest for several engines.
+
+    Returns:
+        Engine → backtest metrics (see rolling_origin_backtest)
+    """
+    return {engine: rolling_origin_backtest(df, engine=engine, **backtest_kwargs) for engine in engines}
+
+
+def backtest_forecast_type(db_path: str, forecast_type: str, horizon: Optional[int] = None,
+                           folds: int = 3) -> Dict[str, Any]:
+    """Backtest a forecast type with its configured engine - runs inside a worker process.
+
+    Module-level so it can be pickled for ProcessPoolExecutor.
+
+    Args:
+        db_path: Path to SQLite database
+        forecast_type: Type of forecast
+        horizon: Periods per fold (default: the type's default horizon)
+        folds: Number of rolling origins
+
+    Raises:
+        ValueError: Invalid type or too little history (NO FALLBACK)
+    """
+    if forecast_type not in FORECAST_TYPES:
+        raise ValueError(f"Invalid forecast type: {forecast_type}")
+
+    definition = FORECAST_TYPES[forecast_type]
+    df = ForecastGenerator(db_path).get_training_data(forecast_type)
+
+    return rolling_origin_backtest(
+        df, engine=definition.engine, model_type=definition.model_type,
+        prophet_kwargs=definition.prophet_kwargs, horizon=horizon or definition.default_horizon_days,
+        folds=folds, freq=FREQUENCIES[definition.granularity]
+    )
+
+
+def score_predictions(predictions: List[Dict[str, Any]], actuals: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    """Score a stored forecast's predictions against the actuals that have arrived.
+
+    Args:
+        predictions: Forecast summary predictions (date, predicted, lower/upper_bound)
+        actuals: Observed series with ds, y columns
+
+    Returns:
+        Accuracy metrics plus the matched points, or None when no predicted
+        period has an actual yet
+    """
+    observed = {ts.isoformat(): float(y) for ts, y in zip(pd.to_datetime(actuals['ds']), actuals['y'])}
+    points = [
+        {'date': p['date'], 'actual': observed[p['date']], 'predicted': p['predicted'],
+         'lower_bound': p['lower_bound'], 'upper_bound': p['upper_bound']}
+        for p in predictions if p['date'] in observed
+    ]
+    if not points:
+        return None
+
+    metrics = accuracy_metrics(*(np.array([p[key] for p in points], dtype=float)
+                                 for key in ('actual', 'predicted', 'lower_bound', 'upper_bound')))
+    return {
+        **metrics,
+        'points_scored': len(points),
+        'points_predicted': len(predictions),
+        'points': points
+    }
@@ -1,13 +1,21 @@
 """Data aggregation for Prophet forecasting.
 
 Pulls historical data from SQLite stores and prepares time-series data
-in Prophet's required format (ds, y columns).
+in Prophet's required format (ds, y columns). Series are read from the
+hourly/daily rollups (see timeseries_rollup_store), so extraction cost
+scales with the number of buckets rather than the number of calls.
 """
 import sqlite3
 import pandas as pd
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 
+from src.storage.timeseries_rollup_store import TimeSeriesRollupStore
+
+
+# Forecast granularity → rollup granularity
+_ROLLUP_GRANULARITY = {'hourly': 'hour', 'daily': 'day', 'weekly': 'week'}
+
 
 class DataAggregator:
     """Aggregates historical data for Prophet time-series forecasting."""
@@ -22,6 +30,7 @@ class DataAggregator:
             raise ValueError("Database path cannot be empty")
 
         self.db_path = db_path
+        self.rollups = TimeSeriesRollupStore(db_path)
 
     def get_call_volume_data(self, granularity: str = 'daily',
                             start_date: Optional[str] = None,
@@ -36,57 +45,8 @@ class DataAggregator:
         Returns:
             DataFrame with columns 'ds' (datetime) and 'y' (call count)
         """
-        conn = sqlite3.connect(self.db_path)
-
-        try:
-            # Build query based on granularity
-            if granularity == 'hourly':
-                query = '''
-                    SELECT
-                        strftime('%Y-%m-%d %H:00:00', timestamp) as ds,
-                        COUNT(*) as y
-                    FROM transcripts
-                    WHERE 1=1
-                '''
-            elif granularity == 'daily':
-                query = '''
-                    SELECT
-                        DATE(timestamp) as ds,
-                        COUNT(*) as y
-                    FROM transcripts
-                    WHERE 1=1
-                '''
-            elif granularity == 'weekly':
-                query = '''
-                    SELECT
-                        DATE(timestamp, 'weekday 0', '-6 days') as ds,
-                        COUNT(*) as y
-                    FROM transcripts
-                    WHERE 1=1
-                '''
-            else:
-                raise ValueError(f"Invalid granularity: {granularity}")
-
-            # Add date filters
-            params = []
-            if start_date:
-                query += ' AND DATE(timestamp) >= ?'
-                params.append(start_date)
-            if end_date:
-                query += ' AND DATE(timestamp) <= ?'
-                params.append(end_date)
-
-            query += ' GROUP BY ds ORDER BY ds'
-
-            df = pd.read_sql_query(query, conn, params=params if params else None)
-
-            # Convert ds to datetime
-            df['ds'] = pd.to_datetime(df['ds'])
-
-            return df
-
-        finally:
-            conn.close()
+        return self._read_series('calls', 'count', granularity, ('hourly', 'daily', 'weekly'),
+                                 start_date=start_date, end_date=end_date)
 
     def get_intent_volume_data(self, intent: str, granularity: str = 'daily',
                                start_date: Optional[str] = None,
@@ -94,7 +54,7 @@ class DataAggregator:
         """Get volume for specific intent type.
 
         Args:
-            intent: Primary intent to filter
+            intent: Primary intent to filter (substring match)
             granularity: 'daily', 'weekly'
             start_date: Start date
             end_date: End date
@@ -102,48 +62,17 @@ class DataAggregator:
         Returns:
             DataFrame with ds, y columns
         """
-        conn = sqlite3.connect(self.db_path)
-
-        try:
-            if granularity == 'daily':
-                date_expr = 'DATE(created_at)'
-            elif granularity == 'weekly':
-                date_expr = "DATE(created_at, 'weekday 0', '-6 days')"
-            else:
-                raise ValueError(f"Invalid granularity: {granularity}")
-
-            query = f'''
-                SELECT
-                    {date_expr} as ds,
-                    COUNT(*) as y
-                FROM analysis
-                WHERE primary_intent LIKE ?
-            '''
-
-            params = [f'%{intent}%']
-
-            if start_date:
-                query += ' AND DATE(created_at) >= ?'
-                params.append(start_date)
-            if end_date:
-                query += ' AND DATE(created_at) <= ?'
-                params.append(end_date)
-
-            query += ' GROUP BY ds ORDER BY ds'
-
-            df = pd.read_sql_query(query, conn, params=params)
-            df['ds'] = pd.to_datetime(df['ds'])
-
-            return df
-
-        finally:
-            conn.close()
+        return self._read_series('analyses', 'count', granularity, ('daily', 'weekly'),
+                                 dimension='intent', dim_value=intent, dim_value_like=True,
+                                 start_date=start_date, end_date=end_date)
 
     def get_sentiment_score_data(self, granularity: str = 'daily',
                                  start_date: Optional[str] = None,
                                  end_date: Optional[str] = None) -> pd.DataFrame:
         """Get average sentiment score over time.
 
+        Sentiment labels are scored with SENTIMENT_SCORES (unknown labels 0.5).
+
         Args:
             granularity: 'daily', 'weekly'
             start_date: Start date
@@ -152,66 +81,8 @@ class DataAggregator:
         Returns:
             DataFrame with ds, y (average sentiment score)
         """
-        conn = sqlite3.connect(self.db_path)
-
-        try:
-            # Map sentiment to numeric score
-            sentiment_map = {
-                'Positive': 1.0,
-                'Neutral': 0.5,
-                'Negative': 0.0,
-                'Frustrated': 0.2,
-                'Angry': 0.0,
-                'Satisfied': 0.9
-            }
-
-            if granularity == 'daily':
-                date_expr = 'DATE(created_at)'
-            elif granularity == 'weekly':
-                date_expr = "DATE(created_at, 'weekday 0', '-6 days')"
-            else:
-                raise ValueError(f"Invalid granularity: {granularity}")
-
-            query = f'''
-                SELECT
-                    {date_expr} as ds,
-                    borrower_sentiment,
-                    COUNT(*) as count
-                FROM analysis
-                WHERE borrower_sentiment IS NOT NULL AND borrower_sentiment != ''
-            '''
-
-            params = []
-            if start_date:
-                query += ' AND DATE(created_at) >= ?'
-                params.append(start_date)
-            if end_date:
-                query += ' AND DATE(created_at) <= ?'
-                params.append(end_date)
-
-            query += ' GROUP BY ds, borrower_sentiment ORDER BY ds'
-
-            df = pd.read_sql_query(query, conn, params=params if params else None)
-
-            # Calculate weighted average
-            df['score'] = df['borrower_sentiment'].map(
-                lambda s: sentiment_map.get(s, 0.5)
-            )
-            df['weighted'] = df['score'] * df['count']
-
-            result = df.groupby('ds').agg({
-                'weighted': 'sum',
-                'count': 'sum'
-            }).reset_index()
-
-            result['y'] = result['weighted'] / result['count']
-            result = result[['ds', 'y']]
-            result['ds'] = pd.to_datetime(result['ds'])
-
-            return result
-
-        finally:
-            conn.close()
+        return self._read_series('sentiment', 'mean', granularity, ('daily', 'weekly'),
+                                 start_date=start_date, end_date=end_date)
 
     def get_risk_score_data(self, risk_type: str, granularity: str = 'daily',
                            start_date: Optional[str] = None,
@@ -227,57 +98,23 @@ class DataAggregator:
         Returns:
             DataFrame with ds, y (average risk score)
         """
-        conn = sqlite3.connect(self.db_path)
+        risk_column_map = {
+            'delinquency': 'delinquency_risk',
+            'churn': 'churn_risk',
+            'complaint': 'complaint_risk'
+        }
 
-        try:
-            risk_column_map = {
-                'delinquency': 'delinquency_risk',
-                'churn': 'churn_risk',
-                'complaint': 'complaint_risk'
-            }
-
-            if risk_type not in risk_column_map:
-                raise ValueError(f"Invalid risk_type: {risk_type}")
-
-            risk_column = risk_column_map[risk_type]
-
-            if granularity == 'daily':
-                date_expr = 'DATE(created_at)'
-            elif granularity == 'weekly':
-                date_expr = "DATE(created_at, 'weekday 0', '-6 days')"
-            else:
-                raise ValueError(f"Invalid granularity: {granularity}")
-
-            query = f'''
-                SELECT
-                    {date_expr} as ds,
-                    AVG({risk_column}) as y
-                FROM analysis
-                WHERE {risk_column} IS NOT NULL
-            '''
-
-            params = []
-            if start_date:
-                query += ' AND DATE(created_at) >= ?'
-                params.append(start_date)
-            if end_date:
-                query += ' AND DATE(created_at) <= ?'
-                params.append(end_date)
-
-            query += ' GROUP BY ds ORDER BY ds'
-
-            df = pd.read_sql_query(query, conn, params=params if params else None)
-            df['ds'] = pd.to_datetime(df['ds'])
+        if risk_type not in risk_column_map:
+            raise ValueError(f"Invalid risk_type: {risk_type}")
 
-            return df
-
-        finally:
-            conn.close()
+        return self._read_series(risk_column_map[risk_type], 'mean', granularity, ('daily', 'weekly'),
+                                 start_date=start_date, end_date=end_date)
 
     def get_advisor_performance_data(self, metric: str = 'empathy',
                                     granularity: str = 'daily',
                                     start_date: Optional[str] = None,
-                                    end_date: Optional[str] = None) -> pd.DataFrame:
+                                    end_date: Optional[str] = None,
+                                    advisor_id: Optional[str] = None) -> pd.DataFrame:
         """Get average advisor performance metric over time.
 
         Args:
@@ -285,56 +122,23 @@ class DataAggregator:
             granularity: 'daily', 'weekly'
             start_date: Start date
             end_date: End date
+            advisor_id: Restrict to one advisor's calls (all advisors when None)
 
         Returns:
             DataFrame with ds, y (average metric score)
         """
-        conn = sqlite3.connect(self.db_path)
-
-        try:
-            metric_column_map = {
-                'empathy': 'empathy_score',
-                'compliance': 'compliance_adherence',
-                'solution_effectiveness': 'solution_effectiveness'
-            }
-
-            if metric not in metric_column_map:
-                raise ValueError(f"Invalid metric: {metric}")
-
-            metric_column = metric_column_map[metric]
-
-            if granularity == 'daily':
-                date_expr = 'DATE(created_at)'
-            elif granularity == 'weekly':
-                date_expr = "DATE(created_at, 'weekday 0', '-6 days')"
-            else:
-                raise ValueError(f"Invalid granularity: {granularity}")
+        metric_column_map = {
+            'empathy': 'empathy_score',
+            'compliance': 'compliance_adherence',
+            'solution_effectiveness': 'solution_effectiveness'
+        }
 
-            query = f'''
-                SELECT
-                    {date_expr} as ds,
-                    AVG({metric_column}) as y
-                FROM analysis
-                WHERE {metric_column} IS NOT NULL
-            '''
-
-            params = []
-            if start_date:
-                query += ' AND DATE(created_at) >= ?'
-                params.append(start_date)
-            if end_date:
-                query += ' AND DATE(created_at) <= ?'
-                params.append(end_date)
-
-            query += ' GROUP BY ds ORDER BY ds'
+        if metric not in metric_column_map:
+            raise ValueError(f"Invalid metric: {metric}")
 
-            df = pd.read_sql_query(query, conn, params=params if params else None)
-            df['ds'] = pd.to_datetime(df['ds'])
-
-            return df
-
-        finally:
-            conn.close()
+        return self._read_series(metric_column_map[metric], 'mean', granularity, ('daily', 'weekly'),
+                                 dimension='advisor' if advisor_id else '', dim_value=advisor_id,
+                                 start_date=start_date, end_date=end_date)
 
     def get_escalation_rate_data(self, granularity: str = 'daily',
                                  start_date: Optional[str] = None,
@@ -349,41 +153,106 @@ class DataAggregator:
         Returns:
             DataFrame with ds, y (escalation rate 0-1)
         """
-        conn = sqlite3.connect(self.db_path)
+        return self._read_series('escalation', 'mean', granularity, ('daily', 'weekly'),
+                                 start_date=start_date, end_date=end_date)
 
-        try:
-            if granularity == 'daily':
-                date_expr = 'DATE(created_at)'
-            elif granularity == 'weekly':
-                date_expr = "DATE(created_at, 'weekday 0', '-6 days')"
-            else:
-                raise ValueError(f"Invalid granularity: {granularity}")
-
-            query = f'''
-                SELECT
-                    {date_expr} as ds,
-                    AVG(CASE WHEN escalation_needed = 1 THEN 1.0 ELSE 0.0 END) as y
-                FROM analysis
-                WHERE 1=1
-            '''
+    def get_grouped_volume_data(self, metric: str, dimension: str, granularity: str = 'daily',
+                                start_date: Optional[str] = None,
+                                end_date: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Get a volume series for every intent or advisor in one grouped read.
 
-            params = []
-            if start_date:
-                query += ' AND DATE(created_at) >= ?'
-                params.append(start_date)
-            if end_date:
-                query += ' AND DATE(created_at) <= ?'
-                params.append(end_date)
+        Series share one time index: buckets without activity are zero-filled
+        over the overall date range, so the children of a hierarchy add up to
+        its total bucket by bucket.
 
-            query += ' GROUP BY ds ORDER BY ds'
+        Args:
+            metric: Count metric - 'calls' (transcripts) or 'analyses'
+            dimension: 'intent' or 'advisor'
+            granularity: 'daily', 'weekly'
+            start_date: Start date
+            end_date: End date
 
-            df = pd.read_sql_query(query, conn, params=params if params else None)
-            df['ds'] = pd.to_datetime(df['ds'])
+        Returns:
+            Dimension value → DataFrame with ds, y columns
+        """
+        if granularity not in ('daily', 'weekly'):
+            raise ValueError(f"Invalid granularity: {granularity}")
+
+        grouped = self.rollups.get_grouped_series(
+            metric, dimension, granularity=_ROLLUP_GRANULARITY[granularity], aggregate='count',
+            start_date=start_date, end_date=end_date
+        )
+        if not grouped:
+            return {}
+
+        frames = {
+            key: pd.Series({pd.Timestamp(ds): y for ds, y in rows}, dtype=float)
+            for key, rows in grouped.items()
+        }
+        start = min(series.index.min() for series in frames.values())
+        end = max(series.index.max() for series in frames.values())
+        index = pd.date_range(start, end, freq='D' if granularity == 'daily' else '7D')
+
+        return {
+            key: pd.DataFrame({'ds': index, 'y': series.reindex(index, fill_value=0.0).values})
+            for key, series in frames.items()
+        }
+
+    def get_all_series(self, metrics: Dict[str, str], granularity: str = 'daily',
+                       start_date: Optional[str] = None,
+                       end_date: Optional[str] = None) -> pd.DataFrame:
+        """Get many metric series in a single read, aligned on one time index.
+
+        Used to load every forecast type's training data at once instead of
+        one query per type.
 
-            return df
+        Args:
+            metrics: Rollup metric → aggregate ('count' or 'mean'), e.g.
+                {'calls': 'count', 'sentiment': 'mean'}
+            granularity: 'hourly', 'daily', 'weekly'
+            start_date: Start date
+            end_date: End date
 
-        finally:
-            conn.close()
+        Returns:
+            DataFrame indexed by ds (sorted union of all buckets) with one
+            column per metric; NaN where a metric has no data in a bucket
+        """
+        if granularity not in _ROLLUP_GRANULARITY:
+            raise ValueError(f"Invalid granularity: {granularity}")
+
+        series = self.rollups.get_multi_series(
+            metrics, granularity=_ROLLUP_GRANULARITY[granularity],
+            start_date=start_date, end_date=end_date
+        )
+
+        frame = pd.DataFrame({
+            metric: pd.Series({pd.Timestamp(ds): y for ds, y in series.get(metric, [])}, dtype=float)
+            for metric in metrics
+        })
+        frame.index = pd.DatetimeIndex(frame.index, name='ds')
+        return frame.sort_index()
+
+    def _read_series(self, metric: str, aggregate: str, granularity: str, allowed: Tuple[str, ...],
+                     dimension: str = '', dim_value: Optional[str] = None, dim_value_like: bool = False,
+                     start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        """Read a metric series from the rollups as a Prophet (ds, y) frame.
+
+        Raises:
+            ValueError: If granularity not supported for the series (NO FALLBACK)
+        """
+        if granularity not in allowed:
+            raise ValueError(f"Invalid granularity: {granularity}")
+
+        rows = self.rollups.get_series(
+            metric, granularity=_ROLLUP_GRANULARITY[granularity], aggregate=aggregate,
+            dimension=dimension, dim_value=dim_value, dim_value_like=dim_value_like,
+            start_date=start_date, end_date=end_date
+        )
+
+        df = pd.DataFrame(rows, columns=['ds', 'y'])
+        df['ds'] = pd.to_datetime(df['ds'])
+
+        return df
 
     def check_data_sufficiency(self, min_days: int = 14) -> Dict[str, Any]:
         """Check if there's sufficient data for forecasting.
@@ -394,51 +263,35 @@ class DataAggregator:
         Returns:
             Dict with sufficiency status and details
         """
-        conn = sqlite3.connect(self.db_path)
+        # Check transcript data (from rollups)
+        coverage = self.rollups.get_coverage('calls')
 
-        try:
-            # Check transcript data
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT
-                    MIN(DATE(timestamp)) as earliest,
-                    MAX(DATE(timestamp)) as latest,
-                    COUNT(*) as total,
-                    COUNT(DISTINCT DATE(timestamp)) as days_of_data
-                FROM transcripts
-            ''')
-            row = cursor.fetchone()
-
-            if not row or row[3] is None:
-                return {
-                    'sufficient': False,
-                    'reason': 'No transcript data found',
-                    'days_of_data': 0,
-                    'min_required': min_days
-                }
-
-            days_of_data = row[3]
-            total_transcripts = row[2]
+        if not coverage['days_of_data']:
+            return {
+                'sufficient': False,
+                'reason': 'No transcript data found',
+                'days_of_data': 0,
+                'min_required': min_days
+            }
 
-            # Check analysis data
-            cursor.execute('SELECT COUNT(*) FROM analysis')
-            analysis_count = cursor.fetchone()[0]
+        days_of_data = coverage['days_of_data']
+        total_transcripts = coverage['total']
 
-            sufficient = days_of_data >= min_days and total_transcripts >= 10
+        # Check analysis data
+        analysis_count = self.rollups.get_coverage('analyses')['total']
 
-            return {
-                'sufficient': sufficient,
-                'days_of_data': days_of_data,
-                'min_required': min_days,
-                'total_transcripts': total_transcripts,
-                'total_analyses': analysis_count,
-                'earliest_date': row[0],
-                'latest_date': row[1],
-                'recommendation': self._get_recommendation(days_of_data, min_days)
-            }
+        sufficient = days_of_data >= min_days and total_transcripts >= 10
 
-        finally:
-            conn.close()
+        return {
+            'sufficient': sufficient,
+            'days_of_data': days_of_data,
+            'min_required': min_days,
+            'total_transcripts': total_transcripts,
+            'total_analyses': analysis_count,
+            'earliest_date': coverage['earliest_date'],
+            'latest_date': coverage['latest_date'],
+            'recommendation': self._get_recommendation(days_of_data, min_days)
+        }
 
     def _get_recommendation(self, days_of_data: int, min_required: int) -> str:
         """Get recommendation based on data availability."""
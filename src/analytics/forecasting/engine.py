@@ -0,0 +1,145 @@
+"""Forecasting engine interface.
+
+Every engine trains on a Prophet-style frame (``ds``, ``y``) and predicts a
+frame with ``ds``, ``yhat``, ``yhat_lower``, ``yhat_upper`` and ``trend``
+covering the history followed by the forecast periods, so summaries,
+registry persistence and reconciliation work the same for all engines.
+"""
+import logging
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+class ForecastEngine(ABC):
+    """Base class for forecasting engines (Prophet, ETS)."""
+
+    name: str = ''
+
+    model = None
+    forecast_result: Optional[pd.DataFrame] = None
+
+    @abstractmethod
+    def train(self, df: pd.DataFrame, **fit_kwargs) -> 'ForecastEngine':
+        """Fit the model on a DataFrame with 'ds' and 'y' columns.
+
+        ``init`` in fit_kwargs carries parameters from ``warm_start_params``
+        of a previous fit of the same engine.
+        """
+
+    @abstractmethod
+    def predict(self, periods: int, freq: str = 'D') -> pd.DataFrame:
+        """Predict the history and ``periods`` future periods."""
+
+    @abstractmethod
+    def warm_start_params(self) -> Dict[str, Any]:
+        """Fitted parameters to pass as ``init`` to a later refit."""
+
+    @abstractmethod
+    def to_json(self) -> str:
+        """Serialize the fitted model."""
+
+    @classmethod
+    @abstractmethod
+    def from_json(cls, model_json: str, **model_kwargs) -> 'ForecastEngine':
+        """Restore a fitted model serialized with ``to_json``."""
+
+    @property
+    def model_kwargs(self) -> Dict[str, Any]:
+        """Configuration to pass to ``from_json`` alongside the serialized model."""
+        return {}
+
+    def summary_metadata(self) -> Dict[str, Any]:
+        """Engine description included in forecast summaries."""
+        return {'model_type': self.name}
+
+    def get_forecast_summary(self, forecast: pd.DataFrame,
+                            periods: int) -> Dict[str, Any]:
+        """Extract forecast summary from prediction results.
+
+        Args:
+            forecast: Forecast DataFrame from ``predict``
+            periods: Number of future periods
+
+        Returns:
+            Forecast summary with predictions and confidence intervals
+        """
+        if forecast is None or forecast.empty:
+            raise ValueError("Forecast is empty")
+
+        try:
+            # Get only future predictions (last N periods)
+            future_forecast = forecast.tail(periods)
+
+            predictions = []
+            for _, row in future_forecast.iterrows():
+                predictions.append({
+                    'date': row['ds'].isoformat(),
+                    'predicted': float(row['yhat']),
+                    'lower_bound': float(row['yhat_lower']),
+                    'upper_bound': float(row['yhat_upper']),
+                    'confidence_interval': float(row['yhat_upper'] - row['yhat_lower'])
+                })
+
+            # Calculate summary statistics
+            avg_predicted = future_forecast['yhat'].mean()
+            min_predicted = future_forecast['yhat'].min()
+            max_predicted = future_forecast['yhat'].max()
+
+            return {
+                'predictions': predictions,
+                'summary': {
+                    'average_predicted': float(avg_predicted),
+                    'min_predicted': float(min_predicted),
+                    'max_predicted': float(max_predicted),
+                    'total_periods': periods,
+                    'prediction_start': predictions[0]['date'],
+                    'prediction_end': predictions[-1]['date']
+                },
+                'metadata': self.summary_metadata()
+            }
+
+        except Exception as e:
+            raise Exception(f"Failed to extract forecast summary: {str(e)}")
+
+    def get_component_analysis(self) -> Optional[Dict[str, Any]]:
+        """Get trend and seasonality components.
+
+        Returns:
+            Component analysis or None if not available
+        """
+        if self.forecast_result is None:
+            return None
+
+        try:
+            components = {}
+
+            # Extract trend
+            if 'trend' in self.forecast_result:
+                components['trend'] = {
+                    'average': float(self.forecast_result['trend'].mean()),
+                    'direction': 'increasing' if self.forecast_result['trend'].iloc[-1] > self.forecast_result['trend'].iloc[0] else 'decreasing'
+                }
+
+            # Extract weekly seasonality if available
+            if 'weekly' in self.forecast_result:
+                components['weekly_seasonality'] = {
+                    'peak_day': int(self.forecast_result['weekly'].idxmax() % 7),
+                    'low_day': int(self.forecast_result['weekly'].idxmin() % 7)
+                }
+
+            # Extract yearly seasonality if available
+            if 'yearly' in self.forecast_result:
+                components['yearly_seasonality'] = {
+                    'amplitude': float(self.forecast_result['yearly'].max() - self.forecast_result['yearly'].min())
+                }
+
+            return components if components else None
+
+        except Exception as e:
+            logger.warning(f"Component analysis failed: {str(e)}")
+            return None
@@ -0,0 +1,374 @@
+"""Vectorized exponential smoothing (Holt-Winters / ETS) engine.
+
+Additive-error ETS with additive trend and seasonality, implemented in
+NumPy. Smoothing parameters are chosen by a grid search that runs the
+recursions for every candidate at once - and for many aligned series at
+once - as 2-D arrays, so a fit takes milliseconds instead of a Stan
+optimization. Importing this engine does not import Prophet.
+"""
+import json
+import logging
+import itertools
+import warnings
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .engine import ForecastEngine
+
+
+logger = logging.getLogger(__name__)
+
+# model_type → season length in periods
+SEASON_LENGTHS = {'daily': 7, 'hourly': 24, 'weekly': 52}
+
+# 80% prediction intervals, matching Prophet's default interval_width
+INTERVAL_Z = 1.2816
+
+ALPHAS = (0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+BETAS = (0.0, 0.01, 0.05, 0.1, 0.2)
+GAMMAS = (0.01, 0.05, 0.1, 0.2, 0.3, 0.5)
+
+
+def _regular_grid(ds: pd.Series) -> pd.DatetimeIndex:
+    """Evenly spaced index from the first to the last timestamp (median step)."""
+    ds = pd.DatetimeIndex(ds)
+    if len(ds) < 2:
+        raise ValueError("Need at least 2 data points to train")
+    step = pd.Series(ds).diff().median()
+    return pd.date_range(ds[0], ds[-1], freq=step)
+
+
+def _initial_states(Y: np.ndarray, m: int, trend: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Classical initial level, trend and seasonal states for each series."""
+    k = Y.shape[0]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # All-missing first season
+        if m > 1:
+            level = np.nanmean(Y[:, :m], axis=1)
+            slope = (np.nanmean(Y[:, m:2 * m], axis=1) - level) / m if trend else np.zeros(k)
+            season = Y[:, :m] - level[:, None]
+        else:
+            level = np.nanmean(Y[:, :2], axis=1)
+            slope = (Y[:, 1] - Y[:, 0]) if trend else np.zeros(k)
+            season = np.zeros((k, 1))
+    return np.nan_to_num(level), np.nan_to_num(slope), np.nan_to_num(season)
+
+
+def _run_recursions(Y: np.ndarray, params: np.ndarray, m: int, trend: bool,
+                    keep_path: bool = False) -> Dict[str, np.ndarray]:
+    """Run additive Holt-Winters for k series × g parameter sets at once.
+
+    Missing observations (NaN) are replaced by their one-step forecast, so
+    they neither update the states nor count towards the error.
+
+    Args:
+        Y: Observations, shape (k, T)
+        params: (alpha, beta, gamma) per series and candidate, shape (k, g, 3)
+        m: Season length (1 = no seasonality)
+        trend: Whether the model has a trend component
+        keep_path: Also return the one-step forecasts and components over time
+
+    Returns:
+        sse (k, g), n_obs (k,), final level/slope (k, g) and season (k, g, m),
+        plus fitted/trend/season_path (k, g, T) when keep_path
+    """
+    k, T = Y.shape
+    g = params.shape[1]
+    alpha, beta, gamma = params[..., 0], params[..., 1], params[..., 2]
+
+    level0, slope0, season0 = _initial_states(Y, m, trend)
+    level = np.repeat(level0[:, None], g, axis=1)
+    slope = np.repeat(slope0[:, None], g, axis=1)
+    season = np.repeat(season0[:, None, :], g, axis=1)
+    sse = np.zeros((k, g))
+
+    if keep_path:
+        fitted = np.empty((k, g, T))
+        trend_path = np.empty((k, g, T))
+        season_path = np.empty((k, g, T))
+
+    for t in range(T):
+        j = t % m
+        s = season[:, :, j]
+        y_hat = level + slope + s
+        y = Y[:, t][:, None]
+        y = np.where(np.isnan(y), y_hat, y)
+
+        sse += (y - y_hat) ** 2
+        new_level = alpha * (y - s) + (1 - alpha) * (level + slope)
+        slope = beta * (new_level - level) + (1 - beta) * slope
+        season[:, :, j] = gamma * (y - new_level) + (1 - gamma) * s
+
+        if keep_path:
+            fitted[:, :, t] = y_hat
+            trend_path[:, :, t] = level + slope
+            season_path[:, :, t] = s
+        level = new_level
+
+    result = {
+        'sse': sse,
+        'n_obs': (~np.isnan(Y)).sum(axis=1),
+        'level': level,
+        'slope': slope,
+        'season': season
+    }
+    if keep_path:
+        result.update({'fitted': fitted, 'trend': trend_path, 'season_path': season_path})
+    return result
+
+
+def fit_ets_batch(Y: np.ndarray, season_length: int = 7, trend: bool = True,
+                  init: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+    """Fit additive ETS to many aligned series at once.
+
+    Args:
+        Y: Observations, shape (k, T), NaN for missing periods
+        season_length: Season length in periods (seasonality is dropped when
+            there are fewer than two full seasons)
+        trend: Whether to fit a trend component
+        init: Smoothing parameters from a previous fit - skips the grid search
+
+    Returns:
+        Fitted model state per series
+    """
+    Y = np.asarray(Y, dtype=float)
+    if Y.ndim != 2 or Y.shape[1] < 2:
+        raise ValueError("Need at least 2 data points to train")
+
+    k, T = Y.shape
+    seasonal = season_length > 1 and T >= 2 * season_length
+    m = season_length if seasonal else 1
+
+    if init is not None:
+        grid = np.array([[init['alpha'], init['beta'], init['gamma']]])
+    else:
+        grid = np.array(list(itertools.product(ALPHAS, BETAS if trend else (0.0,), GAMMAS if seasonal else (0.0,))))
+
+    search = _run_recursions(Y, np.broadcast_to(grid, (k,) + grid.shape), m, trend)
+    best = grid[np.argmin(search['sse'], axis=1)]
+
+    final = _run_recursions(Y, best[:, None, :], m, trend, keep_path=True)
+    n_params = 1 + int(trend) + int(seasonal)
+
+    return [
+        {
+            'alpha': float(best[i, 0]),
+            'beta': float(best[i, 1]),
+            'gamma': float(best[i, 2]),
+            'season_length': m,
+            'trend': trend,
+            'n_periods': T,
+            'sigma2': float(final['sse'][i, 0] / max(final['n_obs'][i] - n_params, 1)),
+            'level': float(final['level'][i, 0]),
+            'slope': float(final['slope'][i, 0]),
+            'season': final['season'][i, 0].tolist(),
+            'fitted': final['fitted'][i, 0],
+            'trend_path': final['trend'][i, 0],
+            'season_path': final['season_path'][i, 0]
+        }
+        for i in range(k)
+    ]
+
+
+class ETSService(ForecastEngine):
+    """NumPy Holt-Winters engine with the ForecastEngine interface."""
+
+    name = 'ets'
+
+    def __init__(self, season_length: int = 7, trend: bool = True):
+        """Initialize ETS service.
+
+        Args:
+            season_length: Season length in periods (7 = weekly for daily data)
+            trend: Whether to fit a trend component
+        """
+        if season_length < 1:
+            raise ValueError("season_length must be positive")
+
+        self.season_length = season_length
+        self.trend = trend
+        self.model = None
+        self.forecast_result = None
+
+    @classmethod
+    def for_model_type(cls, model_type: str = 'daily') -> 'ETSService':
+        """ETS service with the season length of a model type ('daily', 'hourly', 'weekly')."""
+        if model_type not in SEASON_LENGTHS:
+            raise ValueError(f"Invalid model type for ETS: {model_type}")
+        return cls(season_length=SEASON_LENGTHS[model_type])
+
+    @property
+    def model_kwargs(self) -> Dict[str, Any]:
+        return {'season_length': self.season_length, 'trend': self.trend}
+
+    def train(self, df: pd.DataFrame, init: Optional[Dict[str, float]] = None, **fit_kwargs) -> 'ETSService':
+        """Fit on a DataFrame with 'ds' and 'y' columns.
+
+        Args:
+            df: Historical data (gaps in the time index are treated as missing)
+            init: Smoothing parameters from ``warm_start_params`` - reused
+                without a grid search
+
+        Returns:
+            self for method chaining
+
+        Raises:
+            ValueError: If data is invalid (NO FALLBACK)
+        """
+        if df is None or df.empty:
+            raise ValueError("Cannot train on empty data")
+
+        if 'ds' not in df.columns or 'y' not in df.columns:
+            raise ValueError("DataFrame must have 'ds' and 'y' columns")
+
+        if len(df) < 2:
+            raise ValueError("Need at least 2 data points to train")
+
+        history = df[['ds', 'y']].assign(ds=pd.to_datetime(df['ds'])).sort_values('ds')
+        grid = _regular_grid(history['ds'])
+        y = history.set_index('ds')['y'].astype(float).reindex(grid).values
+
+        logger.info(f"Training ETS model on {len(df)} data points")
+        self._set_fit(fit_ets_batch(y[None, :], self.season_length, self.trend, init)[0], grid, history['ds'])
+        return self
+
+    @classmethod
+    def fit_many(cls, dfs: List[pd.DataFrame], season_length: int = 7,
+                 trend: bool = True) -> List['ETSService']:
+        """Fit many series sharing one time index in a single vectorized pass.
+
+        Raises:
+            ValueError: If the series are not aligned (NO FALLBACK)
+        """
+        if not dfs:
+            raise ValueError("At least one series is required")
+
+        ds = pd.to_datetime(dfs[0]['ds']).reset_index(drop=True)
+        if any(not pd.to_datetime(df['ds']).reset_index(drop=True).equals(ds) for df in dfs[1:]):
+            raise ValueError("Series must share the same ds index")
+
+        grid = _regular_grid(ds)
+        Y = np.vstack([df.set_index(pd.to_datetime(df['ds']))['y'].astype(float).reindex(grid).values
+                       for df in dfs])
+
+        services = []
+        for fit in fit_ets_batch(Y, season_length, trend):
+            service = cls(season_length=season_length, trend=trend)
+            service._set_fit(fit, grid, ds)
+            services.append(service)
+        return services
+
+    def _set_fit(self, fit: Dict[str, Any], grid: pd.DatetimeIndex, observed: pd.Series) -> None:
+        """Keep the fitted state plus in-sample results at the observed timestamps."""
+        in_sample = pd.DataFrame({
+            'ds': grid,
+            'yhat': fit.pop('fitted'),
+            'trend': fit.pop('trend_path'),
+            'season': fit.pop('season_path')
+        })
+        in_sample = in_sample[in_sample['ds'].isin(pd.DatetimeIndex(observed))]
+
+        self.model = {
+            **fit,
+            'last_ds': grid[-1].isoformat(),
+            'history': {
+                'ds': [ts.isoformat() for ts in in_sample['ds']],
+                'yhat': in_sample['yhat'].tolist(),
+                'trend': in_sample['trend'].tolist(),
+                'season': in_sample['season'].tolist()
+            }
+        }
+
+    def warm_start_params(self) -> Dict[str, Any]:
+        """Fitted smoothing parameters, passed as ``init`` to skip the grid search.
+
+        Raises:
+            ValueError: If model not trained (NO FALLBACK)
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before extracting parameters")
+        return {name: self.model[name] for name in ('alpha', 'beta', 'gamma')}
+
+    def to_json(self) -> str:
+        """Serialize the fitted model.
+
+        Raises:
+            ValueError: If model not trained (NO FALLBACK)
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before serialization")
+        return json.dumps(self.model)
+
+    @classmethod
+    def from_json(cls, model_json: str, **model_kwargs) -> 'ETSService':
+        """Restore a fitted model serialized with ``to_json`` (configuration included)."""
+        model = json.loads(model_json)
+        service = cls(season_length=model['season_length'], trend=model['trend'])
+        service.model = model
+        return service
+
+    def predict(self, periods: int, freq: str = 'D') -> pd.DataFrame:
+        """Predict the history and ``periods`` future periods.
+
+        Args:
+            periods: Number of periods to forecast
+            freq: Frequency ('D'=daily, 'H'=hourly, 'W'=weekly)
+
+        Returns:
+            DataFrame with ds, yhat, yhat_lower, yhat_upper, trend (and weekly
+            for weekly seasonality)
+
+        Raises:
+            ValueError: If model not trained (NO FALLBACK)
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before prediction")
+
+        if periods <= 0:
+            raise ValueError("periods must be positive")
+
+        model = self.model
+        m = model['season_length']
+        last_ds = pd.Timestamp(model['last_ds'])
+        future_ds = pd.date_range(start=last_ds, periods=periods + 1, freq=freq)
+        future_ds = future_ds[future_ds > last_ds][:periods]
+
+        h = np.arange(1, len(future_ds) + 1)
+        season = np.asarray(model['season'])
+        future_season = season[(model['n_periods'] + h - 1) % m]
+        future_trend = model['level'] + h * model['slope']
+
+        # h-step variance of additive ETS: sigma² (1 + Σ_{j<h} c_j²)
+        j = np.arange(1, len(h))
+        c = model['alpha'] * (1 + model['beta'] * j)
+        if m > 1:
+            c = c + model['gamma'] * (1 - model['alpha']) * (j % m == 0)
+        variance = model['sigma2'] * (1 + np.concatenate([[0.0], np.cumsum(c ** 2)]))
+
+        history = model['history']
+        history_yhat = np.asarray(history['yhat'])
+        width = INTERVAL_Z * np.sqrt(model['sigma2'])
+        future_yhat = future_trend + future_season
+        future_width = INTERVAL_Z * np.sqrt(variance)
+
+        forecast = pd.DataFrame({
+            'ds': list(pd.to_datetime(history['ds'])) + list(future_ds),
+            'yhat': np.concatenate([history_yhat, future_yhat]),
+            'yhat_lower': np.concatenate([history_yhat - width, future_yhat - future_width]),
+            'yhat_upper': np.concatenate([history_yhat + width, future_yhat + future_width]),
+            'trend': np.concatenate([history['trend'], future_trend])
+        })
+        if m == 7:
+            forecast['weekly'] = np.concatenate([history['season'], future_season])
+
+        logger.info(f"Generating {periods} period ETS forecast")
+        self.forecast_result = forecast
+        return forecast
+
+    def summary_metadata(self) -> Dict[str, Any]:
+        metadata = {'model_type': 'ETS', 'seasonality_mode': 'additive', 'season_length': self.season_length}
+        if self.model is not None:
+            metadata.update({name: self.model[name] for name in ('alpha', 'beta', 'gamma')})
+        return metadata
@@ -1,14 +1,31 @@
 """Forecast type definitions.
 
-Defines available forecast types with their data sources, Prophet configs,
-and output formats.
+Defines available forecast types with their data sources, engine and
+Prophet configs, and output formats.
 """
-from typing import Dict, Any, List, Optional
+import hashlib
+import json
+import logging
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 import pandas as pd
 
 from .data_aggregator import DataAggregator
-from .prophet_service import ProphetService, generate_forecast
+from .engine import ForecastEngine
+from .prophet_service import create_model_service, summarize_forecast
+from src.storage.forecast_model_store import ForecastModelStore, model_key
+
+
+logger = logging.getLogger(__name__)
+
+# Granularity → pandas frequency of the forecast periods
+FREQUENCIES = {'hourly': 'H', 'daily': 'D', 'weekly': 'W'}
+
+
+def series_hash(df: pd.DataFrame) -> str:
+    """Hash of a training series' values (any changed bucket changes it)."""
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=False).values.tobytes()).hexdigest()
 
 
 @dataclass
@@ -21,6 +38,10 @@ class ForecastDefinition:
     default_horizon_days: int
     model_type: str  # 'daily', 'weekly', 'hourly'
     prophet_kwargs: Dict[str, Any]
+    metric: str  # Rollup metric the series is read from (see timeseries_rollup_store)
+    aggregate: str = 'mean'  # 'count' or 'mean' per bucket
+    data_sources: Tuple[str, ...] = ('analysis',)  # Tables the series is built from (cache watermark)
+    engine: str = 'prophet'  # 'prophet' or 'ets' (see prophet_service.ENGINES)
 
 
 # Define all available forecast types
@@ -36,7 +57,10 @@ FORECAST_TYPES = {
             'daily_seasonality': False,
             'weekly_seasonality': True,
             'yearly_seasonality': False
-        }
+        },
+        metric='calls',
+        aggregate='count',
+        data_sources=('transcripts',)
     ),
     'call_volume_hourly': ForecastDefinition(
         name='call_volume_hourly',
@@ -49,7 +73,11 @@ FORECAST_TYPES = {
             'daily_seasonality': True,
             'weekly_seasonality': True,
             'yearly_seasonality': False
-        }
+        },
+        metric='calls',
+        aggregate='count',
+        data_sources=('transcripts',),
+        engine='ets'
     ),
     'sentiment_trend': ForecastDefinition(
         name='sentiment_trend',
@@ -61,7 +89,9 @@ FORECAST_TYPES = {
         prophet_kwargs={
             'seasonality_mode': 'additive',
             'changepoint_prior_scale': 0.05
-        }
+        },
+        metric='sentiment',
+        engine='ets'
     ),
     'delinquency_risk': ForecastDefinition(
         name='delinquency_risk',
@@ -73,7 +103,8 @@ FORECAST_TYPES = {
         prophet_kwargs={
             'seasonality_mode': 'additive',
             'changepoint_prior_scale': 0.1
-        }
+        },
+        metric='delinquency_risk'
     ),
     'churn_risk': ForecastDefinition(
         name='churn_risk',
@@ -85,7 +116,8 @@ FORECAST_TYPES = {
         prophet_kwargs={
             'seasonality_mode': 'additive',
             'changepoint_prior_scale': 0.1
-        }
+        },
+        metric='churn_risk'
     ),
     'escalation_rate': ForecastDefinition(
         name='escalation_rate',
@@ -96,7 +128,9 @@ FORECAST_TYPES = {
         model_type='daily',
         prophet_kwargs={
             'seasonality_mode': 'additive'
-        }
+        },
+        metric='escalation',
+        engine='ets'
     ),
     'advisor_empathy': ForecastDefinition(
         name='advisor_empathy',
@@ -108,7 +142,8 @@ FORECAST_TYPES = {
         prophet_kwargs={
             'seasonality_mode': 'additive',
             'changepoint_prior_scale': 0.05
-        }
+        },
+        metric='empathy_score'
     ),
     'advisor_compliance': ForecastDefinition(
         name='advisor_compliance',
@@ -120,7 +155,8 @@ FORECAST_TYPES = {
         prophet_kwargs={
             'seasonality_mode': 'additive',
             'changepoint_prior_scale': 0.05
-        }
+        },
+        metric='compliance_adherence'
     )
 }
 
@@ -135,6 +171,7 @@ class ForecastGenerator:
             db_path: Path to SQLite database
         """
         self.data_aggregator = DataAggregator(db_path)
+        self.model_store = ForecastModelStore(db_path)
 
     def get_available_types(self) -> List[Dict[str, Any]]:
         """Get list of available forecast types.
@@ -148,7 +185,8 @@ class ForecastGenerator:
                 'description': ft.description,
                 'granularity': ft.granularity,
                 'min_data_days': ft.min_data_days,
-                'default_horizon_days': ft.default_horizon_days
+                'default_horizon_days': ft.default_horizon_days,
+                'engine': ft.engine
             }
             for ft in FORECAST_TYPES.values()
         ]
@@ -186,7 +224,8 @@ class ForecastGenerator:
         }
 
     def generate(self, forecast_type: str, horizon_days: Optional[int] = None,
-                start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, Any]:
+                start_date: Optional[str] = None, end_date: Optional[str] = None,
+                data: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """Generate forecast of specified type.
 
         Args:
@@ -194,6 +233,8 @@ class ForecastGenerator:
             horizon_days: Forecast horizon (default from definition)
             start_date: Training data start date
             end_date: Training data end date
+            data: Preloaded training data (from load_training_data); read
+                from the rollups when None
 
         Returns:
             Forecast results
@@ -211,7 +252,7 @@ class ForecastGenerator:
             horizon_days = definition.default_horizon_days
 
         # Get historical data based on forecast type
-        df = self._get_data_for_type(forecast_type, definition, start_date, end_date)
+        df = data if data is not None else self._get_data_for_type(forecast_type, definition, start_date, end_date)
 
         if df is None or df.empty:
             raise ValueError(f"No data available for {forecast_type}")
@@ -220,16 +261,10 @@ class ForecastGenerator:
             raise ValueError(f"Insufficient data points for {forecast_type}. Need at least 2, got {len(df)}")
 
         # Generate forecast
-        freq_map = {'hourly': 'H', 'daily': 'D', 'weekly': 'W'}
-        freq = freq_map[definition.granularity]
-
-        forecast_result = generate_forecast(
-            df=df,
-            periods=horizon_days,
-            freq=freq,
-            model_type=definition.model_type,
-            **definition.prophet_kwargs
-        )
+        freq = FREQUENCIES[definition.granularity]
+
+        service, fit_info = self._fit_or_reuse(forecast_type, definition, df, start_date, end_date)
+        forecast_result = summarize_forecast(service, horizon_days, freq)
 
         # Add metadata
         forecast_result['metadata'].update({
@@ -237,71 +272,161 @@ class ForecastGenerator:
             'granularity': definition.granularity,
             'data_points_used': len(df),
             'training_start': df['ds'].min().isoformat(),
-            'training_end': df['ds'].max().isoformat()
+            'training_end': df['ds'].max().isoformat(),
+            **fit_info
         })
 
         return forecast_result
 
-    def _get_data_for_type(self, forecast_type: str, definition: ForecastDefinition,
-                          start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
-        """Get appropriate data for forecast type.
+    def _fit_or_reuse(self, forecast_type: str, definition: ForecastDefinition, df: pd.DataFrame,
+                      start_date: Optional[str], end_date: Optional[str]) -> Tuple[ForecastEngine, Dict[str, Any]]:
+        """Get a fitted model for the data, fitting only as much as needed.
 
-        Args:
-            forecast_type: Forecast type
-            definition: Forecast definition
-            start_date: Start date filter
-            end_date: End date filter
+        - reused: the registry model was fitted on exactly this data (same
+          series hash) - predict with it directly (e.g. a new horizon)
+        - warm: new data points arrived after the registry model's watermark, or
+          values changed within the same window (a partial bucket filling up,
+          late analyses) - refit starting from its parameters
+        - cold: no usable registry model (none yet, configuration changed or
+          history rewritten) - fit from scratch
 
         Returns:
-            DataFrame with ds, y columns
+            (trained service, fit metadata)
         """
-        if forecast_type == 'call_volume_daily':
-            return self.data_aggregator.get_call_volume_data(
-                granularity='daily', start_date=start_date, end_date=end_date
-            )
+        key = model_key(forecast_type, start_date, end_date)
+        model_params = json.loads(json.dumps(
+            {'model_type': definition.model_type, 'engine': definition.engine, **definition.prophet_kwargs},
+            sort_keys=True
+        ))
+        training_start = df['ds'].min().isoformat()
+        training_end = df['ds'].max().isoformat()
+        data_hash = series_hash(df)
+
+        stored = self.model_store.get(key)
+        if stored and stored['model_params'] != model_params:
+            stored = None  # Model configuration changed - previous parameters don't apply
+
+        service = create_model_service(definition.model_type, engine=definition.engine,
+                                       **definition.prophet_kwargs)
+
+        same_window = bool(stored and stored['training_start'] == training_start
+                           and stored['training_end'] == training_end and stored['data_points'] == len(df))
+
+        if same_window and stored['data_hash'] == data_hash:
+            logger.info(f"Reusing fitted {forecast_type} model (watermark {training_end})")
+            service = type(service).from_json(stored['model_json'], **service.model_kwargs)
+            return service, {'fit_mode': 'reused', 'engine': definition.engine, 'model_fitted_at': stored['fitted_at']}
+
+        start = time.perf_counter()
+        if same_window or (stored and stored['training_end'] < training_end):
+            previous = type(service).from_json(stored['model_json'])
+            service.train(df, init=previous.warm_start_params())
+            fit_mode = 'warm'
+        else:
+            service.train(df)
+            fit_mode = 'cold'
+        fit_duration_ms = int((time.perf_counter() - start) * 1000)
+
+        self.model_store.save(
+            key=key,
+            forecast_type=forecast_type,
+            engine=definition.engine,
+            model_json=service.to_json(),
+            model_params=model_params,
+            training_start=training_start,
+            training_end=training_end,
+            data_points=len(df),
+            data_hash=data_hash,
+            fit_mode=fit_mode,
+            fit_duration_ms=fit_duration_ms
+        )
+        logger.info(f"{fit_mode.capitalize()}-fitted {forecast_type} model on {len(df)} points in {fit_duration_ms} ms")
 
-        elif forecast_type == 'call_volume_hourly':
-            return self.data_aggregator.get_call_volume_data(
-                granularity='hourly', start_date=start_date, end_date=end_date
-            )
+        return service, {'fit_mode': fit_mode, 'engine': definition.engine, 'fit_duration_ms': fit_duration_ms}
 
-        elif forecast_type == 'sentiment_trend':
-            return self.data_aggregator.get_sentiment_score_data(
-                granularity=definition.granularity, start_date=start_date, end_date=end_date
-            )
+    def get_training_data(self, forecast_type: str, start_date: Optional[str] = None,
+                          end_date: Optional[str] = None) -> pd.DataFrame:
+        """Get the historical series a forecast type is trained on (and scored against).
 
-        elif forecast_type == 'delinquency_risk':
-            return self.data_aggregator.get_risk_score_data(
-                risk_type='delinquency', granularity=definition.granularity,
-                start_date=start_date, end_date=end_date
-            )
+        Raises:
+            ValueError: If invalid forecast type (NO FALLBACK)
+        """
+        if forecast_type not in FORECAST_TYPES:
+            raise ValueError(f"Invalid forecast type: {forecast_type}")
+        return self._get_data_for_type(forecast_type, FORECAST_TYPES[forecast_type], start_date, end_date)
 
-        elif forecast_type == 'churn_risk':
-            return self.data_aggregator.get_risk_score_data(
-                risk_type='churn', granularity=definition.granularity,
-                start_date=start_date, end_date=end_date
-            )
+    def load_training_data(self, forecast_types: List[str], start_date: Optional[str] = None,
+                           end_date: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Read the training series of several forecast types at once.
 
-        elif forecast_type == 'escalation_rate':
-            return self.data_aggregator.get_escalation_rate_data(
-                granularity=definition.granularity, start_date=start_date, end_date=end_date
-            )
+        All series of one granularity come from a single rollup read, so a
+        full refresh reads the rollups once per granularity instead of once
+        per forecast type.
 
-        elif forecast_type == 'advisor_empathy':
-            return self.data_aggregator.get_advisor_performance_data(
-                metric='empathy', granularity=definition.granularity,
-                start_date=start_date, end_date=end_date
-            )
+        Returns:
+            Forecast type → DataFrame with ds, y columns
 
-        elif forecast_type == 'advisor_compliance':
-            return self.data_aggregator.get_advisor_performance_data(
-                metric='compliance', granularity=definition.granularity,
+        Raises:
+            ValueError: If invalid forecast type (NO FALLBACK)
+        """
+        invalid = [ft for ft in forecast_types if ft not in FORECAST_TYPES]
+        if invalid:
+            raise ValueError(f"Invalid forecast types: {invalid}")
+
+        by_granularity: Dict[str, List[ForecastDefinition]] = {}
+        for ft in forecast_types:
+            definition = FORECAST_TYPES[ft]
+            by_granularity.setdefault(definition.granularity, []).append(definition)
+
+        data = {}
+        for granularity, definitions in by_granularity.items():
+            series = self.data_aggregator.get_all_series(
+                {d.metric: d.aggregate for d in definitions}, granularity=granularity,
                 start_date=start_date, end_date=end_date
             )
+            for definition in definitions:
+                column = series[definition.metric].dropna()
+                data[definition.name] = pd.DataFrame({'ds': column.index, 'y': column.values})
+        return data
 
-        else:
-            raise ValueError(f"No data handler for forecast type: {forecast_type}")
+    def generate_all(self, forecast_types: Optional[List[str]] = None,
+                     horizon_days: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Generate several forecasts from one bulk read of their training data.
+
+        Args:
+            forecast_types: Types to generate (default: all)
+            horizon_days: Forecast horizon (default per type)
 
+        Returns:
+            Forecast type → forecast results, or {'error': ...} for types that
+            could not be generated (e.g. insufficient data)
+        """
+        forecast_types = forecast_types or list(FORECAST_TYPES)
+        data = self.load_training_data(forecast_types)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for ft in forecast_types:
+            try:
+                results[ft] = self.generate(ft, horizon_days=horizon_days, data=data[ft])
+            except ValueError as e:
+                logger.warning(f"Skipping {ft} forecast: {e}")
+                results[ft] = {'error': str(e)}
+        return results
+
+    def _get_data_for_type(self, forecast_type: str, definition: ForecastDefinition,
+                          start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+        """Get appropriate data for forecast type.
+
+        Args:
+            forecast_type: Forecast type
+            definition: Forecast definition
+            start_date: Start date filter
+            end_date: End date filter
+
+        Returns:
+            DataFrame with ds, y columns
+        """
+        return self.load_training_data([forecast_type], start_date, end_date)[forecast_type]
 
 def get_forecast_type_info(forecast_type: str) -> Dict[str, Any]:
     """Get information about a forecast type.
@@ -327,6 +452,7 @@ def get_forecast_type_info(forecast_type: str) -> Dict[str, Any]:
         'min_data_days': definition.min_data_days,
         'default_horizon_days': definition.default_horizon_days,
         'model_type': definition.model_type,
+        'engine': definition.engine,
         'prophet_config': definition.prophet_kwargs
     }
 
@@ -0,0 +1,225 @@
+"""Hierarchical forecasting definitions and reconciliation.
+
+A hierarchy forecasts a portfolio volume together with its split by intent
+or advisor. Child series are read in one grouped query, fitted
+independently (in parallel by ForecastingService, or in one vectorized
+batch with the ETS engine) and reconciled so the children add up to the
+total at every forecast step.
+"""
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+
+from .data_aggregator import DataAggregator
+from .engine import ForecastEngine
+from .ets_service import ETSService, SEASON_LENGTHS
+from .prophet_service import create_model_service, summarize_forecast
+
+
+TOTAL_NODE = '__total__'
+OTHER_NODE = 'Other'
+RECONCILIATION_METHODS = ('bottom_up', 'mint')
+
+
+@dataclass
+class HierarchyDefinition:
+    """Definition of a hierarchical (total + children) forecast."""
+    name: str
+    description: str
+    metric: str  # Count metric from the rollups: 'calls' or 'analyses'
+    dimension: str  # 'intent' or 'advisor'
+    granularity: str  # 'daily', 'weekly'
+    min_data_days: int
+    default_horizon_days: int
+    model_type: str
+    prophet_kwargs: Dict[str, Any] = field(default_factory=dict)
+    data_sources: tuple = ('analysis',)
+    engine: str = 'prophet'  # 'ets' fits all nodes in one vectorized batch
+
+
+HIERARCHICAL_FORECASTS = {
+    'intent_volume_daily': HierarchyDefinition(
+        name='intent_volume_daily',
+        description='Daily analyzed call volume by primary intent',
+        metric='analyses',
+        dimension='intent',
+        granularity='daily',
+        min_data_days=14,
+        default_horizon_days=7,
+        model_type='daily',
+        prophet_kwargs={
+            'daily_seasonality': False,
+            'weekly_seasonality': True,
+            'yearly_seasonality': False
+        }
+    ),
+    'advisor_call_volume_daily': HierarchyDefinition(
+        name='advisor_call_volume_daily',
+        description='Daily call volume by advisor',
+        metric='calls',
+        dimension='advisor',
+        granularity='daily',
+        min_data_days=14,
+        default_horizon_days=7,
+        model_type='daily',
+        prophet_kwargs={
+            'daily_seasonality': False,
+            'weekly_seasonality': True,
+            'yearly_seasonality': False
+        },
+        data_sources=('transcripts',),
+        engine='ets'
+    )
+}
+
+
+def node_forecast_type(hierarchy: str, node: str) -> str:
+    """ForecastStore type under which a hierarchy node's forecast is stored."""
+    return f"{hierarchy}:{'total' if node == TOTAL_NODE else node}"
+
+
+def load_hierarchy(aggregator: DataAggregator, definition: HierarchyDefinition,
+                   start_date: Optional[str] = None, end_date: Optional[str] = None,
+                   max_children: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+    """Load the child series of a hierarchy and their total.
+
+    Children beyond the ``max_children`` largest (by historical volume) are
+    summed into an 'Other' child. The total is the sum of the children.
+
+    Returns:
+        Node → DataFrame with ds, y columns; TOTAL_NODE first
+
+    Raises:
+        ValueError: If no data or insufficient history (NO FALLBACK)
+    """
+    children = aggregator.get_grouped_volume_data(
+        definition.metric, definition.dimension, granularity=definition.granularity,
+        start_date=start_date, end_date=end_date
+    )
+    if not children:
+        raise ValueError(f"No data available for {definition.name}")
+
+    ranked = sorted(children, key=lambda key: children[key]['y'].sum(), reverse=True)
+    if max_children is not None and len(ranked) > max_children:
+        kept, rest = ranked[:max_children - 1], ranked[max_children - 1:]
+        other = children[rest[0]].copy()
+        other['y'] = sum(children[key]['y'] for key in rest)
+        children = {**{key: children[key] for key in kept}, OTHER_NODE: other}
+    else:
+        children = {key: children[key] for key in ranked}
+
+    first = next(iter(children.values()))
+    if len(first) < definition.min_data_days:
+        raise ValueError(
+            f"Insufficient data for {definition.name}. Need {definition.min_data_days} periods, got {len(first)}"
+        )
+
+    total = first[['ds']].copy()
+    total['y'] = sum(df['y'].values for df in children.values())
+    return {TOTAL_NODE: total, **children}
+
+
+def fit_series(df: pd.DataFrame, periods: int, freq: str, model_type: str,
+               prophet_kwargs: Dict[str, Any], engine: str = 'prophet') -> Dict[str, Any]:
+    """Fit one series and forecast it - runs inside a worker process.
+
+    Module-level so it can be pickled for ProcessPoolExecutor. The in-sample
+    residual variance is added to the metadata for MinT reconciliation.
+    """
+    service = create_model_service(model_type, engine=engine, **prophet_kwargs)
+    service.train(df)
+    return _summarize_fit(service, df, periods, freq)
+
+
+def fit_series_batch(dfs: List[pd.DataFrame], periods: int, freq: str,
+                     model_type: str) -> List[Dict[str, Any]]:
+    """Fit all series of a hierarchy with ETS in one vectorized pass.
+
+    Hierarchy series share one zero-filled time index, so they are fitted
+    as a single (nodes × periods) array - one executor task instead of one
+    per node.
+    """
+    services = ETSService.fit_many(dfs, season_length=SEASON_LENGTHS[model_type])
+    return [_summarize_fit(service, df, periods, freq) for service, df in zip(services, dfs)]
+
+
+def _summarize_fit(service: ForecastEngine, df: pd.DataFrame, periods: int, freq: str) -> Dict[str, Any]:
+    """Forecast summary of a fitted node with the metadata reconciliation needs."""
+    summary = summarize_forecast(service, periods, freq)
+
+    fitted = service.forecast_result['yhat'].values[:len(df)]
+    summary['metadata']['residual_variance'] = float(np.var(df['y'].values - fitted))
+    summary['metadata']['data_points_used'] = len(df)
+    summary['metadata']['training_start'] = df['ds'].min().isoformat()
+    summary['metadata']['training_end'] = df['ds'].max().isoformat()
+    return summary
+
+
+def reconcile(base: Dict[str, Dict[str, Any]], method: str = 'mint') -> Dict[str, Dict[str, Any]]:
+    """Make child forecasts add up to the total at every step.
+
+    - bottom_up: the total is replaced by the sum of the child forecasts
+    - mint: MinT with a diagonal covariance (WLS) - every node's forecast is
+      adjusted in proportion to its in-sample residual variance, so noisy
+      series absorb more of the incoherence than well-fitted ones
+
+    Prediction intervals keep each node's base width, re-centred on its
+    reconciled forecast.
+
+    Args:
+        base: Node → forecast summary (from fit_series); must include TOTAL_NODE
+        method: 'bottom_up' or 'mint'
+
+    Returns:
+        Node → reconciled forecast summary
+
+    Raises:
+        ValueError: Unknown method or missing total (NO FALLBACK)
+    """
+    if method not in RECONCILIATION_METHODS:
+        raise ValueError(f"Invalid reconciliation method: {method}")
+    if TOTAL_NODE not in base:
+        raise ValueError("Hierarchy forecasts must include the total")
+
+    children = [node for node in base if node != TOTAL_NODE]
+    nodes = [TOTAL_NODE] + children
+    y_hat = np.array([[p['predicted'] for p in base[node]['predictions']] for node in nodes])
+
+    # Summing matrix: total = sum of children, each child maps to itself
+    S = np.vstack([np.ones(len(children)), np.eye(len(children))])
+
+    if method == 'bottom_up':
+        reconciled = S @ y_hat[1:]
+    else:
+        variances = np.array([base[node]['metadata'].get('residual_variance', 1.0) for node in nodes])
+        w_inv = 1.0 / np.maximum(variances, 1e-9)
+        StW = S.T * w_inv
+        reconciled = S @ np.linalg.solve(StW @ S, StW @ y_hat)
+
+    return {node: _with_predictions(base[node], reconciled[i], method) for i, node in enumerate(nodes)}
+
+
+def _with_predictions(summary: Dict[str, Any], values: np.ndarray, method: str) -> Dict[str, Any]:
+    """Copy of a forecast summary with its point forecasts replaced."""
+    predictions: List[Dict[str, Any]] = []
+    for prediction, value in zip(summary['predictions'], values):
+        shift = float(value) - prediction['predicted']
+        predictions.append({
+            **prediction,
+            'predicted': float(value),
+            'lower_bound': prediction['lower_bound'] + shift,
+            'upper_bound': prediction['upper_bound'] + shift
+        })
+
+    return {
+        **summary,
+        'predictions': predictions,
+        'summary': {
+            **summary['summary'],
+            'average_predicted': float(np.mean(values)),
+            'min_predicted': float(np.min(values)),
+            'max_predicted': float(np.max(values))
+        },
+        'metadata': {**summary['metadata'], 'reconciliation': method}
+    }
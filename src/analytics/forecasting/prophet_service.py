@@ -1,20 +1,26 @@
 """Prophet forecasting service wrapper.
 
-Core forecasting engine using Facebook Prophet for time-series predictions.
+Core forecasting engine using Facebook Prophet for time-series predictions,
+and the engine registry behind ``generate_forecast``. Prophet is imported
+on first fit, so callers that only use the ETS engine never pay its import
+cost.
 """
 import pandas as pd
 import logging
-from typing import Dict, Any, Optional
-from prophet import Prophet
-from prophet.diagnostics import cross_validation, performance_metrics
+from typing import Dict, Any, Type
+
+from .engine import ForecastEngine
+from .ets_service import ETSService
 
 
 logger = logging.getLogger(__name__)
 
 
-class ProphetService:
+class ProphetService(ForecastEngine):
     """Wrapper for Facebook Prophet forecasting."""
 
+    name = 'prophet'
+
     def __init__(self, **prophet_kwargs):
         """Initialize Prophet service.
 
@@ -25,6 +31,10 @@ class ProphetService:
         self.model = None
         self.forecast_result = None
 
+    @property
+    def model_kwargs(self) -> Dict[str, Any]:
+        return self.prophet_kwargs
+
     def train(self, df: pd.DataFrame, **fit_kwargs) -> 'ProphetService':
         """Train Prophet model on historical data.
 
@@ -47,6 +57,8 @@ class ProphetService:
         if len(df) < 2:
             raise ValueError("Need at least 2 data points to train")
 
+        from prophet import Prophet
+
         try:
             # Initialize Prophet with configured parameters
             self.model = Prophet(**self.prophet_kwargs)
@@ -60,6 +72,53 @@ class ProphetService:
         except Exception as e:
             raise Exception(f"Prophet training failed: {str(e)}")
 
+    def warm_start_params(self) -> Dict[str, Any]:
+        """Fitted parameters in the form Prophet.fit accepts as ``init``.
+
+        Refitting with these as the optimizer's starting point converges in
+        a fraction of the iterations of a cold fit when only a few new data
+        points were added. Prophet replaces any array whose shape no longer
+        matches (more changepoints or seasonality terms) with its default init.
+
+        Raises:
+            ValueError: If model not trained (NO FALLBACK)
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before extracting parameters")
+
+        params = {name: float(self.model.params[name][0][0]) for name in ('k', 'm', 'sigma_obs')}
+        params.update({name: self.model.params[name][0] for name in ('delta', 'beta')})
+        return params
+
+    def to_json(self) -> str:
+        """Serialize the fitted model.
+
+        Raises:
+            ValueError: If model not trained (NO FALLBACK)
+        """
+        if self.model is None:
+            raise ValueError("Model must be trained before serialization")
+
+        from prophet.serialize import model_to_json
+        return model_to_json(self.model)
+
+    @classmethod
+    def from_json(cls, model_json: str, **prophet_kwargs) -> 'ProphetService':
+        """Restore a fitted model serialized with ``to_json``.
+
+        Args:
+            model_json: Serialized model
+            **prophet_kwargs: Parameters the model was configured with
+
+        Returns:
+            ProphetService ready to predict without refitting
+        """
+        from prophet.serialize import model_from_json
+
+        service = cls(**prophet_kwargs)
+        service.model = model_from_json(model_json)
+        return service
+
     def predict(self, periods: int, freq: str = 'D') -> pd.DataFrame:
         """Generate forecasts.
 
@@ -94,58 +153,12 @@ class ProphetService:
         except Exception as e:
             raise Exception(f"Prophet prediction failed: {str(e)}")
 
-    def get_forecast_summary(self, forecast: pd.DataFrame,
-                            periods: int) -> Dict[str, Any]:
-        """Extract forecast summary from Prophet results.
-
-        Args:
-            forecast: Prophet forecast DataFrame
-            periods: Number of future periods
-
-        Returns:
-            Forecast summary with predictions and confidence intervals
-        """
-        if forecast is None or forecast.empty:
-            raise ValueError("Forecast is empty")
-
-        try:
-            # Get only future predictions (last N periods)
-            future_forecast = forecast.tail(periods)
-
-            predictions = []
-            for _, row in future_forecast.iterrows():
-                predictions.append({
-                    'date': row['ds'].isoformat(),
-                    'predicted': float(row['yhat']),
-                    'lower_bound': float(row['yhat_lower']),
-                    'upper_bound': float(row['yhat_upper']),
-                    'confidence_interval': float(row['yhat_upper'] - row['yhat_lower'])
-                })
-
-            # Calculate summary statistics
-            avg_predicted = future_forecast['yhat'].mean()
-            min_predicted = future_forecast['yhat'].min()
-            max_predicted = future_forecast['yhat'].max()
-
-            return {
-                'predictions': predictions,
-                'summary': {
-                    'average_predicted': float(avg_predicted),
-                    'min_predicted': float(min_predicted),
-                    'max_predicted': float(max_predicted),
-                    'total_periods': periods,
-                    'prediction_start': predictions[0]['date'],
-                    'prediction_end': predictions[-1]['date']
-                },
-                'metadata': {
-                    'model_type': 'Prophet',
-                    'seasonality_mode': self.prophet_kwargs.get('seasonality_mode', 'additive'),
-                    'growth': self.prophet_kwargs.get('growth', 'linear')
-                }
-            }
-
-        except Exception as e:
-            raise Exception(f"Failed to extract forecast summary: {str(e)}")
+    def summary_metadata(self) -> Dict[str, Any]:
+        return {
+            'model_type': 'Prophet',
+            'seasonality_mode': self.prophet_kwargs.get('seasonality_mode', 'additive'),
+            'growth': self.prophet_kwargs.get('growth', 'linear')
+        }
 
     def cross_validate_model(self, df: pd.DataFrame, initial: str = '30 days',
                             period: str = '7 days', horizon: str = '14 days') -> Dict[str, Any]:
@@ -163,6 +176,8 @@ class ProphetService:
         if self.model is None:
             raise ValueError("Model must be trained before cross-validation")
 
+        from prophet.diagnostics import cross_validation, performance_metrics
+
         try:
             logger.info("Performing cross-validation...")
             df_cv = cross_validation(self.model, initial=initial, period=period, horizon=horizon)
@@ -183,44 +198,6 @@ class ProphetService:
             # Return None instead of failing - cross-validation is optional
             return None
 
-    def get_component_analysis(self) -> Optional[Dict[str, Any]]:
-        """Get trend and seasonality components.
-
-        Returns:
-            Component analysis or None if not available
-        """
-        if self.forecast_result is None:
-            return None
-
-        try:
-            components = {}
-
-            # Extract trend
-            if 'trend' in self.forecast_result:
-                components['trend'] = {
-                    'average': float(self.forecast_result['trend'].mean()),
-                    'direction': 'increasing' if self.forecast_result['trend'].iloc[-1] > self.forecast_result['trend'].iloc[0] else 'decreasing'
-                }
-
-            # Extract weekly seasonality if available
-            if 'weekly' in self.forecast_result:
-                components['weekly_seasonality'] = {
-                    'peak_day': int(self.forecast_result['weekly'].idxmax() % 7),
-                    'low_day': int(self.forecast_result['weekly'].idxmin() % 7)
-                }
-
-            # Extract yearly seasonality if available
-            if 'yearly' in self.forecast_result:
-                components['yearly_seasonality'] = {
-                    'amplitude': float(self.forecast_result['yearly'].max() - self.forecast_result['yearly'].min())
-                }
-
-            return components if components else None
-
-        except Exception as e:
-            logger.warning(f"Component analysis failed: {str(e)}")
-            return None
-
     @staticmethod
     def create_daily_model(**kwargs) -> 'ProphetService':
         """Create Prophet model for daily forecasting.
@@ -273,32 +250,60 @@ class ProphetService:
         return ProphetService(**default_params)
 
 
-def generate_forecast(df: pd.DataFrame, periods: int, freq: str = 'D',
-                     model_type: str = 'daily', **prophet_kwargs) -> Dict[str, Any]:
-    """Convenience function to generate forecast in one call.
+# Engine name → ForecastEngine implementation
+ENGINES: Dict[str, Type[ForecastEngine]] = {
+    'prophet': ProphetService,
+    'ets': ETSService
+}
+
+
+def get_engine_class(engine: str) -> Type[ForecastEngine]:
+    """Look up a forecasting engine by name.
+
+    Raises:
+        ValueError: If engine unknown (NO FALLBACK)
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Invalid forecasting engine: {engine}. Valid engines: {list(ENGINES.keys())}")
+    return ENGINES[engine]
+
+
+def create_model_service(model_type: str = 'daily', engine: str = 'prophet',
+                         **prophet_kwargs) -> ForecastEngine:
+    """Create an untrained engine with the defaults for a model type.
 
     Args:
-        df: Historical data with 'ds' and 'y' columns
-        periods: Number of periods to forecast
-        freq: Frequency ('D', 'H', 'W')
         model_type: 'daily', 'weekly', or 'hourly'
-        **prophet_kwargs: Additional Prophet parameters
+        engine: 'prophet' or 'ets'
+        **prophet_kwargs: Additional Prophet parameters (ignored by ETS, which
+            takes its season length from the model type)
 
     Returns:
-        Forecast summary dictionary
+        ForecastEngine
     """
-    # Create appropriate model
+    if get_engine_class(engine) is ETSService:
+        return ETSService.for_model_type(model_type)
+
     if model_type == 'daily':
-        service = ProphetService.create_daily_model(**prophet_kwargs)
+        return ProphetService.create_daily_model(**prophet_kwargs)
     elif model_type == 'weekly':
-        service = ProphetService.create_weekly_model(**prophet_kwargs)
+        return ProphetService.create_weekly_model(**prophet_kwargs)
     elif model_type == 'hourly':
-        service = ProphetService.create_hourly_model(**prophet_kwargs)
-    else:
-        service = ProphetService(**prophet_kwargs)
+        return ProphetService.create_hourly_model(**prophet_kwargs)
+    return ProphetService(**prophet_kwargs)
 
-    # Train and predict
-    service.train(df)
+
+def summarize_forecast(service: ForecastEngine, periods: int, freq: str = 'D') -> Dict[str, Any]:
+    """Predict with a trained (or restored) model and build the forecast summary.
+
+    Args:
+        service: Trained ForecastEngine
+        periods: Number of periods to forecast
+        freq: Frequency ('D', 'H', 'W')
+
+    Returns:
+        Forecast summary dictionary
+    """
     forecast = service.predict(periods, freq)
 
     # Get summary
@@ -310,3 +315,24 @@ def generate_forecast(df: pd.DataFrame, periods: int, freq: str = 'D',
         summary['components'] = components
 
     return summary
+
+
+def generate_forecast(df: pd.DataFrame, periods: int, freq: str = 'D',
+                     model_type: str = 'daily', engine: str = 'prophet',
+                     **prophet_kwargs) -> Dict[str, Any]:
+    """Convenience function to generate forecast in one call.
+
+    Args:
+        df: Historical data with 'ds' and 'y' columns
+        periods: Number of periods to forecast
+        freq: Frequency ('D', 'H', 'W')
+        model_type: 'daily', 'weekly', or 'hourly'
+        engine: 'prophet' or 'ets'
+        **prophet_kwargs: Additional Prophet parameters
+
+    Returns:
+        Forecast summary dictionary
+    """
+    service = create_model_service(model_type, engine=engine, **prophet_kwargs)
+    service.train(df)
+    return summarize_forecast(service, periods, freq)
@@ -3,14 +3,25 @@
 This module is used by CLI/demo scripts to seed SQLite with a realistic dataset
 without calling the LLM stack. It relies on the same seeded customer portfolio
 that powers the transcript generator, so everything feels consistent.
+
+``stream_database`` produces load/benchmark datasets (10M+ transcripts): days
+are generated in chunks, optionally across worker processes, from per-day
+seeds and written with bulk inserts, so memory use is bounded by the chunk
+size and output is reproducible for a given seed.
 """
 
 from __future__ import annotations
 
+import csv
+import json
+import os
 import random
-import uuid
+import sqlite3
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional
 
 from src.data.portfolio_seed import (
     PortfolioSeedProvider,
@@ -21,6 +32,7 @@ from src.data.portfolio_seed import (
 )
 from src.storage.transcript_store import TranscriptStore
 from src.storage.analysis_store import AnalysisStore
+from src.storage.timeseries_rollup_store import insert_batch
 
 
 class SyntheticDataGenerator:
@@ -72,13 +84,19 @@ class SyntheticDataGenerator:
         "positive": 8,
     }
 
-    def __init__(self, db_path: str, seed: Optional[int] = 42):
+    def __init__(self, db_path: Optional[str], seed: Optional[int] = 42, init_storage: bool = True):
         self.db_path = db_path
-        self.random = random.Random(seed or random.randint(1, 10_000))
+        self.seed = seed or random.randint(1, 10_000)
+        self.random = random.Random(self.seed)
+        # IDs come from their own stream so they are reproducible without
+        # shifting the value draws of a seeded dataset
+        self.id_random = random.Random(f"{self.seed}:ids")
         self.seed_provider = PortfolioSeedProvider()
         # Initialize storage layers to ensure required SQLite schema exists
-        self.transcript_store = TranscriptStore(db_path)
-        self.analysis_store = AnalysisStore(db_path)
+        # (streaming workers only generate rows and skip this)
+        if init_storage:
+            self.transcript_store = TranscriptStore(db_path)
+            self.analysis_store = AnalysisStore(db_path)
 
     # ------------------------------------------------------------------
     # Transcript generation
@@ -94,55 +112,63 @@ class SyntheticDataGenerator:
         customers = list(self.seed_provider.customers.values())
 
         while current_date <= end_date:
-            weekday_multiplier = 1.0 if current_date.weekday() < 5 else 0.55
-            month_end_multiplier = 1.25 if current_date.day > 25 else 1.0
-            daily_calls = int(base_daily_calls * weekday_multiplier * month_end_multiplier * self.random.uniform(0.8, 1.2))
-
-            for _ in range(daily_calls):
-                topic = self.random.choice(self.TOPICS)
-                customer = self.random.choice(customers)
-                loan = self.seed_provider.get_loan(customer, topic=topic)
-                property_profile = customer.property_profile
-                advisor = self.seed_provider.get_advisor(topic=topic)
-
-                timestamp = current_date.replace(
-                    hour=self.random.randint(9, 16),
-                    minute=self.random.randint(0, 59),
-                    second=self.random.randint(0, 59),
-                )
+            transcripts.extend(self._generate_day(current_date, base_daily_calls, customers))
+            current_date += timedelta(days=1)
 
-                conversation_context = self._build_conversation_context(topic, customer, loan)
-                messages = self._generate_messages(
-                    topic,
-                    customer,
-                    loan,
-                    property_profile,
-                    advisor,
-                    timestamp,
-                    conversation_context,
-                )
+        return transcripts
 
-                transcripts.append(
-                    {
-                        "id": f"CALL_{uuid.uuid4().hex[:8].upper()}",
-                        "customer_id": customer.customer_id,
-                        "advisor_id": advisor.advisor_id,
-                        "loan_id": loan.loan_id,
-                        "property_id": property_profile.property_id,
-                        "timestamp": timestamp.isoformat() + "Z",
-                        "topic": topic,
-                        "duration": self.random.randint(210, 360),  # 3–6 minute conversations
-                        "urgency": self.TOPIC_URGENCY.get(topic, "medium"),
-                        "sentiment": self.random.choice(["positive", "neutral", "frustrated", "concerned"]),
-                        "financial_impact": topic in {"mortgage_payment_issue", "hardship_assistance", "payoff_request"},
-                        "compliance_flags": [],
-                        "outcome": self.random.choice(["open", "follow_up_required", "resolved"]),
-                        "messages": messages,
-                        "context": conversation_context,
-                    }
-                )
+    def _generate_day(self, current_date: datetime, base_daily_calls: int,
+                      customers: List[CustomerProfile]) -> List[Dict[str, Any]]:
+        """Generate one day of transcripts (weekday and month-end seasonality)."""
 
-            current_date += timedelta(days=1)
+        weekday_multiplier = 1.0 if current_date.weekday() < 5 else 0.55
+        month_end_multiplier = 1.25 if current_date.day > 25 else 1.0
+        daily_calls = int(base_daily_calls * weekday_multiplier * month_end_multiplier * self.random.uniform(0.8, 1.2))
+
+        transcripts: List[Dict[str, Any]] = []
+        for _ in range(daily_calls):
+            topic = self.random.choice(self.TOPICS)
+            customer = self.random.choice(customers)
+            loan = self.seed_provider.get_loan(customer, topic=topic)
+            property_profile = customer.property_profile
+            advisor = self.seed_provider.get_advisor(topic=topic)
+
+            timestamp = current_date.replace(
+                hour=self.random.randint(9, 16),
+                minute=self.random.randint(0, 59),
+                second=self.random.randint(0, 59),
+            )
+
+            conversation_context = self._build_conversation_context(topic, customer, loan)
+            messages = self._generate_messages(
+                topic,
+                customer,
+                loan,
+                property_profile,
+                advisor,
+                timestamp,
+                conversation_context,
+            )
+
+            transcripts.append(
+                {
+                    "id": self._new_id("CALL"),
+                    "customer_id": customer.customer_id,
+                    "advisor_id": advisor.advisor_id,
+                    "loan_id": loan.loan_id,
+                    "property_id": property_profile.property_id,
+                    "timestamp": timestamp.isoformat() + "Z",
+                    "topic": topic,
+                    "duration": self.random.randint(210, 360),  # 3–6 minute conversations
+                    "urgency": self.TOPIC_URGENCY.get(topic, "medium"),
+                    "sentiment": self.random.choice(["positive", "neutral", "frustrated", "concerned"]),
+                    "financial_impact": topic in {"mortgage_payment_issue", "hardship_assistance", "payoff_request"},
+                    "compliance_flags": [],
+                    "outcome": self.random.choice(["open", "follow_up_required", "resolved"]),
+                    "messages": messages,
+                    "context": conversation_context,
+                }
+            )
 
         return transcripts
 
@@ -161,7 +187,7 @@ class SyntheticDataGenerator:
             compliance_score = round(self.random.uniform(0.78, 0.98), 2)
             borrower_sentiment = self._build_sentiment_profile(transcript["sentiment"])
 
-            analysis_id = f"ANALYSIS_{uuid.uuid4().hex[:8].upper()}"
+            analysis_id = self._new_id("ANALYSIS")
 
             analysis_record = {
                     "analysis_id": analysis_id,
@@ -224,85 +250,18 @@ class SyntheticDataGenerator:
     # Database population
     # ------------------------------------------------------------------
     def populate_database(self, days: int = 60, base_daily_calls: int = 20) -> Dict[str, int]:
-        import json
-        import sqlite3
-
         transcripts = self.generate_transcripts(days, base_daily_calls)
         analyses = self.generate_analyses(transcripts)
+        timestamps = {transcript["id"]: transcript["timestamp"] for transcript in transcripts}
 
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
 
         try:
-            for transcript in transcripts:
-                cursor.execute(
-                    '''
-                    INSERT OR REPLACE INTO transcripts
-                    (id, customer_id, advisor_id, timestamp, topic, duration, sentiment, urgency, compliance_flags, outcome)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''',
-                    (
-                        transcript["id"],
-                        transcript["customer_id"],
-                        transcript["advisor_id"],
-                        transcript["timestamp"],
-                        transcript["topic"],
-                        transcript["duration"],
-                        transcript["sentiment"],
-                        transcript["urgency"],
-                        json.dumps(transcript["compliance_flags"]),
-                        transcript["outcome"],
-                    ),
-                )
-
-                for message in transcript["messages"]:
-                    cursor.execute(
-                        '''
-                        INSERT INTO messages (transcript_id, speaker, text, timestamp)
-                        VALUES (?, ?, ?, ?)
-                        ''',
-                        (
-                            transcript["id"],
-                            message["speaker"],
-                            message["text"],
-                            message["timestamp"],
-                        ),
-                    )
-
-            for analysis in analyses:
-                cursor.execute(
-                    '''
-                    INSERT OR REPLACE INTO analysis
-                    (id, transcript_id, analysis_data, primary_intent, urgency_level,
-                     borrower_sentiment, delinquency_risk, churn_risk, complaint_risk,
-                     refinance_likelihood, empathy_score, compliance_adherence,
-                     solution_effectiveness, compliance_issues, escalation_needed,
-                     issue_resolved, first_call_resolution, confidence_score, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''',
-                    (
-                        analysis["analysis_id"],
-                        analysis["transcript_id"],
-                        json.dumps(analysis),
-                        analysis["primary_intent"],
-                        analysis["urgency_level"],
-                        analysis.get("borrower_sentiment", {}).get("overall", ""),
-                        analysis["delinquency_risk"],
-                        analysis["churn_risk"],
-                        analysis["complaint_risk"],
-                        analysis["refinance_likelihood"],
-                        analysis["empathy_score"],
-                        analysis["compliance_adherence"],
-                        analysis["solution_effectiveness"],
-                        len(analysis.get("compliance_flags", [])),
-                        analysis["escalation_needed"],
-                        analysis["issue_resolved"],
-                        analysis["first_call_resolution"],
-                        analysis["confidence_score"],
-                        self._match_transcript_timestamp(transcripts, analysis["transcript_id"]),
-                    ),
-                )
-
+            self._insert_rows(conn, {
+                "transcripts": [self._transcript_row(t) for t in transcripts],
+                "messages": [row for t in transcripts for row in self._message_rows(t)],
+                "analyses": [self._analysis_row(a, timestamps[a["transcript_id"]]) for a in analyses],
+            })
             conn.commit()
 
             return {
@@ -319,6 +278,209 @@ class SyntheticDataGenerator:
         finally:
             conn.close()
 
+    # ------------------------------------------------------------------
+    # Streaming generation (large load/benchmark datasets)
+    # ------------------------------------------------------------------
+    def iter_chunks(
+        self,
+        days: int = 365,
+        base_daily_calls: int = 20,
+        chunk_days: int = 7,
+        workers: int = 1,
+        end_date: Optional[datetime] = None,
+        include_messages: bool = True,
+        include_graph: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the dataset as chunks of bulk-insert rows, oldest first.
+
+        Every day is generated from its own seed (generator seed + date), so
+        the output is identical for any ``workers`` / ``chunk_days`` setting.
+        With ``workers > 1`` chunks are generated in worker processes; at most
+        two chunks per worker are in flight, so memory stays bounded by the
+        chunk size rather than the dataset size.
+
+        Args:
+            days: Days of history (``days + 1`` calendar days, like generate_transcripts)
+            base_daily_calls: Weekday calls per day before seasonality
+            chunk_days: Days per chunk
+            workers: Generator processes (1 = in-process)
+            end_date: Last day (default: today, UTC)
+            include_messages: Generate message rows (the bulk of the data)
+            include_graph: Also generate Kuzu node/relationship rows
+
+        Yields:
+            Dict with 'dates' and row lists: 'transcripts', 'messages',
+            'analyses' (and 'graph' when requested)
+        """
+        if days < 0 or base_daily_calls <= 0 or chunk_days <= 0 or workers <= 0:
+            raise ValueError("days must be >= 0; base_daily_calls, chunk_days and workers must be positive")
+
+        end_day = (end_date or datetime.utcnow()).replace(hour=0, minute=0, second=0, microsecond=0)
+        dates = [(end_day - timedelta(days=offset)).date().isoformat() for offset in range(days, -1, -1)]
+        batches = [dates[i:i + chunk_days] for i in range(0, len(dates), chunk_days)]
+        args = (self.seed, base_daily_calls, include_messages, include_graph)
+
+        if workers == 1:
+            for batch in batches:
+                yield _generate_chunk(batch, *args)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending: Deque[Future] = deque()
+            for batch in batches:
+                pending.append(executor.submit(_generate_chunk, batch, *args))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def stream_database(
+        self,
+        days: int = 365,
+        base_daily_calls: int = 20,
+        chunk_days: int = 7,
+        workers: int = 1,
+        end_date: Optional[datetime] = None,
+        include_messages: bool = True,
+        graph_dir: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Write a (large) dataset chunk by chunk with bulk inserts.
+
+        Unlike populate_database nothing is held in memory beyond the chunks
+        in flight, so datasets of 10M+ transcripts can be produced. Each chunk
+        is written with executemany in its own transaction.
+
+        Args:
+            days, base_daily_calls, chunk_days, workers, end_date, include_messages:
+                See iter_chunks
+            graph_dir: Also write Kuzu CSV files here (load with
+                ``COPY <table> FROM '<file>' (header=true)``)
+
+        Returns:
+            Row counts, date range and throughput
+        """
+        started = time.perf_counter()
+        counts = {"transcripts": 0, "messages": 0, "analyses": 0}
+        first_day = last_day = None
+        graph = _GraphCsvWriter(graph_dir, self.seed_provider) if graph_dir else None
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            for chunk in self.iter_chunks(days, base_daily_calls, chunk_days, workers, end_date,
+                                          include_messages, include_graph=graph is not None):
+                self._insert_rows(conn, chunk)
+                conn.commit()
+                for table in counts:
+                    counts[table] += len(chunk[table])
+                if graph is not None:
+                    graph.write(chunk["graph"])
+                first_day = first_day or chunk["dates"][0]
+                last_day = chunk["dates"][-1]
+        except Exception as exc:
+            conn.rollback()
+            raise Exception(f"Database population failed: {exc}")
+        finally:
+            conn.close()
+            if graph is not None:
+                graph.close()
+
+        elapsed = time.perf_counter() - started
+        return {
+            "transcripts_generated": counts["transcripts"],
+            "analyses_generated": counts["analyses"],
+            "messages_generated": counts["messages"],
+            "days_of_data": days,
+            "date_range": f"{first_day} to {last_day}",
+            "workers": workers,
+            "elapsed_seconds": round(elapsed, 2),
+            "transcripts_per_second": round(counts["transcripts"] / elapsed, 1) if elapsed else None,
+            "graph_dir": graph_dir,
+        }
+
+    # ------------------------------------------------------------------
+    # Bulk-insert rows
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _insert_rows(conn: sqlite3.Connection, rows: Dict[str, List[tuple]]) -> None:
+        # Rollups are updated once per batch instead of by the per-row triggers
+        insert_batch(
+            conn,
+            "transcripts",
+            '''
+            INSERT OR REPLACE INTO transcripts
+            (id, customer_id, advisor_id, timestamp, topic, duration, sentiment, urgency, compliance_flags, outcome)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''',
+            rows["transcripts"],
+        )
+        conn.executemany(
+            '''
+            INSERT INTO messages (transcript_id, speaker, text, timestamp)
+            VALUES (?, ?, ?, ?)
+            ''',
+            rows["messages"],
+        )
+        insert_batch(
+            conn,
+            "analysis",
+            '''
+            INSERT OR REPLACE INTO analysis
+            (id, transcript_id, analysis_data, primary_intent, urgency_level,
+             borrower_sentiment, delinquency_risk, churn_risk, complaint_risk,
+             refinance_likelihood, empathy_score, compliance_adherence,
+             solution_effectiveness, compliance_issues, escalation_needed,
+             issue_resolved, first_call_resolution, confidence_score, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''',
+            rows["analyses"],
+        )
+
+    @staticmethod
+    def _transcript_row(transcript: Dict[str, Any]) -> tuple:
+        return (
+            transcript["id"],
+            transcript["customer_id"],
+            transcript["advisor_id"],
+            transcript["timestamp"],
+            transcript["topic"],
+            transcript["duration"],
+            transcript["sentiment"],
+            transcript["urgency"],
+            json.dumps(transcript["compliance_flags"]),
+            transcript["outcome"],
+        )
+
+    @staticmethod
+    def _message_rows(transcript: Dict[str, Any]) -> List[tuple]:
+        return [
+            (transcript["id"], message["speaker"], message["text"], message["timestamp"])
+            for message in transcript["messages"]
+        ]
+
+    @staticmethod
+    def _analysis_row(analysis: Dict[str, Any], timestamp: str) -> tuple:
+        return (
+            analysis["analysis_id"],
+            analysis["transcript_id"],
+            json.dumps(analysis),
+            analysis["primary_intent"],
+            analysis["urgency_level"],
+            analysis.get("borrower_sentiment", {}).get("overall", ""),
+            analysis["delinquency_risk"],
+            analysis["churn_risk"],
+            analysis["complaint_risk"],
+            analysis["refinance_likelihood"],
+            analysis["empathy_score"],
+            analysis["compliance_adherence"],
+            analysis["solution_effectiveness"],
+            len(analysis.get("compliance_flags", [])),
+            analysis["escalation_needed"],
+            analysis["issue_resolved"],
+            analysis["first_call_resolution"],
+            analysis["confidence_score"],
+            timestamp,
+        )
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -777,13 +939,124 @@ class SyntheticDataGenerator:
             "trend": trend,
         }
 
-    def _match_transcript_timestamp(self, transcripts: List[Dict[str, Any]], transcript_id: str) -> str:
-        for transcript in transcripts:
-            if transcript["id"] == transcript_id:
-                return transcript["timestamp"]
-        return datetime.utcnow().isoformat() + "Z"
+    def _new_id(self, prefix: str) -> str:
+        # 64 random bits keep IDs unique at 10M+ rows (INSERT OR REPLACE would
+        # silently drop colliding rows)
+        return f"{prefix}_{self.id_random.getrandbits(64):016X}"
+
+
+# Kuzu tables emitted by stream_database(graph_dir=...), columns in schema order
+# (see initialize_kuzu_schema.py)
+GRAPH_TABLES = {
+    "Customer": ["customer_id", "name", "email", "phone", "risk_score", "compliance_flags",
+                 "total_interactions", "last_updated", "last_contact_date", "satisfaction_score", "created_at"],
+    "Transcript": ["transcript_id", "customer_id", "content", "duration_seconds", "channel", "created_at"],
+    "Analysis": ["analysis_id", "call_id", "transcript_id", "intent", "urgency_level", "sentiment",
+                 "confidence_score", "risk_factors", "compliance_issues", "customer_satisfaction",
+                 "analysis_summary", "llm_reasoning", "analyzed_at", "analyzer_version",
+                 "processing_time_ms", "created_at"],
+    "TRANSCRIPT_BELONGS_TO": ["from", "to", "created_at"],
+    "ANALYSIS_ANALYZES": ["from", "to", "created_at"],
+}
+
+
+def _generate_chunk(dates: List[str], seed: int, base_daily_calls: int,
+                    include_messages: bool, include_graph: bool) -> Dict[str, Any]:
+    """Generate the bulk-insert rows for a run of days - runs inside a worker process.
+
+    Module-level so it can be pickled for ProcessPoolExecutor.
+    """
+    chunk: Dict[str, Any] = {"dates": dates, "transcripts": [], "messages": [], "analyses": []}
+    if include_graph:
+        chunk["graph"] = {table: [] for table in GRAPH_TABLES if table != "Customer"}
+
+    for day in dates:
+        # Fresh generator per day: the seed provider cycles advisors, so
+        # sharing one across days would make output depend on chunking
+        generator = SyntheticDataGenerator(None, seed=seed, init_storage=False)
+        generator.random = random.Random(f"{seed}:{day}")
+        generator.id_random = random.Random(f"{seed}:{day}:ids")
+
+        transcripts = generator._generate_day(
+            datetime.fromisoformat(day), base_daily_calls, list(generator.seed_provider.customers.values())
+        )
+        analyses = generator.generate_analyses(transcripts)
+        timestamps = {transcript["id"]: transcript["timestamp"] for transcript in transcripts}
+
+        chunk["transcripts"].extend(generator._transcript_row(t) for t in transcripts)
+        if include_messages:
+            for transcript in transcripts:
+                chunk["messages"].extend(generator._message_rows(transcript))
+        chunk["analyses"].extend(generator._analysis_row(a, timestamps[a["transcript_id"]]) for a in analyses)
+
+        if include_graph:
+            graph = chunk["graph"]
+            for t in transcripts:
+                graph["Transcript"].append(
+                    (t["id"], t["customer_id"], t["context"], t["duration"], "phone", t["timestamp"])
+                )
+                graph["TRANSCRIPT_BELONGS_TO"].append((t["id"], t["customer_id"], t["timestamp"]))
+            for a in analyses:
+                created_at = timestamps[a["transcript_id"]]
+                graph["Analysis"].append((
+                    a["analysis_id"], a["transcript_id"], a["transcript_id"], a["primary_intent"],
+                    a["urgency_level"], a["borrower_sentiment"].get("overall", ""), a["confidence_score"],
+                    json.dumps(a["borrower_risks"]), json.dumps(a["compliance_flags"]), "",
+                    a["call_summary"], "", created_at, "synthetic", 0, created_at,
+                ))
+                graph["ANALYSIS_ANALYZES"].append((a["analysis_id"], a["transcript_id"], created_at))
+
+    return chunk
+
+
+class _GraphCsvWriter:
+    """Appends streamed graph rows to one Kuzu COPY-ready CSV file per table."""
+
+    def __init__(self, graph_dir: str, seed_provider: PortfolioSeedProvider):
+        os.makedirs(graph_dir, exist_ok=True)
+        self.graph_dir = graph_dir
+        self.seed_provider = seed_provider
+        self.interactions: Counter = Counter()
+        self.last_contact: Dict[str, str] = {}
+        self.files = {
+            table: open(os.path.join(graph_dir, f"{table}.csv"), "w", newline="", encoding="utf-8")
+            for table in GRAPH_TABLES if table != "Customer"
+        }
+        self.writers = {table: csv.writer(f) for table, f in self.files.items()}
+        for table, writer in self.writers.items():
+            writer.writerow(GRAPH_TABLES[table])
+
+    def write(self, graph: Dict[str, List[tuple]]) -> None:
+        for table, rows in graph.items():
+            self.writers[table].writerows(rows)
+        for transcript_id, customer_id, timestamp in graph["TRANSCRIPT_BELONGS_TO"]:
+            self.interactions[customer_id] += 1
+            self.last_contact[customer_id] = max(timestamp, self.last_contact.get(customer_id, ""))
+
+    def close(self) -> None:
+        """Close the streamed files and write Customer.csv (needs the final interaction counts)."""
+        for f in self.files.values():
+            f.close()
+
+        now = datetime.utcnow().isoformat() + "Z"
+        with open(os.path.join(self.graph_dir, "Customer.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(GRAPH_TABLES["Customer"])
+            for customer in self.seed_provider.customers.values():
+                last_contact = self.last_contact.get(customer.customer_id)
+                writer.writerow([
+                    customer.customer_id, customer.name, customer.email, customer.phone, "",
+                    json.dumps(customer.risk_flags), self.interactions[customer.customer_id], now,
+                    last_contact[:19].replace("T", " ") if last_contact else "", "", now,
+                ])
 
 
 def generate_synthetic_data(db_path: str, days: int = 60, base_daily_calls: int = 20) -> Dict[str, int]:
     generator = SyntheticDataGenerator(db_path)
     return generator.populate_database(days, base_daily_calls)
+
+
+def stream_synthetic_data(db_path: str, days: int = 365, base_daily_calls: int = 20, workers: int = 1,
+                          seed: Optional[int] = 42, **kwargs: Any) -> Dict[str, Any]:
+    generator = SyntheticDataGenerator(db_path, seed=seed)
+    return generator.stream_database(days, base_daily_calls, workers=workers, **kwargs)
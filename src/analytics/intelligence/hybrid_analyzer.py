@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 
 from src.services.forecasting_service import ForecastingService
 from src.infrastructure.llm.llm_client_v2 import LLMClientV2
+from src.analytics.personas.metric_compiler import MetricCompiler, MetricSpec, ANALYSIS
 from .insight_generator import InsightGenerator
 
 
@@ -45,6 +46,7 @@ class HybridAnalyzer:
         self.llm_client = llm_client or LLMClientV2()
         self.insight_generator = InsightGenerator(llm_client)
         self.db_path = db_path
+        self.metric_compiler = MetricCompiler()
 
     async def analyze_with_forecast(
         self,
@@ -116,6 +118,8 @@ class HybridAnalyzer:
         cursor = conn.cursor()
 
         data = {}
+        # Per-intent counts, fused into one GROUP BY scan of analysis
+        intent_specs = [MetricSpec('count', ANALYSIS)]
 
         try:
             # Common data
@@ -144,18 +148,7 @@ class HybridAnalyzer:
                 data['avg_high_churn_risk'] = result[1]
 
                 # Top intents for churn risk
-                cursor.execute("""
-                    SELECT primary_intent, COUNT(*) as count
-                    FROM analysis
-                    WHERE churn_risk > 0.5
-                    GROUP BY primary_intent
-                    ORDER BY count DESC
-                    LIMIT 5
-                """)
-                data['churn_risk_intents'] = [
-                    {'intent': row[0], 'count': row[1]}
-                    for row in cursor.fetchall()
-                ]
+                intent_specs.append(MetricSpec('churn_risk_count', ANALYSIS, filter='churn_risk > 0.5'))
 
             elif 'sentiment' in forecast_type:
                 # Sentiment distribution
@@ -220,24 +213,29 @@ class HybridAnalyzer:
                 data['high_delinquency_count'] = result[0]
                 data['avg_delinquency_risk'] = result[1]
 
+            intents = self.metric_compiler.execute(
+                lambda sql: cursor.execute(sql).fetchall(), intent_specs, group_by='primary_intent'
+            )
+            if 'churn' in forecast_type:
+                data['churn_risk_intents'] = self._top_intents(intents, 'churn_risk_count', 5)
+
             # Always include recent intents
-            cursor.execute("""
-                SELECT primary_intent, COUNT(*) as count
-                FROM analysis
-                GROUP BY primary_intent
-                ORDER BY count DESC
-                LIMIT 10
-            """)
-            data['top_intents'] = [
-                {'intent': row[0], 'count': row[1]}
-                for row in cursor.fetchall()
-            ]
+            data['top_intents'] = self._top_intents(intents, 'count', 10)
 
         finally:
             conn.close()
 
         return data
 
+    @staticmethod
+    def _top_intents(intents: Dict[Any, Dict[str, int]], metric: str, limit: int) -> List[Dict[str, Any]]:
+        """Intents with the highest non-zero count of a grouped metric."""
+        ranked = sorted(
+            ((intent, counts[metric]) for intent, counts in intents.items() if counts[metric]),
+            key=lambda item: item[1], reverse=True
+        )
+        return [{'intent': intent, 'count': count} for intent, count in ranked[:limit]]
+
     async def generate_executive_briefing(
         self,
         forecast_types: Optional[List[str]] = None
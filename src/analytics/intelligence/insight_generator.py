@@ -5,12 +5,15 @@ This module uses LLMs to analyze data and generate natural language insights,
 recommendations, and actionable intelligence for different personas.
 """
 
+import asyncio
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, AsyncGenerator, Optional, List
 from datetime import datetime
 import time
 
 from src.infrastructure.llm.llm_client_v2 import LLMClientV2, RequestOptions
+from src.infrastructure.config.config_loader import get_intelligence_config
+from src.infrastructure.llm.json_field_stream import JsonFieldStream
 from .prompt_loader import PromptLoader
 
 
@@ -104,6 +107,74 @@ class InsightGenerator:
             # Fail fast - no fallback logic per CLAUDE.md
             raise Exception(f"Insight generation failed for '{prompt_name}': {str(e)}")
 
+    async def generate_stream(
+        self,
+        prompt_name: str,
+        context: Dict[str, Any],
+        system_instructions: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        stream_field: str = 'content'
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Generate an insight, yielding the answer text while the LLM writes it.
+
+        JSON answers stream only their stream_field string (the readable
+        answer); plain-text answers stream as they are. The complete response
+        is parsed exactly like generate().
+
+        Yields:
+            {'type': 'token', 'text': delta} per decoded delta, then
+            {'type': 'result', 'result': same as generate(), metadata adds time_to_first_token_ms}
+
+        Raises:
+            Exception if LLM generation fails (fail fast, no fallback)
+        """
+        start_time = time.time()
+
+        try:
+            prompt = self.prompt_loader.load(prompt_name, context)
+            options = RequestOptions(
+                temperature=temperature,
+                max_output_tokens=max_tokens,
+            )
+
+            field = JsonFieldStream(stream_field)
+            chunks: List[str] = []
+            time_to_first_token_ms = None
+
+            async for chunk in self.llm_client.astream(
+                messages=[{"role": "user", "content": prompt}],
+                system_prompt=system_instructions,
+                options=options,
+            ):
+                delta = chunk.text or ''
+                chunks.append(delta)
+                text = field.feed(delta)
+                if text:
+                    if time_to_first_token_ms is None:
+                        time_to_first_token_ms = int((time.time() - start_time) * 1000)
+                    yield {'type': 'token', 'text': text}
+
+            yield {
+                'type': 'result',
+                'result': {
+                    'insight': self._parse_response(''.join(chunks)),
+                    'metadata': {
+                        'prompt_name': prompt_name,
+                        'generated_at': datetime.utcnow().isoformat(),
+                        'generation_time_ms': int((time.time() - start_time) * 1000),
+                        'time_to_first_token_ms': time_to_first_token_ms,
+                        'temperature': temperature,
+                        'max_tokens': max_tokens
+                    }
+                }
+            }
+
+        except Exception as e:
+            # Fail fast - no fallback logic per CLAUDE.md
+            raise Exception(f"Insight generation failed for '{prompt_name}': {str(e)}")
+
     def _parse_response(self, response: str) -> Any:
         """
         Attempt to parse LLM response as JSON, fallback to plain text.
@@ -180,34 +251,80 @@ class InsightGenerator:
     async def batch_generate(
         self,
         prompts: List[Dict[str, Any]],
-        parallel: bool = False
+        parallel: bool = False,
+        max_concurrency: Optional[int] = None,
+        item_timeout_seconds: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate multiple insights.
 
+        Identical prompt configurations are generated once per batch. A failed
+        or timed-out item is reported in its own entry; the rest of the batch
+        still completes.
+
         Args:
             prompts: List of prompt configurations, each with:
                      {prompt_name, context, system_instructions?, temperature?}
-            parallel: Whether to generate in parallel (future enhancement)
+            parallel: Whether to generate concurrently (up to max_concurrency LLM calls)
+            max_concurrency: Concurrent generations when parallel
+                             (default: intelligence.insight_batch_concurrency)
+            item_timeout_seconds: Time limit for each generation
+                                  (default: intelligence.insight_item_timeout_seconds)
 
         Returns:
-            List of insight results
+            List of insight results, one per prompt in order:
+            {'success': True, 'result'} or {'success': False, 'error', 'prompt_name'};
+            a repeated prompt's entry also has 'duplicate_of' (index of its first occurrence)
+
+        Raises:
+            ValueError: Invalid concurrency or timeout (NO FALLBACK)
         """
-        results = []
+        if max_concurrency is None:
+            max_concurrency = get_intelligence_config('insight_batch_concurrency', 8)
+        if item_timeout_seconds is None:
+            item_timeout_seconds = get_intelligence_config('insight_item_timeout_seconds', 60)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if item_timeout_seconds <= 0:
+            raise ValueError("item_timeout_seconds must be positive")
+
+        # Index of the first occurrence of each distinct prompt configuration
+        first_index: Dict[str, int] = {}
+        duplicate_of: List[Optional[int]] = []
+        for index, prompt_config in enumerate(prompts):
+            key = json.dumps(prompt_config, sort_keys=True, default=str)
+            duplicate_of.append(first_index.get(key))
+            first_index.setdefault(key, index)
+
+        semaphore = asyncio.Semaphore(max_concurrency if parallel else 1)
+
+        async def run(prompt_config: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(self.generate(**prompt_config), timeout=item_timeout_seconds)
+                    return {
+                        'success': True,
+                        'result': result
+                    }
+                except asyncio.TimeoutError:
+                    error = f"Insight generation timed out after {item_timeout_seconds}s"
+                except Exception as e:
+                    error = str(e)
+            return {
+                'success': False,
+                'error': error,
+                'prompt_name': prompt_config.get('prompt_name')
+            }
 
-        for prompt_config in prompts:
-            try:
-                result = await self.generate(**prompt_config)
-                results.append({
-                    'success': True,
-                    'result': result
-                })
-            except Exception as e:
-                results.append({
-                    'success': False,
-                    'error': str(e),
-                    'prompt_name': prompt_config.get('prompt_name')
-                })
+        unique = [index for index, original in enumerate(duplicate_of) if original is None]
+        outcomes = dict(zip(unique, await asyncio.gather(*(run(prompts[index]) for index in unique))))
+
+        results = []
+        for index, original in enumerate(duplicate_of):
+            if original is None:
+                results.append(outcomes[index])
+            else:
+                results.append({**outcomes[original], 'duplicate_of': original})
 
         return results
 
@@ -9,10 +9,15 @@ from .base_persona import BasePersona
 from .leadership import LeadershipPersona
 from .servicing_ops import ServicingOpsPersona
 from .marketing import MarketingPersona
+from .snapshot import PersonaSnapshotEngine
+from .metric_compiler import MetricCompiler, MetricSpec
 
 __all__ = [
     'BasePersona',
     'LeadershipPersona',
     'ServicingOpsPersona',
-    'MarketingPersona'
+    'MarketingPersona',
+    'PersonaSnapshotEngine',
+    'MetricCompiler',
+    'MetricSpec'
 ]
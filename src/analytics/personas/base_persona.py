@@ -8,8 +8,22 @@ Each persona transforms the same underlying data to answer their specific questi
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 import sqlite3
+import threading
+
+from .metric_compiler import MetricCompiler, MetricSpec
+
+
+# Read connections reused by personas on this thread, by database path.
+# Set on the snapshot engine's worker threads; elsewhere every query opens
+# and closes its own connection.
+_thread_connections = threading.local()
+
+
+def enable_connection_reuse() -> None:
+    """Reuse one read connection per database for persona queries on the current thread."""
+    _thread_connections.by_path = {}
 
 
 class BasePersona(ABC):
@@ -23,6 +37,7 @@ class BasePersona(ABC):
             db_path: Path to SQLite database
         """
         self.db_path = db_path
+        self.metric_compiler = MetricCompiler()
 
     @abstractmethod
     def transform_forecast(self, forecast: Dict[str, Any]) -> Dict[str, Any]:
@@ -68,6 +83,10 @@ class BasePersona(ABC):
         Returns:
             Query results
         """
+        conn = self._reused_connection()
+        if conn is not None:
+            return conn.execute(query, params).fetchall()
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute(query, params)
@@ -86,9 +105,39 @@ class BasePersona(ABC):
         Returns:
             Single result or None
         """
+        conn = self._reused_connection()
+        if conn is not None:
+            return conn.execute(query, params).fetchone()
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
         cursor.execute(query, params)
         result = cursor.fetchone()
         conn.close()
         return result
+
+    def _compute_metrics(self, specs: Iterable[MetricSpec], group_by: Optional[str] = None) -> Dict[Any, Any]:
+        """
+        Compute declared metrics with one fused query per base relation.
+
+        Args:
+            specs: Metric specs
+            group_by: Expression to group every metric by
+
+        Returns:
+            metric name → value (see MetricCompiler.execute)
+        """
+        return self.metric_compiler.execute(self._query_db, specs, group_by)
+
+    def get_query_stats(self) -> Dict[str, int]:
+        """Declared metrics vs fused queries executed by this persona."""
+        return self.metric_compiler.get_stats()
+
+    def _reused_connection(self) -> Optional[sqlite3.Connection]:
+        """This thread's read connection, if reuse is enabled (see enable_connection_reuse)."""
+        by_path = getattr(_thread_connections, 'by_path', None)
+        if by_path is None:
+            return None
+        if self.db_path not in by_path:
+            by_path[self.db_path] = sqlite3.connect(self.db_path)
+        return by_path[self.db_path]
@@ -13,6 +13,7 @@ import json
 from datetime import datetime, timedelta
 
 from .base_persona import BasePersona
+from .metric_compiler import MetricSpec, CALLS, ANALYSIS, WORKFLOWS
 
 
 class LeadershipPersona(BasePersona):
@@ -29,6 +30,35 @@ class LeadershipPersona(BasePersona):
     CHURN_REVENUE_LOSS = 250  # Lost servicing fees per churned loan
     COMPLIANCE_FINE_PER_ISSUE = 5000  # Estimated fine per compliance breach
 
+    LAST_7_DAYS = "created_at >= datetime('now', '-7 days')"
+
+    # Dashboard metrics: one scan each of calls, analysis and workflows
+    KEY_METRICS = (
+        MetricSpec('total_customers', CALLS, 'count_distinct', 't.customer_id'),
+        MetricSpec('avg_delinq_risk', CALLS, 'avg', 'a.delinquency_risk'),
+        MetricSpec('avg_churn_risk', CALLS, 'avg', 'a.churn_risk'),
+        MetricSpec('high_risk_count', CALLS, 'sum', 'CASE WHEN a.delinquency_risk > 0.7 THEN 1 ELSE 0 END'),
+        MetricSpec('compliance_score', ANALYSIS, 'avg', 'compliance_adherence', LAST_7_DAYS),
+        MetricSpec('compliance_issues', ANALYSIS, 'sum', 'COALESCE(compliance_issues, 0)',
+                   "created_at >= datetime('now', '-30 days')"),
+        MetricSpec('recent_delinquency', ANALYSIS, 'avg', 'delinquency_risk', LAST_7_DAYS),
+        MetricSpec('previous_delinquency', ANALYSIS, 'avg', 'delinquency_risk',
+                   "created_at >= datetime('now', '-14 days') AND created_at < datetime('now', '-7 days')"),
+        MetricSpec('total_workflows', WORKFLOWS, filter=LAST_7_DAYS),
+        MetricSpec('executed_workflows', WORKFLOWS, 'sum', "CASE WHEN status = 'EXECUTED' THEN 1 ELSE 0 END",
+                   LAST_7_DAYS),
+        MetricSpec('pending_workflows', WORKFLOWS, 'sum', "CASE WHEN status = 'AWAITING_APPROVAL' THEN 1 ELSE 0 END",
+                   LAST_7_DAYS),
+    )
+
+    # Decision triggers: one scan each of analysis and calls
+    ACTION_METRICS = (
+        MetricSpec('high_churn_count', ANALYSIS, filter=f"churn_risk > 0.7 AND {LAST_7_DAYS}"),
+        MetricSpec('high_delinq_count', ANALYSIS, filter=f"delinquency_risk > 0.7 AND {LAST_7_DAYS}"),
+        MetricSpec('low_compliance_advisors', CALLS, 'count_distinct', 't.advisor_id',
+                   "a.compliance_adherence < 0.75 AND t.advisor_id IS NOT NULL"),
+    )
+
     def transform_forecast(self, forecast: Dict[str, Any]) -> Dict[str, Any]:
         """
         Transform forecast to show dollar impact and strategic implications.
@@ -182,21 +212,13 @@ class LeadershipPersona(BasePersona):
         Returns:
             Key metrics for leadership view
         """
-        # Portfolio at risk
-        result = self._query_db_one("""
-            SELECT
-                COUNT(DISTINCT t.customer_id) as total_customers,
-                AVG(a.delinquency_risk) as avg_delinq_risk,
-                AVG(a.churn_risk) as avg_churn_risk,
-                SUM(CASE WHEN a.delinquency_risk > 0.7 THEN 1 ELSE 0 END) as high_risk_count
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-        """)
+        metrics = self._compute_metrics(self.KEY_METRICS)
 
-        total_customers = result[0] if result else 0
-        avg_delinq = result[1] if result and result[1] else 0
-        avg_churn = result[2] if result and result[2] else 0
-        high_risk_count = result[3] if result and result[3] else 0
+        # Portfolio at risk
+        total_customers = metrics['total_customers']
+        avg_delinq = metrics['avg_delinq_risk'] or 0
+        avg_churn = metrics['avg_churn_risk'] or 0
+        high_risk_count = metrics['high_risk_count'] or 0
 
         # Dollar calculations
         portfolio_value = total_customers * self.AVG_LOAN_BALANCE
@@ -204,50 +226,20 @@ class LeadershipPersona(BasePersona):
         churn_revenue_at_risk = total_customers * avg_churn * self.CHURN_REVENUE_LOSS
 
         # Compliance
-        result = self._query_db_one("""
-            SELECT AVG(compliance_adherence)
-            FROM analysis
-            WHERE created_at >= datetime('now', '-7 days')
-        """)
-        compliance_score = result[0] if result and result[0] else 0
+        compliance_score = metrics['compliance_score'] or 0
 
         # Workflow efficiency
-        result = self._query_db_one("""
-            SELECT
-                COUNT(*) as total_workflows,
-                SUM(CASE WHEN status = 'EXECUTED' THEN 1 ELSE 0 END) as executed,
-                SUM(CASE WHEN status = 'AWAITING_APPROVAL' THEN 1 ELSE 0 END) as pending_approval
-            FROM workflows
-            WHERE created_at >= datetime('now', '-7 days')
-        """)
-        total_wf = result[0] if result else 0
-        executed_wf = result[1] if result and result[1] else 0
-        pending_wf = result[2] if result and result[2] else 0
+        total_wf = metrics['total_workflows']
+        executed_wf = metrics['executed_workflows'] or 0
+        pending_wf = metrics['pending_workflows'] or 0
 
         # Compliance incidents (last 30 days)
-        result = self._query_db_one("""
-            SELECT SUM(COALESCE(compliance_issues, 0))
-            FROM analysis
-            WHERE created_at >= datetime('now', '-30 days')
-        """)
-        compliance_issues = result[0] if result and result[0] else 0
+        compliance_issues = metrics['compliance_issues'] or 0
         compliance_penalty = compliance_issues * self.COMPLIANCE_FINE_PER_ISSUE
 
         # Risk trend (compare last 7 days vs previous period)
-        recent = self._query_db_one("""
-            SELECT AVG(delinquency_risk)
-            FROM analysis
-            WHERE created_at >= datetime('now', '-7 days')
-        """)
-        prev = self._query_db_one("""
-            SELECT AVG(delinquency_risk)
-            FROM analysis
-            WHERE created_at >= datetime('now', '-14 days')
-              AND created_at < datetime('now', '-7 days')
-        """)
-
-        recent_delinq = recent[0] if recent and recent[0] is not None else 0
-        previous_delinq = prev[0] if prev and prev[0] is not None else 0
+        recent_delinq = metrics['recent_delinquency'] if metrics['recent_delinquency'] is not None else 0
+        previous_delinq = metrics['previous_delinquency'] if metrics['previous_delinquency'] is not None else 0
         delta = recent_delinq - previous_delinq
         delta_pct = None
         if previous_delinq:
@@ -292,15 +284,10 @@ class LeadershipPersona(BasePersona):
             List of recommended actions with ROI estimates
         """
         actions = []
+        metrics = self._compute_metrics(self.ACTION_METRICS)
 
         # High churn risk → Retention campaign
-        result = self._query_db_one("""
-            SELECT COUNT(*)
-            FROM analysis
-            WHERE churn_risk > 0.7
-            AND created_at >= datetime('now', '-7 days')
-        """)
-        high_churn_count = result[0] if result else 0
+        high_churn_count = metrics['high_churn_count']
 
         if high_churn_count > 10:
             actions.append({
@@ -316,13 +303,7 @@ class LeadershipPersona(BasePersona):
             })
 
         # High delinquency → Hardship outreach
-        result = self._query_db_one("""
-            SELECT COUNT(*)
-            FROM analysis
-            WHERE delinquency_risk > 0.7
-            AND created_at >= datetime('now', '-7 days')
-        """)
-        high_delinq_count = result[0] if result else 0
+        high_delinq_count = metrics['high_delinq_count']
 
         if high_delinq_count > 10:
             potential_loss = high_delinq_count * self.AVG_LOAN_BALANCE * self.DELINQUENCY_LOSS_RATE
@@ -339,14 +320,7 @@ class LeadershipPersona(BasePersona):
             })
 
         # Compliance issues → Training
-        result = self._query_db_one("""
-            SELECT COUNT(DISTINCT t.advisor_id)
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-            WHERE a.compliance_adherence < 0.75
-            AND t.advisor_id IS NOT NULL
-        """)
-        low_compliance_advisors = result[0] if result else 0
+        low_compliance_advisors = metrics['low_compliance_advisors']
 
         if low_compliance_advisors > 5:
             actions.append({
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 import json
 
 from .base_persona import BasePersona
+from .metric_compiler import MetricSpec, CALLS, TRANSCRIPTS
 
 
 class MarketingPersona(BasePersona):
@@ -35,6 +36,20 @@ class MarketingPersona(BasePersona):
         'pmi_ready': "a.primary_intent = 'PMI removal request'"
     }
 
+    # Segment sizes and profiles, computed in one scan of calls
+    SEGMENT_METRICS = (
+        MetricSpec('refi_ready', CALLS, 'count_distinct', 't.customer_id', SEGMENT_FILTERS['refi_ready']),
+        MetricSpec('refi_avg_likelihood', CALLS, 'avg', 'a.refinance_likelihood', SEGMENT_FILTERS['refi_ready']),
+        MetricSpec('refi_satisfaction_rate', CALLS, 'avg', "(a.borrower_sentiment = 'Positive')",
+                   SEGMENT_FILTERS['refi_ready']),
+        MetricSpec('at_risk', CALLS, 'count_distinct', 't.customer_id', SEGMENT_FILTERS['at_risk']),
+        MetricSpec('at_risk_avg_churn', CALLS, 'avg', 'a.churn_risk', SEGMENT_FILTERS['at_risk']),
+        MetricSpec('at_risk_avg_delinq', CALLS, 'avg', 'a.delinquency_risk', SEGMENT_FILTERS['at_risk']),
+        MetricSpec('loyal', CALLS, 'count_distinct', 't.customer_id', SEGMENT_FILTERS['loyal']),
+        MetricSpec('loyal_avg_churn', CALLS, 'avg', 'a.churn_risk', SEGMENT_FILTERS['loyal']),
+        MetricSpec('pmi_removal', CALLS, 'count_distinct', 't.customer_id', SEGMENT_FILTERS['pmi_ready']),
+    )
+
     def get_segment_condition(self, segment_id: Optional[str]) -> Optional[str]:
         if not segment_id:
             return None
@@ -164,43 +179,15 @@ class MarketingPersona(BasePersona):
         Returns:
             Key metrics for marketing view
         """
-        # Segment sizes
-        result = self._query_db_one("""
-            SELECT COUNT(DISTINCT customer_id)
-            FROM transcripts
-        """)
-        total_customers = result[0] if result else 0
-
-        # High-value segments
-        result = self._query_db_one("""
-            SELECT
-                COUNT(DISTINCT t.customer_id) as refi_ready,
-                AVG(a.refinance_likelihood) as avg_refi_likelihood
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-            WHERE a.refinance_likelihood > 0.7
-        """)
-        refi_ready = result[0] if result and result[0] else 0
-        avg_refi_likelihood = result[1] if result and result[1] else 0
-
-        # At-risk segment
-        result = self._query_db_one("""
-            SELECT COUNT(DISTINCT t.customer_id)
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-            WHERE a.churn_risk > 0.6 OR a.delinquency_risk > 0.6
-        """)
-        at_risk = result[0] if result else 0
-
-        # Loyal segment
-        result = self._query_db_one("""
-            SELECT COUNT(DISTINCT t.customer_id)
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-            WHERE a.churn_risk < 0.3
-            AND a.borrower_sentiment IN ('Positive', 'Satisfied')
-        """)
-        loyal = result[0] if result else 0
+        # Segment sizes (high-value, at-risk, loyal) against all customers
+        metrics = self._compute_metrics(self.SEGMENT_METRICS + (
+            MetricSpec('total_customers', TRANSCRIPTS, 'count_distinct', 'customer_id'),
+        ))
+        total_customers = metrics['total_customers']
+        refi_ready = metrics['refi_ready']
+        avg_refi_likelihood = metrics['refi_avg_likelihood'] or 0
+        at_risk = metrics['at_risk']
+        loyal = metrics['loyal']
 
         return {
             'segment_overview': {
@@ -308,96 +295,68 @@ class MarketingPersona(BasePersona):
             List of segments with characteristics and opportunities
         """
         segments = []
+        metrics = self._compute_metrics(self.SEGMENT_METRICS)
 
         # Refi-ready segment
-        result = self._query_db_one("""
-            SELECT
-                COUNT(DISTINCT t.customer_id) as count,
-                AVG(a.refinance_likelihood) as avg_likelihood,
-                AVG(a.borrower_sentiment = 'Positive') as satisfaction_rate
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-            WHERE a.refinance_likelihood > 0.7
-        """)
-        if result and result[0]:
+        count = metrics['refi_ready']
+        if count:
             segments.append({
                 'segment_name': 'Refi-Ready',
                 'segment_id': 'refi_ready',
-                'count': result[0],
+                'count': count,
                 'profile': 'High refinance likelihood, rate-sensitive',
-                'avg_score': result[1],
-                'satisfaction_rate': result[2] if result[2] else 0.5,
+                'avg_score': metrics['refi_avg_likelihood'],
+                'satisfaction_rate': metrics['refi_satisfaction_rate'] or 0.5,
                 'opportunity': 'Revenue generation through refinancing',
-                'opportunity_value': result[0] * self.REFI_REVENUE_PER_LOAN,
+                'opportunity_value': count * self.REFI_REVENUE_PER_LOAN,
                 'engagement_strategy': 'Personalized rate quotes, benefits calculator',
                 'expected_response_rate': 0.45,
                 'priority': 'high'
             })
 
         # At-risk segment
-        result = self._query_db_one("""
-            SELECT
-                COUNT(DISTINCT t.customer_id) as count,
-                AVG(a.churn_risk) as avg_churn,
-                AVG(a.delinquency_risk) as avg_delinq
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-            WHERE a.churn_risk > 0.6 OR a.delinquency_risk > 0.6
-        """)
-        if result and result[0]:
+        count = metrics['at_risk']
+        if count:
             segments.append({
                 'segment_name': 'At-Risk',
                 'segment_id': 'at_risk',
-                'count': result[0],
+                'count': count,
                 'profile': 'High churn/delinquency risk, needs attention',
-                'avg_churn_risk': result[1] if result[1] else 0,
-                'avg_delinq_risk': result[2] if result[2] else 0,
+                'avg_churn_risk': metrics['at_risk_avg_churn'] or 0,
+                'avg_delinq_risk': metrics['at_risk_avg_delinq'] or 0,
                 'opportunity': 'Retention and loss prevention',
-                'opportunity_value': result[0] * self.AVG_SERVICING_FEE_ANNUAL,
+                'opportunity_value': count * self.AVG_SERVICING_FEE_ANNUAL,
                 'engagement_strategy': 'Proactive support, hardship assistance, retention offers',
                 'expected_response_rate': 0.55,
                 'priority': 'critical'
             })
 
         # Loyal segment
-        result = self._query_db_one("""
-            SELECT
-                COUNT(DISTINCT t.customer_id) as count,
-                AVG(a.churn_risk) as avg_churn
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-            WHERE a.churn_risk < 0.3
-            AND a.borrower_sentiment IN ('Positive', 'Satisfied')
-        """)
-        if result and result[0]:
+        count = metrics['loyal']
+        if count:
             segments.append({
                 'segment_name': 'Loyal Champions',
                 'segment_id': 'loyal',
-                'count': result[0],
+                'count': count,
                 'profile': 'Low risk, high satisfaction, brand advocates',
-                'avg_churn_risk': result[1] if result[1] else 0,
+                'avg_churn_risk': metrics['loyal_avg_churn'] or 0,
                 'opportunity': 'Referrals and advocacy',
-                'opportunity_value': result[0] * 0.25 * self.REFI_REVENUE_PER_LOAN,
+                'opportunity_value': count * 0.25 * self.REFI_REVENUE_PER_LOAN,
                 'engagement_strategy': 'Referral incentives, reviews, testimonials',
                 'expected_response_rate': 0.35,
                 'priority': 'medium'
             })
 
         # PMI removal segment
-        result = self._query_db_one("""
-            SELECT COUNT(DISTINCT t.customer_id)
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-            WHERE a.primary_intent = 'PMI removal request'
-        """)
-        if result and result[0]:
+        count = metrics['pmi_removal']
+        if count:
             segments.append({
                 'segment_name': 'PMI Removal Eligible',
                 'segment_id': 'pmi_removal',
-                'count': result[0],
+                'count': count,
                 'profile': 'Potential equity position, rate optimization',
                 'opportunity': 'Retention through cost savings',
-                'opportunity_value': result[0] * 1200,  # $1200 annual PMI savings
+                'opportunity_value': count * 1200,  # $1200 annual PMI savings
                 'engagement_strategy': 'Proactive PMI analysis, fast-track process',
                 'expected_response_rate': 0.75,
                 'priority': 'high'
@@ -0,0 +1,158 @@
+"""
+Metric compilation: fuse declared persona metrics into conditional aggregates.
+
+Personas declare each metric as a (filter, aggregate) spec over a base
+relation instead of writing one query per WHERE clause. Every spec that
+targets the same base is compiled into a single scan:
+
+    COUNT(DISTINCT t.customer_id) ... WHERE a.churn_risk > 0.7
+    AVG(a.churn_risk)             ... WHERE a.churn_risk > 0.6
+        → COUNT(DISTINCT CASE WHEN a.churn_risk > 0.7 THEN t.customer_id END),
+          AVG(CASE WHEN a.churn_risk > 0.6 THEN a.churn_risk END)
+
+Aggregates ignore NULLs, so each fused column equals its standalone query.
+The WHERE clause keeps the union of the filters (a shared filter stays
+as-is), so narrow metric families such as last-7-days still use indexes.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# Base relations persona metrics are declared over
+CALLS = "transcripts t JOIN analysis a ON t.id = a.transcript_id"
+ANALYSIS = "analysis"
+TRANSCRIPTS = "transcripts"
+WORKFLOWS = "workflows"
+
+AGGREGATES = ('count', 'count_distinct', 'sum', 'avg', 'min', 'max')
+
+
+@dataclass(frozen=True)
+class MetricSpec:
+    """One metric: an aggregate of an expression over the rows of a base matching a filter."""
+    name: str
+    source: str
+    aggregate: str = 'count'
+    expression: str = '*'
+    filter: Optional[str] = None
+
+    def __post_init__(self):
+        if self.aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate '{self.aggregate}' for metric '{self.name}'. "
+                             f"Supported: {AGGREGATES}")
+        if self.expression == '*' and self.aggregate != 'count':
+            raise ValueError(f"Metric '{self.name}': only 'count' can aggregate '*'")
+
+    def to_sql(self, condition: Optional[str]) -> str:
+        """Aggregate column, restricted to rows matching condition (None: every row)."""
+        expression = self.expression
+        if condition:
+            expression = f"CASE WHEN {condition} THEN {'1' if expression == '*' else expression} END"
+        if self.aggregate == 'count_distinct':
+            return f"COUNT(DISTINCT {expression})"
+        return f"{self.aggregate.upper()}({expression})"
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """One fused scan and the metric each selected column answers."""
+    sql: str
+    names: Tuple[str, ...]
+
+
+class MetricCompiler:
+    """Compiles metric specs into one query per base and counts fused vs executed queries."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = 0
+        self._queries_executed = 0
+
+    def compile(self, specs: Iterable[MetricSpec], group_by: Optional[str] = None) -> List[CompiledQuery]:
+        """
+        Fuse specs into one query per base relation.
+
+        Args:
+            specs: Metric specs (unique names)
+            group_by: Expression every query is grouped by (selected first)
+
+        Returns:
+            Compiled queries, in order of each base's first spec
+
+        Raises:
+            ValueError: Duplicate metric names (NO FALLBACK)
+        """
+        by_source: Dict[str, List[MetricSpec]] = OrderedDict()
+        seen = set()
+        for spec in specs:
+            if spec.name in seen:
+                raise ValueError(f"Duplicate metric name: {spec.name}")
+            seen.add(spec.name)
+            by_source.setdefault(spec.source, []).append(spec)
+
+        queries = []
+        for source, group in by_source.items():
+            filters = list(OrderedDict.fromkeys(spec.filter for spec in group))
+            shared = len(filters) == 1
+            columns = [spec.to_sql(None if shared else spec.filter) for spec in group]
+
+            sql = f"SELECT {', '.join(([group_by] if group_by else []) + columns)} FROM {source}"
+            if shared and filters[0]:
+                sql += f" WHERE {filters[0]}"
+            elif None not in filters:
+                # Skip rows no metric counts (and let an index find the rest)
+                sql += " WHERE " + " OR ".join(f"({condition})" for condition in filters)
+            if group_by:
+                sql += f" GROUP BY {group_by} ORDER BY {group_by}"
+            queries.append(CompiledQuery(sql=sql, names=tuple(spec.name for spec in group)))
+        return queries
+
+    def execute(self, run_query: Callable[[str], List[tuple]], specs: Iterable[MetricSpec],
+                group_by: Optional[str] = None) -> Dict[Any, Any]:
+        """
+        Compile specs and run the fused queries.
+
+        Args:
+            run_query: Executes SQL and returns all rows
+            specs: Metric specs
+            group_by: Expression to group every metric by
+
+        Returns:
+            metric name → value, or with group_by: group value → metric name → value
+            (groups a base has no rows for are absent from that base's metrics)
+        """
+        specs = list(specs)
+        queries = self.compile(specs, group_by)
+
+        values: Dict[Any, Any] = {}
+        for query in queries:
+            rows = run_query(query.sql)
+            if group_by:
+                for row in rows:
+                    values.setdefault(row[0], {}).update(zip(query.names, row[1:]))
+            else:
+                values.update(zip(query.names, rows[0]))
+
+        with self._lock:
+            self._metrics += len(specs)
+            self._queries_executed += len(queries)
+        return values
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Query counts since creation.
+
+        Returns:
+            'metrics': specs computed,
+            'queries_executed': fused queries run,
+            'queries_fused': standalone metric queries folded into shared scans
+        """
+        with self._lock:
+            return {
+                'metrics': self._metrics,
+                'queries_executed': self._queries_executed,
+                'queries_fused': self._metrics - self._queries_executed
+            }
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 import json
 
 from .base_persona import BasePersona
+from .metric_compiler import MetricSpec, CALLS, ANALYSIS, TRANSCRIPTS
 
 
 class ServicingOpsPersona(BasePersona):
@@ -32,6 +33,26 @@ class ServicingOpsPersona(BasePersona):
     AVG_CALLS_PER_HOUR_PER_ADVISOR = 6
     AVG_HANDLE_TIME_MINUTES = 8
 
+    # Last-7-days SLA and volume metrics (shared by dashboard and SLA prediction)
+    SLA_METRICS = (
+        MetricSpec('fcr_rate', ANALYSIS, 'avg', 'CASE WHEN first_call_resolution = 1 THEN 1.0 ELSE 0.0 END',
+                   "created_at >= datetime('now', '-7 days')"),
+        MetricSpec('escalation_rate', ANALYSIS, 'avg', 'CASE WHEN escalation_needed = 1 THEN 1.0 ELSE 0.0 END',
+                   "created_at >= datetime('now', '-7 days')"),
+        MetricSpec('weekly_calls', TRANSCRIPTS, filter="timestamp >= datetime('now', '-7 days')"),
+    )
+
+    TEAM_METRICS = SLA_METRICS + (
+        MetricSpec('avg_compliance', ANALYSIS, 'avg', 'compliance_adherence',
+                   "created_at >= datetime('now', '-7 days')"),
+        MetricSpec('total_advisors', CALLS, 'count_distinct', 't.advisor_id',
+                   "t.advisor_id IS NOT NULL AND t.timestamp >= datetime('now', '-7 days')"),
+        MetricSpec('team_avg_empathy', CALLS, 'avg', 'a.empathy_score',
+                   "t.advisor_id IS NOT NULL AND t.timestamp >= datetime('now', '-7 days')"),
+        MetricSpec('team_avg_compliance', CALLS, 'avg', 'a.compliance_adherence',
+                   "t.advisor_id IS NOT NULL AND t.timestamp >= datetime('now', '-7 days')"),
+    )
+
     def transform_forecast(self, forecast: Dict[str, Any]) -> Dict[str, Any]:
         """
         Transform forecast to show operational implications.
@@ -162,25 +183,14 @@ class ServicingOpsPersona(BasePersona):
             return {'status': 'unknown'}
 
         # Get current performance
-        result = self._query_db_one("""
-            SELECT
-                AVG(CASE WHEN first_call_resolution = 1 THEN 1.0 ELSE 0.0 END) as fcr_rate,
-                AVG(CASE WHEN escalation_needed = 1 THEN 1.0 ELSE 0.0 END) as escalation_rate
-            FROM analysis
-            WHERE created_at >= datetime('now', '-7 days')
-        """)
+        metrics = self._compute_metrics(self.SLA_METRICS)
 
-        current_fcr = result[0] if result and result[0] else self.SLA_FIRST_CALL_RESOLUTION
-        current_escalation = result[1] if result and result[1] else self.SLA_ESCALATION_RATE
+        current_fcr = metrics['fcr_rate'] or self.SLA_FIRST_CALL_RESOLUTION
+        current_escalation = metrics['escalation_rate'] or self.SLA_ESCALATION_RATE
 
         # Simple prediction: if volume increases >20%, performance degrades
         avg_volume = forecast.get('summary', {}).get('average_predicted', 0)
-        result = self._query_db_one("""
-            SELECT COUNT(*) / 7.0
-            FROM transcripts
-            WHERE timestamp >= datetime('now', '-7 days')
-        """)
-        baseline_volume = result[0] if result else avg_volume
+        baseline_volume = metrics['weekly_calls'] / 7.0
 
         volume_change = ((avg_volume - baseline_volume) / baseline_volume * 100) if baseline_volume > 0 else 0
 
@@ -304,46 +314,23 @@ class ServicingOpsPersona(BasePersona):
         Returns:
             Key metrics for operations view
         """
-        # Current SLA performance
-        result = self._query_db_one("""
-            SELECT
-                AVG(CASE WHEN first_call_resolution = 1 THEN 1.0 ELSE 0.0 END) as fcr_rate,
-                AVG(CASE WHEN escalation_needed = 1 THEN 1.0 ELSE 0.0 END) as escalation_rate,
-                AVG(compliance_adherence) as avg_compliance
-            FROM analysis
-            WHERE created_at >= datetime('now', '-7 days')
-        """)
+        metrics = self._compute_metrics(self.TEAM_METRICS)
 
-        fcr_rate = result[0] if result and result[0] else 0
-        escalation_rate = result[1] if result and result[1] else 0
-        avg_compliance = result[2] if result and result[2] else 0
+        # Current SLA performance
+        fcr_rate = metrics['fcr_rate'] or 0
+        escalation_rate = metrics['escalation_rate'] or 0
+        avg_compliance = metrics['avg_compliance'] or 0
 
         # Advisor performance summary
-        result = self._query_db_one("""
-            SELECT
-                COUNT(DISTINCT t.advisor_id) as total_advisors,
-                AVG(a.empathy_score) as avg_empathy,
-                AVG(a.compliance_adherence) as avg_compliance
-            FROM transcripts t
-            JOIN analysis a ON t.id = a.transcript_id
-            WHERE t.advisor_id IS NOT NULL
-            AND t.timestamp >= datetime('now', '-7 days')
-        """)
-
-        total_advisors = result[0] if result else 0
-        avg_empathy = result[1] if result and result[1] else 0
-        avg_compliance_team = result[2] if result and result[2] else 0
+        total_advisors = metrics['total_advisors']
+        avg_empathy = metrics['team_avg_empathy'] or 0
+        avg_compliance_team = metrics['team_avg_compliance'] or 0
 
         # Advisors needing attention
         coaching_needed = len(self._identify_coaching_needs())
 
         # Queue estimates (based on recent patterns)
-        result = self._query_db_one("""
-            SELECT COUNT(*) / 7.0
-            FROM transcripts
-            WHERE timestamp >= datetime('now', '-7 days')
-        """)
-        avg_daily_calls = result[0] if result else 0
+        avg_daily_calls = metrics['weekly_calls'] / 7.0
 
         return {
             'sla_performance': {
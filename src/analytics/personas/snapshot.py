@@ -0,0 +1,150 @@
+"""
+Persona snapshot engine: concurrent, memoized persona metric blocks.
+
+A snapshot is made of metric blocks - one persona method call each
+(key metrics, recommended actions, segments), every block several SQL
+queries. Blocks are computed on a bounded thread pool whose threads each
+reuse one read connection, and are memoized until the source data changes
+(data-version watermark) or the TTL passes - the queries are relative to
+'now', so unchanged data still ages.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from src.storage.data_version_store import DataVersionStore, DATA_VERSION_SOURCES
+from .base_persona import BasePersona, enable_connection_reuse
+
+
+# Snapshot block → persona method producing it
+SNAPSHOT_BLOCKS = {
+    'leadership': {'metrics': 'get_key_metrics', 'recommended_actions': 'get_recommended_actions'},
+    'servicing': {'metrics': 'get_key_metrics', 'recommended_actions': 'get_recommended_actions'},
+    'marketing': {'metrics': 'get_key_metrics', 'recommended_actions': 'get_recommended_actions',
+                  'segments': 'get_customer_segments'},
+}
+
+
+class PersonaSnapshotEngine:
+    """Builds persona snapshots from concurrently computed, memoized metric blocks."""
+
+    def __init__(self, personas: Dict[str, BasePersona], db_path: str,
+                 max_workers: int = 4, ttl_seconds: float = 300):
+        """
+        Initialize snapshot engine.
+
+        Args:
+            personas: Persona name ('leadership', 'servicing', 'marketing') → persona
+            db_path: Path to database (data-version watermark)
+            max_workers: Threads running persona queries
+            ttl_seconds: Longest time a memoized block is reused
+
+        Raises:
+            ValueError: Unknown persona or invalid limits (NO FALLBACK)
+        """
+        unknown = set(personas) - set(SNAPSHOT_BLOCKS)
+        if unknown:
+            raise ValueError(f"Unknown personas: {sorted(unknown)}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.personas = personas
+        self.ttl_seconds = ttl_seconds
+        self.data_versions = DataVersionStore(db_path)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='persona-snapshot',
+            initializer=enable_connection_reuse
+        )
+        # (persona, block) → (data version, computed at, value)
+        self._cache: Dict[Tuple[str, str], Tuple[str, float, Any]] = {}
+        # (persona, block, data version) → computation in progress (shared by concurrent builds)
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def get_data_version(self) -> str:
+        """Watermark of every table the persona queries read."""
+        return self.data_versions.get_token(DATA_VERSION_SOURCES)
+
+    async def build(self, personas: Iterable[str], blocks: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Compute the blocks of the given personas concurrently.
+
+        Args:
+            personas: Persona names
+            blocks: Block names to include (default: every block of each persona)
+
+        Returns:
+            'personas': persona → block → value,
+            'snapshot_build_ms': persona → time until its last block was ready,
+            'cached_blocks': persona → blocks served from the memo,
+            'data_version': watermark the blocks are valid for
+        """
+        personas = list(personas)
+        unknown = [p for p in personas if p not in self.personas]
+        if unknown:
+            raise ValueError(f"Unknown personas: {unknown}")
+
+        wanted = set(blocks) if blocks is not None else None
+        started = time.perf_counter()
+        data_version = self.get_data_version()
+
+        async def timed(persona: str) -> Tuple[Dict[str, Any], int, int]:
+            names = [name for name in SNAPSHOT_BLOCKS[persona] if wanted is None or name in wanted]
+            results = await asyncio.gather(*(self._get_block(persona, name, data_version) for name in names))
+            values = {name: value for name, (value, _) in zip(names, results)}
+            cached = sum(1 for _, hit in results if hit)
+            return values, int((time.perf_counter() - started) * 1000), cached
+
+        built = await asyncio.gather(*(timed(persona) for persona in personas))
+        return {
+            'personas': {persona: values for persona, (values, _, _) in zip(personas, built)},
+            'snapshot_build_ms': {persona: ms for persona, (_, ms, _) in zip(personas, built)},
+            'cached_blocks': {persona: cached for persona, (_, _, cached) in zip(personas, built)},
+            'data_version': data_version
+        }
+
+    async def _get_block(self, persona: str, block: str, data_version: str) -> Tuple[Any, bool]:
+        """Memoized block value, computing it on the pool if needed.
+
+        Returns:
+            (value, served from memo)
+        """
+        key = (persona, block)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached and cached[0] == data_version and time.monotonic() - cached[1] < self.ttl_seconds:
+                return cached[2], True
+
+            inflight_key = (persona, block, data_version)
+            future = self._inflight.get(inflight_key)
+            if future is None:
+                method = getattr(self.personas[persona], SNAPSHOT_BLOCKS[persona][block])
+                future = asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._compute, key, data_version, method
+                )
+                self._inflight[inflight_key] = future
+                future.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+
+        return await asyncio.shield(future), False
+
+    def _compute(self, key: Tuple[str, str], data_version: str, method) -> Any:
+        """Run a persona method on a pool thread and memoize the result."""
+        computed_at = time.monotonic()
+        value = method()
+        with self._lock:
+            self._cache[key] = (data_version, computed_at, value)
+        return value
+
+    def invalidate(self, personas: Optional[List[str]] = None) -> None:
+        """Drop memoized blocks (of the given personas, or all)."""
+        with self._lock:
+            for key in list(self._cache):
+                if personas is None or key[0] in personas:
+                    del self._cache[key]
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
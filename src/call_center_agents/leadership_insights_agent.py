@@ -5,27 +5,41 @@ Core Principles Applied:
 - AGENTIC: LLM makes all decisions including what to say to user
 - TRANSPARENT: Real-time narration of thinking process
 - SIMPLE: One agent, one loop, conversational
+
+Retrieval modes:
+- sequential: one LLM "next thought" per source, each searched after it is picked
+- planned: one LLM call returns the understanding and the full retrieval plan,
+  the planned sources are searched concurrently, and a second round (the plan's
+  fallback searches) runs only if the first round found nothing
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
 import json
 import time
 from datetime import datetime
 
+from ..infrastructure.config.config_loader import get_leadership_insights_config
 from ..infrastructure.llm.llm_client_v2 import LLMClientV2, RequestOptions
 from ..infrastructure.telemetry import trace_async_function, set_span_attributes
 from ..utils.prompt_loader import prompt_loader
 from .insights.thinking_agent import ThinkingAgent, QueryUnderstanding
 
 
+DATA_SOURCES = ['analyses', 'transcripts', 'workflows', 'plans']
+RETRIEVAL_MODES = ('sequential', 'planned')
+
+
 class LeadershipInsightsAgent:
     """Simple conversational agent that thinks out loud while searching."""
 
-    def __init__(self, llm_client: LLMClientV2, data_reader=None):
+    def __init__(self, llm_client: LLMClientV2, data_reader=None,
+                 retrieval_mode: Optional[str] = None):
         """Initialize agent with dependencies.
 
         Args:
             llm_client: LLM client for reasoning
             data_reader: Data reader service for analytics
+            retrieval_mode: 'planned' or 'sequential' (default from config)
 
         Raises:
             Exception: If initialization fails (NO FALLBACK)
@@ -36,8 +50,13 @@ class LeadershipInsightsAgent:
         if not data_reader:
             raise ValueError("data_reader cannot be None")
 
+        retrieval_mode = retrieval_mode or get_leadership_insights_config('retrieval_mode', 'planned')
+        if retrieval_mode not in RETRIEVAL_MODES:
+            raise ValueError(f"Invalid retrieval_mode: {retrieval_mode}")
+
         self.llm = llm_client
         self.data_reader = data_reader
+        self.retrieval_mode = retrieval_mode
 
         # Initialize thinking agent for query understanding
         self.thinking_agent = ThinkingAgent(llm_client)
@@ -71,56 +90,19 @@ class LeadershipInsightsAgent:
         )
 
         try:
-            # Quick understanding of the query
-            understanding = await self.thinking_agent.understand_query(
-                query=query,
-                executive_role=executive_role,
-                session_context=session_context
-            )
-
-            # Start conversational search
-            found_data = {}
-            data_sources = ['analyses', 'transcripts', 'workflows', 'plans']
-
-            # Search loop with narration
-            for attempt in range(len(data_sources) + 1):  # +1 for final attempt
-                # Get LLM's next thought and narration
-                thought = await self._get_next_thought(
-                    query=query,
-                    understanding=understanding,
-                    searched_so_far=list(found_data.keys()),
-                    available_sources=[s for s in data_sources if s not in found_data],
-                    current_data=found_data,
-                    attempt=attempt
+            if self.retrieval_mode == 'planned':
+                understanding, found_data, retrieval = await self._planned_retrieval(
+                    query, executive_role, session_context
+                )
+            else:
+                understanding, found_data, retrieval = await self._sequential_retrieval(
+                    query, executive_role, session_context
                 )
-
-                # Print what the agent is thinking
-                print(thought['narration'])
-
-                # If LLM says to summarize, we're done searching
-                if thought['action'] == 'summarize':
-                    break
-
-                # If LLM wants to search, do it
-                if thought['action'] == 'search' and thought.get('source'):
-                    try:
-                        data = await self._search_source(
-                            thought['source'],
-                            thought.get('filters', {}),
-                            understanding
-                        )
-                        if data:
-                            found_data[thought['source']] = data
-                    except Exception as e:
-                        # Continue searching even if one source fails
-                        print(f"❌ Search failed: {str(e)}")
-
-                # If LLM says to fail fast, stop immediately
-                if thought['action'] == 'fail_fast':
-                    raise Exception(thought.get('reason', 'Cannot provide meaningful insights'))
 
             # Generate brief summary
             summary_response = await self._create_summary(query, understanding, found_data)
+            retrieval['llm_calls'] += 1
+            set_span_attributes(retrieval_mode=retrieval['mode'], llm_calls=retrieval['llm_calls'])
 
             # Print the summary
             print(f"\n💬 {summary_response['brief_summary']}")
@@ -142,6 +124,7 @@ class LeadershipInsightsAgent:
                     'overall_confidence': summary_response.get('confidence', 75),
                     'data_sources_used': list(found_data.keys()),
                     'records_analyzed': sum(len(data) if isinstance(data, list) else 1 for data in found_data.values()),
+                    'retrieval': retrieval,
                     'response_timestamp': datetime.now().isoformat()
                 }
             }
@@ -152,6 +135,151 @@ class LeadershipInsightsAgent:
             processing_time = time.time() - start_time
             raise Exception(f"Leadership insights processing failed after {processing_time:.2f}s: {str(e)}")
 
+    async def _sequential_retrieval(self, query: str, executive_role: str,
+                                    session_context: Dict[str, Any]) -> Tuple[QueryUnderstanding, Dict[str, Any], Dict[str, Any]]:
+        """Understand the query, then let the LLM pick and search one source at a time.
+
+        Returns:
+            (understanding, found data by source, retrieval metadata)
+        """
+        # Quick understanding of the query
+        understanding = await self.thinking_agent.understand_query(
+            query=query,
+            executive_role=executive_role,
+            session_context=session_context
+        )
+        retrieval = {'mode': 'sequential', 'llm_calls': 1, 'rounds': 0, 'sources_searched': [], 'searches': []}
+
+        # Start conversational search
+        found_data = {}
+        data_sources = DATA_SOURCES
+
+        # Search loop with narration
+        for attempt in range(len(data_sources) + 1):  # +1 for final attempt
+            # Get LLM's next thought and narration
+            thought = await self._get_next_thought(
+                query=query,
+                understanding=understanding,
+                searched_so_far=list(found_data.keys()),
+                available_sources=[s for s in data_sources if s not in found_data],
+                current_data=found_data,
+                attempt=attempt
+            )
+            retrieval['llm_calls'] += 1
+
+            # Print what the agent is thinking
+            print(thought['narration'])
+
+            # If LLM says to summarize, we're done searching
+            if thought['action'] == 'summarize':
+                break
+
+            # If LLM wants to search, do it
+            if thought['action'] == 'search' and thought.get('source'):
+                retrieval['rounds'] += 1
+                retrieval['sources_searched'].append(thought['source'])
+                retrieval['searches'].append({'source': thought['source'], 'filters': thought.get('filters') or {}})
+                try:
+                    data = await self._search_source(
+                        thought['source'],
+                        thought.get('filters', {}),
+                        understanding
+                    )
+                    if data:
+                        found_data[thought['source']] = data
+                except Exception as e:
+                    # Continue searching even if one source fails
+                    print(f"❌ Search failed: {str(e)}")
+
+            # If LLM says to fail fast, stop immediately
+            if thought['action'] == 'fail_fast':
+                raise Exception(thought.get('reason', 'Cannot provide meaningful insights'))
+
+        return understanding, found_data, retrieval
+
+    async def _planned_retrieval(self, query: str, executive_role: str,
+                                 session_context: Dict[str, Any]) -> Tuple[QueryUnderstanding, Dict[str, Any], Dict[str, Any]]:
+        """One planning LLM call, then concurrent searches of every planned source.
+
+        The second round (the plan's fallback searches) runs only when the
+        first round found no records - a relevance check that costs no LLM call.
+
+        Returns:
+            (understanding, found data by source, retrieval metadata)
+
+        Raises:
+            Exception: If planning fails or the plan says fail_fast (NO FALLBACK)
+        """
+        plan = await self._plan_retrieval(query, executive_role, session_context)
+        understanding = QueryUnderstanding(plan.get('understanding') or {})
+        retrieval = {'mode': 'planned', 'llm_calls': 1, 'rounds': 0, 'sources_searched': [], 'searches': []}
+
+        print(plan.get('narration', '🔍 Searching the planned sources...'))
+
+        if plan.get('action') == 'fail_fast':
+            raise Exception(plan.get('reason', 'Cannot provide meaningful insights'))
+
+        found_data: Dict[str, Any] = {}
+        for searches in (plan.get('searches') or [], plan.get('fallback_searches') or []):
+            # Cheap relevance check: a second round only when nothing relevant came back
+            if retrieval['rounds'] and found_data:
+                break
+
+            # One search per known source not searched yet
+            batch = {}
+            for search in searches:
+                source = search.get('source')
+                if source in DATA_SOURCES and source not in batch and source not in retrieval['sources_searched']:
+                    batch[source] = search.get('filters') or {}
+            if not batch:
+                continue
+
+            retrieval['rounds'] += 1
+            retrieval['sources_searched'].extend(batch)
+            retrieval['searches'].extend({'source': source, 'filters': filters} for source, filters in batch.items())
+            results = await asyncio.gather(*(
+                self._search_source(source, filters, understanding) for source, filters in batch.items()
+            ))
+            for source, data in zip(batch, results):
+                if data:
+                    found_data[source] = data
+
+            print(f"✅ Searched {', '.join(batch)}: {self._summarize_found_data(found_data)}")
+
+        return understanding, found_data, retrieval
+
+    async def _plan_retrieval(self, query: str, executive_role: str,
+                              session_context: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the query understanding and full retrieval plan in one LLM call.
+
+        Returns:
+            Plan with understanding, narration, action, searches and fallback_searches
+
+        Raises:
+            Exception: If the LLM returns no usable plan (NO FALLBACK)
+        """
+        try:
+            prompt = prompt_loader.format(
+                'insights/planning/retrieval_plan.txt',
+                query=query,
+                executive_role=executive_role or 'Unknown',
+                session_context=session_context or {},
+                available_sources=DATA_SOURCES
+            )
+
+            response = await self.llm.arun(
+                messages=[{"role": "user", "content": prompt}],
+                options=RequestOptions(temperature=0.3)
+            )
+
+            if not response.text:
+                raise Exception("LLM returned no plan")
+
+            return self._parse_json_response(response.text)
+
+        except Exception as e:
+            raise Exception(f"Retrieval planning failed: {str(e)}")
+
     async def _get_next_thought(self, query: str, understanding: QueryUnderstanding,
                                searched_so_far: List[str], available_sources: List[str],
                                current_data: Dict[str, Any], attempt: int) -> Dict[str, Any]:
@@ -353,9 +481,11 @@ class LeadershipInsightsAgent:
             'agent_type': 'LeadershipInsightsAgent',
             'version': '3.0.0',
             'approach': 'conversational_transparent',
+            'retrieval_mode': self.retrieval_mode,
             'capabilities': [
                 'real_time_narration',
                 'progressive_search',
+                'planned_parallel_search',
                 'conversational_summary',
                 'fail_fast_behavior'
             ],
@@ -121,6 +121,30 @@ def get_prediction_config(key: str, default=None):
     """Get prediction system configuration"""
     return _config.get(f'predictions.{key}', default)
 
+def get_orchestration_config(key: str, default=None):
+    """Get orchestration pipeline configuration"""
+    return _config.get(f'orchestration.{key}', default)
+
+def get_forecasting_config(key: str, default=None):
+    """Get forecasting (Prophet training) configuration"""
+    return _config.get(f'forecasting.{key}', default)
+
+def get_precompute_config(key: str, default=None):
+    """Get background cache warming (precompute scheduler) configuration"""
+    return _config.get(f'precompute.{key}', default)
+
+def get_intelligence_config(key: str, default=None):
+    """Get intelligence service (persona snapshot, insight cache) configuration"""
+    return _config.get(f'intelligence.{key}', default)
+
+def get_leadership_insights_config(key: str, default=None):
+    """Get leadership insights (semantic query cache) configuration"""
+    return _config.get(f'leadership_insights.{key}', default)
+
+def get_conversation_context_config(key: str, default=None):
+    """Get conversation context (rolling summary, prompt token budget) configuration"""
+    return _config.get(f'conversation_context.{key}', default)
+
 def get_agent_config_value(agent_name: str, config_key: str, default=None):
     """Get specific configuration value for an agent"""
     return _config.get(f'agents.{agent_name}.{config_key}', default)
\ No newline at end of file
@@ -14,12 +14,14 @@ from .event_types import (
     PlanGeneratedPayload,
     WorkflowCreatedPayload,
     ExecutionStepCompletedPayload,
+    WorkflowExecutedPayload,
     create_transcript_event,
     create_escalation_event,
     create_analysis_event,
     create_plan_generated_event,
     create_workflow_created_event,
-    create_execution_step_completed_event
+    create_execution_step_completed_event,
+    create_workflow_executed_event
 )
 from .event_system import (
     EventSystem,
@@ -43,12 +45,14 @@ __all__ = [
     'PlanGeneratedPayload',
     'WorkflowCreatedPayload',
     'ExecutionStepCompletedPayload',
+    'WorkflowExecutedPayload',
     'create_transcript_event',
     'create_escalation_event',
     'create_analysis_event',
     'create_plan_generated_event',
     'create_workflow_created_event',
     'create_execution_step_completed_event',
+    'create_workflow_executed_event',
     'get_event_system',
     'publish_event',
     'subscribe_to_events',
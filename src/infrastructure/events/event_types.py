@@ -212,6 +212,19 @@ class ExecutionStepCompletedPayload:
     execution_time_ms: int
 
 
+@dataclass
+class WorkflowExecutedPayload:
+    """Payload for WORKFLOW_COMPLETED / WORKFLOW_FAILED execution events."""
+    workflow_id: str
+    status: str  # executed, partial_failure, failed
+    execution_id: Optional[str]
+    successful_steps: int
+    failed_steps: int
+    execution_duration_ms: int
+    executed_by: str
+    error: Optional[str] = None
+
+
 # Event Factory Functions
 def create_transcript_event(transcript_id: str, customer_id: str, advisor_id: str,
                           topic: str, urgency: str, channel: str) -> Event:
@@ -350,4 +363,28 @@ def create_execution_step_completed_event(execution_id: str, workflow_id: str, s
         timestamp=datetime.utcnow(),
         payload=payload,
         source_service="execution_service"
-    )
\ No newline at end of file
+    )
+
+def create_workflow_executed_event(workflow_id: str, status: str, execution_id: Optional[str],
+                                   successful_steps: int, failed_steps: int, execution_duration_ms: int,
+                                   executed_by: str, error: Optional[str] = None) -> Event:
+    """Create a WORKFLOW_COMPLETED event, or WORKFLOW_FAILED when the execution failed."""
+    payload = WorkflowExecutedPayload(
+        workflow_id=workflow_id,
+        status=status,
+        execution_id=execution_id,
+        successful_steps=successful_steps,
+        failed_steps=failed_steps,
+        execution_duration_ms=execution_duration_ms,
+        executed_by=executed_by,
+        error=error
+    ).__dict__
+
+    event_type = EventType.WORKFLOW_FAILED if status == "failed" else EventType.WORKFLOW_COMPLETED
+    return Event(
+        event_type=event_type,
+        event_id=f"workflow_executed_{workflow_id}_{int(datetime.utcnow().timestamp())}",
+        timestamp=datetime.utcnow(),
+        payload=payload,
+        source_service="execution_service"
+    )
@@ -0,0 +1,85 @@
+"""Offline LLM provider that streams scripted answers.
+
+Stands in for OpenAIProvider in tests and local demos: every request is
+answered with a scripted text, delivered in small chunks with configurable
+latency so streaming consumers see the same shape of output (first token
+early, the rest over time) without network access or an API key.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import AsyncGenerator, Callable, List, Sequence, Union
+
+from .llm_client_v2 import LLMProvider, RequestSpec, ResponseEnvelope
+
+Responder = Union[str, Sequence[str], Callable[[RequestSpec], str]]
+
+
+class FakeStreamingProvider(LLMProvider):
+    """Answers from a script: one fixed text, a list used in order, or a function of the request."""
+
+    model = "fake-streaming"
+
+    def __init__(self, responses: Responder, chunk_chars: int = 4,
+                 first_token_ms: float = 0.0, chunk_ms: float = 0.0) -> None:
+        """
+        Args:
+            responses: Fixed answer, answers for successive requests, or spec → answer
+            chunk_chars: Characters per streamed delta
+            first_token_ms: Latency before the first delta
+            chunk_ms: Latency between deltas
+
+        Raises:
+            ValueError: chunk_chars below 1 (NO FALLBACK)
+        """
+        if chunk_chars < 1:
+            raise ValueError("chunk_chars must be at least 1")
+
+        self.responses = responses
+        self.chunk_chars = chunk_chars
+        self.first_token_ms = first_token_ms
+        self.chunk_ms = chunk_ms
+        self.requests: List[RequestSpec] = []
+        self._next = 0
+
+    def _answer(self, spec: RequestSpec) -> str:
+        self.requests.append(spec)
+        if isinstance(self.responses, str):
+            return self.responses
+        if callable(self.responses):
+            return self.responses(spec)
+        if self._next >= len(self.responses):
+            raise RuntimeError(f"FakeStreamingProvider has no scripted answer for request {self._next + 1}")
+        self._next += 1
+        return self.responses[self._next - 1]
+
+    def _envelope(self, text: str, spec: RequestSpec, start: float) -> ResponseEnvelope:
+        return ResponseEnvelope(
+            text=text,
+            parsed=None,
+            messages=list(spec.messages),
+            usage=None,
+            response_id=f"fake-{len(self.requests)}",
+            latency_ms=(time.perf_counter() - start) * 1000,
+            raw=None,
+        )
+
+    async def astream(self, spec: RequestSpec) -> AsyncGenerator[ResponseEnvelope, None]:
+        start = time.perf_counter()
+        text = self._answer(spec)
+        await asyncio.sleep(self.first_token_ms / 1000)
+        for offset in range(0, len(text), self.chunk_chars):
+            if offset:
+                await asyncio.sleep(self.chunk_ms / 1000)
+            yield self._envelope(text[offset:offset + self.chunk_chars], spec, start)
+
+    async def arun(self, spec: RequestSpec) -> ResponseEnvelope:
+        start = time.perf_counter()
+        text = self._answer(spec)
+        chunks = max(1, -(-len(text) // self.chunk_chars))
+        await asyncio.sleep((self.first_token_ms + (chunks - 1) * self.chunk_ms) / 1000)
+        return self._envelope(text, spec, start)
+
+    def run(self, spec: RequestSpec) -> ResponseEnvelope:
+        return asyncio.run(self.arun(spec))
@@ -0,0 +1,91 @@
+"""Incremental extraction of a readable field from streamed JSON output.
+
+Prompts that answer in JSON put the human-readable answer in one string
+field ("content"). While the model is still writing, JsonFieldStream turns
+the raw deltas into the decoded characters of that field only, so a client
+can render the answer as it arrives without seeing JSON syntax. Output that
+does not start like JSON is passed through unchanged.
+"""
+
+import re
+
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+
+class JsonFieldStream:
+    """Feeds raw LLM deltas, returns the newly decoded characters of one top-level string field."""
+
+    def __init__(self, field: str = 'content'):
+        self.field = field
+        self._key = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ''
+        self._pos = 0
+        self._mode = 'start'  # start | json (looking for the field) | string | text (not JSON) | done
+
+    @property
+    def done(self) -> bool:
+        """Whether the field's closing quote has been seen."""
+        return self._mode == 'done'
+
+    def feed(self, delta: str) -> str:
+        """Decoded field characters completed by this delta ('' if none yet)."""
+        self._buffer += delta
+
+        if self._mode == 'text':
+            return delta
+        if self._mode == 'start':
+            head = self._buffer.lstrip()
+            if not head:
+                return ''
+            if head[0] not in '{[`':
+                self._mode = 'text'
+                return self._buffer
+            self._mode = 'json'
+        if self._mode == 'json':
+            match = self._key.search(self._buffer)
+            if not match:
+                return ''
+            self._mode = 'string'
+            self._pos = match.end()
+        if self._mode == 'string':
+            return self._decode()
+        return ''
+
+    def _decode(self) -> str:
+        """Decode buffered string characters; incomplete escapes wait for the next delta."""
+        buffer, i, out = self._buffer, self._pos, []
+        while i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self._mode = 'done'
+                i += 1
+                break
+            if char != '\\':
+                out.append(char)
+                i += 1
+                continue
+
+            if i + 1 >= len(buffer):
+                break
+            escape = buffer[i + 1]
+            if escape != 'u':
+                out.append(_ESCAPES.get(escape, escape))
+                i += 2
+                continue
+
+            if i + 6 > len(buffer):
+                break
+            code = int(buffer[i + 2:i + 6], 16)
+            if 0xD800 <= code < 0xDC00:
+                # Surrogate pair: wait for the low half
+                if i + 12 > len(buffer):
+                    break
+                low = int(buffer[i + 8:i + 12], 16)
+                out.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                i += 12
+            else:
+                out.append(chr(code))
+                i += 6
+
+        self._pos = i
+        return ''.join(out)
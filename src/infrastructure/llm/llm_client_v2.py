@@ -200,51 +200,73 @@ class OpenAIProvider(LLMProvider):
         raise last_exc
 
     async def astream(self, spec: RequestSpec) -> AsyncGenerator[ResponseEnvelope, None]:
+        """Yield the response text as it is generated, one envelope per delta.
+
+        Failures before the first delta are retried like arun; after that the
+        caller has consumed partial output, so errors propagate.
+        """
+        if spec.response_schema is not None:
+            raise ValueError("Structured (response_schema) requests cannot be streamed - use arun")
+
         messages = self._build_messages(spec)
-        schema_payload = self._schema_payload(spec)
+        params = {
+            "model": self.model,
+            "input": messages,
+            "max_output_tokens": spec.options.max_output_tokens,
+            "top_p": spec.options.top_p,
+        }
+        # Only add temperature if not gpt-5-nano (which doesn't support it)
+        if self.model != "gpt-5-nano":
+            params["temperature"] = spec.options.temperature
+        params = {key: value for key, value in params.items() if value is not None}
+        params.update(spec.provider_overrides or {})
 
-        tracer = get_tracer()
-        context = tracer.start_as_current_span("openai.llm.astream") if tracer else nullcontext()
-        start = time.perf_counter()
-
-        with context as span:
-            if span:
-                span.set_attribute("llm.provider", "openai")
-                span.set_attribute("llm.model", self.model)
-
-            params = {
-                "model": self.model,
-                "input": messages,
-                "response_format": schema_payload,
-                "max_output_tokens": spec.options.max_output_tokens,
-                "top_p": spec.options.top_p,
-                **(spec.provider_overrides or {}),
-            }
-
-            # Only add temperature if not gpt-5-nano (which doesn't support it)
-            if self.model != "gpt-5-nano":
-                params["temperature"] = spec.options.temperature
-
-            # Seed parameter not supported by current OpenAI client version
-            # if spec.options.seed is not None:
-            #     params["seed"] = spec.options.seed
-
-            response = await self._aclient.responses.stream(**params)
-
-            async with response as stream:
-                async for event in stream:
-                    if event.type != "response.output_text.delta":
-                        continue
-                    latency_ms = (time.perf_counter() - start) * 1000
-                    yield ResponseEnvelope(
-                        text=event.delta,
-                        parsed=None,
-                        messages=list(messages),
-                        usage=None,
-                        response_id=event.response_id,
-                        latency_ms=latency_ms,
-                        raw=event,
-                    )
+        attempt = 0
+        while True:
+            tracer = get_tracer()
+            context = tracer.start_as_current_span("openai.llm.astream") if tracer else nullcontext()
+            start = time.perf_counter()
+            response_id: Optional[str] = None
+            deltas = 0
+
+            with context as span:
+                if span:
+                    span.set_attribute("llm.provider", "openai")
+                    span.set_attribute("llm.model", self.model)
+                    span.set_attribute("llm.attempt", attempt + 1)
+
+                try:
+                    async with self._aclient.responses.stream(**params) as stream:
+                        async for event in stream:
+                            if event.type == "response.created":
+                                response_id = event.response.id
+                            if event.type != "response.output_text.delta":
+                                continue
+                            latency_ms = (time.perf_counter() - start) * 1000
+                            if deltas == 0 and span:
+                                span.set_attribute("llm.time_to_first_token_ms", latency_ms)
+                            deltas += 1
+                            yield ResponseEnvelope(
+                                text=event.delta,
+                                parsed=None,
+                                messages=list(messages),
+                                usage=None,
+                                response_id=response_id,
+                                latency_ms=latency_ms,
+                                raw=event,
+                            )
+                    return
+                except Exception as exc:  # pragma: no cover - error path
+                    retryable = (deltas == 0 and self._is_retryable(exc)
+                                 and attempt < self.retry_policy.max_attempts - 1)
+                    if span:
+                        span.record_exception(exc)
+                        span.set_attribute("llm.retryable", retryable)
+                    logger.warning("OpenAIProvider stream failed", exc_info=exc, extra={"retryable": retryable, "attempt": attempt + 1})
+                    if not retryable:
+                        raise
+            await asyncio.sleep(self.retry_policy.compute_sleep(attempt))
+            attempt += 1
 
     # --- helpers --------------------------------------------------------
     async def _dispatch_async(self, messages: List[Message], schema_payload: Optional[Dict[str, Any]], spec: RequestSpec) -> Any:
@@ -0,0 +1,99 @@
+"""
+Local query embeddings for semantic caching.
+
+Embeddings come from a pluggable local model (sentence-transformers, imported
+lazily) or from a deterministic hashing vectorizer that needs no model files
+and works offline. Every embedder exposes a `name`; vectors from different
+embedders are not comparable, so callers store and match on it.
+"""
+
+import hashlib
+import re
+from typing import List
+
+import numpy as np
+
+
+# Words that carry no meaning for matching leadership questions
+STOPWORDS = frozenset({
+    'a', 'about', 'an', 'and', 'are', 'at', 'be', 'by', 'can', 'could', 'did', 'do', 'does',
+    'for', 'from', 'give', 'has', 'have', 'how', 'i', 'in', 'is', 'it', 'its', 'me', 'my',
+    'of', 'on', 'or', 'our', 'please', 'show', 'tell', 'that', 'the', 'their', 'there', 'to',
+    'us', 'was', 'we', 'were', 'what', 'whats', 'which', 'with', 'you', 'your'
+})
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class HashingQueryEmbedder:
+    """Deterministic hashing-trick embeddings of word and character-trigram features."""
+
+    def __init__(self, dimensions: int = 512):
+        if dimensions < 16:
+            raise ValueError("dimensions must be at least 16")
+        self.dimensions = dimensions
+        self.name = f"hashing-{dimensions}"
+
+    def tokenize(self, text: str) -> List[str]:
+        """Lowercased content words with possessives and plurals folded."""
+        text = text.lower().replace("'s", "").replace("’s", "")
+        tokens = []
+        for token in _TOKEN.findall(text):
+            if token in STOPWORDS:
+                continue
+            if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+                token = token[:-1]
+            tokens.append(token)
+        return tokens
+
+    def embed(self, text: str) -> np.ndarray:
+        """Unit-length float32 vector (all zeros for text without content words)."""
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token in self.tokenize(text):
+            self._add(vector, f"w:{token}", 1.0)
+            padded = f"<{token}>"
+            for i in range(len(padded) - 2):
+                self._add(vector, f"c:{padded[i:i + 3]}", 0.5)
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _add(self, vector: np.ndarray, feature: str, weight: float) -> None:
+        # blake2b, not hash(): buckets must be stable across processes
+        digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), 'little')
+        vector[digest % self.dimensions] += weight if digest >> 63 else -weight
+
+
+class SentenceTransformerQueryEmbedder:
+    """Embeddings from a local sentence-transformers model."""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer  # optional dependency
+
+        self.model = SentenceTransformer(model_name)
+        self.name = f"sentence-transformers:{model_name}"
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+
+def create_query_embedder(model: str = 'hashing', dimensions: int = 512):
+    """
+    Create the configured query embedder.
+
+    Args:
+        model: 'hashing' or a local sentence-transformers model name
+        dimensions: Hashing vectorizer size
+
+    Returns:
+        Embedder with `name` and `embed(text)`; the hashing vectorizer when the
+        model package is not installed (offline environments)
+    """
+    if model == 'hashing':
+        return HashingQueryEmbedder(dimensions)
+
+    try:
+        return SentenceTransformerQueryEmbedder(model)
+    except ImportError:
+        print(f"⚠️  sentence-transformers not installed - query embeddings use hashing-{dimensions} instead of {model}")
+        return HashingQueryEmbedder(dimensions)
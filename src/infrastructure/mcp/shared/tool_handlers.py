@@ -6,6 +6,8 @@ Each handler is a pure async function that calls the FastAPI backend.
 """
 
 from typing import Dict, Any
+import asyncio
+import json
 import httpx
 
 
@@ -800,21 +802,74 @@ Pipeline: Transcript → Analysis → Plan → Workflows → Execute
 
 
 async def handle_get_orchestration_status(http_client: httpx.AsyncClient, args: Dict[str, Any]) -> str:
-    """Orchestration: Get orchestration status via FastAPI."""
+    """Orchestration: Follow the orchestration event stream via FastAPI and summarize it."""
     run_id = args.get("run_id")
     if not run_id:
         raise ValueError("run_id is required")
 
-    response = await http_client.get(f"/api/v1/orchestrate/status/{run_id}")
-    response.raise_for_status()
-    result = response.json()
+    wait_seconds = min(max(float(args.get("wait_seconds", 10)), 0.0), 25.0)
+
+    result: Dict[str, Any] = {}
+    recent_events = []
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait_seconds
+
+    async def follow_stream():
+        async with http_client.stream("GET", f"/api/v1/orchestrate/events/{run_id}",
+                                      timeout=httpx.Timeout(wait_seconds + 10)) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = json.loads(line[len("data: "):])
+                event_type = event.get("type")
+
+                if event_type == "snapshot":
+                    result.update(event)
+                elif event_type == "stage":
+                    result["stage"] = event.get("stage")
+                    for key in ("analysis_id", "plan_id", "workflow_count"):
+                        if event.get(key) is not None:
+                            result[key] = event[key]
+                    recent_events.append(f"{event.get('transcript_id')}: {event.get('stage')}")
+                elif event_type in ("workflow_executed", "workflow_failed"):
+                    recent_events.append(f"{event.get('transcript_id')}: workflow {event.get('workflow_id')} {event.get('status')}")
+                elif event_type == "job_finished":
+                    progress = result.setdefault("progress", {})
+                    progress["processed"] = progress.get("processed", 0) + 1
+                    if progress.get("total"):
+                        progress["percentage"] = round(progress["processed"] / progress["total"] * 100, 2)
+                    if event.get("status") == "COMPLETED":
+                        result.setdefault("results", []).append(event)
+                    elif event.get("status") == "FAILED":
+                        result.setdefault("errors", []).append(event)
+                    recent_events.append(f"{event.get('transcript_id')}: {event.get('status')}")
+                elif event_type == "run_finished":
+                    result["status"] = event.get("status")
+                    result["completed_at"] = event.get("completed_at")
+                    result["summary"] = event.get("summary")
+                    return
+                elif event_type == "error":
+                    raise ValueError(event.get("error"))
+
+                if loop.time() >= deadline:
+                    return
+
+    try:
+        await asyncio.wait_for(follow_stream(), timeout=wait_seconds + 5)
+    except asyncio.TimeoutError:
+        pass  # Run still in progress - report what was streamed so far
+
+    if not result:
+        raise ValueError(f"No status received for run {run_id}")
 
     progress = result.get('progress', {})
     status = result.get('status')
     stage = result.get('stage')
 
-    successful = len(result.get('results', []))
-    failed = len(result.get('errors', []))
+    summary = result.get('summary') or {}
+    successful = summary.get('successful', len(result.get('results', [])))
+    failed = summary.get('failed', len(result.get('errors', [])))
 
     # Extract pipeline IDs for ChatGPT to use in follow-up queries
     analysis_id = result.get('analysis_id', 'N/A')
@@ -832,7 +887,10 @@ Progress: {progress.get('processed', 0)}/{progress.get('total', 0)} ({progress.g
 - Failed: {failed}
 
 Started: {result.get('started_at', 'N/A')}
-Completed: {result.get('completed_at', 'In progress')}"""
+Completed: {result.get('completed_at') or 'In progress'}"""
+
+    if recent_events:
+        response_text += "\n\nLive events:\n" + "\n".join(f"- {line}" for line in recent_events[-10:])
 
     # Add pipeline IDs if available (helps ChatGPT query workflows correctly)
     if analysis_id != 'N/A' or plan_id != 'N/A':
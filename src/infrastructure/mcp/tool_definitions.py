@@ -328,7 +328,11 @@ GET_ORCHESTRATION_STATUS_SCHEMA: Dict[str, Any] = {
         "run_id": {
             "type": "string",
             "description": "Orchestration run ID",
-        }
+        },
+        "wait_seconds": {
+            "type": "number",
+            "description": "Seconds to follow the run's live event stream before answering (0-25, default: 10). Returns early when the run finishes.",
+        },
     },
     "required": ["run_id"],
     "additionalProperties": False,
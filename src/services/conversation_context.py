@@ -0,0 +1,210 @@
+"""
+Conversation context compaction for multi-turn sessions.
+
+Each turn's prompt carries the newest turns verbatim plus a rolling summary
+of everything older, so prompt size stays flat as a conversation grows.
+The summary is updated incrementally - only turns that have just left the
+verbatim window are folded into it - and persisted next to the session
+(SessionStore / AdvisorSessionStore get/save_conversation_summary), so a
+restarted service picks up where it left off.
+
+Every prompt is held to a hard per-model token budget using the local
+tokenizer estimate; verbatim turns that do not fit move into the summary.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from ..infrastructure.config.config_loader import get_conversation_context_config
+from ..infrastructure.llm.llm_client_v2 import LLMClientV2, RequestOptions
+from ..infrastructure.llm.token_counter import (
+    MESSAGE_OVERHEAD_TOKENS, estimate_message_tokens, estimate_tokens, truncate_to_tokens
+)
+from ..utils.prompt_loader import prompt_loader
+
+
+class ConversationContextManager:
+    """Builds budgeted conversation context: recent turns verbatim, older turns as a rolling summary."""
+
+    def __init__(self, session_store, llm_client: LLMClientV2, model: Optional[str] = None,
+                 recent_turns: Optional[int] = None, summary_max_tokens: Optional[int] = None,
+                 token_budget: Optional[int] = None):
+        """
+        Initialize context manager.
+
+        Args:
+            session_store: Store with get_conversation_summary / save_conversation_summary
+            llm_client: LLM client that writes the rolling summary
+            model: Model the prompts are sent to (selects the token budget and tokenizer)
+            recent_turns: Turns replayed verbatim (default: conversation_context.recent_turns)
+            summary_max_tokens: Rolling summary cap (default: conversation_context.summary_max_tokens)
+            token_budget: Hard prompt-token limit (default: conversation_context.token_budgets[model])
+
+        Raises:
+            ValueError: Invalid limits (NO FALLBACK)
+        """
+        if recent_turns is None:
+            recent_turns = get_conversation_context_config('recent_turns', 6)
+        if summary_max_tokens is None:
+            summary_max_tokens = get_conversation_context_config('summary_max_tokens', 400)
+        if token_budget is None:
+            budgets = get_conversation_context_config('token_budgets', {}) or {}
+            token_budget = budgets.get(model, budgets.get('default', 4000))
+
+        if recent_turns < 0:
+            raise ValueError("recent_turns cannot be negative")
+        if summary_max_tokens < 1:
+            raise ValueError("summary_max_tokens must be at least 1")
+        if token_budget <= summary_max_tokens:
+            raise ValueError(f"token_budget ({token_budget}) must exceed summary_max_tokens ({summary_max_tokens})")
+
+        self.session_store = session_store
+        self.llm_client = llm_client
+        self.model = model
+        self.recent_turns = recent_turns
+        self.summary_max_tokens = summary_max_tokens
+        self.token_budget = token_budget
+
+        self._lock = threading.Lock()
+        self._turns: deque = deque(maxlen=100)  # newest per-turn prompt-token records
+        self._turn_count = 0
+        self._summaries_updated = 0
+        self._turns_summarized = 0
+
+    async def build_context(self, session_id: str, turns: List[Dict[str, Any]], query: str,
+                            reserved_tokens: int = 0) -> Dict[str, Any]:
+        """
+        Conversation context for the next turn of a session.
+
+        Args:
+            session_id: Session identifier
+            turns: Session history, oldest first: {'role', 'content', 'timestamp'}
+            query: The new user message
+            reserved_tokens: Tokens of the rest of the prompt, counted against the budget
+
+        Returns:
+            'summary': rolling summary of older turns ('' if none),
+            'recent_turns': newest turns ({'role', 'content'}), oldest first,
+            'prompt_tokens': estimated tokens of reserved + summary + recent turns + query,
+            'token_budget', 'summarized_turns'
+
+        Raises:
+            ValueError: The query and reserved tokens alone exceed the budget (NO FALLBACK)
+            Exception: Summary update failed (NO FALLBACK)
+        """
+        state = self.session_store.get_conversation_summary(session_id) or {
+            'summary': '', 'summarized_through': None, 'summarized_turns': 0
+        }
+        through = state['summarized_through']
+        pending = [turn for turn in turns if through is None or str(turn['timestamp']) > through]
+
+        keep = min(self.recent_turns, len(pending))
+        to_fold = pending[:len(pending) - keep]
+        recent = pending[len(pending) - keep:]
+        recent_tokens = [estimate_message_tokens(turn, self.model) for turn in recent]
+
+        fixed_tokens = reserved_tokens + estimate_message_tokens({'content': query}, self.model)
+        summary_allowance = self.summary_max_tokens + MESSAGE_OVERHEAD_TOKENS
+
+        # Hard budget: the oldest verbatim turns move into the summary until the rest fits
+        while recent and fixed_tokens + summary_allowance + sum(recent_tokens) > self.token_budget:
+            to_fold.append(recent.pop(0))
+            recent_tokens.pop(0)
+
+        if fixed_tokens + (summary_allowance if state['summary'] or to_fold else 0) > self.token_budget:
+            raise ValueError(f"Query needs {fixed_tokens} prompt tokens plus {summary_allowance} for the "
+                             f"conversation summary; the budget is {self.token_budget}")
+
+        summary = state['summary']
+        summarized_turns = state['summarized_turns']
+        if to_fold:
+            summary = await self._fold(summary, to_fold)
+            summarized_turns += len(to_fold)
+            self.session_store.save_conversation_summary(
+                session_id, summary, str(to_fold[-1]['timestamp']), summarized_turns
+            )
+
+        summary_tokens = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(summary, self.model) if summary else 0
+        prompt_tokens = fixed_tokens + summary_tokens + sum(recent_tokens)
+
+        with self._lock:
+            self._turn_count += 1
+            self._turns.append({
+                'session_id': session_id,
+                'prompt_tokens': prompt_tokens,
+                'summary_tokens': summary_tokens,
+                'recent_turns': len(recent)
+            })
+            if to_fold:
+                self._summaries_updated += 1
+                self._turns_summarized += len(to_fold)
+
+        return {
+            'summary': summary,
+            'recent_turns': [{'role': turn['role'], 'content': turn['content']} for turn in recent],
+            'prompt_tokens': prompt_tokens,
+            'token_budget': self.token_budget,
+            'summarized_turns': summarized_turns
+        }
+
+    async def _fold(self, summary: str, turns: List[Dict[str, Any]]) -> str:
+        """Rolling summary extended with turns, summarized in chunks that fit the budget."""
+        chunk: List[str] = []
+        chunk_tokens = 0
+        # Room for the instructions, the current summary and the model's answer
+        chunk_limit = max(self.token_budget - 2 * self.summary_max_tokens - 300, self.summary_max_tokens)
+
+        for turn in turns:
+            line = f"{turn['role']}: {turn['content']}"
+            line = truncate_to_tokens(line, chunk_limit, self.model)
+            tokens = estimate_tokens(line, self.model)
+            if chunk and chunk_tokens + tokens > chunk_limit:
+                summary = await self._summarize(summary, chunk)
+                chunk, chunk_tokens = [], 0
+            chunk.append(line)
+            chunk_tokens += tokens
+
+        return await self._summarize(summary, chunk)
+
+    async def _summarize(self, summary: str, lines: List[str]) -> str:
+        """One LLM call folding lines into the summary, capped at summary_max_tokens."""
+        try:
+            prompt = prompt_loader.format(
+                'insights/conversational/rolling_summary.txt',
+                summary=summary or '(none yet)',
+                turns='\n'.join(lines),
+                max_words=int(self.summary_max_tokens * 0.75)
+            )
+            response = await self.llm_client.arun(
+                messages=[{"role": "user", "content": prompt}],
+                options=RequestOptions(temperature=0.2, max_output_tokens=self.summary_max_tokens)
+            )
+            return truncate_to_tokens(response.require_text().strip(), self.summary_max_tokens, self.model)
+
+        except Exception as e:
+            raise Exception(f"Conversation summary update failed: {str(e)}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Prompt-token metrics.
+
+        Returns:
+            'turns', 'avg_prompt_tokens', 'max_prompt_tokens' (newest 100 turns),
+            'prompt_tokens_per_turn': newest 100 {session_id, prompt_tokens, summary_tokens, recent_turns},
+            'summaries_updated', 'turns_summarized', 'token_budget', 'recent_turns', 'model'
+        """
+        with self._lock:
+            per_turn = list(self._turns)
+            counts = [turn['prompt_tokens'] for turn in per_turn]
+            return {
+                'turns': self._turn_count,
+                'avg_prompt_tokens': round(sum(counts) / len(counts), 1) if counts else None,
+                'max_prompt_tokens': max(counts) if counts else None,
+                'prompt_tokens_per_turn': per_turn,
+                'summaries_updated': self._summaries_updated,
+                'turns_summarized': self._turns_summarized,
+                'token_budget': self.token_budget,
+                'recent_turns': self.recent_turns,
+                'model': self.model
+            }
@@ -7,6 +7,7 @@ Core Principles Applied:
 """
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
+import asyncio
 import json
 
 from ..infrastructure.telemetry import trace_async_function, set_span_attributes, add_span_event
@@ -115,6 +116,28 @@ class DataReaderService:
         except Exception as e:
             raise Exception(f"Data fetching failed: {str(e)}")
 
+    async def get_transcripts(self, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Fetch filtered transcripts off the event loop (concurrent source searches).
+
+        Args:
+            filters: Filter parameters
+
+        Returns:
+            List of transcript dictionaries
+        """
+        return await asyncio.to_thread(self._fetch_transcripts, filters or {})
+
+    async def get_analyses(self, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Fetch filtered analyses off the event loop (concurrent source searches).
+
+        Args:
+            filters: Filter parameters
+
+        Returns:
+            List of analysis dictionaries
+        """
+        return await asyncio.to_thread(self._fetch_analyses, filters or {})
+
     def _fetch_transcripts(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Fetch transcripts with filters.
 
@@ -3,17 +3,50 @@
 Provides business logic layer for time-series forecasting.
 Follows NO FALLBACK principle - fails fast on errors.
 """
+import asyncio
 import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from ..analytics.forecasting.forecast_types import ForecastGenerator, get_forecast_type_info, list_all_forecast_types
+from ..analytics.forecasting.forecast_types import (
+    FORECAST_TYPES, ForecastGenerator, get_forecast_type_info, list_all_forecast_types
+)
 from ..analytics.forecasting.data_aggregator import DataAggregator
+from ..analytics.forecasting.backtest import backtest_forecast_type, score_predictions
+from ..analytics.forecasting.hierarchical import (
+    HIERARCHICAL_FORECASTS, RECONCILIATION_METHODS, TOTAL_NODE,
+    fit_series, fit_series_batch, load_hierarchy, node_forecast_type, reconcile
+)
 from ..storage.forecast_store import ForecastStore
+from ..storage.forecast_backtest_store import ForecastBacktestStore
+from ..storage.forecast_job_store import ForecastJobStore, TERMINAL_JOB_STATUSES
+from ..storage.data_version_store import DataVersionStore
+from ..infrastructure.config.config_loader import get_forecasting_config
 
 
 logger = logging.getLogger(__name__)
 
+# Active jobs older than this are treated as abandoned by a stopped server
+JOB_STALE_SECONDS = 1800
+
+
+def _train_forecast(db_path: str, forecast_type: str, horizon_days: Optional[int],
+                    start_date: Optional[str], end_date: Optional[str]) -> Dict[str, Any]:
+    """Load training data and fit the model - runs inside a worker process.
+
+    Module-level so it can be pickled for ProcessPoolExecutor. The result is
+    the plain summary dict returned by ForecastGenerator.generate.
+    """
+    return ForecastGenerator(db_path).generate(
+        forecast_type=forecast_type,
+        horizon_days=horizon_days,
+        start_date=start_date,
+        end_date=end_date
+    )
+
 
 class ForecastingServiceError(Exception):
     """Exception raised for forecasting service errors."""
@@ -23,16 +56,279 @@ class ForecastingServiceError(Exception):
 class ForecastingService:
     """Service layer for time-series forecasting using Prophet."""
 
-    def __init__(self, db_path: str = "data/call_center.db"):
+    def __init__(self, db_path: str = "data/call_center.db", max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None):
         """Initialize forecasting service.
 
+        Prophet training is CPU-bound (Stan optimization), so it never runs on
+        the event loop: every forecast is produced by a job executed on a
+        process pool, created on first use.
+
         Args:
             db_path: Path to SQLite database
+            max_workers: Training processes (default from config forecasting.max_workers)
+            executor: Executor to run training jobs on instead of the process pool
         """
         self.db_path = db_path
         self.forecast_generator = ForecastGenerator(db_path)
         self.forecast_store = ForecastStore(db_path)
         self.data_aggregator = DataAggregator(db_path)
+        self.job_store = ForecastJobStore(db_path)
+        self.data_versions = DataVersionStore(db_path)
+        self.backtest_store = ForecastBacktestStore(db_path)
+        self.max_workers = max_workers or get_forecasting_config('max_workers', 2)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._job_tasks: Dict[str, asyncio.Task] = {}
+
+    def _get_executor(self) -> Executor:
+        """Create the training process pool on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the training process pool (running jobs are abandoned)."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_data_version(self, forecast_type: str) -> str:
+        """Current watermark of the source data a forecast type is built from.
+
+        Raises:
+            ValueError: If invalid forecast type (NO FALLBACK)
+        """
+        if forecast_type not in FORECAST_TYPES:
+            raise ValueError(f"Invalid forecast type: {forecast_type}")
+        return self.data_versions.get_token(FORECAST_TYPES[forecast_type].data_sources)
+
+    def get_cached_forecast(self, forecast_type: str) -> Optional[Dict[str, Any]]:
+        """Return the latest cached forecast if it is still valid for the current data.
+
+        A cached forecast is valid while its source data is unchanged since
+        it was trained: only forecasts recorded with the current data version
+        are served. Forecasts trained on older data stay stored until they
+        have been scored against the actuals (see ``score_forecasts``).
+
+        Args:
+            forecast_type: Type of forecast
+
+        Returns:
+            Forecast results with cached=True, or None
+        """
+        data_version = self.get_data_version(forecast_type)
+        cached = self.forecast_store.get_latest_by_type(forecast_type, data_version)
+        if not cached:
+            return None
+
+        logger.info(f"Using cached forecast for {forecast_type}")
+        return {
+            'forecast_id': cached['id'],
+            'forecast_type': forecast_type,
+            'cached': True,
+            'generated_at': cached['generated_at'],
+            'expires_at': cached['expires_at'],
+            'data_version': cached['data_version'],
+            **cached['forecast_data']
+        }
+
+    async def submit_forecast_job(self, forecast_type: str, horizon_days: Optional[int] = None,
+                                  start_date: Optional[str] = None, end_date: Optional[str] = None,
+                                  ttl_hours: int = 24) -> Dict[str, Any]:
+        """Queue a forecast training job and return immediately.
+
+        An identical request (same type, horizon and data window) that is
+        already queued or running is joined instead of training twice.
+
+        Args:
+            forecast_type: Type of forecast to generate
+            horizon_days: Forecast horizon in days
+            start_date: Training data start date
+            end_date: Training data end date
+            ttl_hours: Cache TTL in hours for the stored forecast
+
+        Returns:
+            Job record with ``deduplicated`` set when an existing job was joined
+
+        Raises:
+            ForecastingServiceError: Invalid forecast type or insufficient data
+        """
+        try:
+            readiness = self.forecast_generator.check_data_readiness(forecast_type)
+        except ValueError as e:
+            raise ForecastingServiceError(f"Invalid forecast parameters: {str(e)}")
+
+        if not readiness['ready']:
+            raise ForecastingServiceError(
+                f"Insufficient data for {forecast_type}. {readiness['recommendation']}"
+            )
+
+        params = {
+            'horizon_days': horizon_days,
+            'start_date': start_date,
+            'end_date': end_date,
+            'ttl_hours': ttl_hours
+        }
+        job, created = self.job_store.create_or_get_active(forecast_type, params, JOB_STALE_SECONDS)
+
+        if created:
+            logger.info(f"Queued forecast job {job['id']} for {forecast_type}")
+            task = asyncio.create_task(self._run_forecast_job(job))
+            self._job_tasks[job['id']] = task
+            task.add_done_callback(lambda _: self._job_tasks.pop(job['id'], None))
+        else:
+            logger.info(f"Joining active forecast job {job['id']} for {forecast_type}")
+
+        return {**job, 'deduplicated': not created}
+
+    async def _run_forecast_job(self, job: Dict[str, Any]) -> None:
+        """Train on the process pool, store the forecast and record the outcome."""
+        job_id = job['id']
+        params = job['params']
+        start = time.perf_counter()
+
+        try:
+            self.job_store.mark_running(job_id)
+            # Watermark before the data is read: writes landing during training make the result stale
+            data_version = self.get_data_version(job['forecast_type'])
+            loop = asyncio.get_running_loop()
+            try:
+                forecast_result = await loop.run_in_executor(
+                    self._get_executor(), _train_forecast, self.db_path, job['forecast_type'],
+                    params['horizon_days'], params['start_date'], params['end_date']
+                )
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory) - start a fresh pool for later jobs
+                if self._owns_executor:
+                    self._executor = None
+                raise
+
+            forecast_id = self._store_forecast(job['forecast_type'], forecast_result,
+                                               params['horizon_days'], params['ttl_hours'], data_version)
+            self.job_store.complete_job(job_id, forecast_id, int((time.perf_counter() - start) * 1000))
+            logger.info(f"Forecast job {job_id} completed: {forecast_id}")
+            # Scoring reads the whole series from SQLite - keep it off the event loop
+            await asyncio.to_thread(self._score_forecasts_safely, job['forecast_type'])
+
+        except Exception as e:
+            logger.error(f"Forecast job {job_id} failed: {str(e)}")
+            self.job_store.fail_job(job_id, str(e), int((time.perf_counter() - start) * 1000))
+
+    def _store_forecast(self, forecast_type: str, forecast_result: Dict[str, Any],
+                        horizon_days: Optional[int], ttl_hours: int,
+                        data_version: Optional[str] = None) -> str:
+        """Persist a generated forecast and return its ID."""
+        metadata = forecast_result.get('metadata', {})
+        return self.forecast_store.store(
+            forecast_type=forecast_type,
+            forecast_data=forecast_result,
+            horizon_days=horizon_days or metadata.get('default_horizon_days', 7),
+            data_start=metadata.get('training_start', ''),
+            data_end=metadata.get('training_end', ''),
+            prediction_start=forecast_result['summary']['prediction_start'],
+            prediction_end=forecast_result['summary']['prediction_end'],
+            data_points=metadata.get('data_points_used', 0),
+            model_params=metadata.get('prophet_config'),
+            ttl_hours=ttl_hours,
+            data_version=data_version
+        )
+
+    async def get_forecast_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a forecast job record or None if not found."""
+        return self.job_store.get_job(job_id)
+
+    async def wait_for_forecast_job(self, job_id: str, timeout: Optional[float] = None,
+                                    poll_interval: float = 0.5) -> Dict[str, Any]:
+        """Wait until a job finishes or the timeout passes.
+
+        Jobs started by this process are awaited directly; jobs owned by
+        another server process are followed by polling the job table.
+
+        Args:
+            job_id: Forecast job ID
+            timeout: Seconds to wait (None = until finished)
+            poll_interval: Seconds between job table reads for foreign jobs
+
+        Returns:
+            The job record (still QUEUED/RUNNING if the timeout passed)
+
+        Raises:
+            ValueError: Job not found (NO FALLBACK)
+        """
+        job = self.job_store.get_job(job_id)
+        if job is None:
+            raise ValueError(f"Forecast job {job_id} not found")
+
+        task = self._job_tasks.get(job_id)
+        if task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            return self.job_store.get_job(job_id)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while job['status'] not in TERMINAL_JOB_STATUSES:
+            if self.job_store.fail_stale_jobs(JOB_STALE_SECONDS):
+                job = self.job_store.get_job(job_id)
+                continue
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(poll_interval)
+            job = self.job_store.get_job(job_id)
+
+        return job
+
+    async def list_forecast_jobs(self, status: Optional[str] = None,
+                                 limit: int = 20) -> List[Dict[str, Any]]:
+        """List forecast jobs, most recent first."""
+        return self.job_store.list_jobs(status=status, limit=limit)
+
+    async def list_fitted_models(self) -> List[Dict[str, Any]]:
+        """Fitted models in the registry with their training watermark and last fit mode.
+
+        Raises:
+            ForecastingServiceError: If retrieval fails
+        """
+        try:
+            return self.forecast_generator.model_store.list_models()
+        except Exception as e:
+            raise ForecastingServiceError(f"Model registry retrieval failed: {str(e)}")
+
+    async def get_forecast_job_result(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Forecast produced by a completed job.
+
+        Raises:
+            ForecastingServiceError: Job failed, not finished, or its forecast is gone
+        """
+        if job['status'] == 'FAILED':
+            raise ForecastingServiceError(f"Forecast generation failed: {job['error']}")
+        if job['status'] != 'COMPLETED':
+            raise ForecastingServiceError(f"Forecast job {job['id']} is still {job['status'].lower()}")
+
+        forecast = self.forecast_store.get_by_id(job['forecast_id'])
+        if not forecast:
+            raise ForecastingServiceError(f"Forecast {job['forecast_id']} from job {job['id']} has expired")
+
+        return {
+            'forecast_id': forecast['id'],
+            'forecast_type': forecast['forecast_type'],
+            'cached': False,
+            'job_id': job['id'],
+            'generated_at': forecast['generated_at'],
+            'expires_at': forecast['expires_at'],
+            'data_version': forecast['data_version'],
+            **forecast['forecast_data']
+        }
+
+    def recover_interrupted_jobs(self) -> int:
+        """Fail jobs abandoned by a stopped server so they are no longer joined.
+
+        Returns:
+            Number of jobs failed
+        """
+        return self.job_store.fail_stale_jobs(JOB_STALE_SECONDS)
 
     async def generate_forecast(self, forecast_type: str, horizon_days: Optional[int] = None,
                                start_date: Optional[str] = None, end_date: Optional[str] = None,
@@ -54,79 +350,313 @@ class ForecastingService:
             ForecastingServiceError: If forecast generation fails
         """
         try:
-            # Check if cached forecast exists
-            readiness = None
-
             if use_cache:
-                cached = self.forecast_store.get_latest_by_type(forecast_type)
+                cached = self.get_cached_forecast(forecast_type)
                 if cached:
-                    # Ensure cached forecast is still valid for current data window
-                    try:
-                        readiness = self.forecast_generator.check_data_readiness(forecast_type)
-                    except ValueError:
-                        readiness = None
-
-                    if readiness and readiness.get('ready'):
-                        logger.info(f"Using cached forecast for {forecast_type}")
-                        return {
-                            'forecast_id': cached['id'],
-                            'forecast_type': forecast_type,
-                            'cached': True,
-                            'generated_at': cached['generated_at'],
-                            'expires_at': cached['expires_at'],
-                            **cached['forecast_data']
-                        }
-
-                    # Cached forecast is stale relative to current data; remove and regenerate
-                    logger.info(
-                        "Discarding cached forecast for %s due to insufficient or outdated data",
-                        forecast_type,
-                    )
-                    self.forecast_store.delete(cached['id'])
-
-            # Check data readiness
-            readiness = readiness or self.forecast_generator.check_data_readiness(forecast_type)
-            if not readiness['ready']:
-                raise ForecastingServiceError(
-                    f"Insufficient data for {forecast_type}. {readiness['recommendation']}"
-                )
+                    return cached
 
-            # Generate new forecast
+            # Train off the event loop; identical concurrent requests share one job
             logger.info(f"Generating new forecast for {forecast_type}")
-            forecast_result = self.forecast_generator.generate(
+            job = await self.submit_forecast_job(
                 forecast_type=forecast_type,
                 horizon_days=horizon_days,
                 start_date=start_date,
-                end_date=end_date
-            )
-
-            # Store forecast
-            metadata = forecast_result.get('metadata', {})
-            forecast_id = self.forecast_store.store(
-                forecast_type=forecast_type,
-                forecast_data=forecast_result,
-                horizon_days=horizon_days or metadata.get('default_horizon_days', 7),
-                data_start=metadata.get('training_start', ''),
-                data_end=metadata.get('training_end', ''),
-                prediction_start=forecast_result['summary']['prediction_start'],
-                prediction_end=forecast_result['summary']['prediction_end'],
-                data_points=metadata.get('data_points_used', 0),
-                model_params=metadata.get('prophet_config'),
+                end_date=end_date,
                 ttl_hours=ttl_hours
             )
+            job = await self.wait_for_forecast_job(job['id'])
 
-            return {
-                'forecast_id': forecast_id,
-                'forecast_type': forecast_type,
-                'cached': False,
-                'generated_at': datetime.now().isoformat(),
-                **forecast_result
-            }
+            return await self.get_forecast_job_result(job)
+
+        except ValueError as e:
+            raise ForecastingServiceError(f"Invalid forecast parameters: {str(e)}")
+        except ForecastingServiceError:
+            raise
+        except Exception as e:
+            raise ForecastingServiceError(f"Forecast generation failed: {str(e)}")
+
+    async def generate_hierarchical_forecast(self, hierarchy: str, horizon_days: Optional[int] = None,
+                                             start_date: Optional[str] = None, end_date: Optional[str] = None,
+                                             method: str = 'mint', max_children: Optional[int] = None,
+                                             ttl_hours: int = 24) -> Dict[str, Any]:
+        """Forecast a portfolio volume and its split by intent or advisor.
+
+        All child series come from one grouped rollup read and are fitted in
+        parallel on the training process pool. The forecasts are reconciled
+        so the children add up to the total, then stored as one batch (one
+        forecast per node, typed ``<hierarchy>:<node>``).
+
+        Args:
+            hierarchy: Hierarchy name from HIERARCHICAL_FORECASTS
+            horizon_days: Forecast horizon (default from definition)
+            start_date: Training data start date
+            end_date: Training data end date
+            method: Reconciliation - 'mint' or 'bottom_up'
+            max_children: Largest children forecast individually, the rest as
+                'Other' (default from config forecasting.hierarchy_max_children)
+            ttl_hours: Cache TTL in hours for the stored forecasts
+
+        Returns:
+            Reconciled total and child forecasts with their forecast IDs
 
+        Raises:
+            ForecastingServiceError: Invalid parameters, insufficient data or fit failure
+        """
+        if hierarchy not in HIERARCHICAL_FORECASTS:
+            raise ForecastingServiceError(f"Invalid hierarchy: {hierarchy}")
+        if method not in RECONCILIATION_METHODS:
+            raise ForecastingServiceError(f"Invalid reconciliation method: {method}")
+
+        definition = HIERARCHICAL_FORECASTS[hierarchy]
+        horizon_days = horizon_days or definition.default_horizon_days
+        freq = {'daily': 'D', 'weekly': 'W'}[definition.granularity]
+        max_children = max_children or get_forecasting_config('hierarchy_max_children', 50)
+
+        try:
+            data_version = self.data_versions.get_token(definition.data_sources)
+            series = load_hierarchy(self.data_aggregator, definition, start_date, end_date, max_children)
         except ValueError as e:
             raise ForecastingServiceError(f"Invalid forecast parameters: {str(e)}")
+
+        logger.info(f"Fitting {len(series)} series for hierarchical forecast {hierarchy}")
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            if definition.engine == 'ets':
+                fitted = await loop.run_in_executor(executor, fit_series_batch, list(series.values()),
+                                                    horizon_days, freq, definition.model_type)
+            else:
+                fitted = await asyncio.gather(*[
+                    loop.run_in_executor(executor, fit_series, df, horizon_days, freq,
+                                         definition.model_type, definition.prophet_kwargs, definition.engine)
+                    for df in series.values()
+                ])
+        except BrokenProcessPool:
+            if self._owns_executor:
+                self._executor = None
+            raise ForecastingServiceError("Forecast generation failed: training process died")
         except Exception as e:
             raise ForecastingServiceError(f"Forecast generation failed: {str(e)}")
+        fit_duration_ms = int((time.perf_counter() - start) * 1000)
+
+        reconciled = reconcile(dict(zip(series, fitted)), method)
+
+        nodes = list(reconciled)
+        forecast_ids = self.forecast_store.store_batch([
+            {
+                'forecast_type': node_forecast_type(hierarchy, node),
+                'forecast_data': reconciled[node],
+                'horizon_days': horizon_days,
+                'data_start': reconciled[node]['metadata']['training_start'],
+                'data_end': reconciled[node]['metadata']['training_end'],
+                'prediction_start': reconciled[node]['summary']['prediction_start'],
+                'prediction_end': reconciled[node]['summary']['prediction_end'],
+                'data_points': reconciled[node]['metadata']['data_points_used'],
+                'model_params': {'model_type': definition.model_type, 'engine': definition.engine,
+                                 **definition.prophet_kwargs},
+                'ttl_hours': ttl_hours,
+                'data_version': data_version
+            }
+            for node in nodes
+        ])
+        results = {
+            node: {'forecast_id': forecast_id, **reconciled[node]}
+            for node, forecast_id in zip(nodes, forecast_ids)
+        }
+
+        return {
+            'hierarchy': hierarchy,
+            'dimension': definition.dimension,
+            'reconciliation': method,
+            'horizon_days': horizon_days,
+            'series_count': len(nodes),
+            'fit_duration_ms': fit_duration_ms,
+            'data_version': data_version,
+            'total': results.pop(TOTAL_NODE),
+            'children': results
+        }
+
+    def forecast_seconds_to_expiry(self, forecast_type: str) -> Optional[float]:
+        """Seconds until the cached forecast of a type must be regenerated.
+
+        Returns:
+            None when nothing is cached, 0 when the cached forecast is expired
+            or was trained on an older data version
+        """
+        cached = self.forecast_store.get_latest_by_type(forecast_type)
+        if not cached:
+            return None
+        if cached['data_version'] != self.get_data_version(forecast_type):
+            return 0.0
+        if not cached['expires_at']:
+            return float('inf')
+        remaining = (datetime.fromisoformat(str(cached['expires_at'])) - datetime.now()).total_seconds()
+        return max(0.0, remaining)
+
+    async def refresh_forecast(self, forecast_type: str, ttl_hours: int = 24,
+                               timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Train and cache a fresh forecast of a type (cache warming).
+
+        Joins an identical job that is already running.
+
+        Returns:
+            The completed job record
+
+        Raises:
+            ForecastingServiceError: Insufficient data, job failure or timeout
+        """
+        job = await self.submit_forecast_job(forecast_type, ttl_hours=ttl_hours)
+        job = await self.wait_for_forecast_job(job['id'], timeout=timeout)
+
+        if job['status'] == 'FAILED':
+            raise ForecastingServiceError(f"Forecast refresh failed: {job['error']}")
+        if job['status'] != 'COMPLETED':
+            raise ForecastingServiceError(f"Forecast refresh of {forecast_type} timed out after {timeout}s")
+        return job
+
+    def score_forecasts(self, forecast_type: Optional[str] = None) -> Dict[str, int]:
+        """Score stored forecasts against the actuals that have arrived since they were made.
+
+        Each forecast whose prediction window has started is compared with
+        the observed series and its accuracy (MAE, MAPE, interval coverage
+        and the matched points) is written with ForecastStore.update_accuracy.
+        Partially scored forecasts are rescored when the source data changes.
+        Forecasts from an older data version whose window has closed without
+        a single actual are pruned.
+
+        Args:
+            forecast_type: Type to score, or None for all types
+
+        Returns:
+            Forecast type → number of forecasts scored
+
+        Raises:
+            ValueError: If invalid forecast type (NO FALLBACK)
+        """
+        forecast_types = [forecast_type] if forecast_type else list_all_forecast_types()
+        scored = {}
+
+        for ft in forecast_types:
+            actuals = self.forecast_generator.get_training_data(ft)
+            scored[ft] = 0
+            if actuals.empty:
+                continue
+
+            data_version = self.get_data_version(ft)
+            latest_actual = actuals['ds'].max().isoformat()
+            for forecast in self.forecast_store.get_unscored(ft, latest_actual, data_version):
+                accuracy = score_predictions(forecast['forecast_data']['predictions'], actuals)
+                if accuracy is None:
+                    continue
+                self.forecast_store.update_accuracy(
+                    forecast['id'],
+                    {**accuracy, 'data_version': data_version, 'scored_at': datetime.now().isoformat()},
+                    accuracy['mae'], accuracy['mape']
+                )
+                scored[ft] += 1
+
+            pruned = self.forecast_store.prune_superseded(ft, data_version, latest_actual)
+            if pruned:
+                logger.info(f"Pruned {pruned} superseded {ft} forecast(s) that could not be scored")
+
+        return scored
+
+    def _score_forecasts_safely(self, forecast_type: str) -> None:
+        """Score past forecasts after a job - a scoring error must not fail the finished job."""
+        try:
+            scored = self.score_forecasts(forecast_type)
+            if scored[forecast_type]:
+                logger.info(f"Scored {scored[forecast_type]} past {forecast_type} forecast(s) against actuals")
+        except Exception as e:
+            logger.error(f"Scoring past {forecast_type} forecasts failed: {str(e)}")
+
+    async def run_backtests(self, forecast_types: Optional[List[str]] = None,
+                            horizon_days: Optional[int] = None,
+                            folds: Optional[int] = None) -> Dict[str, Any]:
+        """Run rolling-origin backtests for forecast types in parallel.
+
+        Every type is backtested with its configured engine in its own task
+        on the training process pool. Results are stored and reported by
+        ``get_forecast_accuracy``; types without enough history for the
+        folds are reported as skipped.
+
+        Args:
+            forecast_types: Types to backtest (default: all)
+            horizon_days: Periods scored per fold (default: each type's horizon)
+            folds: Rolling origins per type (default from config forecasting.backtest_folds)
+
+        Returns:
+            Per type: status and backtest metrics
+
+        Raises:
+            ForecastingServiceError: Invalid forecast type or training pool failure
+        """
+        forecast_types = forecast_types or list_all_forecast_types()
+        invalid = [ft for ft in forecast_types if ft not in FORECAST_TYPES]
+        if invalid:
+            raise ForecastingServiceError(f"Invalid forecast types: {invalid}")
+        folds = folds or get_forecasting_config('backtest_folds', 3)
+
+        data_versions = {ft: self.get_data_version(ft) for ft in forecast_types}
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        outcomes = await asyncio.gather(*[
+            loop.run_in_executor(executor, backtest_forecast_type, self.db_path, ft, horizon_days, folds)
+            for ft in forecast_types
+        ], return_exceptions=True)
+
+        if any(isinstance(outcome, BrokenProcessPool) for outcome in outcomes):
+            if self._owns_executor:
+                self._executor = None
+            raise ForecastingServiceError("Backtest failed: training process died")
+
+        results = {}
+        for ft, outcome in zip(forecast_types, outcomes):
+            if isinstance(outcome, ValueError):
+                results[ft] = {'status': 'skipped', 'detail': str(outcome)}
+            elif isinstance(outcome, Exception):
+                logger.error(f"Backtest of {ft} failed: {str(outcome)}")
+                results[ft] = {'status': 'failed', 'detail': str(outcome)}
+            else:
+                backtest_id = self.backtest_store.save(ft, outcome, data_versions[ft])
+                results[ft] = {'status': 'completed', 'backtest_id': backtest_id, **outcome}
+
+        return {
+            'folds': folds,
+            'duration_ms': int((time.perf_counter() - start) * 1000),
+            'results': results
+        }
+
+    async def get_forecast_accuracy(self, forecast_type: Optional[str] = None) -> Dict[str, Any]:
+        """Get forecast accuracy: latest backtests and live scores of past forecasts.
+
+        Past forecasts are scored against newly arrived actuals first.
+
+        Args:
+            forecast_type: Specific type, or None for all types
+
+        Returns:
+            backtests (latest per type), live (aggregate of scored forecasts
+            per type) and newly_scored counts
+
+        Raises:
+            ForecastingServiceError: Invalid forecast type or retrieval failure
+        """
+        if forecast_type and forecast_type not in FORECAST_TYPES:
+            raise ForecastingServiceError(f"Invalid forecast type: {forecast_type}")
+
+        try:
+            newly_scored = await asyncio.to_thread(self.score_forecasts, forecast_type)
+            return {
+                'backtests': {b['forecast_type']: b for b in self.backtest_store.get_latest(forecast_type)},
+                'live': {row['forecast_type']: row for row in self.forecast_store.get_accuracy_by_type(forecast_type)},
+                'newly_scored': newly_scored
+            }
+
+        except Exception as e:
+            raise ForecastingServiceError(f"Accuracy retrieval failed: {str(e)}")
 
     async def get_forecast_by_id(self, forecast_id: str) -> Optional[Dict[str, Any]]:
         """Get forecast by ID.
@@ -0,0 +1,148 @@
+"""Insight invalidator - change-driven invalidation of cached insights.
+
+Subscribes to the transcript, analysis and workflow creation events and
+turns each into a DataChange (table, row timestamp, row attributes). Only
+cached insights whose recorded dependencies overlap the change are touched:
+
+- precomputed insights with a running refresher are kept serving and
+  refreshed in the background (a burst of changes coalesces into one refresh)
+- everything else is expired, so the next request recomputes it
+
+Entries a change does not overlap stay cached until their TTL.
+"""
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from ..infrastructure.events import Event, EventType, get_event_system
+from ..storage.insight_dependencies import DataChange
+from ..storage.insight_store import InsightStore
+from ..storage.insights_cache_store import InsightsCacheStore
+
+
+logger = logging.getLogger(__name__)
+
+
+# Creation events → the source table they add a row to
+EVENT_TABLES = {
+    EventType.TRANSCRIPT_CREATED: 'transcripts',
+    EventType.ANALYSIS_COMPLETED: 'analysis',
+    EventType.WORKFLOW_CREATED: 'workflows',
+}
+
+INVALIDATION_MODES = ('refresh', 'invalidate')
+
+
+def change_from_event(event: Event) -> DataChange:
+    """Data change described by a creation event.
+
+    Raises:
+        ValueError: Not a creation event (NO FALLBACK)
+    """
+    if event.event_type not in EVENT_TABLES:
+        raise ValueError(f"Event {event.event_type.value} does not describe a data change")
+
+    payload = event.payload
+    changed_at = payload.get('created_at') or payload.get('started_at') or event.timestamp
+    if isinstance(changed_at, datetime):
+        changed_at = changed_at.isoformat()
+
+    return DataChange(
+        table=EVENT_TABLES[event.event_type],
+        changed_at=str(changed_at),
+        attributes={key: value for key, value in payload.items() if isinstance(value, (str, int, float, bool))}
+    )
+
+
+class InsightInvalidator:
+    """Invalidates (or refreshes) the cached insights a data change overlaps."""
+
+    def __init__(self, insight_store: Optional[InsightStore] = None,
+                 cache_store: Optional[InsightsCacheStore] = None,
+                 request_refresh: Optional[Callable[[str], bool]] = None,
+                 mode: str = 'refresh'):
+        """Initialize invalidator.
+
+        Args:
+            insight_store: Persona insight cache
+            cache_store: Leadership answer cache
+            request_refresh: insight_type → True if a background refresh was scheduled
+            mode: 'refresh' (keep serving refreshable insights until refreshed) or 'invalidate'
+
+        Raises:
+            ValueError: No cache or unknown mode (NO FALLBACK)
+        """
+        if insight_store is None and cache_store is None:
+            raise ValueError("At least one of insight_store and cache_store is required")
+        if mode not in INVALIDATION_MODES:
+            raise ValueError(f"Unknown invalidation mode '{mode}'. Supported: {INVALIDATION_MODES}")
+
+        self.insight_store = insight_store
+        self.cache_store = cache_store
+        self.request_refresh = request_refresh
+        self.mode = mode
+
+        self._lock = threading.Lock()
+        self._changes: Counter = Counter()
+        self._stats = {'insights_invalidated': 0, 'refreshes_requested': 0, 'cache_entries_invalidated': 0}
+        self._last_change: Optional[Dict[str, Any]] = None
+
+    def subscribe(self, subscriber_name: str = 'insight_invalidator', event_system=None) -> None:
+        """Subscribe to the creation events (global event system by default)."""
+        (event_system or get_event_system()).subscribe(
+            event_types=list(EVENT_TABLES),
+            handler=self._handle_event,
+            subscriber_name=subscriber_name
+        )
+        logger.info(f"✅ {subscriber_name} subscribed to {len(EVENT_TABLES)} data change events")
+
+    def _handle_event(self, sender, **kwargs) -> Dict[str, Any]:
+        return self.apply_change(change_from_event(kwargs['event']))
+
+    def apply_change(self, change: DataChange) -> Dict[str, Any]:
+        """Invalidate or refresh the cached insights the change overlaps.
+
+        Args:
+            change: Row written to a source table
+
+        Returns:
+            'invalidated': insight ids expired, 'refreshing': insight types refreshed
+            in the background, 'cache_entries_invalidated': leadership answers expired
+        """
+        invalidated, refreshing = [], []
+        if self.insight_store is not None:
+            for dependent in self.insight_store.find_dependents(change):
+                if dependent['insight_type'] in refreshing:
+                    continue
+                if self.mode == 'refresh' and self.request_refresh and self.request_refresh(dependent['insight_type']):
+                    refreshing.append(dependent['insight_type'])
+                else:
+                    invalidated.append(dependent['id'])
+            self.insight_store.invalidate(invalidated)
+
+        cache_invalidated = self.cache_store.invalidate_for_change(change) if self.cache_store is not None else 0
+
+        with self._lock:
+            self._changes[change.table] += 1
+            self._stats['insights_invalidated'] += len(invalidated)
+            self._stats['refreshes_requested'] += len(refreshing)
+            self._stats['cache_entries_invalidated'] += cache_invalidated
+            self._last_change = {'table': change.table, 'changed_at': change.changed_at}
+
+        if invalidated or refreshing or cache_invalidated:
+            logger.info(f"{change.table} change: {len(invalidated)} insight(s) invalidated, "
+                        f"{len(refreshing)} refreshing, {cache_invalidated} cached answer(s) invalidated")
+
+        return {'invalidated': invalidated, 'refreshing': refreshing, 'cache_entries_invalidated': cache_invalidated}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Changes seen per table and entries invalidated or refreshed since startup."""
+        with self._lock:
+            return {
+                'mode': self.mode,
+                'changes': dict(self._changes),
+                **self._stats,
+                'last_change': self._last_change
+            }
@@ -7,7 +7,7 @@ Handles caching, error handling, and response formatting.
 
 import uuid
 import sqlite3
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, AsyncGenerator, Optional, List, Tuple
 from datetime import datetime
 import time
 
@@ -15,10 +15,24 @@ from src.analytics.intelligence.hybrid_analyzer import HybridAnalyzer
 from src.analytics.personas.leadership import LeadershipPersona
 from src.analytics.personas.servicing_ops import ServicingOpsPersona
 from src.analytics.personas.marketing import MarketingPersona
+from src.analytics.personas.snapshot import PersonaSnapshotEngine
+from src.infrastructure.config.config_loader import get_intelligence_config
+from src.storage.insight_dependencies import DataDependency
 from src.storage.insight_store import InsightStore
 from src.services.forecasting_service import ForecastingServiceError
 
 
+# Cached insights kept warm by the precompute scheduler:
+# insight type → persona, TTL, the generating method (called with use_cache=False)
+# and the tables (days back) it reads - changes there refresh it early
+PRECOMPUTED_INSIGHTS = {
+    'leadership_briefing': {
+        'persona': 'leadership', 'ttl_hours': 1, 'method': 'get_leadership_briefing',
+        'dependencies': {'transcripts': 30, 'analysis': 7}
+    },
+}
+
+
 class IntelligenceServiceError(Exception):
     """Exception raised by intelligence service."""
     pass
@@ -56,6 +70,17 @@ class IntelligenceService:
         self.leadership = LeadershipPersona(db_path)
         self.servicing_ops = ServicingOpsPersona(db_path)
         self.marketing = MarketingPersona(db_path)
+        self.snapshot_engine = PersonaSnapshotEngine(
+            {'leadership': self.leadership, 'servicing': self.servicing_ops, 'marketing': self.marketing},
+            db_path,
+            max_workers=get_intelligence_config('snapshot_max_workers', 4),
+            ttl_seconds=get_intelligence_config('snapshot_ttl_seconds', 300)
+        )
+
+        # Set by the server when background cache warming runs (reported in get_health)
+        self.precompute_scheduler = None
+        # Set by the server when data-change invalidation is subscribed (reported in get_health)
+        self.insight_invalidator = None
 
     # ============================================================
     # LEADERSHIP ENDPOINTS
@@ -112,7 +137,8 @@ class IntelligenceService:
                 insight_data=result,
                 ttl_hours=ttl_hours,
                 generation_time_ms=generation_time_ms,
-                confidence_score=insight_data.get('confidence', 0.8)
+                confidence_score=insight_data.get('confidence', 0.8),
+                dependencies=self._insight_dependencies(insight_type)
             )
 
             return result
@@ -962,10 +988,89 @@ class IntelligenceService:
         - optional caller-supplied context (recent workflow IDs, etc.)
         """
 
+        prepared = await self._prepare_question(persona, context)
+
+        try:
+            # First determine the strategy for answering the question.
+            strategy = await self._answer_strategy(question, prepared)
+
+            # Provide the strategy, persona data, and interpretation scaffolding
+            # back to the response prompt to synthesize an executive-ready answer.
+            response_result = await self.hybrid_analyzer.insight_generator.generate(
+                **self._response_request(question, strategy, prepared)
+            )
+
+            return self._answer(question, persona, strategy, response_result.get('insight', {}), prepared)
+
+        except Exception as exc:
+            raise IntelligenceServiceError(
+                f"Failed to answer intelligence question: {str(exc)}"
+            )
+
+    async def ask_stream(
+        self,
+        question: str,
+        persona: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        ask() as a stream of events, so the answer starts rendering while it is written.
+
+        Yields, in order:
+            {'type': 'snapshot_ready', 'persona', 'cached_insights', plus snapshot metadata}
+            {'type': 'strategy', 'strategy'}
+            {'type': 'token', 'text'} per piece of the answer text
+            {'type': 'completed', 'result': same as ask(), 'timing': {'time_to_first_token_ms', 'total_ms'}}
+
+        Raises:
+            IntelligenceServiceError: If answering fails (NO FALLBACK)
+        """
+        start_time = time.time()
+        prepared = await self._prepare_question(persona, context)
+        yield {
+            'type': 'snapshot_ready',
+            'persona': prepared['persona'],
+            'cached_insights': len(prepared['cached_insights']),
+            **prepared['metadata']
+        }
+
+        try:
+            strategy = await self._answer_strategy(question, prepared)
+            yield {'type': 'strategy', 'strategy': strategy}
+
+            time_to_first_token_ms = None
+            response_result: Dict[str, Any] = {}
+            async for event in self.hybrid_analyzer.insight_generator.generate_stream(
+                **self._response_request(question, strategy, prepared)
+            ):
+                if event['type'] == 'token':
+                    if time_to_first_token_ms is None:
+                        time_to_first_token_ms = int((time.time() - start_time) * 1000)
+                    yield event
+                else:
+                    response_result = event['result']
+
+            yield {
+                'type': 'completed',
+                'result': self._answer(question, persona, strategy, response_result.get('insight', {}), prepared),
+                'timing': {
+                    'time_to_first_token_ms': time_to_first_token_ms,
+                    'total_ms': int((time.time() - start_time) * 1000)
+                }
+            }
+
+        except Exception as exc:
+            raise IntelligenceServiceError(
+                f"Failed to answer intelligence question: {str(exc)}"
+            )
+
+    async def _prepare_question(self, persona: Optional[str], context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Persona snapshot, active cached insights and session context handed to the ask prompts."""
+
         resolved_persona, persona_label = self._resolve_persona(persona)
 
         # Gather structured context that can be handed to the prompt set.
-        persona_snapshot = self._build_persona_snapshot(resolved_persona)
+        persona_snapshot, snapshot_metadata = await self._build_persona_snapshot(resolved_persona)
 
         cached_insights = self.insight_store.list_cached(
             persona=resolved_persona if resolved_persona != 'cross_persona' else None,
@@ -975,65 +1080,70 @@ class IntelligenceService:
         # Reduce noise by keeping the freshest entries only.
         cached_insights = cached_insights[:5]
 
-        session_context = {
+        return {
             'persona': resolved_persona,
-            'input_persona': persona,
-            'caller_context': context or {},
-            'persona_snapshot': persona_snapshot,
+            'persona_label': persona_label,
+            'snapshot': persona_snapshot,
+            'metadata': snapshot_metadata,
             'cached_insights': cached_insights,
+            'session_context': {
+                'persona': resolved_persona,
+                'input_persona': persona,
+                'caller_context': context or {},
+                'persona_snapshot': persona_snapshot,
+                'cached_insights': cached_insights,
+            },
         }
 
-        try:
-            # First determine the strategy for answering the question.
-            strategy_result = await self.hybrid_analyzer.insight_generator.generate(
-                prompt_name='insights/strategy/query_strategy',
-                context={
-                    'query': question,
-                    'executive_role': persona_label,
-                    'session_context': session_context,
-                },
-                temperature=0.2,
-                max_tokens=800,
-            )
-            strategy = strategy_result.get('insight', {})
+    async def _answer_strategy(self, question: str, prepared: Dict[str, Any]) -> Dict[str, Any]:
+        """Strategy LLM call: how to answer the question."""
+        strategy_result = await self.hybrid_analyzer.insight_generator.generate(
+            prompt_name='insights/strategy/query_strategy',
+            context={
+                'query': question,
+                'executive_role': prepared['persona_label'],
+                'session_context': prepared['session_context'],
+            },
+            temperature=0.2,
+            max_tokens=800,
+        )
+        return strategy_result.get('insight', {})
 
-            # Provide the strategy, persona data, and interpretation scaffolding
-            # back to the response prompt to synthesize an executive-ready answer.
-            response_result = await self.hybrid_analyzer.insight_generator.generate(
-                prompt_name='insights/response/strategic_executive_response',
-                context={
-                    'query': question,
-                    'strategy': strategy,
-                    'data_result': persona_snapshot,
-                    'understanding': {
-                        'cached_insights': cached_insights,
-                        'persona': resolved_persona,
-                    },
+    def _response_request(self, question: str, strategy: Dict[str, Any], prepared: Dict[str, Any]) -> Dict[str, Any]:
+        """Arguments of the response LLM call."""
+        return {
+            'prompt_name': 'insights/response/strategic_executive_response',
+            'context': {
+                'query': question,
+                'strategy': strategy,
+                'data_result': prepared['snapshot'],
+                'understanding': {
+                    'cached_insights': prepared['cached_insights'],
+                    'persona': prepared['persona'],
                 },
-                temperature=0.3,
-                max_tokens=1200,
-            )
-
-            response_payload = response_result.get('insight', {})
-            answer_text = (
-                response_payload.get('content')
-                if isinstance(response_payload, dict)
-                else str(response_payload)
-            )
+            },
+            'temperature': 0.3,
+            'max_tokens': 1200,
+        }
 
-            return {
-                'question': question,
-                'persona': persona or resolved_persona,
-                'answer': answer_text,
-                'generated_at': datetime.utcnow().isoformat(),
-                'strategy': strategy,
-                'response': response_payload,
-            }
+    def _answer(self, question: str, persona: Optional[str], strategy: Dict[str, Any],
+                response_payload: Any, prepared: Dict[str, Any]) -> Dict[str, Any]:
+        """ask() result from the strategy and the parsed response."""
+        answer_text = (
+            response_payload.get('content')
+            if isinstance(response_payload, dict)
+            else str(response_payload)
+        )
 
-        except Exception as exc:
-            raise IntelligenceServiceError(
-                f"Failed to answer intelligence question: {str(exc)}"
-            )
+        return {
+            'question': question,
+            'persona': persona or prepared['persona'],
+            'answer': answer_text,
+            'generated_at': datetime.utcnow().isoformat(),
+            'strategy': strategy,
+            'response': response_payload,
+            'metadata': prepared['metadata'],
+        }
 
     async def get_cached_insights(
         self,
@@ -1041,7 +1151,7 @@ class IntelligenceService:
         insight_type: Optional[str] = None,
         limit: int = 10
     ) -> List[Dict[str, Any]]:
-        """Return cached insight summaries with optional filtering."""
+        """Return cached insight summaries (with their data dependencies) with optional filtering."""
 
         resolved_persona, _ = self._resolve_persona(persona)
 
@@ -1085,43 +1195,74 @@ class IntelligenceService:
 
         return resolved, resolved
 
-    def _build_persona_snapshot(self, persona: str) -> Dict[str, Any]:
-        """Collect persona-specific context shared with the LLM prompts."""
+    async def _build_persona_snapshot(self, persona: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Collect persona-specific context shared with the LLM prompts.
+
+        Returns:
+            (snapshot, metadata with snapshot_build_ms and cached_blocks per persona)
+        """
+
+        personas = [persona] if persona in ('leadership', 'servicing', 'marketing') else \
+            ['leadership', 'servicing', 'marketing']
+        built = await self.snapshot_engine.build(
+            personas, blocks=None if len(personas) == 1 else ('metrics', 'recommended_actions')
+        )
+        blocks = built['personas']
 
         snapshot: Dict[str, Any] = {
             'metrics': {},
             'recommended_actions': [],
         }
 
-        if persona == 'leadership':
-            snapshot['metrics'] = self.leadership.get_key_metrics()
-            snapshot['recommended_actions'] = self.leadership.get_recommended_actions()
-        elif persona == 'servicing':
-            metrics = self.servicing_ops.get_key_metrics()
-            snapshot['metrics'] = metrics
-            snapshot['recommended_actions'] = self.servicing_ops.get_recommended_actions()
-        elif persona == 'marketing':
-            snapshot['metrics'] = self.marketing.get_key_metrics()
-            snapshot['recommended_actions'] = self.marketing.get_recommended_actions()
-            snapshot['segments'] = self.marketing.get_customer_segments()
+        if persona in blocks:
+            snapshot.update(blocks[persona])
         else:
             # Cross-persona snapshot pulls the top-level data from all personas.
             snapshot['personas'] = {
-                'leadership': {
-                    'metrics': self.leadership.get_key_metrics(),
-                    'actions': self.leadership.get_recommended_actions(),
-                },
-                'servicing': {
-                    'metrics': self.servicing_ops.get_key_metrics(),
-                    'actions': self.servicing_ops.get_recommended_actions(),
-                },
-                'marketing': {
-                    'metrics': self.marketing.get_key_metrics(),
-                    'actions': self.marketing.get_recommended_actions(),
-                },
+                name: {'metrics': block['metrics'], 'actions': block['recommended_actions']}
+                for name, block in blocks.items()
             }
 
-        return snapshot
+        metadata = {
+            'snapshot_build_ms': built['snapshot_build_ms'],
+            'snapshot_cached_blocks': built['cached_blocks'],
+            'data_version': built['data_version'],
+        }
+        return snapshot, metadata
+
+    def insight_seconds_to_expiry(self, insight_type: str) -> Optional[float]:
+        """Seconds until a precomputed insight expires (None when not cached)."""
+        spec = PRECOMPUTED_INSIGHTS[insight_type]
+        expires_at = self.insight_store.get_expiry(insight_type, spec['persona'])
+        if not expires_at:
+            return None
+        return max(0.0, (datetime.fromisoformat(expires_at) - datetime.utcnow()).total_seconds())
+
+    async def refresh_insight(self, insight_type: str) -> Dict[str, Any]:
+        """Regenerate and cache a precomputed insight ahead of its expiry."""
+        if insight_type not in PRECOMPUTED_INSIGHTS:
+            raise IntelligenceServiceError(f"Insight {insight_type} is not precomputed")
+
+        spec = PRECOMPUTED_INSIGHTS[insight_type]
+        generate = getattr(self, spec['method'])
+        return await generate(use_cache=False, ttl_hours=spec['ttl_hours'])
+
+    def request_refresh(self, insight_type: str) -> bool:
+        """
+        Refresh a cached insight in the background because its data changed.
+
+        Returns:
+            True if the precompute scheduler will refresh it (the cached insight keeps
+            being served until then), False if it is not precomputed or no scheduler runs
+        """
+        if insight_type not in PRECOMPUTED_INSIGHTS or self.precompute_scheduler is None:
+            return False
+        return self.precompute_scheduler.request_refresh(f"insight:{insight_type}")
+
+    def _insight_dependencies(self, insight_type: str) -> List[DataDependency]:
+        """Data a precomputed insight is generated from."""
+        tables = PRECOMPUTED_INSIGHTS[insight_type]['dependencies']
+        return [DataDependency.last_days(table, days) for table, days in tables.items()]
 
     async def clear_cache(
         self,
@@ -1142,6 +1283,8 @@ class IntelligenceService:
                 persona=persona,
                 insight_type=insight_type
             )
+            # Memoized persona metric blocks are cleared along with the insights
+            self.snapshot_engine.invalidate(None if persona is None else [self._resolve_persona(persona)[0]])
             return {
                 'cleared_count': count,
                 'persona': persona or 'all',
@@ -1170,6 +1313,8 @@ class IntelligenceService:
                     'forecasting_service': 'operational',
                     'insight_store': 'operational'
                 },
+                'precompute': self.precompute_scheduler.get_status() if self.precompute_scheduler else None,
+                'invalidation': self.insight_invalidator.get_stats() if self.insight_invalidator else None,
                 'checked_at': datetime.utcnow().isoformat()
             }
 
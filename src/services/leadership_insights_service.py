@@ -9,13 +9,28 @@ from typing import Dict, Any, Optional, List
 import time
 from datetime import datetime
 
+from ..infrastructure.config.config_loader import get_leadership_insights_config
 from ..infrastructure.llm.llm_client_v2 import LLMClientV2, OpenAIProvider
+from ..infrastructure.llm.query_embedder import create_query_embedder
 from ..infrastructure.telemetry import trace_async_function, set_span_attributes
+from ..storage.insight_dependencies import DataDependency
 from ..storage.session_store import SessionStore
 from ..storage.insights_cache_store import InsightsCacheStore
 from ..storage.insights_pattern_store import InsightsPatternStore
 from ..call_center_agents.leadership_insights_agent import LeadershipInsightsAgent
+from .conversation_context import ConversationContextManager
 from .data_reader_service import DataReaderService
+from .insight_invalidator import InsightInvalidator
+from .semantic_query_cache import SemanticQueryCache
+
+
+# Agent data sources → tables they read
+SOURCE_TABLES = {
+    'analyses': 'analysis',
+    'transcripts': 'transcripts',
+    'workflows': 'workflows',
+    'plans': 'plans',
+}
 
 
 class LeadershipInsightsService:
@@ -49,10 +64,32 @@ class LeadershipInsightsService:
         self.cache_store = InsightsCacheStore(db_path)
         self.pattern_store = InsightsPatternStore(db_path)
 
+        # Paraphrased questions are served from the cache via query embeddings
+        self.query_cache = SemanticQueryCache(
+            cache_store=self.cache_store,
+            embedder=create_query_embedder(
+                get_leadership_insights_config('semantic_cache.embedding_model', 'hashing'),
+                get_leadership_insights_config('semantic_cache.embedding_dimensions', 512)
+            ),
+            similarity_threshold=get_leadership_insights_config('semantic_cache.similarity_threshold', 0.85),
+            role_thresholds=get_leadership_insights_config('semantic_cache.role_thresholds', {})
+        )
+
+        # New transcripts/analyses/workflows expire only the cached answers they overlap
+        self.cache_invalidator = InsightInvalidator(cache_store=self.cache_store, mode='invalidate')
+        self.cache_invalidator.subscribe(subscriber_name='leadership_cache_invalidator')
+
         # Initialize LLM client
         provider = OpenAIProvider(api_key=api_key)
         self.llm_client = LLMClientV2(provider=provider)
 
+        # Older turns reach the agent as a rolling summary, within the model's token budget
+        self.context_manager = ConversationContextManager(
+            session_store=self.session_store,
+            llm_client=self.llm_client,
+            model=provider.model
+        )
+
         # Initialize data reader (read-only, no API key needed)
         self.data_reader = DataReaderService(db_path)
 
@@ -128,6 +165,8 @@ class LeadershipInsightsService:
                     content=cache_result['response']['content'],
                     metadata={
                         'cache_hit': True,
+                        'cache_match': cache_result['cache_metadata']['match'],
+                        'cache_similarity': cache_result['cache_metadata']['similarity'],
                         'response_time_ms': round((time.time() - start_time) * 1000),
                         'confidence_score': cache_result['response']['metadata']['overall_confidence']
                     }
@@ -136,17 +175,23 @@ class LeadershipInsightsService:
                 return {
                     **cache_result['response'],
                     'session_id': session_id,
-                    'cache_hit': True
+                    'cache_hit': True,
+                    'cache_match': cache_result['cache_metadata']['match'],
+                    'cache_similarity': cache_result['cache_metadata']['similarity'],
+                    'matched_query': cache_result['cache_metadata']['matched_query']
                 }
 
             # Step 3: Get session context for the agent
-            session_context = await self._build_session_context(session)
+            session_context = await self._build_session_context(session, query)
+            conversation = session_context['conversation']
+            set_span_attributes(prompt_tokens=conversation['prompt_tokens'])
 
             # Step 4: Store user message
             self.session_store.add_message(
                 session_id=session_id,
                 role='user',
-                content=query
+                content=query,
+                metadata={'token_count': conversation['prompt_tokens']}
             )
 
             # Step 5: Process query with insights agent
@@ -197,6 +242,12 @@ class LeadershipInsightsService:
             # Add session info to response
             response['session_id'] = session_id
             response['cache_hit'] = False
+            response['metadata']['conversation_context'] = {
+                'prompt_tokens': conversation['prompt_tokens'],
+                'token_budget': conversation['token_budget'],
+                'recent_turns': len(conversation['recent_turns']),
+                'summarized_turns': conversation['summarized_turns']
+            }
 
             return response
 
@@ -309,7 +360,7 @@ class LeadershipInsightsService:
             data_summary = await self.data_reader.get_data_summary()
 
             # Get cache statistics
-            cache_stats = self.cache_store.get_cache_statistics()
+            cache_stats = self.get_cache_statistics()
 
             # Get pattern statistics
             pattern_stats = self.pattern_store.get_pattern_statistics()
@@ -349,19 +400,23 @@ class LeadershipInsightsService:
                 executive_role=executive_role
             )
 
-            # Check for exact or similar cached queries
-            cached = self.cache_store.get_cached_aggregation(
-                query=query,
-                filters={'executive_role': executive_role}
-            )
+            # Check for exact or semantically similar cached queries
+            cached = self.query_cache.lookup(query, executive_role)
 
             if cached:
-                set_span_attributes(cache_hit=True)
+                set_span_attributes(
+                    cache_hit=True,
+                    cache_match=cached['match'],
+                    cache_similarity=cached['similarity']
+                )
                 return {
-                    'response': cached['aggregated_data'],
+                    'response': cached['entry']['aggregated_data'],
                     'cache_metadata': {
-                        'hit_count': cached['hit_count'],
-                        'created_at': cached['created_at']
+                        'hit_count': cached['entry']['hit_count'],
+                        'created_at': cached['entry']['created_at'],
+                        'match': cached['match'],
+                        'similarity': cached['similarity'],
+                        'matched_query': cached['matched_query']
                     }
                 }
 
@@ -372,14 +427,15 @@ class LeadershipInsightsService:
             # Cache errors shouldn't fail the main process
             return None
 
-    async def _build_session_context(self, session: Dict[str, Any]) -> Dict[str, Any]:
+    async def _build_session_context(self, session: Dict[str, Any], query: str) -> Dict[str, Any]:
         """Build session context for the agent.
 
         Args:
             session: Session data
+            query: The new query (counted against the conversation token budget)
 
         Returns:
-            Session context
+            Session context, with 'conversation': rolling summary and recent turns
         """
         context = {
             'focus_area': session.get('focus_area'),
@@ -397,6 +453,13 @@ class LeadershipInsightsService:
             except (json.JSONDecodeError, TypeError):
                 pass
 
+        messages = self.session_store.get_session_messages(session['session_id'])
+        context['conversation'] = await self.context_manager.build_context(
+            session_id=session['session_id'],
+            turns=[{'role': m['role'], 'content': m['content'], 'timestamp': m['created_at']} for m in messages],
+            query=query
+        )
+
         return context
 
     @trace_async_function("leadership.cache_response")
@@ -409,21 +472,37 @@ class LeadershipInsightsService:
             executive_role: Executive role
         """
         try:
-            # Cache the response
-            self.cache_store.store_aggregation(
+            # Cache the response with its query embedding
+            self.query_cache.store(
                 query=query,
-                aggregated_data=response,
-                data_sources=response['metadata']['data_sources_used'],
-                record_count=response['metadata']['records_analyzed'],
-                computation_time_ms=response['metadata']['total_processing_time_ms'],
-                filters={'executive_role': executive_role},
-                ttl_hours=24  # Cache for 24 hours
+                response=response,
+                executive_role=executive_role,
+                ttl_hours=24,  # Cache for 24 hours
+                dependencies=self._cache_dependencies(response)
             )
 
         except Exception as e:
             # Cache errors shouldn't fail the main process
             print(f"Cache storage failed: {str(e)}")
 
+    @staticmethod
+    def _cache_dependencies(response: Dict[str, Any]) -> List[DataDependency]:
+        """Tables, date ranges and filters of every search behind a response.
+
+        Searches that came back empty count too - new rows can change the answer.
+        """
+        dependencies = []
+        for search in response['metadata']['retrieval'].get('searches', []):
+            table = SOURCE_TABLES.get(search['source'])
+            if not table:
+                continue
+            filters = {key: value for key, value in search['filters'].items() if key not in ('date_range', 'limit')}
+            date_range = search['filters'].get('date_range') or {}
+            dependencies.append(DataDependency(
+                table=table, date_from=date_range.get('start'), date_to=date_range.get('end'), filters=filters
+            ))
+        return dependencies
+
     @trace_async_function("leadership.store_patterns")
     async def _store_learning_patterns(self, response: Dict[str, Any]):
         """Store learning patterns from successful responses.
@@ -456,10 +535,21 @@ class LeadershipInsightsService:
             Cache statistics dictionary
         """
         try:
-            return self.cache_store.get_cache_statistics()
+            return {
+                **self.cache_store.get_cache_statistics(),
+                'semantic_cache': self.query_cache.get_metrics()
+            }
         except Exception as e:
             raise Exception(f"Failed to get cache statistics: {str(e)}")
 
+    def get_context_statistics(self) -> Dict[str, Any]:
+        """Get conversation context statistics (prompt tokens per turn, summary updates).
+
+        Returns:
+            Context statistics dictionary
+        """
+        return self.context_manager.get_metrics()
+
     def get_pattern_statistics(self) -> Dict[str, Any]:
         """Get learning pattern statistics.
 
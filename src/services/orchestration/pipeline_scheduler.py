@@ -0,0 +1,299 @@
+"""
+Pipeline scheduler - runs many transcript pipelines concurrently
+Bounded worker pool over durable, leased pipeline jobs with per-stage
+concurrency limits, stage checkpoints and cancellation
+NO FALLBACK LOGIC - invalid limits fail fast
+"""
+import asyncio
+import os
+import socket
+import uuid
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+from src.infrastructure.config.config_loader import get_orchestration_config
+from src.services.orchestration.models.pipeline_models import PipelineStage
+from src.services.orchestration.run_events import OrchestrationEventBroker, get_orchestration_event_broker
+from src.storage.pipeline_job_store import PipelineJobStore
+
+
+# Stages of SimplePipeline that can be throttled independently
+LIMITED_STAGES = [
+    PipelineStage.ANALYSIS.value,
+    PipelineStage.PLAN.value,
+    PipelineStage.WORKFLOWS.value,
+    PipelineStage.EXECUTION.value
+]
+
+
+def resolve_concurrency(max_concurrent: Optional[int] = None,
+                        stage_limits: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """Merge per-run concurrency overrides with config/system.yaml defaults.
+
+    Args:
+        max_concurrent: Pipelines allowed to run at once (None = config default)
+        stage_limits: Per-stage overrides keyed by stage name (analysis, plan, workflows, execution)
+
+    Returns:
+        Dict with validated ``max_concurrent`` and complete ``stage_limits``
+
+    Raises:
+        ValueError: Unknown stage or non-positive limit (NO FALLBACK)
+    """
+    if max_concurrent is None:
+        max_concurrent = get_orchestration_config('max_concurrent_pipelines', 4)
+    if not isinstance(max_concurrent, int) or isinstance(max_concurrent, bool) or max_concurrent < 1:
+        raise ValueError(f"max_concurrent must be a positive integer, got {max_concurrent!r}")
+
+    configured = get_orchestration_config('stage_limits', {}) or {}
+    resolved = {}
+    for stage in LIMITED_STAGES:
+        resolved[stage] = configured.get(stage, max_concurrent)
+
+    for stage, limit in (stage_limits or {}).items():
+        if stage not in LIMITED_STAGES:
+            raise ValueError(f"Unknown pipeline stage '{stage}'. Valid stages: {LIMITED_STAGES}")
+        if limit is None:
+            continue
+        resolved[stage] = limit
+
+    for stage, limit in resolved.items():
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise ValueError(f"Stage limit for '{stage}' must be a positive integer, got {limit!r}")
+
+    return {"max_concurrent": max_concurrent, "stage_limits": resolved}
+
+
+# Stage data persisted as job checkpoints
+CHECKPOINT_FIELDS = (
+    "analysis_id", "plan_id", "workflow_ids", "workflow_count",
+    "execution_ids", "executed_count", "failed_count"
+)
+
+
+def default_worker_id() -> str:
+    """Lease owner identifier unique to this scheduler instance (host:pid:random)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class PipelineScheduler:
+    """Bounded worker pool for one orchestration run.
+
+    Jobs live in ``PipelineJobStore``. Up to ``max_concurrent`` workers lease
+    jobs in submission order, so transcripts start in the order they were
+    submitted, and every completed stage is checkpointed to the job row. If
+    the process dies, the leases expire and a scheduler started for the same
+    run (after a restart, or in another process) picks the jobs up again and
+    resumes each pipeline from its last checkpoint.
+
+    Every pipeline also acquires a shared per-stage semaphore around each
+    stage, which keeps the expensive stages (e.g. workflow extraction) below
+    their own limit while other pipelines progress through cheaper stages.
+
+    Job starts, stage checkpoints and outcomes are published to the
+    ``OrchestrationEventBroker`` for streaming clients.
+    """
+
+    def __init__(self,
+                 run_id: str,
+                 job_store: PipelineJobStore,
+                 max_concurrent: Optional[int] = None,
+                 stage_limits: Optional[Dict[str, int]] = None,
+                 pipeline_runner: Optional[Callable[..., Awaitable[Dict[str, Any]]]] = None,
+                 worker_id: Optional[str] = None,
+                 lease_seconds: Optional[int] = None,
+                 max_attempts: Optional[int] = None,
+                 poll_interval: Optional[float] = None,
+                 event_broker: Optional[OrchestrationEventBroker] = None):
+        """Initialize scheduler.
+
+        Args:
+            run_id: Run created with PipelineJobStore.create_run
+            job_store: Durable job store
+            max_concurrent: Pipelines allowed to run at once (None = config default)
+            stage_limits: Per-stage overrides (None = config defaults)
+            pipeline_runner: Coroutine running one pipeline (defaults to run_simple_pipeline)
+            worker_id: Lease owner identifier (defaults to host:pid:random)
+            lease_seconds: Job lease duration (None = config default)
+            max_attempts: Claims allowed per job before it is failed (None = config default)
+            poll_interval: Seconds between claim attempts while other workers hold jobs
+            event_broker: Progress event broker (defaults to the global broker)
+
+        Raises:
+            ValueError: Unknown run or invalid limits (NO FALLBACK)
+        """
+        if job_store.get_run(run_id) is None:
+            raise ValueError(f"Run {run_id} not found")
+
+        concurrency = resolve_concurrency(max_concurrent, stage_limits)
+
+        if pipeline_runner is None:
+            from src.services.orchestration.simple_pipeline import run_simple_pipeline
+            pipeline_runner = run_simple_pipeline
+
+        self.run_id = run_id
+        self.job_store = job_store
+        self.max_concurrent = concurrency["max_concurrent"]
+        self.stage_limit_values = concurrency["stage_limits"]
+        self.stage_limits = {
+            stage: asyncio.Semaphore(limit) for stage, limit in self.stage_limit_values.items()
+        }
+        self.pipeline_runner = pipeline_runner
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds or get_orchestration_config('lease_seconds', 300)
+        self.max_attempts = max_attempts or get_orchestration_config('max_attempts', 3)
+        self.poll_interval = poll_interval or get_orchestration_config('poll_interval_seconds', 5)
+
+        self.event_broker = event_broker or get_orchestration_event_broker()
+
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def concurrency(self) -> Dict[str, Any]:
+        """Resolved concurrency settings (persisted with the run for resumption)."""
+        return {"max_concurrent": self.max_concurrent, "stage_limits": dict(self.stage_limit_values)}
+
+    async def run(self) -> None:
+        """Process the run's jobs and return when none are left for this scheduler."""
+        heartbeat = asyncio.create_task(self._heartbeat())
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.max_concurrent)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # On shutdown, wait for the workers to requeue their in-flight jobs
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            if self.job_store.finalize_run_if_done(self.run_id):
+                run = self.job_store.get_run(self.run_id)
+                self.event_broker.publish(
+                    self.run_id, "run_finished",
+                    status=run["status"], summary=run["summary"], completed_at=run["completed_at"]
+                )
+
+    def cancel(self) -> Dict[str, int]:
+        """Cancel the run: drop queued jobs and cancel in-flight pipelines.
+
+        Jobs leased by other processes are cancelled when their next lease
+        renewal sees the run is no longer RUNNING.
+
+        Returns:
+            Counts of queued and running jobs that were cancelled
+
+        Raises:
+            ValueError: Run is not running (NO FALLBACK)
+        """
+        queued = self.job_store.cancel_run(self.run_id)
+        self._cancelled = True
+
+        running = 0
+        for task in list(self._in_flight.values()):
+            if not task.done():
+                task.cancel()
+                running += 1
+
+        return {"queued_cancelled": queued, "running_cancelled": running}
+
+    async def _worker(self) -> None:
+        """Lease jobs until none are runnable or held by other workers."""
+        while not self._cancelled:
+            job = self.job_store.claim_next_job(
+                self.run_id, self.worker_id, self.lease_seconds, self.max_attempts
+            )
+            if job is None:
+                # Remaining jobs are in flight here (their workers finish them) or leased
+                # elsewhere - keep polling only for the latter, their leases may expire
+                if self.job_store.count_unfinished_jobs(self.run_id, exclude_owner=self.worker_id) == 0:
+                    return
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            task = asyncio.create_task(self._run_job(job))
+            self._in_flight[job["id"]] = task
+            try:
+                # asyncio.wait does not propagate the task's cancellation to the worker
+                await asyncio.wait([task])
+            except asyncio.CancelledError:
+                # Scheduler stopped (e.g. shutdown) - let the job requeue itself before exiting
+                task.cancel()
+                await asyncio.wait([task])
+                raise
+            finally:
+                self._in_flight.pop(job["id"], None)
+
+    async def _heartbeat(self) -> None:
+        """Renew leases of in-flight jobs; cancel any job whose lease was lost or whose run was cancelled."""
+        interval = max(self.lease_seconds / 3, 0.01)
+        while True:
+            await asyncio.sleep(interval)
+            for job_id, task in list(self._in_flight.items()):
+                if task.done():
+                    continue
+                if not self.job_store.renew_lease(job_id, self.worker_id, self.lease_seconds):
+                    task.cancel()
+
+    async def _run_job(self, job: Dict[str, Any]) -> None:
+        """Run one pipeline from its last checkpoint and record the outcome."""
+        job_id = job["id"]
+        transcript_id = job["transcript_id"]
+        tracked_workflows = list(job.get("workflow_ids") or [])
+        if tracked_workflows:
+            self.event_broker.track_workflows(self.run_id, transcript_id, tracked_workflows)
+        self.event_broker.publish(
+            self.run_id, "job_started", transcript_id,
+            attempt=job["attempts"], resumed_stage=job.get("stage")
+        )
+
+        def checkpoint(stage: str, data: Dict[str, Any]) -> None:
+            fields = {key: value for key, value in data.items() if key in CHECKPOINT_FIELDS}
+            if not self.job_store.checkpoint(job_id, self.worker_id, stage, **fields):
+                raise ValueError(f"Lease lost for job {job_id} - another worker owns it")
+            if fields.get("workflow_ids"):
+                # Route the upcoming per-workflow execution events to this run
+                tracked_workflows.extend(fields["workflow_ids"])
+                self.event_broker.track_workflows(self.run_id, transcript_id, fields["workflow_ids"])
+            self.event_broker.publish(self.run_id, "stage", transcript_id, stage=stage, **fields)
+
+        status, error = "FAILED", None
+        try:
+            result = await self.pipeline_runner(
+                job["transcript_id"],
+                job["auto_approve"],
+                stage_limits=self.stage_limits,
+                resume_from=job,
+                checkpoint_callback=checkpoint
+            )
+            self.job_store.finish_job(job_id, self.worker_id, "COMPLETED", result=result)
+            status = "COMPLETED"
+        except asyncio.CancelledError:
+            if self._run_cancelled():
+                self.job_store.finish_job(job_id, self.worker_id, "CANCELLED")
+                status = "CANCELLED"
+            else:
+                # Stopped without a cancel (e.g. server shutdown) - requeue for resumption
+                self.job_store.release_job(job_id, self.worker_id)
+                status = None
+            raise
+        except Exception as e:
+            # NO FALLBACK - record failure and let the other pipelines continue
+            self.job_store.finish_job(job_id, self.worker_id, "FAILED", error=str(e))
+            error = str(e)
+        finally:
+            self.event_broker.untrack_workflows(tracked_workflows)
+            if status is None:
+                self.event_broker.publish(self.run_id, "job_requeued", transcript_id)
+            else:
+                self.event_broker.publish(self.run_id, "job_finished", transcript_id, status=status, error=error)
+
+    def _run_cancelled(self) -> bool:
+        """Whether the run itself was cancelled (here or by another process)."""
+        if self._cancelled:
+            return True
+        run = self.job_store.get_run(self.run_id)
+        return run is None or run["status"] in ("CANCELLING", "CANCELLED")
@@ -0,0 +1,233 @@
+"""
+Orchestration run events - pushes pipeline progress to stream subscribers
+Sources: stage checkpoints reported by SimplePipeline._update_status (via
+PipelineScheduler) and per-workflow execution events from the EventSystem
+NO FALLBACK LOGIC - unknown runs fail fast
+"""
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
+
+from src.infrastructure.events import EventType, get_event_system
+
+logger = logging.getLogger(__name__)
+
+# Run statuses after which no more events are published
+TERMINAL_RUN_STATUSES = ('COMPLETED', 'CANCELLED')
+
+
+class OrchestrationEventBroker:
+    """In-process fan-out of orchestration run events.
+
+    Every event gets a per-run, monotonically increasing ``id``. A bounded
+    history per run lets a reconnecting client pass the last id it saw and
+    receive only what it missed. Subscribers get an ``asyncio.Queue``; events
+    published from another thread are handed over to the subscriber's loop.
+    """
+
+    def __init__(self, history_size: int = 500, max_runs: int = 100):
+        """Initialize broker.
+
+        Args:
+            history_size: Events kept per run for replay
+            max_runs: Runs whose history is kept (least recently published dropped first)
+        """
+        self.history_size = history_size
+        self.max_runs = max_runs
+        self._history: "OrderedDict[str, deque]" = OrderedDict()
+        self._sequence: Dict[str, int] = {}
+        self._subscribers: Dict[str, List[Tuple[asyncio.Queue, asyncio.AbstractEventLoop]]] = {}
+        self._workflow_jobs: Dict[str, Tuple[str, str]] = {}
+
+    def publish(self, run_id: str, event_type: str, transcript_id: Optional[str] = None,
+                **data) -> Dict[str, Any]:
+        """Record an event for a run and push it to every subscriber.
+
+        Args:
+            run_id: Orchestration run
+            event_type: stage, job_started, job_finished, job_requeued,
+                workflow_executed, workflow_failed or run_finished
+            transcript_id: Transcript the event belongs to (None for run-level events)
+            **data: Event fields
+
+        Returns:
+            The published event
+        """
+        sequence = self._sequence.get(run_id, 0) + 1
+        self._sequence[run_id] = sequence
+        event = {
+            "id": sequence,
+            "type": event_type,
+            "run_id": run_id,
+            "transcript_id": transcript_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            **data
+        }
+
+        history = self._history.get(run_id)
+        if history is None:
+            history = deque(maxlen=self.history_size)
+            self._history[run_id] = history
+        self._history.move_to_end(run_id)
+        history.append(event)
+        while len(self._history) > self.max_runs:
+            dropped, _ = self._history.popitem(last=False)
+            self._sequence.pop(dropped, None)
+
+        for queue, loop in list(self._subscribers.get(run_id, [])):
+            self._deliver(queue, loop, event)
+
+        return event
+
+    def subscribe(self, run_id: str, last_event_id: Optional[int] = None) -> asyncio.Queue:
+        """Subscribe to a run's events.
+
+        Args:
+            run_id: Orchestration run
+            last_event_id: Replay history after this id (None = no replay)
+
+        Returns:
+            Queue receiving event dicts
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        if last_event_id is not None:
+            for event in self._history.get(run_id, ()):
+                if event["id"] > last_event_id:
+                    queue.put_nowait(event)
+        self._subscribers.setdefault(run_id, []).append((queue, asyncio.get_running_loop()))
+        return queue
+
+    def unsubscribe(self, run_id: str, queue: asyncio.Queue) -> None:
+        """Stop delivering events to a queue."""
+        subscribers = self._subscribers.get(run_id, [])
+        self._subscribers[run_id] = [entry for entry in subscribers if entry[0] is not queue]
+        if not self._subscribers[run_id]:
+            del self._subscribers[run_id]
+
+    def subscriber_count(self, run_id: str) -> int:
+        return len(self._subscribers.get(run_id, []))
+
+    def track_workflows(self, run_id: str, transcript_id: str, workflow_ids: List[str]) -> None:
+        """Map workflows to their run so execution events can be routed."""
+        for workflow_id in workflow_ids:
+            self._workflow_jobs[workflow_id] = (run_id, transcript_id)
+
+    def untrack_workflows(self, workflow_ids: List[str]) -> None:
+        for workflow_id in workflow_ids:
+            self._workflow_jobs.pop(workflow_id, None)
+
+    def handle_workflow_event(self, sender, **kwargs) -> None:
+        """EventSystem handler for WORKFLOW_COMPLETED / WORKFLOW_FAILED."""
+        payload = kwargs.get("payload") or {}
+        job = self._workflow_jobs.get(payload.get("workflow_id"))
+        if job is None:
+            return  # Workflow executed outside an orchestration run
+
+        run_id, transcript_id = job
+        event_type = "workflow_failed" if kwargs.get("event_type") == EventType.WORKFLOW_FAILED else "workflow_executed"
+        self.publish(
+            run_id,
+            event_type,
+            transcript_id,
+            workflow_id=payload["workflow_id"],
+            status=payload.get("status"),
+            execution_id=payload.get("execution_id"),
+            execution_duration_ms=payload.get("execution_duration_ms"),
+            error=payload.get("error")
+        )
+
+    @staticmethod
+    def _deliver(queue: asyncio.Queue, loop: asyncio.AbstractEventLoop, event: Dict[str, Any]) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            queue.put_nowait(event)
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+
+# Global broker instance
+_global_broker: Optional[OrchestrationEventBroker] = None
+
+
+def get_orchestration_event_broker() -> OrchestrationEventBroker:
+    """Get the global broker (singleton), subscribed to workflow execution events."""
+    global _global_broker
+
+    if _global_broker is None:
+        _global_broker = OrchestrationEventBroker()
+        get_event_system().subscribe(
+            [EventType.WORKFLOW_COMPLETED, EventType.WORKFLOW_FAILED],
+            _global_broker.handle_workflow_event,
+            "orchestration_event_broker"
+        )
+
+    return _global_broker
+
+
+async def stream_run_events(run_id: str,
+                            job_store,
+                            broker: Optional[OrchestrationEventBroker] = None,
+                            last_event_id: Optional[int] = None,
+                            heartbeat_seconds: float = 15) -> AsyncIterator[Dict[str, Any]]:
+    """Yield a run's events until it finishes.
+
+    Between events a ``heartbeat`` is yielded every ``heartbeat_seconds``;
+    each heartbeat re-reads the run from the job store, so a run finished
+    by another process (whose events this broker never sees) still ends
+    the stream with a ``run_finished`` event.
+
+    Args:
+        run_id: Orchestration run
+        job_store: PipelineJobStore holding the run
+        broker: Event broker (defaults to the global broker)
+        last_event_id: Replay events after this id
+        heartbeat_seconds: Idle time before a heartbeat
+
+    Raises:
+        ValueError: Run not found (NO FALLBACK)
+    """
+    broker = broker or get_orchestration_event_broker()
+    if job_store.get_run(run_id) is None:
+        raise ValueError(f"Run {run_id} not found")
+
+    # Subscribe before checking the run so nothing published in between is lost
+    queue = broker.subscribe(run_id, last_event_id)
+    try:
+        while True:
+            try:
+                event = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                run = job_store.get_run(run_id)
+                if run["status"] in TERMINAL_RUN_STATUSES:
+                    yield _run_finished_event(run)
+                    return
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat_seconds)
+                except asyncio.TimeoutError:
+                    yield {"type": "heartbeat", "run_id": run_id,
+                           "timestamp": datetime.now(timezone.utc).isoformat()}
+                    continue
+
+            yield event
+            if event["type"] == "run_finished":
+                return
+    finally:
+        broker.unsubscribe(run_id, queue)
+
+
+def _run_finished_event(run: Dict[str, Any]) -> Dict[str, Any]:
+    """Terminal event built from the stored run (used when the broker missed the finish)."""
+    return {
+        "type": "run_finished",
+        "run_id": run["id"],
+        "transcript_id": None,
+        "status": run["status"],
+        "summary": run.get("summary"),
+        "completed_at": run.get("completed_at"),
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
@@ -4,7 +4,8 @@ Connects: Transcript → Analysis → Plan → Workflows → Execution
 NO FALLBACK LOGIC - fails fast on any errors
 """
 import asyncio
-from typing import Dict, Any, List, Optional
+import contextlib
+from typing import Dict, Any, List, Optional, Callable
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -23,11 +24,14 @@ from src.services.workflow_execution_engine import WorkflowExecutionEngine
 class SimplePipeline:
     """Simple pipeline using native Python async/await without external dependencies"""
     
-    def __init__(self, api_key: str, db_path: str, status_dict: Optional[Dict[str, Any]] = None):
+    def __init__(self, api_key: str, db_path: str,
+                 checkpoint_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                 stage_limits: Optional[Dict[str, asyncio.Semaphore]] = None):
         self.api_key = api_key
         self.db_path = db_path
         self.current_stage = PipelineStage.TRANSCRIPT
-        self.status_dict = status_dict  # For real-time status updates
+        self.checkpoint_callback = checkpoint_callback  # Persists each completed stage (see PipelineScheduler)
+        self.stage_limits = stage_limits or {}  # Shared stage semaphores from PipelineScheduler
         
         # Initialize tracing to ensure OpenAI instrumentation is active
         from src.infrastructure.telemetry import initialize_tracing
@@ -44,17 +48,20 @@ class SimplePipeline:
         self.execution_engine = WorkflowExecutionEngine(db_path)
 
     def _update_status(self, stage: str, **kwargs):
-        """Update the status dict with current stage and additional data."""
-        if self.status_dict is not None:
-            self.status_dict["stage"] = stage
-            # Update any additional fields passed as kwargs
-            for key, value in kwargs.items():
-                self.status_dict[key] = value
+        """Report a completed stage and the data it produced to the checkpoint callback."""
+        if self.checkpoint_callback is not None:
+            self.checkpoint_callback(stage, kwargs)
+
+    def _stage_slot(self, stage: PipelineStage):
+        """Concurrency slot for a stage - shared semaphore when scheduled, no-op otherwise."""
+        semaphore = self.stage_limits.get(stage.value)
+        return semaphore if semaphore is not None else contextlib.nullcontext()
 
     async def run_complete_pipeline(
         self, 
         transcript_id: str, 
-        auto_approve: bool = False
+        auto_approve: bool = False,
+        resume_from: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Run the complete call center pipeline.
@@ -62,11 +69,14 @@ class SimplePipeline:
         Args:
             transcript_id: Transcript to process
             auto_approve: If True, approve all workflows regardless of risk
+            resume_from: Checkpoint of an interrupted run (analysis_id, plan_id,
+                workflow_ids) - stages with a checkpoint are not repeated
             
         Returns:
             Complete pipeline result
         """
         tracer = get_tracer()
+        resume_from = resume_from or {}
         
         with tracer.start_as_current_span("orchestration.run_complete_pipeline") as root_span:
             # Set root span attributes
@@ -83,9 +93,14 @@ class SimplePipeline:
                 # Stage 1: Generate Analysis (1:1)
                 with tracer.start_as_current_span("pipeline.stage.analysis") as analysis_span:
                     self.current_stage = PipelineStage.ANALYSIS
-                    add_span_event("stage.started", stage="analysis")
 
-                    analysis = await self._generate_analysis_task(transcript_id)
+                    if resume_from.get("analysis_id"):
+                        analysis = {"id": resume_from["analysis_id"]}
+                        add_span_event("stage.resumed", stage="analysis", analysis_id=analysis["id"])
+                    else:
+                        add_span_event("stage.started", stage="analysis")
+                        async with self._stage_slot(PipelineStage.ANALYSIS):
+                            analysis = await self._generate_analysis_task(transcript_id)
 
                     analysis_span.set_attribute("analysis_id", analysis["id"])
                     add_span_event("stage.completed", stage="analysis", analysis_id=analysis["id"])
@@ -96,9 +111,14 @@ class SimplePipeline:
                 # Stage 2: Create Plan (1:1)
                 with tracer.start_as_current_span("pipeline.stage.plan") as plan_span:
                     self.current_stage = PipelineStage.PLAN
-                    add_span_event("stage.started", stage="plan")
 
-                    plan = await self._create_plan_task(analysis["id"])
+                    if resume_from.get("plan_id"):
+                        plan = {"id": resume_from["plan_id"]}
+                        add_span_event("stage.resumed", stage="plan", plan_id=plan["id"])
+                    else:
+                        add_span_event("stage.started", stage="plan")
+                        async with self._stage_slot(PipelineStage.PLAN):
+                            plan = await self._create_plan_task(analysis["id"])
 
                     plan_span.set_attribute("plan_id", plan["id"])
                     add_span_event("stage.completed", stage="plan", plan_id=plan["id"])
@@ -109,16 +129,23 @@ class SimplePipeline:
                 # Stage 3: Extract Workflows (1:n) - THE BOTTLENECK
                 with tracer.start_as_current_span("pipeline.stage.workflows") as workflows_span:
                     self.current_stage = PipelineStage.WORKFLOWS
-                    add_span_event("stage.started", stage="workflows", message="This stage may take 2-5 minutes")
 
-                    workflows = await self._extract_workflows_task(plan["id"])
+                    if resume_from.get("workflow_ids"):
+                        workflows = await self._load_workflows_task(resume_from["workflow_ids"])
+                        add_span_event("stage.resumed", stage="workflows", workflow_count=len(workflows))
+                    else:
+                        add_span_event("stage.started", stage="workflows", message="This stage may take 2-5 minutes")
+                        async with self._stage_slot(PipelineStage.WORKFLOWS):
+                            workflows = await self._extract_workflows_task(plan["id"])
 
                     workflows_span.set_attribute("workflow_count", len(workflows))
                     workflows_span.set_attribute("plan_id", plan["id"])
                     add_span_event("stage.completed", stage="workflows", workflow_count=len(workflows))
 
                     # Update status for real-time tracking
-                    self._update_status("WORKFLOWS_COMPLETED", workflow_count=len(workflows))
+                    self._update_status("WORKFLOWS_COMPLETED",
+                                      workflow_count=len(workflows),
+                                      workflow_ids=[wf["id"] for wf in workflows])
             
                 # Stage 4: Process approvals
                 with tracer.start_as_current_span("pipeline.stage.approval") as approval_span:
@@ -130,6 +157,8 @@ class SimplePipeline:
                         add_span_event("approval.auto_approving", workflow_count=len(workflows))
                         # Force approve all workflows (both in memory and database)
                         for i, workflow in enumerate(workflows):
+                            if workflow.get("status") == "EXECUTED":
+                                continue  # Executed before the run was interrupted
                             workflow["status"] = "AUTO_APPROVED"
                             # Update status in database
                             try:
@@ -157,30 +186,29 @@ class SimplePipeline:
                     
                     execution_results = []
                     failed_executions = []
+                    execution_timing = {"wall_clock_ms": 0, "summed_duration_ms": 0}
                     
                     if approved_workflows:
-                        
-                        # Execute workflows individually with graceful error handling
-                        for workflow in approved_workflows:
-                            try:
-                                result = await self._execute_workflow_task(workflow["id"])
-                                execution_results.append(result)
-                            except Exception as e:
-                                failed_executions.append({
-                                    "workflow_id": workflow["id"],
-                                    "error": str(e),
-                                    "status": "failed"
-                                })
+                        async with self._stage_slot(PipelineStage.EXECUTION):
+                            # Execute workflows concurrently - failures are isolated per workflow
+                            batch = await self._execute_workflows_task([wf["id"] for wf in approved_workflows])
+                        execution_results = batch["execution_results"]
+                        failed_executions = batch["failed_executions"]
+                        execution_timing = batch["timing"]
                     
                     execution_span.set_attribute("successful_executions", len(execution_results))
                     execution_span.set_attribute("failed_executions", len(failed_executions))
+                    execution_span.set_attribute("execution_wall_clock_ms", execution_timing["wall_clock_ms"])
+                    execution_span.set_attribute("execution_summed_duration_ms", execution_timing["summed_duration_ms"])
                     add_span_event("stage.completed", stage="execution",
                                   successful=len(execution_results), failed=len(failed_executions))
 
                     # Update status for real-time tracking
                     self._update_status("EXECUTION_COMPLETED",
                                       executed_count=len(execution_results),
-                                      failed_count=len(failed_executions))
+                                      failed_count=len(failed_executions),
+                                      execution_ids=[r.get("execution_id") for r in execution_results
+                                                     if r.get("execution_id")])
 
                 # Stage 6: Complete
                 self.current_stage = PipelineStage.COMPLETE
@@ -197,6 +225,7 @@ class SimplePipeline:
                     "failed_count": len(failed_executions),
                     "execution_results": execution_results,
                     "failed_executions": failed_executions,
+                    "execution_timing": execution_timing,
                     "stage": PipelineStage.COMPLETE.value,
                     "success": len(execution_results) > 0 or len(approved_workflows) == 0,  # Success if we executed something or had nothing to execute
                     "partial_success": len(failed_executions) > 0 and len(execution_results) > 0
@@ -304,6 +333,23 @@ class SimplePipeline:
         
         return validated_workflows
     
+    @trace_async_function("task.load_workflows")
+    async def _load_workflows_task(self, workflow_ids: List[str]) -> List[Dict[str, Any]]:
+        """Reload checkpointed workflows when resuming an interrupted run"""
+        workflows = []
+        for workflow_id in workflow_ids:
+            workflow = self.workflow_service.workflow_store.get_by_id(workflow_id)
+            if not workflow:
+                raise ValueError(f"Checkpointed workflow not found: {workflow_id}")
+            
+            # Same auto-approval rule as extraction
+            if workflow.get("risk_level") == "LOW" and workflow.get("status") != "EXECUTED":
+                workflow["status"] = "AUTO_APPROVED"
+            
+            workflows.append(workflow)
+        
+        return workflows
+    
     @trace_async_function("task.execute_workflow")
     async def _execute_workflow_task(self, workflow_id: str) -> Dict[str, Any]:
         """Execute a single workflow"""
@@ -320,6 +366,37 @@ class SimplePipeline:
         
         return result
     
+    @trace_async_function("task.execute_workflows")
+    async def _execute_workflows_task(self, workflow_ids: List[str]) -> Dict[str, Any]:
+        """Execute approved workflows concurrently, keeping partial results"""
+        batch = await self.execution_engine.execute_multiple_workflows(workflow_ids)
+        
+        execution_results = []
+        failed_executions = list(batch["failed_executions"])
+        
+        # Validate each execution result - invalid results count as failures
+        required_fields = ["status", "workflow_id"]
+        for result in batch["successful_executions"]:
+            missing = [field for field in required_fields if field not in result]
+            if missing:
+                failed_executions.append({
+                    "workflow_id": result.get("workflow_id"),
+                    "error": f"Execution result missing required field: {missing[0]}",
+                    "status": "failed"
+                })
+            else:
+                execution_results.append(result)
+        
+        summary = batch["execution_summary"]
+        return {
+            "execution_results": execution_results,
+            "failed_executions": failed_executions,
+            "timing": {
+                "wall_clock_ms": summary["wall_clock_ms"],
+                "summed_duration_ms": summary["summed_duration_ms"]
+            }
+        }
+    
     def get_pipeline_status(self) -> Dict[str, Any]:
         """Get current pipeline status"""
         return {
@@ -332,7 +409,9 @@ async def run_simple_pipeline(
     auto_approve: bool = False,
     api_key: str = None,
     db_path: str = "data/call_center.db",
-    status_dict: Optional[Dict[str, Any]] = None
+    stage_limits: Optional[Dict[str, asyncio.Semaphore]] = None,
+    resume_from: Optional[Dict[str, Any]] = None,
+    checkpoint_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to run the simple pipeline.
@@ -342,6 +421,9 @@ async def run_simple_pipeline(
         auto_approve: Auto-approve all workflows
         api_key: OpenAI API key (defaults to env var)
         db_path: Database path
+        stage_limits: Shared per-stage semaphores (see PipelineScheduler)
+        resume_from: Checkpoint to resume from (pipeline job record)
+        checkpoint_callback: Called with (stage, data) after each completed stage
         
     Returns:
         Pipeline execution result
@@ -352,5 +434,10 @@ async def run_simple_pipeline(
     if not api_key:
         raise ValueError("OpenAI API key required")
     
-    pipeline = SimplePipeline(api_key, db_path, status_dict=status_dict)
-    return await pipeline.run_complete_pipeline(transcript_id, auto_approve)
\ No newline at end of file
+    pipeline = SimplePipeline(
+        api_key,
+        db_path,
+        checkpoint_callback=checkpoint_callback,
+        stage_limits=stage_limits
+    )
+    return await pipeline.run_complete_pipeline(transcript_id, auto_approve, resume_from=resume_from)
\ No newline at end of file
@@ -0,0 +1,271 @@
+"""Precompute scheduler - background cache warming for forecasts and insights.
+
+Every FORECAST_TYPES entry and every PRECOMPUTED_INSIGHTS insight is a
+refresh target. A target is regenerated shortly before its cached result
+expires (or at once when nothing valid is cached), so requests are served
+from the cache instead of waiting for Prophet training or LLM generation.
+
+Refreshes are spread with random jitter, bounded by a concurrency limit and
+retried with exponential backoff after failures. A data change a target
+depends on brings its refresh forward (request_refresh); changes arriving
+within the debounce window share one refresh.
+"""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..analytics.forecasting.forecast_types import FORECAST_TYPES
+from ..infrastructure.config.config_loader import get_precompute_config
+from .forecasting_service import ForecastingService
+from .intelligence_service import IntelligenceService, PRECOMPUTED_INSIGHTS
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RefreshTarget:
+    """A cached result the scheduler keeps warm, with its refresh state."""
+    name: str
+    ttl_seconds: float
+    refresh: Callable[[], Awaitable[Any]]
+    seconds_to_expiry: Callable[[], Optional[float]]  # None = nothing cached
+
+    next_run_at: float = 0.0  # time.time()
+    running: bool = False
+    last_status: str = 'pending'  # pending | ok | failed
+    last_refresh_at: Optional[float] = None
+    last_latency_ms: Optional[int] = None
+    last_error: Optional[str] = None
+    consecutive_failures: int = 0
+    refresh_count: int = 0
+    stale: bool = False  # data changed since the running refresh read it
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class PrecomputeScheduler:
+    """Refreshes cached forecasts and insights ahead of their TTL expiry."""
+
+    def __init__(self, targets: List[RefreshTarget], max_concurrency: int = 2,
+                 refresh_ahead_fraction: float = 0.2, jitter_fraction: float = 0.1,
+                 min_interval_seconds: float = 900, backoff_base_seconds: float = 60,
+                 backoff_max_seconds: float = 3600, poll_interval_seconds: float = 30,
+                 startup_spread_seconds: float = 60, change_debounce_seconds: float = 30,
+                 rng: Optional[random.Random] = None):
+        """Initialize scheduler.
+
+        Args:
+            targets: Refresh targets
+            max_concurrency: Refreshes running at once
+            refresh_ahead_fraction: Refresh when this share of the TTL is left
+            jitter_fraction: Random extra lead time, as a share of the TTL
+            min_interval_seconds: Minimum time between refreshes of one target
+            backoff_base_seconds: Retry delay after the first failure (doubles per failure)
+            backoff_max_seconds: Upper bound of the retry delay
+            poll_interval_seconds: Longest sleep between scheduling passes
+            startup_spread_seconds: Window over which initial refreshes are spread
+            change_debounce_seconds: Delay of a change-driven refresh (later changes join it)
+            rng: Random source (seedable for tests)
+        """
+        if not targets:
+            raise ValueError("At least one refresh target is required")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.targets = {target.name: target for target in targets}
+        self.max_concurrency = max_concurrency
+        self.refresh_ahead_fraction = refresh_ahead_fraction
+        self.jitter_fraction = jitter_fraction
+        self.min_interval_seconds = min_interval_seconds
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.poll_interval_seconds = poll_interval_seconds
+        self.startup_spread_seconds = startup_spread_seconds
+        self.change_debounce_seconds = change_debounce_seconds
+        self._rng = rng or random.Random()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._started_at: Optional[float] = None
+
+    @classmethod
+    def for_services(cls, forecasting_service: ForecastingService,
+                     intelligence_service: IntelligenceService) -> 'PrecomputeScheduler':
+        """Scheduler for every forecast type and precomputed insight, configured from config."""
+        forecast_ttl_hours = get_precompute_config('forecast_ttl_hours', 24)
+        timeout = get_precompute_config('refresh_timeout_seconds', 900)
+
+        targets = [
+            RefreshTarget(
+                name=f"forecast:{forecast_type}",
+                ttl_seconds=forecast_ttl_hours * 3600,
+                refresh=lambda ft=forecast_type: forecasting_service.refresh_forecast(
+                    ft, ttl_hours=forecast_ttl_hours, timeout=timeout),
+                seconds_to_expiry=lambda ft=forecast_type: forecasting_service.forecast_seconds_to_expiry(ft)
+            )
+            for forecast_type in FORECAST_TYPES
+        ] + [
+            RefreshTarget(
+                name=f"insight:{insight_type}",
+                ttl_seconds=spec['ttl_hours'] * 3600,
+                refresh=lambda it=insight_type: intelligence_service.refresh_insight(it),
+                seconds_to_expiry=lambda it=insight_type: intelligence_service.insight_seconds_to_expiry(it)
+            )
+            for insight_type, spec in PRECOMPUTED_INSIGHTS.items()
+        ]
+
+        return cls(
+            targets,
+            max_concurrency=get_precompute_config('max_concurrency', 2),
+            refresh_ahead_fraction=get_precompute_config('refresh_ahead_fraction', 0.2),
+            jitter_fraction=get_precompute_config('jitter_fraction', 0.1),
+            min_interval_seconds=get_precompute_config('min_interval_seconds', 900),
+            backoff_base_seconds=get_precompute_config('backoff_base_seconds', 60),
+            backoff_max_seconds=get_precompute_config('backoff_max_seconds', 3600),
+            poll_interval_seconds=get_precompute_config('poll_interval_seconds', 30),
+            startup_spread_seconds=get_precompute_config('startup_spread_seconds', 60),
+            change_debounce_seconds=get_precompute_config('change_debounce_seconds', 30)
+        )
+
+    def _schedule(self, target: RefreshTarget, now: float) -> None:
+        """Set the next run from the cached result's remaining lifetime."""
+        remaining = target.seconds_to_expiry()
+        if remaining is None:
+            delay = 0.0  # Nothing cached - warm it now
+        else:
+            lead = (self.refresh_ahead_fraction + self._rng.uniform(0, self.jitter_fraction)) * target.ttl_seconds
+            delay = max(0.0, remaining - lead)
+
+        if target.last_refresh_at is not None:
+            delay = max(delay, target.last_refresh_at + self.min_interval_seconds - now)
+        target.next_run_at = now + delay
+
+    def _backoff(self, target: RefreshTarget, now: float) -> None:
+        """Retry after an exponentially growing, jittered delay."""
+        delay = min(self.backoff_base_seconds * 2 ** (target.consecutive_failures - 1), self.backoff_max_seconds)
+        delay *= self._rng.uniform(1 - self.jitter_fraction, 1 + self.jitter_fraction)
+        target.next_run_at = now + delay
+
+    def start(self) -> None:
+        """Compute the initial schedule; initial refreshes are spread over the startup window."""
+        now = time.time()
+        self._started_at = now
+        for target in self.targets.values():
+            self._schedule(target, now)
+            target.next_run_at += self._rng.uniform(0, self.startup_spread_seconds)
+
+    def request_refresh(self, name: str) -> bool:
+        """
+        Refresh a target soon because data it depends on changed.
+
+        The refresh runs within change_debounce_seconds, but no sooner than
+        min_interval_seconds after the previous one; a change during a running
+        refresh schedules another one after it.
+
+        Returns:
+            True if a refresh is scheduled, False when the scheduler isn't running
+            (or the target is unknown) and the caller should invalidate instead
+        """
+        target = self.targets.get(name)
+        if target is None or self._started_at is None:
+            return False
+
+        if target.running:
+            target.stale = True
+        else:
+            target.next_run_at = min(target.next_run_at, self._change_due_at(target, time.time()))
+        return True
+
+    def _change_due_at(self, target: RefreshTarget, now: float) -> float:
+        """Run time of a change-driven refresh: debounced and rate limited."""
+        due = now + self.change_debounce_seconds
+        if target.last_refresh_at is not None:
+            due = max(due, target.last_refresh_at + self.min_interval_seconds)
+        return due
+
+    def run_due(self) -> List[asyncio.Task]:
+        """Start refreshes of every due target that isn't already refreshing."""
+        now = time.time()
+        started = []
+        for target in self.targets.values():
+            if not target.running and target.next_run_at <= now:
+                target.running = True
+                started.append(asyncio.create_task(self._refresh(target)))
+        return started
+
+    async def _refresh(self, target: RefreshTarget) -> None:
+        """Refresh one target under the concurrency limit and reschedule it."""
+        try:
+            async with self._semaphore:
+                target.stale = False
+                start = time.perf_counter()
+                try:
+                    await target.refresh()
+                except Exception as e:
+                    target.consecutive_failures += 1
+                    target.last_status = 'failed'
+                    target.last_error = str(e)
+                    self._backoff(target, time.time())
+                    logger.warning(
+                        f"Precompute of {target.name} failed ({target.consecutive_failures} in a row), "
+                        f"retrying at {_iso(target.next_run_at)}: {e}"
+                    )
+                    return
+
+                target.last_latency_ms = int((time.perf_counter() - start) * 1000)
+                target.last_refresh_at = time.time()
+                target.last_status = 'ok'
+                target.last_error = None
+                target.consecutive_failures = 0
+                target.refresh_count += 1
+                self._schedule(target, target.last_refresh_at)
+                if target.stale:
+                    target.next_run_at = min(target.next_run_at, self._change_due_at(target, target.last_refresh_at))
+                logger.info(f"Precomputed {target.name} in {target.last_latency_ms} ms")
+        finally:
+            target.running = False
+
+    async def run(self) -> None:
+        """Scheduling loop - runs until cancelled (started from the server lifespan)."""
+        self.start()
+        tasks = set()
+        try:
+            while True:
+                for task in self.run_due():
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+                idle = [t.next_run_at for t in self.targets.values() if not t.running]
+                wait = min(idle) - time.time() if idle else self.poll_interval_seconds
+                await asyncio.sleep(min(max(wait, 1.0), self.poll_interval_seconds))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Refresh schedule and last-refresh latency per target (for /intelligence/health)."""
+        return {
+            'started_at': _iso(self._started_at),
+            'max_concurrency': self.max_concurrency,
+            'refreshing': sum(1 for t in self.targets.values() if t.running),
+            'targets': {
+                target.name: {
+                    'status': 'refreshing' if target.running else target.last_status,
+                    'next_refresh_at': _iso(target.next_run_at) if self._started_at else None,
+                    'last_refresh_at': _iso(target.last_refresh_at),
+                    'last_latency_ms': target.last_latency_ms,
+                    'refresh_count': target.refresh_count,
+                    'consecutive_failures': target.consecutive_failures,
+                    'last_error': target.last_error
+                }
+                for target in self.targets.values()
+            }
+        }
@@ -0,0 +1,182 @@
+"""Semantic query cache for leadership insights.
+
+Core Principles Applied:
+- NO FALLBACK: Fail fast on invalid thresholds
+- Performance: Paraphrased questions reuse a cached answer instead of
+  re-running the multi-LLM-call agent loop
+
+Exact query matches are tried first; otherwise the query embedding is
+compared (cosine) with the cached queries of the same executive role and
+the nearest one is served if it reaches the role's similarity threshold.
+Embeddings barely move when a single qualifier changes ("this quarter" vs
+"last quarter", ADV001 vs ADV002, "non-refinance"), so a semantic match
+also needs the same numbers/IDs, time-period words and negations.
+"""
+import re
+import threading
+from typing import Dict, Any, FrozenSet, List, Optional
+
+from ..storage.insight_dependencies import DataDependency
+from ..storage.insights_cache_store import InsightsCacheStore
+
+
+# Words that change which data a question is about, not just how it is phrased
+TIME_PERIOD_WORDS = frozenset({
+    'this', 'last', 'next', 'previous', 'prior', 'past', 'current', 'today', 'yesterday',
+    'day', 'week', 'month', 'quarter', 'year', 'ytd', 'mtd', 'qtd'
+})
+NEGATION_WORDS = frozenset({'no', 'non', 'not', 'without', 'never', 'except', 'excluding'})
+
+_WORD = re.compile(r"[a-z0-9]+")
+# daily/weekly/... and plurals name the same period as day/week/...
+_PERIOD_FORMS = {'daily': 'day', 'weekly': 'week', 'monthly': 'month', 'quarterly': 'quarter',
+                 'yearly': 'year', 'annual': 'year', 'annually': 'year'}
+
+
+def query_qualifiers(query: str) -> FrozenSet[str]:
+    """Numbers/IDs, time-period words and negations a semantic match must share."""
+    text = query.lower().replace("n't", " not").replace("n’t", " not")
+    qualifiers = set()
+    for word in _WORD.findall(text):
+        word = _PERIOD_FORMS.get(word, word)
+        if word.endswith('s') and word[:-1] in TIME_PERIOD_WORDS:
+            word = word[:-1]
+        if any(ch.isdigit() for ch in word) or word in TIME_PERIOD_WORDS or word in NEGATION_WORDS:
+            qualifiers.add(word)
+    return frozenset(qualifiers)
+
+
+class SemanticQueryCache:
+    """Exact + nearest-neighbour lookups over InsightsCacheStore, with hit/miss metrics."""
+
+    def __init__(self, cache_store: InsightsCacheStore, embedder,
+                 similarity_threshold: float = 0.85,
+                 role_thresholds: Optional[Dict[str, float]] = None):
+        """Initialize semantic cache.
+
+        Args:
+            cache_store: Aggregation cache storage
+            embedder: Query embedder (`name`, `embed(text)`)
+            similarity_threshold: Cosine similarity a semantic match must reach
+            role_thresholds: Executive role → threshold overriding the default
+
+        Raises:
+            ValueError: If a threshold is outside (0, 1] (NO FALLBACK)
+        """
+        role_thresholds = role_thresholds or {}
+        for role, threshold in {'default': similarity_threshold, **role_thresholds}.items():
+            if not 0 < threshold <= 1:
+                raise ValueError(f"Similarity threshold for {role} must be in (0, 1], got {threshold}")
+
+        self.cache_store = cache_store
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.role_thresholds = role_thresholds
+
+        self._lock = threading.Lock()
+        self._metrics = {
+            'lookups': 0, 'exact_hits': 0, 'semantic_hits': 0, 'misses': 0,
+            'hit_similarity_sum': 0.0, 'miss_similarity_sum': 0.0, 'miss_similarity_count': 0
+        }
+
+    def get_threshold(self, executive_role: str) -> float:
+        """Similarity threshold for an executive role."""
+        return self.role_thresholds.get(executive_role, self.similarity_threshold)
+
+    def lookup(self, query: str, executive_role: str) -> Optional[Dict[str, Any]]:
+        """Find a cached response for the query or a paraphrase of it.
+
+        Only cached queries with the same qualifiers (see query_qualifiers)
+        are semantic match candidates.
+
+        Args:
+            query: Query string
+            executive_role: Executive role (cache entries are per role)
+
+        Returns:
+            'entry': cached data, 'match': 'exact' or 'semantic',
+            'similarity': cosine similarity, 'matched_query': cached query;
+            None on a miss
+        """
+        filters = {'executive_role': executive_role}
+
+        entry = self.cache_store.get_cached_aggregation(query=query, filters=filters)
+        if entry:
+            self._record('exact_hits', 1.0)
+            return {'entry': entry, 'match': 'exact', 'similarity': 1.0, 'matched_query': query.strip()}
+
+        qualifiers = query_qualifiers(query)
+        match = self.cache_store.find_semantic_match(
+            embedding=self.embedder.embed(query),
+            embedding_model=self.embedder.name,
+            min_similarity=self.get_threshold(executive_role),
+            filters=filters,
+            query_filter=lambda cached_query: query_qualifiers(cached_query) == qualifiers
+        )
+        if match['entry']:
+            self._record('semantic_hits', match['similarity'])
+            return {**match, 'match': 'semantic'}
+
+        self._record('misses', match['similarity'])
+        return None
+
+    def store(self, query: str, response: Dict[str, Any], executive_role: str,
+              ttl_hours: int = 24, dependencies: Optional[List[DataDependency]] = None) -> str:
+        """Cache a response together with its query embedding.
+
+        Args:
+            query: Original query
+            response: Agent response (with metadata)
+            executive_role: Executive role
+            ttl_hours: Time to live in hours
+            dependencies: Source rows the response was computed from
+
+        Returns:
+            Cache key
+        """
+        return self.cache_store.store_aggregation(
+            query=query,
+            aggregated_data=response,
+            data_sources=response['metadata']['data_sources_used'],
+            record_count=response['metadata']['records_analyzed'],
+            computation_time_ms=response['metadata']['total_processing_time_ms'],
+            filters={'executive_role': executive_role},
+            ttl_hours=ttl_hours,
+            embedding=self.embedder.embed(query),
+            embedding_model=self.embedder.name,
+            dependencies=dependencies
+        )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Hit/miss counts and similarity scores since startup."""
+        with self._lock:
+            m = dict(self._metrics)
+
+        hits = m['exact_hits'] + m['semantic_hits']
+        return {
+            'embedding_model': self.embedder.name,
+            'similarity_threshold': self.similarity_threshold,
+            'role_thresholds': dict(self.role_thresholds),
+            'lookups': m['lookups'],
+            'exact_hits': m['exact_hits'],
+            'semantic_hits': m['semantic_hits'],
+            'misses': m['misses'],
+            'hit_rate': round(hits / m['lookups'], 4) if m['lookups'] else None,
+            'avg_semantic_hit_similarity': (
+                round(m['hit_similarity_sum'] / m['semantic_hits'], 4) if m['semantic_hits'] else None
+            ),
+            'avg_miss_similarity': (
+                round(m['miss_similarity_sum'] / m['miss_similarity_count'], 4)
+                if m['miss_similarity_count'] else None
+            )
+        }
+
+    def _record(self, outcome: str, similarity: Optional[float]) -> None:
+        with self._lock:
+            self._metrics['lookups'] += 1
+            self._metrics[outcome] += 1
+            if outcome == 'semantic_hits':
+                self._metrics['hit_similarity_sum'] += similarity
+            elif outcome == 'misses' and similarity is not None:
+                self._metrics['miss_similarity_sum'] += similarity
+                self._metrics['miss_similarity_count'] += 1
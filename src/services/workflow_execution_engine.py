@@ -4,6 +4,7 @@ Coordinates between agents, adapters, and storage systems.
 NO FALLBACK LOGIC - fails fast on any execution issues.
 """
 import time
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
@@ -26,9 +27,11 @@ from src.infrastructure.adapters.workflow_mock_adapters import (
 )
 from src.storage.workflow_store import WorkflowStore
 from src.storage.workflow_execution_store import WorkflowExecutionStore
+from src.infrastructure.config.config_loader import get_agent_config_value
 from src.infrastructure.events import (
     EventType,
     create_execution_step_completed_event,
+    create_workflow_executed_event,
     publish_event
 )
 
@@ -46,11 +49,17 @@ class WorkflowExecutionEngine:
     NO FALLBACK LOGIC - any failure causes immediate exception.
     """
     
-    def __init__(self, db_path: str = "data/call_center.db"):
+    def __init__(self, db_path: str = "data/call_center.db",
+                 max_concurrent_workflows: Optional[int] = None,
+                 adapter_limits: Optional[Dict[str, int]] = None):
         """Initialize execution engine with all dependencies.
 
         Args:
             db_path: Path to database file
+            max_concurrent_workflows: Workflows executed at once by
+                execute_multiple_workflows (None = config default)
+            adapter_limits: In-flight calls allowed per adapter, with an optional
+                'default' entry (None = config default)
         """
         self.logger = logging.getLogger(__name__)
 
@@ -78,6 +87,31 @@ class WorkflowExecutionEngine:
             'accounting_api': AccountingAPIMockAdapter()
         }
 
+        # Concurrency limits - workflows per batch and in-flight calls per adapter
+        if max_concurrent_workflows is None:
+            max_concurrent_workflows = get_agent_config_value('workflow_execution', 'max_concurrent_workflows', 10)
+        if max_concurrent_workflows < 1:
+            raise ValueError(f"max_concurrent_workflows must be positive, got {max_concurrent_workflows}")
+        self.max_concurrent_workflows = max_concurrent_workflows
+
+        if adapter_limits is None:
+            adapter_limits = get_agent_config_value('workflow_execution', 'adapter_limits', {}) or {}
+        default_limit = adapter_limits.get('default', 5)
+        self.adapter_limits = {
+            name: asyncio.Semaphore(adapter_limits.get(name, default_limit))
+            for name in self.adapters
+        }
+
+    async def _call_adapter(self, executor_type: str, workflow: Dict[str, Any],
+                            step_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Invoke an adapter within its concurrency limit.
+
+        Adapters are synchronous, so the call runs in a worker thread and
+        concurrent workflows do not block the event loop or each other.
+        """
+        async with self.adapter_limits[executor_type]:
+            return await asyncio.to_thread(self.adapters[executor_type].execute, workflow, step_parameters)
+
     async def execute_single_step(self, workflow_id: str, step_number: int, executed_by: str = "system") -> Dict[str, Any]:
         """Execute a single workflow step.
 
@@ -142,7 +176,6 @@ class WorkflowExecutionEngine:
                 raise Exception(f"No executor available for type: {executor_type}. Available: {list(self.adapters.keys())}")
 
             # Step 7: Execute the step
-            executor = self.adapters[executor_type]
             self.logger.info(f"Executing step {step_number} with executor: {executor_type}")
 
             step_parameters = {
@@ -154,7 +187,7 @@ class WorkflowExecutionEngine:
             }
 
             # Execute using the adapter - FAIL FAST on execution error
-            step_result = executor.execute(workflow, step_parameters)
+            step_result = await self._call_adapter(executor_type, workflow, step_parameters)
 
             # Step 8: Calculate timing
             step_duration = int((time.time() - step_start_time) * 1000)
@@ -332,7 +365,6 @@ class WorkflowExecutionEngine:
                     continue
 
                 # Execute step using appropriate executor
-                executor = self.adapters[executor_type]
                 self.logger.info(f"Found executor for step: workflow_id={workflow_id}, step_number={step_number}, executor_type={executor_type}")
 
                 # Create step-specific parameters
@@ -347,7 +379,7 @@ class WorkflowExecutionEngine:
                 # Execute the step - FAIL FAST if execution fails
                 self.logger.info(f"Calling executor.execute(): workflow_id={workflow_id}, step_number={step_number}, executor_type={executor_type}")
                 try:
-                    step_result = executor.execute(workflow, step_parameters)
+                    step_result = await self._call_adapter(executor_type, workflow, step_parameters)
                     self.logger.info(f"Executor completed successfully: workflow_id={workflow_id}, step_number={step_number}, result_keys={list(step_result.keys()) if isinstance(step_result, dict) else 'not_dict'}")
                 except Exception as e:
                     self.logger.exception(f"Executor failed: workflow_id={workflow_id}, step_number={step_number}, executor_type={executor_type}")
@@ -408,8 +440,8 @@ class WorkflowExecutionEngine:
             if not success:
                 raise Exception(f"Failed to update workflow status: {workflow_id}")
 
-            # Step 5: Return complete execution result
-            return {
+            # Step 5: Build complete execution result
+            result = {
                 'execution_id': execution_id,
                 'workflow_id': workflow_id,
                 'status': 'executed' if len(failed_steps) == 0 else 'partial_failure',
@@ -447,20 +479,61 @@ class WorkflowExecutionEngine:
             except Exception as store_error:
                 # Even storage failed - but don't mask original error
                 pass
+
+            try:
+                publish_event(create_workflow_executed_event(
+                    workflow_id=workflow_id,
+                    status='failed',
+                    execution_id=None,
+                    successful_steps=0,
+                    failed_steps=0,
+                    execution_duration_ms=execution_duration,
+                    executed_by=executed_by,
+                    error=str(e)
+                ))
+            except Exception as event_error:
+                # Don't mask original error
+                self.logger.error(f"Failed to publish WORKFLOW_FAILED event: {event_error}")
             
             # Re-raise original exception - NO FALLBACK
             raise Exception(f"Workflow execution failed for {workflow_id}: {e}")
+
+        # Per-workflow completion event (orchestration progress streams). Published outside
+        # the try block: the workflow already executed, so a subscriber error must not turn it
+        # into a reported execution failure
+        try:
+            publish_event(create_workflow_executed_event(
+                workflow_id=workflow_id,
+                status=result['status'],
+                execution_id=result['execution_id'],
+                successful_steps=result['successful_steps'],
+                failed_steps=result['failed_steps'],
+                execution_duration_ms=result['execution_duration_ms'],
+                executed_by=executed_by
+            ))
+        except Exception as event_error:
+            self.logger.error(f"Failed to publish WORKFLOW_COMPLETED event for {workflow_id}: {event_error}")
+
+        return result
     
     async def execute_multiple_workflows(self, workflow_ids: list, 
-                                       executed_by: str = "system_executor") -> Dict[str, Any]:
-        """Execute multiple approved workflows in sequence.
+                                       executed_by: str = "system_executor",
+                                       max_concurrent: Optional[int] = None) -> Dict[str, Any]:
+        """Execute multiple approved workflows concurrently.
+
+        At most ``max_concurrent`` workflows run at once and adapter calls are
+        further bounded per adapter. A failing workflow is recorded in
+        ``failed_executions`` without affecting the others.
         
         Args:
             workflow_ids: List of workflow IDs to execute
             executed_by: Who is executing the workflows
+            max_concurrent: Workflows to run at once (None = engine default)
             
         Returns:
-            Summary of all executions with results and failures
+            Summary of all executions with results and failures, in input order.
+            ``execution_summary`` reports both ``wall_clock_ms`` (elapsed batch
+            time) and ``summed_duration_ms`` (sum of successful workflow durations).
             
         Raises:
             ValueError: Invalid input parameters (NO FALLBACK)
@@ -470,6 +543,11 @@ class WorkflowExecutionEngine:
         
         if not all(isinstance(wf_id, str) for wf_id in workflow_ids):
             raise ValueError("All workflow_ids must be strings")
+
+        if max_concurrent is None:
+            max_concurrent = self.max_concurrent_workflows
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be positive, got {max_concurrent}")
         
         results = {
             'total_workflows': len(workflow_ids),
@@ -478,34 +556,47 @@ class WorkflowExecutionEngine:
             'execution_summary': {
                 'success_count': 0,
                 'failure_count': 0,
-                'total_duration_ms': 0
+                'total_duration_ms': 0,
+                'max_concurrent': max_concurrent
             },
             'started_at': datetime.now(timezone.utc).isoformat()
         }
         
         batch_start_time = time.time()
-        
-        # Execute each workflow
-        for workflow_id in workflow_ids:
-            try:
-                execution_result = await self.execute_workflow(workflow_id, executed_by)
-                results['successful_executions'].append(execution_result)
-                results['execution_summary']['success_count'] += 1
-                results['execution_summary']['total_duration_ms'] += execution_result.get('execution_duration_ms', 0)
-                
-            except Exception as e:
-                failed_result = {
-                    'workflow_id': workflow_id,
-                    'status': 'failed',
-                    'error': str(e),
-                    'failed_at': datetime.now(timezone.utc).isoformat()
-                }
-                results['failed_executions'].append(failed_result)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        outcomes: List[Optional[Dict[str, Any]]] = [None] * len(workflow_ids)
+
+        async def execute_one(index: int, workflow_id: str):
+            # Errors are captured per workflow so one failure never cancels the task group
+            async with semaphore:
+                try:
+                    outcomes[index] = await self.execute_workflow(workflow_id, executed_by)
+                except Exception as e:
+                    outcomes[index] = {
+                        'workflow_id': workflow_id,
+                        'status': 'failed',
+                        'error': str(e),
+                        'failed_at': datetime.now(timezone.utc).isoformat()
+                    }
+
+        async with asyncio.TaskGroup() as task_group:
+            for index, workflow_id in enumerate(workflow_ids):
+                task_group.create_task(execute_one(index, workflow_id))
+
+        for outcome in outcomes:
+            if outcome['status'] == 'failed':
+                results['failed_executions'].append(outcome)
                 results['execution_summary']['failure_count'] += 1
+            else:
+                results['successful_executions'].append(outcome)
+                results['execution_summary']['success_count'] += 1
+                results['execution_summary']['total_duration_ms'] += outcome.get('execution_duration_ms', 0)
         
-        # Add batch timing
+        # Add batch timing - wall clock vs. summed per-workflow durations
         batch_duration = int((time.time() - batch_start_time) * 1000)
         results['execution_summary']['batch_duration_ms'] = batch_duration
+        results['execution_summary']['wall_clock_ms'] = batch_duration
+        results['execution_summary']['summed_duration_ms'] = results['execution_summary']['total_duration_ms']
         results['completed_at'] = datetime.now(timezone.utc).isoformat()
         
         return results
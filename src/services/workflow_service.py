@@ -646,14 +646,28 @@ class WorkflowService:
         (BORROWER, ADVISOR, SUPERVISOR, LEADERSHIP) as separate workflows for
         independent risk assessment and approval routing.
         
+        Extraction runs as a dataflow pipeline: every pillar starts as soon as
+        the plan is loaded, each action item flows through risk assessment →
+        approval routing on its own (with step generation running alongside,
+        since it does not depend on the risk result), and completed workflows
+        are written with ``WorkflowStore.create_bulk`` in micro-batches while
+        other items are still with the LLM. If any item fails, the workflows
+        written so far are deleted again, so a plan never ends up with a
+        partial workflow set.
+        
+        Extraction is idempotent per plan: a complete set left by an earlier
+        extraction is returned as is, and a partial set left by a process that
+        died mid-extraction (no compensation ran) is deleted before extracting.
+        
         Args:
             plan_id: Action plan ID
             
         Returns:
             List of workflow data dictionaries for all extracted items
+            (pillar order, then plan item order)
             
         Raises:
-            ValueError: Invalid plan_id or plan not found (NO FALLBACK)
+            ValueError: Invalid plan_id, plan not found or plan-to-workflow mismatch (NO FALLBACK)
             Exception: LLM agent failures (NO FALLBACK)
         """
         # Set up tracing for workflow extraction
@@ -671,6 +685,11 @@ class WorkflowService:
             raise ValueError(f"Action plan not found: {plan_id}")
         add_span_event("extraction.plan_loaded", plan_id=plan_id)
         
+        existing_workflows = self._previous_extraction(plan_id, plan_data)
+        if existing_workflows is not None:
+            add_span_event("extraction.reused", plan_id=plan_id, workflow_count=len(existing_workflows))
+            return existing_workflows
+        
         # Build complete context for LLM agent
         add_span_event("extraction.building_context", plan_id=plan_id)
         context_data = {
@@ -682,14 +701,165 @@ class WorkflowService:
             'pipeline_stage': 'granular_workflow_extraction'
         }
         
-        all_workflows = []
         workflow_types = ['BORROWER', 'ADVISOR', 'SUPERVISOR', 'LEADERSHIP']
+        # Expected workflows per pillar are known from the plan up front (1:1 mapping)
+        expected_counts = self._expected_workflow_counts(plan_data)
         add_span_event("extraction.processing_workflow_types", workflow_types=len(workflow_types))
         
-        # Create async task for each workflow type to enable parallel processing
-        async def process_workflow_type(workflow_type: str) -> List[Dict[str, Any]]:
-            """Process a single workflow type in parallel."""
+        # Completed workflows flow from the item tasks to the writer
+        completed: asyncio.Queue = asyncio.Queue()
+        persisted: List[tuple] = []  # (order_key, workflow_id, workflow_data)
+        
+        async def persist_completed() -> None:
+            """Write completed workflows in micro-batches until the end-of-stream marker."""
+            while True:
+                batch = [await completed.get()]
+                while not completed.empty():
+                    batch.append(completed.get_nowait())
+                
+                items = [entry for entry in batch if entry is not None]
+                if items:
+                    try:
+                        workflow_ids = self.workflow_store.create_bulk([workflow for _, workflow in items])
+                    except Exception as e:
+                        raise Exception(f"Failed to save workflows to database: {str(e)}")
+                    persisted.extend(
+                        (order_key, workflow_id, workflow)
+                        for (order_key, workflow), workflow_id in zip(items, workflow_ids)
+                    )
+                    add_span_event("workflow.batch_persisted", workflow_count=len(items))
+                
+                if len(items) < len(batch):
+                    return
+        
+        async def process_action_item(workflow_type: str, item: Dict[str, Any]) -> Dict[str, Any]:
+            """Process a single action item with all required assessments."""
+            import time
+            start_time = time.time()
+            
+            # Start processing individual action item
+            item_description = item.get('action', 'Unknown action')[:50]
+            add_span_event("action_item.processing_started", workflow_type=workflow_type, description=item_description)
+            
+            # Step generation doesn't depend on the risk result - start it speculatively
+            # alongside risk assessment → approval routing
+            add_span_event("action_item.generating_steps", workflow_type=workflow_type, description=item_description)
+            steps_task = asyncio.create_task(self.generate_steps_for_action(
+                action_item=item,
+                workflow_type=workflow_type,
+                context=context_data
+            ))
+            
+            try:
+                # We need risk assessment before approval routing, so we await it first
+                risk_assessment = await self.risk_agent.assess_action_item_risk(
+                    action_item=item,
+                    workflow_type=workflow_type,
+                    context=context_data
+                )
+                
+                # Log completion with timing
+                elapsed = time.time() - start_time
+                risk_level = risk_assessment.get('risk_level', 'UNKNOWN')
+                add_span_event("action_item.processing_completed", workflow_type=workflow_type, 
+                              risk_level=risk_level, duration_seconds=round(elapsed, 1))
+                
+                # Validate risk assessment
+                if 'risk_level' not in risk_assessment or 'reasoning' not in risk_assessment:
+                    raise ValueError(f"LLM agent failed to provide complete risk assessment for {workflow_type} item")
+                
+                # Now do approval routing with risk assessment results
+                approval_routing = await self.risk_agent.determine_action_item_approval_routing(
+                    action_item=item,
+                    risk_assessment=risk_assessment,
+                    workflow_type=workflow_type,
+                    context=context_data
+                )
+            except BaseException:
+                # Speculative step generation is wasted work once the item fails
+                steps_task.cancel()
+                raise
+            
+            # Validate approval routing with detailed logging
+            required_routing_fields = ['requires_human_approval', 'initial_status', 'routing_reasoning']
+            missing_fields = [field for field in required_routing_fields if field not in approval_routing]
+
+            if missing_fields:
+                add_span_event("approval_routing.validation_failed",
+                              workflow_type=workflow_type,
+                              missing_fields=missing_fields,
+                              actual_fields=list(approval_routing.keys()),
+                              approval_routing_response=str(approval_routing))
+
+                # Add defensive defaults to allow workflow to proceed
+                for field in missing_fields:
+                    if field == 'requires_human_approval':
+                        approval_routing[field] = True  # Safe default
+                        add_span_event("approval_routing.default_applied", field=field, default_value=True)
+                    elif field == 'initial_status':
+                        approval_routing[field] = 'PENDING_ASSESSMENT'  # Safe default
+                        add_span_event("approval_routing.default_applied", field=field, default_value='PENDING_ASSESSMENT')
+                    elif field == 'routing_reasoning':
+                        approval_routing[field] = f'Default routing for {workflow_type} action item due to missing LLM response field'
+                        add_span_event("approval_routing.default_applied", field=field, default_value='generated_default')
+
+                add_span_event("approval_routing.validation_recovered",
+                              workflow_type=workflow_type,
+                              applied_defaults=missing_fields)
+
+            try:
+                step_result = await steps_task
+
+                # Extract steps from response
+                steps = step_result.get('steps', [])
+
+                add_span_event("action_item.steps_generated", workflow_type=workflow_type,
+                              step_count=len(steps))
+            except Exception as e:
+                add_span_event("action_item.step_generation_failed", workflow_type=workflow_type,
+                              error=str(e))
+                # Following NO FALLBACK principle - fail fast if steps can't be generated
+                raise Exception(f"Failed to generate steps for {workflow_type} action: {str(e)}")
+
+            # Enhance the item with generated steps
+            enhanced_item = {
+                **item,
+                'steps': steps
+            }
+
+            # Create workflow data for this action item
+            # Normalize risk_level to uppercase for database compatibility
+            if risk_assessment and 'risk_level' in risk_assessment:
+                risk_assessment['risk_level'] = str(risk_assessment['risk_level']).upper()
+
+            # Normalize workflow_type to uppercase for database compatibility
+            normalized_workflow_type = workflow_type.upper()
+            if normalized_workflow_type not in ['BORROWER', 'ADVISOR', 'SUPERVISOR', 'LEADERSHIP']:
+                raise ValueError(f"Invalid workflow_type: {workflow_type} -> {normalized_workflow_type}")
+
+            return {
+                'plan_id': plan_id,
+                'analysis_id': plan_data['analysis_id'],
+                'transcript_id': plan_data['transcript_id'],
+                'workflow_data': enhanced_item,
+                'workflow_type': normalized_workflow_type,
+                'context_data': {
+                    **context_data,
+                    'workflow_type': normalized_workflow_type,
+                    'action_item_context': item.get('context', {})
+                },
+                'risk_assessment': risk_assessment,
+                'approval_routing': approval_routing
+            }
+        
+        async def process_workflow_type(type_index: int, workflow_type: str) -> None:
+            """Extract one pillar and stream its items through assessment to the writer."""
             add_span_event("workflow_type.processing_started", workflow_type=workflow_type)
+            if expected_counts[workflow_type] == 0:
+                # Nothing executable in this pillar - no LLM work needed
+                add_span_event("workflow_type.processing_completed", workflow_type=workflow_type, successful_count=0)
+                return
+            
             try:
                 # Extract individual action items using LLM agent
                 add_span_event("workflow_type.extracting_items", workflow_type=workflow_type)
@@ -699,194 +869,59 @@ class WorkflowService:
                     context=context_data
                 )
                 add_span_event("workflow_type.items_extracted", workflow_type=workflow_type, items_count=len(action_items))
-                
-                # Add progress information before risk assessment
-                if action_items:
-                    add_span_event("workflow_type.risk_assessment_starting", workflow_type=workflow_type, items_count=len(action_items))
-                
-                # Process action items in parallel batches
-                async def process_action_item(item: Dict[str, Any]) -> Dict[str, Any]:
-                    """Process a single action item with all required assessments."""
-                    import time
-                    start_time = time.time()
-                    
-                    # Start processing individual action item
-                    item_description = item.get('action', 'Unknown action')[:50]
-                    add_span_event("action_item.processing_started", workflow_type=workflow_type, description=item_description)
-                    
-                    # Run risk assessment and approval routing in parallel
-                    risk_assessment_task = self.risk_agent.assess_action_item_risk(
-                        action_item=item,
-                        workflow_type=workflow_type,
-                        context=context_data
-                    )
-                    
-                    # We need risk assessment before approval routing, so we await it first
-                    risk_assessment = await risk_assessment_task
-                    
-                    # Log completion with timing
-                    elapsed = time.time() - start_time
-                    risk_level = risk_assessment.get('risk_level', 'UNKNOWN')
-                    add_span_event("action_item.processing_completed", workflow_type=workflow_type, 
-                                  risk_level=risk_level, duration_seconds=round(elapsed, 1))
-                    
-                    # Validate risk assessment
-                    if 'risk_level' not in risk_assessment or 'reasoning' not in risk_assessment:
-                        raise ValueError(f"LLM agent failed to provide complete risk assessment for {workflow_type} item")
-                    
-                    # Now do approval routing with risk assessment results
-                    approval_routing = await self.risk_agent.determine_action_item_approval_routing(
-                        action_item=item,
-                        risk_assessment=risk_assessment,
-                        workflow_type=workflow_type,
-                        context=context_data
-                    )
-                    
-                    # Validate approval routing with detailed logging
-                    required_routing_fields = ['requires_human_approval', 'initial_status', 'routing_reasoning']
-                    missing_fields = [field for field in required_routing_fields if field not in approval_routing]
-
-                    if missing_fields:
-                        add_span_event("approval_routing.validation_failed",
-                                      workflow_type=workflow_type,
-                                      missing_fields=missing_fields,
-                                      actual_fields=list(approval_routing.keys()),
-                                      approval_routing_response=str(approval_routing))
-
-                        # Add defensive defaults to allow workflow to proceed
-                        for field in missing_fields:
-                            if field == 'requires_human_approval':
-                                approval_routing[field] = True  # Safe default
-                                add_span_event("approval_routing.default_applied", field=field, default_value=True)
-                            elif field == 'initial_status':
-                                approval_routing[field] = 'PENDING_ASSESSMENT'  # Safe default
-                                add_span_event("approval_routing.default_applied", field=field, default_value='PENDING_ASSESSMENT')
-                            elif field == 'routing_reasoning':
-                                approval_routing[field] = f'Default routing for {workflow_type} action item due to missing LLM response field'
-                                add_span_event("approval_routing.default_applied", field=field, default_value='generated_default')
-
-                        add_span_event("approval_routing.validation_recovered",
-                                      workflow_type=workflow_type,
-                                      applied_defaults=missing_fields)
-
-                    # Generate detailed execution steps for this action item
-                    add_span_event("action_item.generating_steps", workflow_type=workflow_type, description=item_description)
-
-                    try:
-                        step_result = await self.generate_steps_for_action(
-                            action_item=item,
-                            workflow_type=workflow_type,
-                            context=context_data
-                        )
-
-                        # Extract steps from response
-                        steps = step_result.get('steps', [])
-
-                        add_span_event("action_item.steps_generated", workflow_type=workflow_type,
-                                      step_count=len(steps))
-                    except Exception as e:
-                        add_span_event("action_item.step_generation_failed", workflow_type=workflow_type,
-                                      error=str(e))
-                        # Following NO FALLBACK principle - fail fast if steps can't be generated
-                        raise Exception(f"Failed to generate steps for {workflow_type} action: {str(e)}")
-
-                    # Enhance the item with generated steps
-                    enhanced_item = {
-                        **item,
-                        'steps': steps
-                    }
-
-                    # Create workflow data for this action item
-                    # Normalize risk_level to uppercase for database compatibility
-                    if risk_assessment and 'risk_level' in risk_assessment:
-                        risk_assessment['risk_level'] = str(risk_assessment['risk_level']).upper()
-
-                    # Normalize workflow_type to uppercase for database compatibility
-                    normalized_workflow_type = workflow_type.upper()
-                    if normalized_workflow_type not in ['BORROWER', 'ADVISOR', 'SUPERVISOR', 'LEADERSHIP']:
-                        raise ValueError(f"Invalid workflow_type: {workflow_type} -> {normalized_workflow_type}")
-
-                    return {
-                        'plan_id': plan_id,
-                        'analysis_id': plan_data['analysis_id'],
-                        'transcript_id': plan_data['transcript_id'],
-                        'workflow_data': enhanced_item,
-                        'workflow_type': normalized_workflow_type,
-                        'context_data': {
-                            **context_data,
-                            'workflow_type': normalized_workflow_type,
-                            'action_item_context': item.get('context', {})
-                        },
-                        'risk_assessment': risk_assessment,
-                        'approval_routing': approval_routing
-                    }
-                
-                # Process all action items for this workflow type in parallel
-                workflow_tasks = [process_action_item(item) for item in action_items]
-                print(f"[DEBUG] Processing {len(workflow_tasks)} tasks for {workflow_type}")
-                workflows_for_type = await asyncio.gather(*workflow_tasks, return_exceptions=True)
-                print(f"[DEBUG] Got {len(workflows_for_type)} results for {workflow_type}")
-                
-                # Filter out exceptions and collect successful workflows
-                successful_workflows = []
-                failed_items = []
-                for i, result in enumerate(workflows_for_type):
-                    if isinstance(result, Exception):
-                        error_str = str(result)
-                        print(f"[ERROR] {workflow_type} item {i} failed: {error_str}")
-                        print(f"[ERROR] Exception type: {type(result)}")
-                        failed_items.append({
-                            'item_index': i,
-                            'item': action_items[i] if i < len(action_items) else None,
-                            'error': error_str
-                        })
-                        add_span_event("action_item.processing_failed", workflow_type=workflow_type, item_index=i, error=error_str)
-                    else:
-                        print(f"[SUCCESS] {workflow_type} item {i} succeeded: {type(result)}")
-                        successful_workflows.append(result)
-                
-                # Log failures but don't fail the entire workflow type
-                if failed_items:
-                    add_span_event("workflow_type.partial_failures", workflow_type=workflow_type, 
-                                  failed_count=len(failed_items), total_count=len(action_items))
-                
-                # Log completion summary for this workflow type
-                add_span_event("workflow_type.processing_completed", workflow_type=workflow_type, 
-                              successful_count=len(successful_workflows))
-                
-                return successful_workflows
-                
             except Exception as e:
                 raise Exception(f"Failed to extract {workflow_type} workflows: {str(e)}")
+            
+            # FAIL FAST - a pillar with the wrong item count can never align with the plan
+            if len(action_items) != expected_counts[workflow_type]:
+                raise ValueError(
+                    f"Plan-to-workflow mapping failed: Expected {expected_counts[workflow_type]} "
+                    f"{workflow_type} workflows, got {len(action_items)}"
+                )
+            
+            if action_items:
+                add_span_event("workflow_type.risk_assessment_starting", workflow_type=workflow_type, items_count=len(action_items))
+            
+            async def process_and_emit(item_index: int, item: Dict[str, Any]) -> None:
+                try:
+                    workflow = await process_action_item(workflow_type, item)
+                except Exception as e:
+                    add_span_event("action_item.processing_failed", workflow_type=workflow_type,
+                                  item_index=item_index, error=str(e))
+                    raise Exception(f"Failed to extract {workflow_type} workflows: {str(e)}")
+                # Extraction order is kept with the workflow so a reused set keeps it too
+                workflow['context_data']['extraction_order'] = [type_index, item_index]
+                completed.put_nowait(((type_index, item_index), workflow))
+            
+            # Items of this pillar run in parallel - each is written as soon as it completes
+            async with asyncio.TaskGroup() as item_group:
+                for item_index, item in enumerate(action_items):
+                    item_group.create_task(process_and_emit(item_index, item))
+            
+            add_span_event("workflow_type.processing_completed", workflow_type=workflow_type,
+                          successful_count=len(action_items))
         
-        # Process all workflow types in parallel
-        workflow_type_tasks = [process_workflow_type(wt) for wt in workflow_types]
-        workflow_results = await asyncio.gather(*workflow_type_tasks, return_exceptions=True)
-        
-        # Collect all successful workflows and handle any exceptions
-        failed_workflow_types = []
-        for i, result in enumerate(workflow_results):
-            if isinstance(result, Exception):
-                workflow_type = workflow_types[i]
-                failed_workflow_types.append({
-                    'workflow_type': workflow_type,
-                    'error': str(result)
-                })
-                add_span_event("workflow_type.extraction_failed", workflow_type=workflow_type, error=str(result))
-            else:
-                all_workflows.extend(result)
-        
-        # Log failures but continue with successful workflow types
-        if failed_workflow_types:
-            add_span_event("extraction.partial_failures", failed_types=len(failed_workflow_types), 
-                          total_types=len(workflow_types))
-            for failure in failed_workflow_types:
-                add_span_event("extraction.type_failure", workflow_type=failure['workflow_type'], 
-                              error=failure['error'])
-        
-        # Only fail completely if no workflows were extracted at all
-        if not all_workflows and failed_workflow_types:
-            raise Exception(f"All workflow types failed: {[f['error'] for f in failed_workflow_types]}")
+        writer = asyncio.create_task(persist_completed())
+        try:
+            try:
+                # Process all workflow types in parallel - the first failure cancels the rest
+                async with asyncio.TaskGroup() as type_group:
+                    for type_index, workflow_type in enumerate(workflow_types):
+                        type_group.create_task(process_workflow_type(type_index, workflow_type))
+            except BaseExceptionGroup as group:
+                raise self._first_leaf_exception(group)
+            finally:
+                completed.put_nowait(None)  # End of stream for the writer
+                await asyncio.shield(writer)
+        except BaseException as e:
+            # NO FALLBACK - never leave a partial workflow set behind
+            compensated = self.workflow_store.delete_bulk([workflow_id for _, workflow_id, _ in persisted])
+            add_span_event("extraction.failed", error=str(e), rolled_back=compensated)
+            raise
+        
+        persisted.sort(key=lambda entry: entry[0])
+        all_workflows = [workflow for _, _, workflow in persisted]
+        workflow_ids = [workflow_id for _, workflow_id, _ in persisted]
 
         # Validate plan-to-workflow alignment (1:1 mapping) - FAIL FAST if misaligned
         if all_workflows:
@@ -898,6 +933,7 @@ class WorkflowService:
 
             # FAIL FAST - NO FALLBACK: If alignment is not perfect, fail immediately
             if not validation_report['perfect_alignment']:
+                self.workflow_store.delete_bulk(workflow_ids)
                 error_details = {
                     'expected_counts': validation_report['expected_counts'],
                     'actual_counts': validation_report['actual_counts'],
@@ -908,54 +944,85 @@ class WorkflowService:
                               error_details=error_details)
                 raise ValueError(f"Plan-to-workflow mapping failed: Expected {validation_report['expected_total']} workflows, got {validation_report['actual_total']}. Mismatches: {validation_report['mismatches']}")
 
-        # Bulk create all workflows
-        if all_workflows:
-            try:
-                add_span_event("workflow.bulk_create_start", workflow_count=len(all_workflows))
-                workflow_ids = self.workflow_store.create_bulk(all_workflows)
-                add_span_event("workflow.bulk_create_success", created_count=len(workflow_ids))
+        if not all_workflows:
+            return []
 
-                # Publish WORKFLOW_CREATED events for all created workflows
-                try:
-                    for i, workflow_id in enumerate(workflow_ids):
-                        workflow_data = all_workflows[i]
-
-                        # Count steps in the workflow
-                        workflow_steps = workflow_data.get('steps', [])
-                        step_count = len(workflow_steps) if isinstance(workflow_steps, list) else 0
-
-                        # Create and publish workflow created event
-                        workflow_event = create_workflow_created_event(
-                            workflow_id=workflow_id,
-                            plan_id=workflow_data.get('plan_id'),
-                            workflow_type=workflow_data.get('workflow_type', 'BORROWER'),
-                            approval_status=workflow_data.get('status', 'pending'),
-                            risk_level=workflow_data.get('risk_level', 'medium'),
-                            step_count=step_count
-                        )
-
-                        publish_event(workflow_event)
-                        logger.info(f"📢 Published WORKFLOW_CREATED event for bulk workflow {workflow_id}")
+        add_span_event("workflow.bulk_create_success", created_count=len(workflow_ids))
 
-                except Exception as e:
-                    # NO FALLBACK: Fail fast on event publishing errors
-                    logger.error(f"Failed to publish WORKFLOW_CREATED events for bulk workflows: {str(e)}")
-                    raise RuntimeError(f"Failed to publish WORKFLOW_CREATED events: {str(e)}")
-
-                # Return workflows with their assigned IDs
-                created_workflows = []
-                for i, workflow_id in enumerate(workflow_ids):
-                    workflow = self.workflow_store.get_by_id(workflow_id)
-                    if workflow:
-                        created_workflows.append(workflow)
-
-                return created_workflows
-            except Exception as e:
-                add_span_event("workflow.bulk_create_failed", error=str(e), workflow_count=len(all_workflows))
-                # NO FALLBACK - fail fast with clear error
-                raise Exception(f"Failed to save workflows to database: {str(e)}")
+        # Publish WORKFLOW_CREATED events once the whole set is committed
+        try:
+            for workflow_id, workflow_data in zip(workflow_ids, all_workflows):
+                # Count steps in the workflow
+                workflow_steps = workflow_data.get('steps', [])
+                step_count = len(workflow_steps) if isinstance(workflow_steps, list) else 0
+
+                # Create and publish workflow created event
+                workflow_event = create_workflow_created_event(
+                    workflow_id=workflow_id,
+                    plan_id=workflow_data.get('plan_id'),
+                    workflow_type=workflow_data.get('workflow_type', 'BORROWER'),
+                    approval_status=workflow_data.get('status', 'pending'),
+                    risk_level=workflow_data.get('risk_level', 'medium'),
+                    step_count=step_count
+                )
 
-        return []
+                publish_event(workflow_event)
+                logger.info(f"📢 Published WORKFLOW_CREATED event for bulk workflow {workflow_id}")
+
+        except Exception as e:
+            # NO FALLBACK: Fail fast on event publishing errors
+            logger.error(f"Failed to publish WORKFLOW_CREATED events for bulk workflows: {str(e)}")
+            raise RuntimeError(f"Failed to publish WORKFLOW_CREATED events: {str(e)}")
+
+        # Return workflows with their assigned IDs
+        created_workflows = []
+        for workflow_id in workflow_ids:
+            workflow = self.workflow_store.get_by_id(workflow_id)
+            if workflow:
+                created_workflows.append(workflow)
+
+        return created_workflows
+
+    def _previous_extraction(self, plan_id: str, plan_data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Workflows of an earlier extraction of the plan, if they form a complete set.
+
+        A partial set can only be left by a process that died mid-extraction;
+        it is deleted so the plan is extracted from scratch.
+
+        Returns:
+            The complete set (extraction order), or None if the plan must be extracted
+
+        Raises:
+            ValueError: A partial set has already been executed (NO FALLBACK)
+        """
+        previous = [
+            workflow for workflow in self.workflow_store.get_by_plan_id(plan_id)
+            if (workflow.get('context_data') or {}).get('pipeline_stage') == 'granular_workflow_extraction'
+        ]
+        if not previous:
+            return None
+
+        if self._validate_plan_workflow_alignment(plan_data, previous)['perfect_alignment']:
+            # Sets extracted before the order was recorded keep their creation order
+            return sorted(previous, key=lambda workflow: (
+                workflow['context_data'].get('extraction_order', []),
+                workflow.get('created_at') or ''
+            ))
+
+        executed = [workflow['id'] for workflow in previous if workflow.get('status') == 'EXECUTED']
+        if executed:
+            raise ValueError(f"Plan {plan_id} has a partial workflow set with executed workflows: {executed}")
+
+        deleted = self.workflow_store.delete_bulk([workflow['id'] for workflow in previous])
+        logger.info(f"Deleted {deleted} workflows of an interrupted extraction of plan {plan_id}")
+        return None
+
+    @staticmethod
+    def _first_leaf_exception(group: BaseExceptionGroup) -> BaseException:
+        """Unwrap the first real error from (nested) TaskGroup exception groups."""
+        while isinstance(group, BaseExceptionGroup):
+            group = group.exceptions[0]
+        return group
     
     async def get_workflows_by_plan(self, plan_id: str) -> List[Dict[str, Any]]:
         """Get all workflows for a specific plan.
@@ -989,12 +1056,7 @@ class WorkflowService:
             Validation report with alignment score and details
         """
         # Count expected executable items from plan
-        expected_counts = {
-            'BORROWER': self._count_borrower_executable_items(plan_data.get('borrower_plan', {})),
-            'ADVISOR': self._count_advisor_executable_items(plan_data.get('advisor_plan', {})),
-            'SUPERVISOR': self._count_supervisor_executable_items(plan_data.get('supervisor_plan', {})),
-            'LEADERSHIP': self._count_leadership_executable_items(plan_data.get('leadership_plan', {}))
-        }
+        expected_counts = self._expected_workflow_counts(plan_data)
 
         # Count actual workflows by type
         actual_counts = {}
@@ -1028,6 +1090,15 @@ class WorkflowService:
             ]
         }
 
+    def _expected_workflow_counts(self, plan_data: Dict[str, Any]) -> Dict[str, int]:
+        """Executable items per workflow type - each becomes exactly one workflow."""
+        return {
+            'BORROWER': self._count_borrower_executable_items(plan_data.get('borrower_plan', {})),
+            'ADVISOR': self._count_advisor_executable_items(plan_data.get('advisor_plan', {})),
+            'SUPERVISOR': self._count_supervisor_executable_items(plan_data.get('supervisor_plan', {})),
+            'LEADERSHIP': self._count_leadership_executable_items(plan_data.get('leadership_plan', {}))
+        }
+
     def _count_borrower_executable_items(self, borrower_plan: Dict[str, Any]) -> int:
         """Count executable items in borrower plan."""
         count = 0
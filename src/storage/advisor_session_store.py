@@ -58,6 +58,17 @@ class AdvisorSessionStore:
                 )
             ''')
 
+            # Rolling summary of turns older than the verbatim context window
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS advisor_session_summaries (
+                    session_id TEXT PRIMARY KEY,
+                    summary TEXT NOT NULL,
+                    summarized_through TEXT,  -- timestamp of the newest turn folded in
+                    summarized_turns INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
             # Create indexes for common queries
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_advisor_sessions_advisor_id
@@ -281,6 +292,70 @@ class AdvisorSessionStore:
             'conversation_history': conversation_history
         })
 
+    def get_conversation_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get the rolling summary of a session's older turns.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            {summary, summarized_through, summarized_turns} or None if nothing is summarized yet
+
+        Raises:
+            Exception: Database operation failure (NO FALLBACK)
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                SELECT summary, summarized_through, summarized_turns
+                FROM advisor_session_summaries
+                WHERE session_id = ?
+            ''', (session_id,))
+
+            row = cursor.fetchone()
+
+            if not row:
+                return None
+
+            return {
+                'summary': row[0],
+                'summarized_through': row[1],
+                'summarized_turns': row[2]
+            }
+
+        finally:
+            conn.close()
+
+    def save_conversation_summary(self, session_id: str, summary: str,
+                                  summarized_through: str, summarized_turns: int) -> None:
+        """Store the rolling summary of a session's older turns.
+
+        Args:
+            session_id: Session identifier
+            summary: Summary text
+            summarized_through: Timestamp of the newest turn folded into the summary
+            summarized_turns: Turns folded into the summary so far
+
+        Raises:
+            Exception: Database operation failure (NO FALLBACK)
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                INSERT OR REPLACE INTO advisor_session_summaries
+                (session_id, summary, summarized_through, summarized_turns, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (session_id, summary, summarized_through, summarized_turns))
+
+            conn.commit()
+
+        finally:
+            conn.close()
+
     def list_advisor_sessions(self, advisor_id: str, limit: int = 10) -> List[Dict[str, Any]]:
         """List recent sessions for an advisor.
 
@@ -341,8 +416,10 @@ class AdvisorSessionStore:
 
         try:
             cursor.execute('DELETE FROM advisor_sessions WHERE session_id = ?', (session_id,))
+            deleted = cursor.rowcount > 0
+            cursor.execute('DELETE FROM advisor_session_summaries WHERE session_id = ?', (session_id,))
             conn.commit()
-            return cursor.rowcount > 0
+            return deleted
 
         finally:
             conn.close()
\ No newline at end of file
@@ -5,6 +5,8 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 from src.models.transcript import Transcript
+from src.storage.data_version_store import ensure_data_versions
+from src.storage.timeseries_rollup_store import ensure_timeseries_rollups
 
 
 class AnalysisStore:
@@ -80,6 +82,10 @@ class AnalysisStore:
 
             conn.execute('CREATE INDEX IF NOT EXISTS idx_created_at ON analysis(created_at)')
 
+            # Forecasting rollups and data versions are maintained by triggers on analysis
+            ensure_timeseries_rollups(conn)
+            ensure_data_versions(conn)
+
             conn.commit()
     
     def store(self, analysis: Dict[str, Any]) -> str:
@@ -0,0 +1,146 @@
+"""SQLite data-version watermarks for forecast and persona snapshot cache validation.
+
+Core Principles Applied:
+- NO FALLBACK: Fail fast on unknown sources
+- Performance: A forecast records the data version it was trained on, so
+  checking a cached forecast is a primary-key read and comparison instead
+  of re-aggregating transcripts/analysis
+- Consistency: Versions are maintained by triggers, so every writer
+  (stores, synthetic data generator, deletes, INSERT OR REPLACE) bumps them
+"""
+import sqlite3
+from typing import Dict, Any, Iterable, Optional
+
+
+# Versioned source table → timestamp column tracked as the high watermark
+DATA_VERSION_SOURCES = {
+    'transcripts': 'timestamp',
+    'analysis': 'created_at',
+    'workflows': 'created_at'
+}
+
+
+def _create_triggers(conn: sqlite3.Connection, source: str) -> None:
+    """Install the triggers that bump a source's version on every write."""
+    column = DATA_VERSION_SOURCES[source]
+    bump = '''
+        UPDATE data_versions
+        SET version = version + 1, row_count = row_count + {delta},
+            max_timestamp = {max_timestamp}, updated_at = CURRENT_TIMESTAMP
+        WHERE source = '{source}';
+    '''
+    raise_max = (
+        f"CASE WHEN max_timestamp IS NULL OR NEW.{column} > max_timestamp "
+        f"THEN NEW.{column} ELSE max_timestamp END"
+    )
+
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{source}_version_insert AFTER INSERT ON {source}
+        BEGIN {bump.format(delta=1, max_timestamp=raise_max, source=source)} END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{source}_version_update AFTER UPDATE ON {source}
+        BEGIN {bump.format(delta=0, max_timestamp=raise_max, source=source)} END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{source}_version_delete AFTER DELETE ON {source}
+        BEGIN {bump.format(delta=-1, max_timestamp='max_timestamp', source=source)} END
+    ''')
+    # INSERT OR REPLACE removes the old row without firing delete triggers
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{source}_version_replace BEFORE INSERT ON {source}
+        WHEN EXISTS (SELECT 1 FROM {source} WHERE id = NEW.id)
+        BEGIN UPDATE data_versions SET row_count = row_count - 1 WHERE source = '{source}'; END
+    ''')
+
+
+def ensure_data_versions(conn: sqlite3.Connection) -> None:
+    """Create the version table and triggers for every existing source table.
+
+    A source whose triggers are installed for the first time is seeded from
+    its table (one scan) and its version bumped, so the version never
+    repeats. Idempotent; the caller commits.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS data_versions (
+            source TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            row_count INTEGER NOT NULL,
+            max_timestamp TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")}
+    for source, column in DATA_VERSION_SOURCES.items():
+        if source in existing and f'trg_{source}_version_insert' not in existing:
+            row_count, max_timestamp = conn.execute(f'SELECT COUNT(*), MAX({column}) FROM {source}').fetchone()
+            conn.execute('''
+                INSERT INTO data_versions (source, version, row_count, max_timestamp)
+                VALUES (?, 1, ?, ?)
+                ON CONFLICT (source) DO UPDATE SET
+                    version = version + 1, row_count = excluded.row_count,
+                    max_timestamp = excluded.max_timestamp, updated_at = CURRENT_TIMESTAMP
+            ''', (source, row_count, max_timestamp))
+            _create_triggers(conn, source)
+
+
+class DataVersionStore:
+    """Read access to the per-source data versions."""
+
+    def __init__(self, db_path: str):
+        """Initialize store, installing version tracking if needed.
+
+        Args:
+            db_path: SQLite database file path
+
+        Raises:
+            ValueError: Empty database path (NO FALLBACK)
+        """
+        if not db_path:
+            raise ValueError("Database path cannot be empty")
+
+        self.db_path = db_path
+        conn = sqlite3.connect(self.db_path)
+        try:
+            ensure_data_versions(conn)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_versions(self, sources: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Current version, row count and max timestamp per source.
+
+        Sources whose table does not exist yet are reported at version 0.
+
+        Raises:
+            ValueError: Unknown source (NO FALLBACK)
+        """
+        sources = list(sources) if sources is not None else list(DATA_VERSION_SOURCES)
+        unknown = [source for source in sources if source not in DATA_VERSION_SOURCES]
+        if unknown:
+            raise ValueError(f"Unknown data sources: {unknown}")
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute(
+                f"SELECT * FROM data_versions WHERE source IN ({','.join('?' * len(sources))})", sources
+            ).fetchall()
+        finally:
+            conn.close()
+
+        found = {row['source']: dict(row) for row in rows}
+        return {
+            source: found.get(source, {'source': source, 'version': 0, 'row_count': 0,
+                                       'max_timestamp': None, 'updated_at': None})
+            for source in sources
+        }
+
+    def get_token(self, sources: Iterable[str]) -> str:
+        """Compact watermark for a set of sources, e.g. ``analysis:42;transcripts:17``.
+
+        Two tokens are equal only if none of the sources was written in between.
+        """
+        versions = self.get_versions(sources)
+        return ';'.join(f"{source}:{versions[source]['version']}" for source in sorted(versions))
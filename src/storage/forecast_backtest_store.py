@@ -0,0 +1,123 @@
+"""SQLite storage for forecast backtest results.
+
+Core Principles Applied:
+- NO FALLBACK: Fail fast on missing data or invalid states
+- Performance: Backtests are expensive (one fit per fold), so every run is
+  kept and the accuracy report reads the latest run per forecast type
+"""
+import sqlite3
+import json
+import uuid
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timezone
+
+
+class ForecastBacktestStore:
+    """SQLite-backed history of rolling-origin backtests."""
+
+    def __init__(self, db_path: str):
+        """Initialize store with database path.
+
+        Args:
+            db_path: SQLite database file path
+
+        Raises:
+            ValueError: Empty database path (NO FALLBACK)
+        """
+        if not db_path:
+            raise ValueError("Database path cannot be empty")
+
+        self.db_path = db_path
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Create the backtest table if it doesn't exist."""
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS forecast_backtests (
+                    id TEXT PRIMARY KEY,
+                    forecast_type TEXT NOT NULL,
+                    engine TEXT NOT NULL,
+                    horizon INTEGER NOT NULL,     -- Periods scored per fold
+                    folds INTEGER NOT NULL,
+                    data_version TEXT,            -- Source data watermark the backtest ran on
+
+                    -- Mean over all folds and horizon steps
+                    mae REAL NOT NULL,
+                    rmse REAL NOT NULL,
+                    mape REAL,                    -- NULL when every actual is zero
+                    coverage REAL NOT NULL,       -- Share of actuals inside the prediction interval
+                    by_horizon TEXT NOT NULL,     -- JSON metrics per horizon step
+
+                    fit_ms REAL NOT NULL,         -- Mean fit time per fold
+                    run_at TEXT NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_forecast_backtests_type
+                ON forecast_backtests (forecast_type, run_at DESC)
+            ''')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def save(self, forecast_type: str, result: Dict[str, Any],
+             data_version: Optional[str] = None) -> str:
+        """Store a backtest result (from backtest.rolling_origin_backtest).
+
+        Returns:
+            Backtest ID
+
+        Raises:
+            ValueError: Missing forecast type or metrics (NO FALLBACK)
+        """
+        if not forecast_type:
+            raise ValueError("forecast_type is required")
+        missing = {'engine', 'horizon', 'folds', 'mae', 'rmse', 'coverage', 'by_horizon', 'fit_ms'} - set(result)
+        if missing:
+            raise ValueError(f"Backtest result missing: {sorted(missing)}")
+
+        backtest_id = f"BT_{uuid.uuid4().hex[:12].upper()}"
+        conn = self._connect()
+        try:
+            conn.execute('''
+                INSERT INTO forecast_backtests (
+                    id, forecast_type, engine, horizon, folds, data_version,
+                    mae, rmse, mape, coverage, by_horizon, fit_ms, run_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                backtest_id, forecast_type, result['engine'], result['horizon'], result['folds'],
+                data_version, result['mae'], result['rmse'], result.get('mape'), result['coverage'],
+                json.dumps(result['by_horizon']), result['fit_ms'], datetime.now(timezone.utc).isoformat()
+            ))
+            conn.commit()
+            return backtest_id
+        finally:
+            conn.close()
+
+    def get_latest(self, forecast_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Latest backtest per forecast type (or of one type)."""
+        conn = self._connect()
+        try:
+            rows = conn.execute('''
+                SELECT * FROM forecast_backtests AS b
+                WHERE run_at = (
+                    SELECT MAX(run_at) FROM forecast_backtests WHERE forecast_type = b.forecast_type
+                ) AND (? IS NULL OR forecast_type = ?)
+                ORDER BY forecast_type
+            ''', (forecast_type, forecast_type)).fetchall()
+        finally:
+            conn.close()
+
+        backtests = []
+        for row in rows:
+            backtest = dict(row)
+            backtest['by_horizon'] = json.loads(backtest['by_horizon'])
+            backtests.append(backtest)
+        return backtests
@@ -0,0 +1,231 @@
+"""SQLite storage for forecast generation jobs.
+
+Core Principles Applied:
+- NO FALLBACK: Fail fast on missing data or invalid states
+- De-duplication: Identical requests share one active job, looked up and
+  created inside a BEGIN IMMEDIATE transaction so concurrent requests
+  (from any server process) never train the same model twice
+- Visibility: Every job records its timing, outcome and resulting forecast_id
+"""
+import sqlite3
+import json
+import uuid
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta, timezone
+
+
+# Job states - QUEUED → RUNNING → COMPLETED | FAILED
+ACTIVE_JOB_STATUSES = ('QUEUED', 'RUNNING')
+TERMINAL_JOB_STATUSES = ('COMPLETED', 'FAILED')
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def forecast_request_key(forecast_type: str, horizon_days: Optional[int],
+                         start_date: Optional[str], end_date: Optional[str]) -> str:
+    """Identity of a forecast request - requests with the same key produce the same forecast."""
+    return json.dumps([forecast_type, horizon_days, start_date, end_date])
+
+
+class ForecastJobStore:
+    """SQLite-backed job table for forecast generation.
+
+    One row per training job. ``request_key`` identifies the forecast being
+    produced, so a request arriving while an identical job is QUEUED or
+    RUNNING is handed the existing job instead of starting another one.
+    """
+
+    def __init__(self, db_path: str):
+        """Initialize store with database path.
+
+        Args:
+            db_path: SQLite database file path
+
+        Raises:
+            ValueError: Empty database path (NO FALLBACK)
+        """
+        if not db_path:
+            raise ValueError("Database path cannot be empty")
+
+        self.db_path = db_path
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode so transactions are explicit."""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Create the job table if it doesn't exist."""
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS forecast_jobs (
+                    id TEXT PRIMARY KEY,
+                    forecast_type TEXT NOT NULL,
+                    request_key TEXT NOT NULL,
+                    params TEXT NOT NULL,  -- JSON: horizon_days, start_date, end_date, ttl_hours
+                    status TEXT NOT NULL CHECK (status IN ('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED')),
+
+                    -- Outcome
+                    forecast_id TEXT,
+                    error TEXT,
+                    duration_ms INTEGER,
+
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    completed_at TEXT
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_forecast_jobs_key_status ON forecast_jobs (request_key, status)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_forecast_jobs_created ON forecast_jobs (created_at DESC)')
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        data = dict(row)
+        data['params'] = json.loads(data['params'])
+        return data
+
+    def create_or_get_active(self, forecast_type: str, params: Dict[str, Any],
+                             stale_after_seconds: float) -> Tuple[Dict[str, Any], bool]:
+        """Return the active job for an identical request, or create a QUEUED one.
+
+        Args:
+            forecast_type: Forecast type
+            params: horizon_days, start_date, end_date and ttl_hours
+            stale_after_seconds: Active jobs created longer ago than this are
+                assumed abandoned (their process died) and are not joined
+
+        Returns:
+            (job, created) - created is False when an existing job was returned
+
+        Raises:
+            ValueError: Missing forecast_type (NO FALLBACK)
+        """
+        if not forecast_type:
+            raise ValueError("forecast_type is required")
+
+        request_key = forecast_request_key(
+            forecast_type, params.get('horizon_days'), params.get('start_date'), params.get('end_date')
+        )
+        now = _now()
+        stale_before = (now - timedelta(seconds=stale_after_seconds)).isoformat()
+
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('''
+                SELECT * FROM forecast_jobs
+                WHERE request_key = ? AND status IN ('QUEUED', 'RUNNING') AND created_at > ?
+                ORDER BY created_at DESC
+                LIMIT 1
+            ''', (request_key, stale_before)).fetchone()
+            if row:
+                conn.execute('COMMIT')
+                return self._row_to_dict(row), False
+
+            job_id = f"FJOB_{uuid.uuid4().hex[:12].upper()}"
+            conn.execute('''
+                INSERT INTO forecast_jobs (id, forecast_type, request_key, params, status, created_at)
+                VALUES (?, ?, ?, ?, 'QUEUED', ?)
+            ''', (job_id, forecast_type, request_key, json.dumps(params), now.isoformat()))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+        return self.get_job(job_id), True
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job record or None if not found."""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT * FROM forecast_jobs WHERE id = ?', (job_id,)).fetchone()
+            return self._row_to_dict(row) if row else None
+        finally:
+            conn.close()
+
+    def list_jobs(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List jobs, most recent first, optionally filtered by status."""
+        query = 'SELECT * FROM forecast_jobs'
+        params: List[Any] = []
+        if status:
+            query += ' WHERE status = ?'
+            params.append(status)
+        query += ' ORDER BY created_at DESC'
+        if limit:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        conn = self._connect()
+        try:
+            return [self._row_to_dict(row) for row in conn.execute(query, params).fetchall()]
+        finally:
+            conn.close()
+
+    def mark_running(self, job_id: str) -> None:
+        """Move a QUEUED job to RUNNING.
+
+        Raises:
+            ValueError: Job not found or not QUEUED (NO FALLBACK)
+        """
+        conn = self._connect()
+        try:
+            updated = conn.execute('''
+                UPDATE forecast_jobs SET status = 'RUNNING', started_at = ?
+                WHERE id = ? AND status = 'QUEUED'
+            ''', (_now().isoformat(), job_id)).rowcount
+        finally:
+            conn.close()
+
+        if not updated:
+            raise ValueError(f"Forecast job {job_id} is not queued")
+
+    def complete_job(self, job_id: str, forecast_id: str, duration_ms: int) -> None:
+        """Record a successful job and the forecast it produced."""
+        self._finish(job_id, 'COMPLETED', forecast_id=forecast_id, error=None, duration_ms=duration_ms)
+
+    def fail_job(self, job_id: str, error: str, duration_ms: Optional[int] = None) -> None:
+        """Record a failed job."""
+        self._finish(job_id, 'FAILED', forecast_id=None, error=error, duration_ms=duration_ms)
+
+    def _finish(self, job_id: str, status: str, forecast_id: Optional[str],
+                error: Optional[str], duration_ms: Optional[int]) -> None:
+        conn = self._connect()
+        try:
+            updated = conn.execute('''
+                UPDATE forecast_jobs
+                SET status = ?, forecast_id = ?, error = ?, duration_ms = ?, completed_at = ?
+                WHERE id = ? AND status IN ('QUEUED', 'RUNNING')
+            ''', (status, forecast_id, error, duration_ms, _now().isoformat(), job_id)).rowcount
+        finally:
+            conn.close()
+
+        if not updated:
+            raise ValueError(f"Forecast job {job_id} is not active")
+
+    def fail_stale_jobs(self, stale_after_seconds: float) -> int:
+        """Fail active jobs older than the stale threshold (their process is gone).
+
+        Returns:
+            Number of jobs failed
+        """
+        now = _now()
+        stale_before = (now - timedelta(seconds=stale_after_seconds)).isoformat()
+        conn = self._connect()
+        try:
+            return conn.execute('''
+                UPDATE forecast_jobs
+                SET status = 'FAILED', error = 'Forecast job abandoned (server stopped before it finished)',
+                    completed_at = ?
+                WHERE status IN ('QUEUED', 'RUNNING') AND created_at <= ?
+            ''', (now.isoformat(), stale_before)).rowcount
+        finally:
+            conn.close()
@@ -0,0 +1,148 @@
+"""SQLite registry of fitted forecasting models.
+
+Core Principles Applied:
+- NO FALLBACK: Fail fast on missing data or invalid states
+- Performance: A fitted model is kept with the training watermark (last
+  data point it saw) and a hash of the series it was fitted on, so a
+  forecast for new data can warm-start from the previous parameters and a
+  forecast for a new horizon on unchanged data needs no fit at all
+"""
+import sqlite3
+import json
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timezone
+
+
+def model_key(forecast_type: str, start_date: Optional[str], end_date: Optional[str]) -> str:
+    """Registry key - one model per forecast type and training data window."""
+    return json.dumps([forecast_type, start_date, end_date])
+
+
+class ForecastModelStore:
+    """SQLite-backed registry of serialized fitted models.
+
+    One row per model key; refitting replaces the row. ``model_params`` holds
+    the model configuration the model was fitted with - a model is only
+    reused or warm-started under the same configuration.
+    """
+
+    def __init__(self, db_path: str):
+        """Initialize store with database path.
+
+        Args:
+            db_path: SQLite database file path
+
+        Raises:
+            ValueError: Empty database path (NO FALLBACK)
+        """
+        if not db_path:
+            raise ValueError("Database path cannot be empty")
+
+        self.db_path = db_path
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Create the registry table if it doesn't exist."""
+        conn = self._connect()
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS forecast_models (
+                    model_key TEXT PRIMARY KEY,
+                    forecast_type TEXT NOT NULL,
+                    engine TEXT NOT NULL,
+                    model_json TEXT NOT NULL,     -- Serialized fitted model
+                    model_params TEXT NOT NULL,   -- JSON model configuration
+
+                    -- Training watermark
+                    training_start TEXT NOT NULL,
+                    training_end TEXT NOT NULL,
+                    data_points INTEGER NOT NULL,
+                    data_hash TEXT,               -- Hash of the training series (ds, y)
+
+                    fit_mode TEXT NOT NULL CHECK (fit_mode IN ('cold', 'warm')),
+                    fit_duration_ms INTEGER,
+                    fitted_at TEXT NOT NULL
+                )
+            ''')
+            # Add data_hash to registries created before series hashing (their models never match)
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(forecast_models)').fetchall()}
+            if 'data_hash' not in columns:
+                conn.execute('ALTER TABLE forecast_models ADD COLUMN data_hash TEXT')
+
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_forecast_models_type ON forecast_models (forecast_type)')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def save(self, key: str, forecast_type: str, engine: str, model_json: str,
+             model_params: Dict[str, Any], training_start: str, training_end: str,
+             data_points: int, fit_mode: str, fit_duration_ms: Optional[int] = None,
+             data_hash: Optional[str] = None) -> None:
+        """Store (or replace) the fitted model for a key.
+
+        Raises:
+            ValueError: Missing model or watermark (NO FALLBACK)
+        """
+        if not all([key, forecast_type, engine, model_json, training_start, training_end]):
+            raise ValueError("key, forecast_type, engine, model_json and training window are required")
+        if data_points <= 0:
+            raise ValueError("data_points must be positive")
+
+        conn = self._connect()
+        try:
+            conn.execute('''
+                INSERT OR REPLACE INTO forecast_models (
+                    model_key, forecast_type, engine, model_json, model_params,
+                    training_start, training_end, data_points, data_hash, fit_mode, fit_duration_ms, fitted_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                key, forecast_type, engine, model_json, json.dumps(model_params, sort_keys=True),
+                training_start, training_end, data_points, data_hash, fit_mode, fit_duration_ms,
+                datetime.now(timezone.utc).isoformat()
+            ))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the fitted model for a key or None."""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT * FROM forecast_models WHERE model_key = ?', (key,)).fetchone()
+        finally:
+            conn.close()
+
+        if not row:
+            return None
+        model = dict(row)
+        model['model_params'] = json.loads(model['model_params'])
+        return model
+
+    def list_models(self) -> List[Dict[str, Any]]:
+        """Registry overview (without the serialized models)."""
+        conn = self._connect()
+        try:
+            rows = conn.execute('''
+                SELECT model_key, forecast_type, engine, training_start, training_end, data_points,
+                       fit_mode, fit_duration_ms, fitted_at
+                FROM forecast_models
+                ORDER BY forecast_type, fitted_at DESC
+            ''').fetchall()
+            return [dict(row) for row in rows]
+        finally:
+            conn.close()
+
+    def delete_by_type(self, forecast_type: str) -> int:
+        """Drop all models of a forecast type (next forecast cold-fits)."""
+        conn = self._connect()
+        try:
+            deleted = conn.execute('DELETE FROM forecast_models WHERE forecast_type = ?', (forecast_type,)).rowcount
+            conn.commit()
+            return deleted
+        finally:
+            conn.close()
@@ -68,6 +68,7 @@ class ForecastStore:
                     model_params TEXT,  -- JSON
 
                     -- Cache management
+                    data_version TEXT,  -- Source data watermark at generation time
                     expires_at TIMESTAMP,
                     access_count INTEGER DEFAULT 0,
                     last_accessed TIMESTAMP,
@@ -79,6 +80,11 @@ class ForecastStore:
                 )
             ''')
 
+            # Add data_version to databases created before cache watermarks
+            cursor.execute('PRAGMA table_info(forecasts)')
+            if 'data_version' not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute('ALTER TABLE forecasts ADD COLUMN data_version TEXT')
+
             # Indexes for performance
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_forecasts_type
@@ -105,7 +111,7 @@ class ForecastStore:
               horizon_days: int, data_start: str, data_end: str,
               prediction_start: str, prediction_end: str,
               data_points: int, model_params: Dict[str, Any] = None,
-              ttl_hours: int = 24) -> str:
+              ttl_hours: int = 24, data_version: Optional[str] = None) -> str:
         """Store forecast results.
 
         Args:
@@ -119,6 +125,7 @@ class ForecastStore:
             data_points: Number of data points used
             model_params: Prophet model parameters
             ttl_hours: Time to live in hours
+            data_version: Source data watermark the forecast was trained on
 
         Returns:
             Forecast ID
@@ -127,44 +134,77 @@ class ForecastStore:
             ValueError: Invalid parameters (NO FALLBACK)
             Exception: Database operation failure (NO FALLBACK)
         """
-        if not all([forecast_type, forecast_data, data_start, data_end,
-                   prediction_start, prediction_end]):
-            raise ValueError("All forecast parameters are required")
+        return self.store_batch([{
+            'forecast_type': forecast_type,
+            'forecast_data': forecast_data,
+            'horizon_days': horizon_days,
+            'data_start': data_start,
+            'data_end': data_end,
+            'prediction_start': prediction_start,
+            'prediction_end': prediction_end,
+            'data_points': data_points,
+            'model_params': model_params,
+            'ttl_hours': ttl_hours,
+            'data_version': data_version
+        }])[0]
+
+    def store_batch(self, forecasts: List[Dict[str, Any]]) -> List[str]:
+        """Store several forecasts in one transaction (all or nothing).
+
+        Args:
+            forecasts: Keyword arguments of ``store`` for each forecast
 
-        if horizon_days <= 0 or data_points <= 0:
-            raise ValueError("horizon_days and data_points must be positive")
+        Returns:
+            Forecast IDs in input order
+
+        Raises:
+            ValueError: Invalid parameters (NO FALLBACK)
+            Exception: Database operation failure (NO FALLBACK)
+        """
+        if not forecasts:
+            raise ValueError("At least one forecast is required")
 
-        forecast_id = str(uuid.uuid4())
         now = datetime.now()
-        expires_at = now + timedelta(hours=ttl_hours)
+        rows = []
+        for forecast in forecasts:
+            if not all([forecast.get('forecast_type'), forecast.get('forecast_data'), forecast.get('data_start'),
+                        forecast.get('data_end'), forecast.get('prediction_start'), forecast.get('prediction_end')]):
+                raise ValueError("All forecast parameters are required")
+
+            if forecast['horizon_days'] <= 0 or forecast['data_points'] <= 0:
+                raise ValueError("horizon_days and data_points must be positive")
+
+            model_params = forecast.get('model_params')
+            rows.append((
+                str(uuid.uuid4()),
+                forecast['forecast_type'],
+                json.dumps(forecast['forecast_data']),
+                forecast['horizon_days'],
+                forecast['data_start'],
+                forecast['data_end'],
+                forecast['prediction_start'],
+                forecast['prediction_end'],
+                forecast['data_points'],
+                json.dumps(model_params) if model_params else None,
+                forecast.get('data_version'),
+                now + timedelta(hours=forecast.get('ttl_hours', 24)),
+                now
+            ))
 
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
         try:
-            cursor.execute('''
+            cursor.executemany('''
                 INSERT INTO forecasts (
                     id, forecast_type, forecast_data, forecast_horizon_days,
                     data_start_date, data_end_date, prediction_start_date, prediction_end_date,
-                    data_points_used, model_params, expires_at, last_accessed
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                forecast_id,
-                forecast_type,
-                json.dumps(forecast_data),
-                horizon_days,
-                data_start,
-                data_end,
-                prediction_start,
-                prediction_end,
-                data_points,
-                json.dumps(model_params) if model_params else None,
-                expires_at,
-                now
-            ))
+                    data_points_used, model_params, data_version, expires_at, last_accessed
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
 
             conn.commit()
-            return forecast_id
+            return [row[0] for row in rows]
 
         except Exception as e:
             conn.rollback()
@@ -226,11 +266,13 @@ class ForecastStore:
         finally:
             conn.close()
 
-    def get_latest_by_type(self, forecast_type: str) -> Optional[Dict[str, Any]]:
+    def get_latest_by_type(self, forecast_type: str,
+                           data_version: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get latest non-expired forecast for type.
 
         Args:
             forecast_type: Forecast type
+            data_version: Only consider forecasts trained on this data version
 
         Returns:
             Latest forecast or None
@@ -247,9 +289,10 @@ class ForecastStore:
                 SELECT * FROM forecasts
                 WHERE forecast_type = ?
                   AND (expires_at IS NULL OR expires_at > ?)
+                  AND (? IS NULL OR data_version = ?)
                 ORDER BY generated_at DESC
                 LIMIT 1
-            ''', (forecast_type, datetime.now()))
+            ''', (forecast_type, datetime.now(), data_version, data_version))
 
             row = cursor.fetchone()
             if not row:
@@ -348,6 +391,130 @@ class ForecastStore:
         finally:
             conn.close()
 
+    def get_unscored(self, forecast_type: str, latest_actual: str,
+                     data_version: str) -> List[Dict[str, Any]]:
+        """Get forecasts of a type that have new actuals to be scored against.
+
+        A forecast needs (re)scoring once its prediction window has started
+        and it has not been scored yet, or was only partially scored on an
+        older data version. Expired forecasts are included - accuracy is
+        only known after the cache TTL has usually passed.
+
+        Args:
+            forecast_type: Forecast type
+            latest_actual: Timestamp of the latest observed period (ISO)
+            data_version: Current source data watermark
+
+        Returns:
+            List of forecasts (id, forecast_data, actual_vs_predicted)
+        """
+        if not forecast_type or not latest_actual:
+            raise ValueError("forecast_type and latest_actual are required")
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                SELECT id, forecast_data, actual_vs_predicted FROM forecasts
+                WHERE forecast_type = ? AND prediction_start_date <= ?
+                  AND (
+                    actual_vs_predicted IS NULL
+                    OR (json_extract(actual_vs_predicted, '$.points_scored')
+                            < json_extract(actual_vs_predicted, '$.points_predicted')
+                        AND json_extract(actual_vs_predicted, '$.data_version') IS NOT ?)
+                  )
+                ORDER BY generated_at
+            ''', (forecast_type, latest_actual, data_version))
+
+            forecasts = []
+            for row in cursor.fetchall():
+                forecast = dict(row)
+                forecast['forecast_data'] = json.loads(forecast['forecast_data'])
+                if forecast['actual_vs_predicted']:
+                    forecast['actual_vs_predicted'] = json.loads(forecast['actual_vs_predicted'])
+                forecasts.append(forecast)
+
+            return forecasts
+
+        except Exception as e:
+            raise Exception(f"Forecast retrieval failed: {str(e)}")
+        finally:
+            conn.close()
+
+    def get_accuracy_by_type(self, forecast_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Aggregate accuracy of scored forecasts per type.
+
+        Returns:
+            Per type: scored forecast count, average MAE/MAPE/coverage and the
+            most recent scoring time
+        """
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                SELECT forecast_type,
+                       COUNT(*) as forecasts_scored,
+                       AVG(mae) as mae,
+                       AVG(mape) as mape,
+                       AVG(json_extract(actual_vs_predicted, '$.coverage')) as coverage,
+                       MAX(json_extract(actual_vs_predicted, '$.scored_at')) as last_scored_at
+                FROM forecasts
+                WHERE mae IS NOT NULL AND (? IS NULL OR forecast_type = ?)
+                GROUP BY forecast_type
+                ORDER BY forecast_type
+            ''', (forecast_type, forecast_type))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+        except Exception as e:
+            raise Exception(f"Accuracy retrieval failed: {str(e)}")
+        finally:
+            conn.close()
+
+    def prune_superseded(self, forecast_type: str, data_version: str, latest_actual: str) -> int:
+        """Remove superseded forecasts of a type that can no longer be scored.
+
+        A forecast trained on an older data version is kept until its
+        prediction window has closed (the actuals reach past its end), so
+        live accuracy scoring sees it. Scored forecasts are kept for their
+        accuracy; only the ones that never matched an actual are removed.
+
+        Args:
+            forecast_type: Forecast type
+            data_version: Current source data watermark
+            latest_actual: Timestamp of the latest observed period (ISO)
+
+        Returns:
+            Number of forecasts deleted
+        """
+        if not forecast_type or not data_version or not latest_actual:
+            raise ValueError("forecast_type, data_version and latest_actual are required")
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                DELETE FROM forecasts
+                WHERE forecast_type = ? AND (data_version IS NULL OR data_version != ?)
+                  AND prediction_end_date <= ? AND actual_vs_predicted IS NULL
+            ''', (forecast_type, data_version, latest_actual))
+
+            deleted_count = cursor.rowcount
+            conn.commit()
+
+            return deleted_count
+
+        except Exception as e:
+            conn.rollback()
+            raise Exception(f"Forecast pruning failed: {str(e)}")
+        finally:
+            conn.close()
+
     def cleanup_expired(self) -> int:
         """Remove expired forecasts.
 
@@ -0,0 +1,144 @@
+"""
+Data dependencies of cached insights.
+
+Every cached insight can record the footprint of the data it was computed
+from: per source table an optional date range and the filters applied.
+A data change (a new transcript, analysis or workflow) overlaps a footprint
+when it hits the same table, falls inside the date range and does not
+contradict any filter, so only the insights it can actually affect are
+invalidated.
+
+Both insight caches keep their footprints in a side table through the
+helpers below (one row per dependency, keyed by the cache entry's key).
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+@dataclass(frozen=True)
+class DataDependency:
+    """Rows of one source table an insight was computed from."""
+    table: str
+    date_from: Optional[str] = None  # ISO date or timestamp, inclusive (None = unbounded)
+    date_to: Optional[str] = None
+    filters: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.table:
+            raise ValueError("Dependency table is required")
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError(f"Dependency on {self.table}: date_from {self.date_from} is after date_to {self.date_to}")
+
+    @classmethod
+    def last_days(cls, table: str, days: int, filters: Optional[Dict[str, Any]] = None) -> 'DataDependency':
+        """Dependency on the rows of the last days (open-ended, so new rows overlap)."""
+        date_from = (datetime.utcnow() - timedelta(days=days)).isoformat(timespec='seconds')
+        return cls(table=table, date_from=date_from, filters=filters or {})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'table': self.table, 'date_from': self.date_from, 'date_to': self.date_to, 'filters': self.filters}
+
+
+@dataclass(frozen=True)
+class DataChange:
+    """A row written to a source table."""
+    table: str
+    changed_at: str  # ISO timestamp of the row
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+
+def filters_overlap(filters: Dict[str, Any], attributes: Dict[str, Any]) -> bool:
+    """
+    Whether a changed row can match the filters.
+
+    A filter only rules the row out when the row carries that attribute with
+    a different value (list filters match any of their values); filters on
+    attributes the change does not describe are assumed to match.
+    """
+    for key, expected in filters.items():
+        if key not in attributes or attributes[key] is None:
+            continue
+        allowed = expected if isinstance(expected, (list, tuple, set)) else [expected]
+        if str(attributes[key]).lower() not in {str(value).lower() for value in allowed}:
+            return False
+    return True
+
+
+def create_dependency_table(cursor, table: str, key_column: str) -> None:
+    """Create a dependency side table keyed by key_column."""
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {table} (
+            {key_column} TEXT NOT NULL,
+            source_table TEXT NOT NULL,
+            date_from TEXT,
+            date_to TEXT,
+            filters TEXT
+        )
+    ''')
+    cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_key ON {table}({key_column})')
+    cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_source ON {table}(source_table)')
+
+
+def save_dependencies(cursor, table: str, key_column: str, key: str,
+                      dependencies: Optional[Iterable[DataDependency]]) -> None:
+    """Replace the dependencies recorded for a cache entry."""
+    cursor.execute(f'DELETE FROM {table} WHERE {key_column} = ?', (key,))
+    cursor.executemany(f'''
+        INSERT INTO {table} ({key_column}, source_table, date_from, date_to, filters)
+        VALUES (?, ?, ?, ?, ?)
+    ''', [
+        (key, dependency.table, dependency.date_from, dependency.date_to,
+         json.dumps(dependency.filters, sort_keys=True) if dependency.filters else None)
+        for dependency in dependencies or ()
+    ])
+
+
+def load_dependencies(cursor, table: str, key_column: str, keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Recorded dependencies (as dicts) of each key."""
+    if not keys:
+        return {}
+    cursor.execute(f'''
+        SELECT {key_column}, source_table, date_from, date_to, filters
+        FROM {table}
+        WHERE {key_column} IN ({','.join('?' * len(keys))})
+    ''', keys)
+
+    dependencies: Dict[str, List[Dict[str, Any]]] = {}
+    for key, source_table, date_from, date_to, filters in cursor.fetchall():
+        dependencies.setdefault(key, []).append(
+            DataDependency(source_table, date_from, date_to, json.loads(filters) if filters else {}).to_dict()
+        )
+    return dependencies
+
+
+def overlapping_keys(cursor, table: str, key_column: str, change: DataChange) -> Set[str]:
+    """
+    Keys with a dependency the change overlaps.
+
+    Table and date range are matched in SQL (bounds compare against the
+    change timestamp cut to the bound's precision, so date-only bounds cover
+    whole days); filters are checked on the remaining candidates.
+    """
+    cursor.execute(f'''
+        SELECT {key_column}, filters
+        FROM {table}
+        WHERE source_table = ?
+        AND (date_from IS NULL OR substr(?, 1, length(date_from)) >= date_from)
+        AND (date_to IS NULL OR substr(?, 1, length(date_to)) <= date_to)
+    ''', (change.table, change.changed_at, change.changed_at))
+
+    return {
+        key for key, filters in cursor.fetchall()
+        if not filters or filters_overlap(json.loads(filters), change.attributes)
+    }
+
+
+def delete_orphaned_dependencies(cursor, table: str, key_column: str, entries_table: str, entries_key: str) -> None:
+    """Drop dependencies of cache entries that no longer exist."""
+    cursor.execute(f'''
+        DELETE FROM {table}
+        WHERE {key_column} NOT IN (SELECT {entries_key} FROM {entries_table})
+    ''')
@@ -3,20 +3,75 @@ Storage layer for caching GenAI-generated insights.
 
 Caches expensive LLM calls to avoid regeneration within TTL window.
 Supports persona-specific insights (leadership, servicing, marketing).
+
+Reads are served from an in-process LRU (L1) in front of the SQLite table
+(L2). Access statistics are buffered in memory and written behind in one
+batched UPDATE, so a cache read never opens a write transaction.
+
+Each insight can record the data it depends on (source tables, date range,
+filters); a data change then invalidates only the insights it overlaps.
 """
 
+import copy
 import sqlite3
 import json
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
+from .insight_dependencies import (
+    DataChange, DataDependency, create_dependency_table, delete_orphaned_dependencies,
+    load_dependencies, overlapping_keys, save_dependencies
+)
+
 
 class InsightStore:
     """SQLite storage for GenAI insights with TTL-based caching."""
 
-    def __init__(self, db_path: str = "data/call_center.db"):
+    def __init__(
+        self,
+        db_path: str = "data/call_center.db",
+        l1_size: int = 256,
+        access_flush_seconds: float = 30,
+        access_flush_hits: int = 100
+    ):
+        """
+        Initialize insight store.
+
+        Args:
+            db_path: Path to database
+            l1_size: Insights kept in the in-process LRU (0 disables it)
+            access_flush_seconds: Longest time buffered access counts wait for a flush
+            access_flush_hits: Buffered reads that trigger a flush
+
+        Raises:
+            ValueError: Invalid limits (NO FALLBACK)
+        """
+        if l1_size < 0:
+            raise ValueError("l1_size must not be negative")
+        if access_flush_hits < 1:
+            raise ValueError("access_flush_hits must be at least 1")
+
         self.db_path = db_path
+        self.l1_size = l1_size
+        self.access_flush_seconds = access_flush_seconds
+        self.access_flush_hits = access_flush_hits
+
+        # ('latest', insight_type, persona) or ('id', insight_id) → (insight_id, expires_at, insight)
+        self._l1: OrderedDict = OrderedDict()
+        self._l1_hits = 0
+        self._l1_misses = 0
+        # Bumped by every invalidation; reads started before one don't populate L1
+        self._l1_generation = 0
+        # insight_id → [buffered reads, last read at]
+        self._pending_access: Dict[str, List[Any]] = {}
+        self._pending_hits = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
         self._ensure_database_exists()
         self._create_tables()
 
@@ -63,6 +118,8 @@ class InsightStore:
             ON insights(expires_at)
         ''')
 
+        create_dependency_table(cursor, 'insight_dependencies', 'insight_id')
+
         conn.commit()
         conn.close()
 
@@ -76,7 +133,8 @@ class InsightStore:
         metadata: Optional[Dict[str, Any]] = None,
         generation_time_ms: Optional[int] = None,
         tokens_used: Optional[int] = None,
-        confidence_score: Optional[float] = None
+        confidence_score: Optional[float] = None,
+        dependencies: Optional[List[DataDependency]] = None
     ) -> str:
         """
         Store a GenAI insight with TTL.
@@ -91,6 +149,7 @@ class InsightStore:
             generation_time_ms: Time taken to generate (for monitoring)
             tokens_used: LLM tokens consumed (for cost tracking)
             confidence_score: LLM confidence in the insight
+            dependencies: Data the insight was computed from (for change-driven invalidation)
 
         Returns:
             insight_id
@@ -116,10 +175,15 @@ class InsightStore:
             tokens_used,
             confidence_score
         ))
+        save_dependencies(cursor, 'insight_dependencies', 'insight_id', insight_id, dependencies)
 
         conn.commit()
         conn.close()
 
+        self._invalidate_l1(
+            lambda key, entry: entry[0] == insight_id or key == ('latest', insight_type, persona)
+        )
+
         return insight_id
 
     def get(
@@ -137,11 +201,17 @@ class InsightStore:
         Returns:
             Insight data if found and not expired, None otherwise
         """
+        now = datetime.utcnow().isoformat()
+
+        key = ('latest', insight_type, persona)
+        cached = self._get_l1(key, now)
+        if cached:
+            return cached
+        generation = self._current_l1_generation()
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        now = datetime.utcnow().isoformat()
-
         cursor.execute('''
             SELECT id, insight_data, generated_at, expires_at, confidence_score, metadata
             FROM insights
@@ -153,17 +223,9 @@ class InsightStore:
         ''', (insight_type, persona, now))
 
         result = cursor.fetchone()
+        conn.close()
 
         if result:
-            # Update access tracking
-            cursor.execute('''
-                UPDATE insights
-                SET access_count = access_count + 1,
-                    last_accessed_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (result[0],))
-            conn.commit()
-
             insight_data = json.loads(result[1])
             insight_data['_cached'] = True
             insight_data['_generated_at'] = result[2]
@@ -172,14 +234,43 @@ class InsightStore:
             if result[5]:
                 insight_data['_metadata'] = json.loads(result[5])
 
-            conn.close()
+            self._put_l1(key, result[0], result[3], insight_data, generation)
+            self._record_access(result[0])
             return insight_data
 
-        conn.close()
         return None
 
+    def get_expiry(self, insight_type: str, persona: str) -> Optional[str]:
+        """
+        Expiry (UTC ISO timestamp) of the latest active insight, without access tracking.
+
+        Returns:
+            expires_at or None if no active insight is cached
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            SELECT MAX(expires_at)
+            FROM insights
+            WHERE insight_type = ?
+            AND persona = ?
+            AND expires_at > ?
+        ''', (insight_type, persona, datetime.utcnow().isoformat()))
+
+        result = cursor.fetchone()
+        conn.close()
+
+        return result[0] if result else None
+
     def get_by_id(self, insight_id: str) -> Optional[Dict[str, Any]]:
-        """Retrieve a specific insight by ID."""
+        """Retrieve a specific insight by ID (expired insights included)."""
+        key = ('id', insight_id)
+        cached = self._get_l1(key)
+        if cached:
+            return cached
+        generation = self._current_l1_generation()
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -197,6 +288,9 @@ class InsightStore:
             insight_data['_generated_at'] = result[1]
             insight_data['_expires_at'] = result[2]
             insight_data['_confidence_score'] = result[3]
+
+            self._put_l1(key, insight_id, result[2], insight_data, generation)
+            self._record_access(insight_id)
             return insight_data
 
         return None
@@ -216,6 +310,8 @@ class InsightStore:
         Returns:
             List of insight summaries
         """
+        self.flush()
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -242,6 +338,7 @@ class InsightStore:
 
         cursor.execute(query, params)
         results = cursor.fetchall()
+        dependencies = load_dependencies(cursor, 'insight_dependencies', 'insight_id', [row[0] for row in results])
         conn.close()
 
         insights = []
@@ -253,7 +350,8 @@ class InsightStore:
                 'generated_at': row[3],
                 'expires_at': row[4],
                 'access_count': row[5],
-                'confidence_score': row[6]
+                'confidence_score': row[6],
+                'dependencies': dependencies.get(row[0], [])
             })
 
         return insights
@@ -276,9 +374,12 @@ class InsightStore:
         ''', (now,))
 
         deleted = cursor.rowcount
+        delete_orphaned_dependencies(cursor, 'insight_dependencies', 'insight_id', 'insights', 'id')
         conn.commit()
         conn.close()
 
+        self._invalidate_l1(lambda key, entry: entry[1] <= now)
+
         return deleted
 
     def clear_cache(
@@ -316,11 +417,82 @@ class InsightStore:
 
         cursor.execute(query, params)
         deleted = cursor.rowcount
+        delete_orphaned_dependencies(cursor, 'insight_dependencies', 'insight_id', 'insights', 'id')
         conn.commit()
         conn.close()
 
+        # L1 entries don't carry type/persona for by-id keys, so filtered clears drop them all
+        self._invalidate_l1(
+            lambda key, entry: key[0] == 'id'
+            or ((persona is None or key[2] == persona) and (insight_type is None or key[1] == insight_type))
+        )
+
         return deleted
 
+    def find_dependents(self, change: DataChange) -> List[Dict[str, Any]]:
+        """
+        Active insights whose recorded dependencies overlap a data change.
+
+        Args:
+            change: Row written to a source table
+
+        Returns:
+            List of {'id', 'insight_type', 'persona'}
+        """
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        keys = overlapping_keys(cursor, 'insight_dependencies', 'insight_id', change)
+        dependents = []
+        if keys:
+            cursor.execute(f'''
+                SELECT id, insight_type, persona
+                FROM insights
+                WHERE id IN ({','.join('?' * len(keys))})
+                AND expires_at > ?
+                ORDER BY generated_at DESC
+            ''', [*keys, datetime.utcnow().isoformat()])
+            dependents = [
+                {'id': row[0], 'insight_type': row[1], 'persona': row[2]}
+                for row in cursor.fetchall()
+            ]
+
+        conn.close()
+        return dependents
+
+    def invalidate(self, insight_ids: List[str]) -> int:
+        """
+        Expire insights now (rows are kept until cleanup_expired).
+
+        Args:
+            insight_ids: Insights to expire
+
+        Returns:
+            Number of active insights expired
+        """
+        if not insight_ids:
+            return 0
+
+        now = datetime.utcnow().isoformat()
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute(f'''
+            UPDATE insights
+            SET expires_at = ?
+            WHERE id IN ({','.join('?' * len(insight_ids))})
+            AND expires_at > ?
+        ''', [now, *insight_ids, now])
+
+        invalidated = cursor.rowcount
+        conn.commit()
+        conn.close()
+
+        ids = set(insight_ids)
+        self._invalidate_l1(lambda key, entry: entry[0] in ids)
+
+        return invalidated
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get cache statistics.
@@ -328,6 +500,8 @@ class InsightStore:
         Returns:
             Statistics about cached insights
         """
+        self.flush()
+
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -381,5 +555,116 @@ class InsightStore:
             'most_accessed': most_accessed,
             'avg_generation_time_ms': avgs[0] if avgs[0] else None,
             'avg_tokens_used': avgs[1] if avgs[1] else None,
-            'avg_confidence_score': avgs[2] if avgs[2] else None
+            'avg_confidence_score': avgs[2] if avgs[2] else None,
+            'l1_cache': {
+                'size': len(self._l1),
+                'max_size': self.l1_size,
+                'hits': self._l1_hits,
+                'misses': self._l1_misses
+            }
         }
+
+    def flush(self) -> int:
+        """
+        Write buffered access statistics in one batched UPDATE.
+
+        Called when the buffer reaches access_flush_hits reads or
+        access_flush_seconds age, before statistics are read, and on shutdown.
+
+        Returns:
+            Number of insights whose access statistics were written
+        """
+        with self._lock:
+            pending = self._pending_access
+            self._pending_access = {}
+            self._pending_hits = 0
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executemany('''
+                UPDATE insights
+                SET access_count = access_count + ?,
+                    last_accessed_at = MAX(COALESCE(last_accessed_at, ''), ?)
+                WHERE id = ?
+            ''', [(hits, last_accessed, insight_id) for insight_id, (hits, last_accessed) in pending.items()])
+            conn.commit()
+        finally:
+            conn.close()
+
+        return len(pending)
+
+    def _record_access(self, insight_id: str) -> None:
+        """Buffer one read of an insight, flushing when the buffer is full or old."""
+        # Same format as SQLite's CURRENT_TIMESTAMP
+        accessed_at = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock:
+            entry = self._pending_access.setdefault(insight_id, [0, accessed_at])
+            entry[0] += 1
+            entry[1] = accessed_at
+            self._pending_hits += 1
+            due = (self._pending_hits >= self.access_flush_hits
+                   or time.monotonic() - self._last_flush >= self.access_flush_seconds)
+
+        if due:
+            self.flush()
+
+    def _get_l1(self, key: Tuple, now: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Insight from the in-process LRU, or None on a miss.
+
+        Args:
+            key: L1 key
+            now: UTC ISO timestamp; entries expiring by then are misses (None = no expiry check)
+        """
+        if not self.l1_size:
+            return None
+
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is not None and now is not None and entry[1] <= now:
+                del self._l1[key]
+                entry = None
+            if entry is None:
+                self._l1_misses += 1
+                return None
+            self._l1.move_to_end(key)
+            self._l1_hits += 1
+
+        self._record_access(entry[0])
+        # Callers may mutate the returned insight
+        return copy.deepcopy(entry[2])
+
+    def _current_l1_generation(self) -> int:
+        """Invalidation generation - read before a SQLite read that may populate L1."""
+        with self._lock:
+            return self._l1_generation
+
+    def _put_l1(self, key: Tuple, insight_id: str, expires_at: str, insight: Dict[str, Any],
+                generation: int) -> None:
+        """
+        Add an insight read from SQLite to the LRU, evicting the least recently used.
+
+        Skipped if an invalidation ran since the read started (generation changed):
+        the row read may already be superseded or expired.
+        """
+        if not self.l1_size:
+            return
+
+        with self._lock:
+            if generation != self._l1_generation:
+                return
+            self._l1[key] = (insight_id, expires_at, copy.deepcopy(insight))
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.l1_size:
+                self._l1.popitem(last=False)
+
+    def _invalidate_l1(self, predicate) -> None:
+        """Drop LRU entries for which predicate(key, (insight_id, expires_at, insight)) is true."""
+        with self._lock:
+            self._l1_generation += 1
+            for key in [key for key, entry in self._l1.items() if predicate(key, entry)]:
+                del self._l1[key]
@@ -8,9 +8,16 @@ Core Principles Applied:
 import sqlite3
 import json
 import hashlib
-from typing import List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from .insight_dependencies import (
+    DataChange, DataDependency, create_dependency_table, delete_orphaned_dependencies,
+    overlapping_keys, save_dependencies
+)
+
 
 class InsightsCacheStore:
     """SQLite-based storage for caching expensive aggregations.
@@ -59,6 +66,24 @@ class InsightsCacheStore:
                     schema_sql = f.read()
                     cursor.executescript(schema_sql)
 
+            # Query embeddings for semantic lookups (one per cache entry)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS query_embeddings (
+                    cache_key TEXT PRIMARY KEY,
+                    scope_hash TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    embedding_model TEXT NOT NULL,
+                    embedding BLOB NOT NULL
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_query_embeddings_scope
+                ON query_embeddings(scope_hash, embedding_model)
+            ''')
+
+            # Data each cached answer was computed from (change-driven invalidation)
+            create_dependency_table(cursor, 'cache_dependencies', 'cache_key')
+
             conn.commit()
 
         except Exception as e:
@@ -99,11 +124,28 @@ class InsightsCacheStore:
         """
         return hashlib.sha256(query.strip().lower().encode()).hexdigest()
 
+    def _generate_scope_hash(self, filters: Dict[str, Any] = None,
+                             timeframe: Dict[str, Any] = None) -> str:
+        """Generate hash of the filters and timeframe a semantic match must share.
+
+        Args:
+            filters: Data filters applied
+            timeframe: Time range filters
+
+        Returns:
+            Scope hash
+        """
+        scope_string = json.dumps({'filters': filters or {}, 'timeframe': timeframe or {}}, sort_keys=True)
+        return hashlib.sha256(scope_string.encode()).hexdigest()
+
     def store_aggregation(self, query: str, aggregated_data: Dict[str, Any],
                          data_sources: List[str], record_count: int,
                          computation_time_ms: int, filters: Dict[str, Any] = None,
                          timeframe: Dict[str, Any] = None,
-                         ttl_hours: int = 24) -> str:
+                         ttl_hours: int = 24,
+                         embedding: Optional[np.ndarray] = None,
+                         embedding_model: Optional[str] = None,
+                         dependencies: Optional[List[DataDependency]] = None) -> str:
         """Store aggregated data in cache.
 
         Args:
@@ -115,6 +157,9 @@ class InsightsCacheStore:
             filters: Data filters applied
             timeframe: Time range filters
             ttl_hours: Time to live in hours
+            embedding: Unit-length query embedding for semantic lookups
+            embedding_model: Name of the embedder that produced it
+            dependencies: Source rows the aggregation was computed from
 
         Returns:
             Cache key
@@ -125,6 +170,9 @@ class InsightsCacheStore:
         if not query or not aggregated_data:
             raise ValueError("query and aggregated_data are required")
 
+        if (embedding is None) != (embedding_model is None):
+            raise ValueError("embedding and embedding_model must be given together")
+
         cache_key = self._generate_cache_key(query, filters, timeframe)
         query_hash = self._generate_query_hash(query)
         now = datetime.now()
@@ -148,6 +196,16 @@ class InsightsCacheStore:
                   json.dumps(data_sources), record_count, computation_time_ms,
                   now, expires_at, now))
 
+            if embedding is not None:
+                cursor.execute('''
+                    INSERT OR REPLACE INTO query_embeddings
+                    (cache_key, scope_hash, query, embedding_model, embedding)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (cache_key, self._generate_scope_hash(filters, timeframe), query.strip(),
+                      embedding_model, np.asarray(embedding, dtype=np.float32).tobytes()))
+
+            save_dependencies(cursor, 'cache_dependencies', 'cache_key', cache_key, dependencies)
+
             conn.commit()
             return cache_key
 
@@ -207,6 +265,78 @@ class InsightsCacheStore:
         finally:
             conn.close()
 
+    def find_semantic_match(self, embedding: np.ndarray, embedding_model: str,
+                            min_similarity: float, filters: Dict[str, Any] = None,
+                            timeframe: Dict[str, Any] = None,
+                            query_filter: Optional[Callable[[str], bool]] = None) -> Dict[str, Any]:
+        """Find the cached entry whose query is nearest to the embedding (cosine).
+
+        Only active entries with the same filters/timeframe and embedder are
+        compared. A match is returned only at or above min_similarity.
+
+        Args:
+            embedding: Unit-length query embedding
+            embedding_model: Name of the embedder that produced it
+            min_similarity: Cosine similarity a match must reach
+            filters: Data filters applied
+            timeframe: Time range filters
+            query_filter: Cached query → whether the entry may be matched at all
+
+        Returns:
+            'similarity': best cosine similarity (None when nothing matchable is cached),
+            'matched_query': query of the nearest entry,
+            'entry': cached data as from get_cached_aggregation, or None below min_similarity
+        """
+        now = datetime.now()
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                SELECT e.cache_key, e.query, e.embedding
+                FROM query_embeddings e
+                JOIN aggregation_cache c ON c.cache_key = e.cache_key
+                WHERE e.scope_hash = ? AND e.embedding_model = ? AND c.expires_at > ?
+            ''', (self._generate_scope_hash(filters, timeframe), embedding_model, now))
+            candidates = cursor.fetchall()
+            if query_filter is not None:
+                candidates = [row for row in candidates if query_filter(row['query'])]
+
+            if not candidates:
+                return {'similarity': None, 'matched_query': None, 'entry': None}
+
+            matrix = np.vstack([np.frombuffer(row['embedding'], dtype=np.float32) for row in candidates])
+            similarities = matrix @ np.asarray(embedding, dtype=np.float32)
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            match = {'similarity': similarity, 'matched_query': candidates[best]['query'], 'entry': None}
+
+            if similarity < min_similarity:
+                return match
+
+            cache_key = candidates[best]['cache_key']
+            cursor.execute('SELECT * FROM aggregation_cache WHERE cache_key = ?', (cache_key,))
+            cached_data = dict(cursor.fetchone())
+
+            cursor.execute('''
+                UPDATE aggregation_cache
+                SET last_accessed = ?, hit_count = hit_count + 1
+                WHERE cache_key = ?
+            ''', (now, cache_key))
+            conn.commit()
+
+            cached_data['aggregated_data'] = json.loads(cached_data['aggregated_data'])
+            cached_data['data_sources'] = json.loads(cached_data['data_sources'])
+            match['entry'] = cached_data
+            return match
+
+        except Exception as e:
+            raise Exception(f"Semantic cache lookup failed: {str(e)}")
+        finally:
+            conn.close()
+
     def get_similar_cached_queries(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
         """Get similar cached queries for learning patterns.
 
@@ -272,6 +402,48 @@ class InsightsCacheStore:
         finally:
             conn.close()
 
+    def invalidate_for_change(self, change: DataChange) -> int:
+        """Expire the active entries whose recorded dependencies overlap a data change.
+
+        Unlike invalidate_cache_by_data_source, entries whose date range or
+        filters exclude the changed row stay cached.
+
+        Args:
+            change: Row written to a source table
+
+        Returns:
+            Number of entries expired
+
+        Raises:
+            Exception: If invalidation fails (NO FALLBACK)
+        """
+        now = datetime.now()
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        try:
+            keys = list(overlapping_keys(cursor, 'cache_dependencies', 'cache_key', change))
+            if not keys:
+                return 0
+
+            cursor.execute(f'''
+                UPDATE aggregation_cache
+                SET expires_at = ?
+                WHERE cache_key IN ({','.join('?' * len(keys))})
+                AND expires_at > ?
+            ''', [now, *keys, now])
+            invalidated = cursor.rowcount
+
+            conn.commit()
+            return invalidated
+
+        except Exception as e:
+            conn.rollback()
+            raise Exception(f"Cache invalidation failed: {str(e)}")
+        finally:
+            conn.close()
+
     def get_cache_statistics(self) -> Dict[str, Any]:
         """Get cache performance statistics.
 
@@ -341,6 +513,12 @@ class InsightsCacheStore:
                 DELETE FROM aggregation_cache
                 WHERE expires_at <= CURRENT_TIMESTAMP
             ''')
+            cursor.execute('''
+                DELETE FROM query_embeddings
+                WHERE cache_key NOT IN (SELECT cache_key FROM aggregation_cache)
+            ''')
+            delete_orphaned_dependencies(cursor, 'cache_dependencies', 'cache_key',
+                                         'aggregation_cache', 'cache_key')
         except Exception as e:
             # Log error but don't fail the main operation
             print(f"Cache cleanup warning: {str(e)}")
@@ -356,6 +534,8 @@ class InsightsCacheStore:
 
         try:
             cursor.execute('DELETE FROM aggregation_cache')
+            cursor.execute('DELETE FROM query_embeddings')
+            cursor.execute('DELETE FROM cache_dependencies')
             conn.commit()
 
         except Exception as e:
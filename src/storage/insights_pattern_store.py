@@ -4,13 +4,75 @@ Core Principles Applied:
 - NO FALLBACK: Fail fast on missing data or invalid states
 - AGENTIC: No hardcoded routing logic - all decisions by LLM agents
 - Learning: Store patterns to improve agent performance over time
+
+Pattern lookups go through a token inverted index over query_pattern: an
+FTS5 table kept in sync by triggers where SQLite has FTS5, otherwise an
+in-process posting-list index. Either way only patterns sharing a token
+with the query are read, ranked by token overlap.
 """
+import re
 import sqlite3
 import json
+import threading
 import uuid
+from array import array
+from collections import Counter
+from itertools import chain, combinations
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from ..infrastructure.llm.query_embedder import STOPWORDS
+
+
+INDEX_BACKENDS = ('auto', 'fts5', 'python')
+
+# Query terms considered for matching (overlap levels expand to term combinations)
+MAX_QUERY_TERMS = 8
+
+_TERM = re.compile(r"[^\W_]+")
+
+
+def _pattern_terms(text: str) -> List[str]:
+    """Distinct index terms of a pattern or query (case-folded words, no stopwords)."""
+    terms = []
+    for term in _TERM.findall(text.lower()):
+        if len(term) > 1 and term not in STOPWORDS and term not in terms:
+            terms.append(term)
+    return terms
+
+
+class _PostingListIndex:
+    """In-process inverted index: term → rowids of insight_patterns containing it.
+
+    Postings are append-only arrays; deleted patterns drop out when the hits
+    are joined back to insight_patterns, and the index is rebuilt after
+    deletes because SQLite may reuse their rowids.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, array] = {}
+        self.stale = True
+        self._lock = threading.Lock()
+
+    def add(self, rowid: int, text: str) -> None:
+        with self._lock:
+            for term in _pattern_terms(text):
+                self.postings.setdefault(term, array('q')).append(rowid)
+
+    def rebuild(self, cursor) -> None:
+        postings: Dict[str, array] = {}
+        for rowid, text in cursor.execute('SELECT rowid, query_pattern FROM insight_patterns ORDER BY rowid'):
+            for term in _pattern_terms(text):
+                postings.setdefault(term, array('q')).append(rowid)
+        with self._lock:
+            self.postings = postings
+            self.stale = False
+
+    def overlap(self, terms: List[str]) -> Dict[int, int]:
+        """rowid → number of the terms the pattern contains."""
+        with self._lock:
+            return Counter(chain.from_iterable(self.postings.get(term, ()) for term in terms))
+
 
 class InsightsPatternStore:
     """SQLite-based storage for learned insights patterns.
@@ -19,11 +81,12 @@ class InsightsPatternStore:
     to improve future query processing and response quality.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, index_backend: str = 'auto'):
         """Initialize pattern store with database path.
 
         Args:
             db_path: SQLite database file path
+            index_backend: 'fts5', 'python' (posting lists) or 'auto' (FTS5 when available)
 
         Raises:
             Exception: If database initialization fails (NO FALLBACK)
@@ -31,7 +94,12 @@ class InsightsPatternStore:
         if not db_path:
             raise ValueError("Database path cannot be empty")
 
+        if index_backend not in INDEX_BACKENDS:
+            raise ValueError(f"Invalid index_backend: {index_backend}")
+
         self.db_path = db_path
+        self.index_backend = index_backend
+        self._posting_index: Optional[_PostingListIndex] = None
         self._init_database()
 
     def _init_database(self):
@@ -59,6 +127,21 @@ class InsightsPatternStore:
                     schema_sql = f.read()
                     cursor.executescript(schema_sql)
 
+            # GENERAL patterns match every query
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_insight_patterns_general
+                ON insight_patterns(query_pattern) WHERE query_pattern = 'GENERAL'
+            ''')
+
+            if self.index_backend != 'python' and self._fts5_available(cursor):
+                self.index_backend = 'fts5'
+                self._create_fts_index(cursor)
+            elif self.index_backend == 'fts5':
+                raise ValueError("SQLite was built without FTS5")
+            else:
+                self.index_backend = 'python'
+                self._posting_index = _PostingListIndex()
+
             conn.commit()
 
         except Exception as e:
@@ -67,6 +150,59 @@ class InsightsPatternStore:
         finally:
             conn.close()
 
+    @staticmethod
+    def _fts5_available(cursor) -> bool:
+        """Whether this SQLite build has FTS5 (compiled in or loaded)."""
+        try:
+            cursor.execute('CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)')
+            cursor.execute('DROP TABLE temp.fts5_probe')
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def _create_fts_index(self, cursor):
+        """Create the FTS5 index over query_pattern and the triggers maintaining it.
+
+        Args:
+            cursor: SQLite cursor
+        """
+        cursor.execute('''
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='insight_patterns_fts'
+        ''')
+        exists = cursor.fetchone()
+
+        # External content: the text stays in insight_patterns, FTS5 keeps only the index
+        cursor.executescript('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS insight_patterns_fts USING fts5(
+                query_pattern, content='insight_patterns', content_rowid='rowid'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS trg_insight_patterns_fts_insert
+            AFTER INSERT ON insight_patterns BEGIN
+                INSERT INTO insight_patterns_fts(rowid, query_pattern)
+                VALUES (new.rowid, new.query_pattern);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_insight_patterns_fts_delete
+            AFTER DELETE ON insight_patterns BEGIN
+                INSERT INTO insight_patterns_fts(insight_patterns_fts, rowid, query_pattern)
+                VALUES ('delete', old.rowid, old.query_pattern);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_insight_patterns_fts_update
+            AFTER UPDATE OF query_pattern ON insight_patterns BEGIN
+                INSERT INTO insight_patterns_fts(insight_patterns_fts, rowid, query_pattern)
+                VALUES ('delete', old.rowid, old.query_pattern);
+                INSERT INTO insight_patterns_fts(rowid, query_pattern)
+                VALUES (new.rowid, new.query_pattern);
+            END;
+        ''')
+
+        if not exists:
+            # Index patterns stored before the FTS table existed
+            cursor.execute("INSERT INTO insight_patterns_fts(insight_patterns_fts) VALUES ('rebuild')")
+
     def store_pattern(self, pattern_type: str, query_pattern: str,
                      successful_approach: Dict[str, Any], effectiveness_score: float,
                      executive_roles: List[str] = None, focus_areas: List[str] = None) -> str:
@@ -115,6 +251,10 @@ class InsightsPatternStore:
                   now, now, now))
 
             conn.commit()
+
+            if self._posting_index and not self._posting_index.stale:
+                self._posting_index.add(cursor.lastrowid, query_pattern)
+
             return pattern_id
 
         except Exception as e:
@@ -170,6 +310,13 @@ class InsightsPatternStore:
                              focus_area: str = None, limit: int = 5) -> List[Dict[str, Any]]:
         """Get patterns that might match the query.
 
+        Patterns are ranked by overlap (how many query terms they contain),
+        then effectiveness and usage; GENERAL patterns match every query with
+        overlap 0. Overlap levels are read from the highest down and the
+        lookup stops once `limit` patterns are found, so the large
+        single-term posting lists are only read when few patterns share more
+        of the query.
+
         Args:
             query: Query to find patterns for
             executive_role: Executive role for filtering
@@ -177,55 +324,78 @@ class InsightsPatternStore:
             limit: Maximum patterns to return
 
         Returns:
-            List of matching patterns
+            List of matching patterns with 'match_score' (fraction of query terms matched)
         """
         if not query:
             raise ValueError("query cannot be empty")
 
+        terms = _pattern_terms(query)[:MAX_QUERY_TERMS]
+
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         try:
-            # Basic pattern matching - could be enhanced with embeddings
-            base_query = '''
-                SELECT * FROM insight_patterns
-                WHERE (
-                    query_pattern LIKE ? OR
-                    ? LIKE query_pattern OR
-                    query_pattern = 'GENERAL'
-                )
-            '''
-
-            params = [f'%{query.lower()}%', query.lower()]
+            filters = ''
+            filter_params: List[Any] = []
 
             # Add role filtering if specified
             if executive_role:
-                base_query += ' AND (executive_roles LIKE ? OR executive_roles = "[]")'
-                params.append(f'%"{executive_role}"%')
+                filters += ' AND (p.executive_roles LIKE ? OR p.executive_roles = "[]")'
+                filter_params.append(f'%"{executive_role}"%')
 
             # Add focus area filtering if specified
             if focus_area:
-                base_query += ' AND (focus_areas LIKE ? OR focus_areas = "[]")'
-                params.append(f'%"{focus_area}"%')
-
-            base_query += '''
-                ORDER BY effectiveness_score DESC, usage_count DESC
-                LIMIT ?
-            '''
-            params.append(limit)
-
-            cursor.execute(base_query, params)
-            rows = cursor.fetchall()
-
-            patterns = []
-            for row in rows:
-                pattern = dict(row)
-                # Parse JSON fields
-                pattern['successful_approach'] = json.loads(pattern['successful_approach'])
-                pattern['executive_roles'] = json.loads(pattern['executive_roles'])
-                pattern['focus_areas'] = json.loads(pattern['focus_areas'])
-                patterns.append(pattern)
+                filters += ' AND (p.focus_areas LIKE ? OR p.focus_areas = "[]")'
+                filter_params.append(f'%"{focus_area}"%')
+
+            if self.index_backend == 'python':
+                if self._posting_index.stale:
+                    self._posting_index.rebuild(cursor)
+                by_overlap: Dict[int, List[int]] = {}
+                for rowid, overlap in self._posting_index.overlap(terms).items():
+                    by_overlap.setdefault(overlap, []).append(rowid)
+
+            patterns: List[Dict[str, Any]] = []
+            taken: List[int] = []
+            for overlap in range(len(terms), -1, -1):
+                if len(patterns) >= limit:
+                    break
+
+                if overlap == 0:
+                    source = "SELECT rowid FROM insight_patterns WHERE query_pattern = 'GENERAL'"
+                    source_params = []
+                elif self.index_backend == 'fts5':
+                    # Patterns containing any `overlap` of the terms
+                    source = 'SELECT rowid FROM insight_patterns_fts WHERE insight_patterns_fts MATCH ?'
+                    source_params = [' OR '.join(
+                        '(' + ' AND '.join(f'"{term}"' for term in subset) + ')'
+                        for subset in combinations(terms, overlap)
+                    )]
+                elif overlap in by_overlap:
+                    source = 'SELECT value FROM json_each(?)'
+                    source_params = [json.dumps(by_overlap[overlap])]
+                else:
+                    continue
+
+                cursor.execute(f'''
+                    SELECT p.rowid AS pattern_rowid, p.* FROM insight_patterns p
+                    WHERE p.rowid IN ({source})
+                    AND p.rowid NOT IN (SELECT value FROM json_each(?))
+                    {filters}
+                    ORDER BY p.effectiveness_score DESC, p.usage_count DESC
+                    LIMIT ?
+                ''', [*source_params, json.dumps(taken), *filter_params, limit - len(patterns)])
+
+                for row in cursor.fetchall():
+                    pattern = dict(row)
+                    taken.append(pattern.pop('pattern_rowid'))
+                    # Parse JSON fields
+                    pattern['successful_approach'] = json.loads(pattern['successful_approach'])
+                    pattern['executive_roles'] = json.loads(pattern['executive_roles'])
+                    pattern['focus_areas'] = json.loads(pattern['focus_areas'])
+                    pattern['match_score'] = round(overlap / len(terms), 4) if terms else 0.0
+                    patterns.append(pattern)
 
             return patterns
 
@@ -364,6 +534,9 @@ class InsightsPatternStore:
             deleted_count = cursor.rowcount
             conn.commit()
 
+            if self._posting_index and deleted_count:
+                self._posting_index.stale = True
+
             return deleted_count
 
         except Exception as e:
@@ -0,0 +1,512 @@
+"""SQLite storage for durable orchestration runs and per-transcript pipeline jobs.
+
+Core Principles Applied:
+- NO FALLBACK: Fail fast on missing data or invalid states
+- Durability: Every stage checkpoint is persisted, so a restart resumes
+  a job from its last completed stage instead of from zero
+- Leasing: Workers claim jobs with a time-limited lease inside a
+  BEGIN IMMEDIATE transaction, so several server processes can share
+  one database without running the same job twice
+"""
+import sqlite3
+import json
+from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+
+
+# Job states - QUEUED → RUNNING → COMPLETED | FAILED | CANCELLED
+TERMINAL_JOB_STATUSES = ('COMPLETED', 'FAILED', 'CANCELLED')
+
+# Columns holding JSON documents
+_JSON_COLUMNS = ('workflow_ids', 'execution_ids', 'result', 'transcript_ids', 'concurrency', 'summary')
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class PipelineJobStore:
+    """SQLite-backed run/job table with stage checkpoints and row leasing.
+
+    ``pipeline_runs`` holds one row per orchestration run; ``pipeline_jobs``
+    holds one row per transcript in that run, with the IDs produced by each
+    completed stage (analysis_id, plan_id, workflow_ids, execution_ids).
+    """
+
+    def __init__(self, db_path: str):
+        """Initialize store with database path.
+
+        Args:
+            db_path: SQLite database file path
+
+        Raises:
+            ValueError: Empty database path (NO FALLBACK)
+        """
+        if not db_path:
+            raise ValueError("Database path cannot be empty")
+
+        self.db_path = db_path
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode so transactions are explicit."""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Create run and job tables if they don't exist."""
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS pipeline_runs (
+                    id TEXT PRIMARY KEY,
+                    transcript_ids TEXT NOT NULL,
+                    auto_approve BOOLEAN NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL CHECK (status IN ('RUNNING', 'CANCELLING', 'COMPLETED', 'CANCELLED')),
+                    concurrency TEXT,
+                    summary TEXT,
+                    started_at TEXT NOT NULL,
+                    completed_at TEXT
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS pipeline_jobs (
+                    id TEXT PRIMARY KEY,
+                    run_id TEXT NOT NULL,
+                    transcript_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    auto_approve BOOLEAN NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL CHECK (status IN ('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED', 'CANCELLED')),
+
+                    -- Stage checkpoints (NULL until the stage completes)
+                    stage TEXT,
+                    analysis_id TEXT,
+                    plan_id TEXT,
+                    workflow_ids TEXT,
+                    workflow_count INTEGER,
+                    execution_ids TEXT,
+                    executed_count INTEGER,
+                    failed_count INTEGER,
+
+                    -- Outcome
+                    result TEXT,
+                    error TEXT,
+
+                    -- Leasing
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    lease_owner TEXT,
+                    lease_expires_at TEXT,
+
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    started_at TEXT,
+                    completed_at TEXT,
+
+                    FOREIGN KEY (run_id) REFERENCES pipeline_runs (id) ON DELETE CASCADE
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_run_status ON pipeline_jobs (run_id, status, position)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_pipeline_runs_status ON pipeline_runs (status)')
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        data = dict(row)
+        for column in _JSON_COLUMNS:
+            if column in data and data[column] is not None:
+                data[column] = json.loads(data[column])
+        if 'auto_approve' in data:
+            data['auto_approve'] = bool(data['auto_approve'])
+        return data
+
+    # ------------------------------------------------------------------
+    # Runs
+    # ------------------------------------------------------------------
+
+    def create_run(self, run_id: str, transcript_ids: List[str], auto_approve: bool,
+                   concurrency: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Create a run and one QUEUED job per transcript in a single transaction.
+
+        Args:
+            run_id: Run identifier
+            transcript_ids: Transcripts in priority order (must be unique)
+            auto_approve: Auto-approve flag for every job
+            concurrency: Concurrency settings to reuse when the run is resumed
+
+        Returns:
+            The created run record
+
+        Raises:
+            ValueError: Missing run_id, empty or duplicate transcript_ids (NO FALLBACK)
+        """
+        if not run_id:
+            raise ValueError("run_id cannot be empty")
+        if not transcript_ids:
+            raise ValueError("transcript_ids cannot be empty")
+        if len(set(transcript_ids)) != len(transcript_ids):
+            raise ValueError("transcript_ids must be unique within a run")
+
+        now = _now().isoformat()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('''
+                INSERT INTO pipeline_runs (id, transcript_ids, auto_approve, status, concurrency, started_at)
+                VALUES (?, ?, ?, 'RUNNING', ?, ?)
+            ''', (run_id, json.dumps(transcript_ids), auto_approve, json.dumps(concurrency or {}), now))
+            conn.executemany('''
+                INSERT INTO pipeline_jobs (id, run_id, transcript_id, position, auto_approve, status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, 'QUEUED', ?, ?)
+            ''', [
+                (f"{run_id}:{position}", run_id, transcript_id, position, auto_approve, now, now)
+                for position, transcript_id in enumerate(transcript_ids)
+            ])
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+        return self.get_run(run_id)
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Get a run record (without jobs) or None if not found."""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT * FROM pipeline_runs WHERE id = ?', (run_id,)).fetchone()
+            return self._row_to_dict(row) if row else None
+        finally:
+            conn.close()
+
+    def list_runs(self, status: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List runs, most recent first, optionally filtered by status."""
+        query = 'SELECT * FROM pipeline_runs'
+        params: List[Any] = []
+        if status:
+            query += ' WHERE status = ?'
+            params.append(status)
+        query += ' ORDER BY started_at DESC'
+        if limit:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        conn = self._connect()
+        try:
+            return [self._row_to_dict(row) for row in conn.execute(query, params).fetchall()]
+        finally:
+            conn.close()
+
+    def list_unfinished_runs(self) -> List[Dict[str, Any]]:
+        """Runs that still have work to do (used to resume after a restart)."""
+        conn = self._connect()
+        try:
+            rows = conn.execute('''
+                SELECT * FROM pipeline_runs WHERE status IN ('RUNNING', 'CANCELLING') ORDER BY started_at
+            ''').fetchall()
+            return [self._row_to_dict(row) for row in rows]
+        finally:
+            conn.close()
+
+    def cancel_run(self, run_id: str) -> int:
+        """Request cancellation: queued jobs are cancelled, running jobs lose their lease on next renewal.
+
+        Returns:
+            Number of queued jobs cancelled
+
+        Raises:
+            ValueError: Run not found or already finished (NO FALLBACK)
+        """
+        now = _now().isoformat()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            updated = conn.execute('''
+                UPDATE pipeline_runs SET status = 'CANCELLING' WHERE id = ? AND status = 'RUNNING'
+            ''', (run_id,)).rowcount
+            if updated == 0:
+                conn.execute('ROLLBACK')
+                run = self.get_run(run_id)
+                if run is None:
+                    raise ValueError(f"Run {run_id} not found")
+                raise ValueError(f"Run {run_id} is not running (status: {run['status']})")
+            cancelled = conn.execute('''
+                UPDATE pipeline_jobs SET status = 'CANCELLED', completed_at = ?, updated_at = ?
+                WHERE run_id = ? AND status = 'QUEUED'
+            ''', (now, now, run_id)).rowcount
+            conn.execute('COMMIT')
+            return cancelled
+        finally:
+            conn.close()
+
+    def finalize_run_if_done(self, run_id: str) -> bool:
+        """Mark the run COMPLETED/CANCELLED with a summary once every job is terminal.
+
+        Returns:
+            True if this call finalized the run
+        """
+        now = _now().isoformat()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            run = conn.execute('SELECT status FROM pipeline_runs WHERE id = ?', (run_id,)).fetchone()
+            if run is None or run['status'] not in ('RUNNING', 'CANCELLING'):
+                conn.execute('ROLLBACK')
+                return False
+
+            counts = {status: 0 for status in ('QUEUED', 'RUNNING') + TERMINAL_JOB_STATUSES}
+            for row in conn.execute('''
+                SELECT status, COUNT(*) AS n FROM pipeline_jobs WHERE run_id = ? GROUP BY status
+            ''', (run_id,)):
+                counts[row['status']] = row['n']
+
+            if counts['QUEUED'] or counts['RUNNING']:
+                conn.execute('ROLLBACK')
+                return False
+
+            total = sum(counts.values())
+            summary = {
+                "total_transcripts": total,
+                "successful": counts['COMPLETED'],
+                "failed": counts['FAILED'],
+                "cancelled": counts['CANCELLED'],
+                "success_rate": counts['COMPLETED'] / total if total else 0
+            }
+            final_status = 'CANCELLED' if run['status'] == 'CANCELLING' else 'COMPLETED'
+            conn.execute('''
+                UPDATE pipeline_runs SET status = ?, summary = ?, completed_at = ? WHERE id = ?
+            ''', (final_status, json.dumps(summary), now, run_id))
+            conn.execute('COMMIT')
+            return True
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Jobs
+    # ------------------------------------------------------------------
+
+    def get_jobs(self, run_id: str) -> List[Dict[str, Any]]:
+        """Get every job of a run in submission order."""
+        conn = self._connect()
+        try:
+            rows = conn.execute('''
+                SELECT * FROM pipeline_jobs WHERE run_id = ? ORDER BY position
+            ''', (run_id,)).fetchall()
+            return [self._row_to_dict(row) for row in rows]
+        finally:
+            conn.close()
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job or None if not found."""
+        conn = self._connect()
+        try:
+            row = conn.execute('SELECT * FROM pipeline_jobs WHERE id = ?', (job_id,)).fetchone()
+            return self._row_to_dict(row) if row else None
+        finally:
+            conn.close()
+
+    def count_unfinished_jobs(self, run_id: str, exclude_owner: Optional[str] = None) -> int:
+        """Count jobs that are still QUEUED or RUNNING.
+
+        Args:
+            run_id: Run to inspect
+            exclude_owner: Skip RUNNING jobs leased by this worker (its own in-flight jobs)
+        """
+        query = '''
+            SELECT COUNT(*) FROM pipeline_jobs WHERE run_id = ? AND status IN ('QUEUED', 'RUNNING')
+        '''
+        params: List[Any] = [run_id]
+        if exclude_owner:
+            query += ' AND (lease_owner IS NULL OR lease_owner != ?)'
+            params.append(exclude_owner)
+
+        conn = self._connect()
+        try:
+            return conn.execute(query, params).fetchone()[0]
+        finally:
+            conn.close()
+
+    def claim_next_job(self, run_id: str, worker_id: str, lease_seconds: int,
+                       max_attempts: int = 3) -> Optional[Dict[str, Any]]:
+        """Atomically lease the next runnable job of a run.
+
+        A job is runnable when it is QUEUED, or RUNNING with an expired lease
+        (its worker died). Jobs whose lease expired ``max_attempts`` times are
+        marked FAILED instead of being retried forever.
+
+        Args:
+            run_id: Run to claim from
+            worker_id: Unique identifier of the claiming worker
+            lease_seconds: Lease duration; renew with renew_lease
+            max_attempts: Claims allowed per job
+
+        Returns:
+            The claimed job, or None if nothing is runnable
+        """
+        now = _now()
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+
+            # A cancelled run never starts new work; orphaned jobs of dead workers are closed out
+            conn.execute('''
+                UPDATE pipeline_jobs
+                SET status = 'CANCELLED', lease_owner = NULL, lease_expires_at = NULL, completed_at = ?, updated_at = ?
+                WHERE run_id = ? AND run_id IN (SELECT id FROM pipeline_runs WHERE status = 'CANCELLING')
+                  AND (status = 'QUEUED' OR (status = 'RUNNING' AND lease_expires_at < ?))
+            ''', (now.isoformat(), now.isoformat(), run_id, now.isoformat()))
+
+            while True:
+                row = conn.execute('''
+                    SELECT j.* FROM pipeline_jobs j
+                    JOIN pipeline_runs r ON r.id = j.run_id
+                    WHERE j.run_id = ? AND r.status = 'RUNNING'
+                      AND (j.status = 'QUEUED' OR (j.status = 'RUNNING' AND j.lease_expires_at < ?))
+                    ORDER BY j.position
+                    LIMIT 1
+                ''', (run_id, now.isoformat())).fetchone()
+
+                if row is None:
+                    conn.execute('COMMIT')
+                    return None
+
+                if row['attempts'] >= max_attempts:
+                    conn.execute('''
+                        UPDATE pipeline_jobs
+                        SET status = 'FAILED', error = ?, lease_owner = NULL, lease_expires_at = NULL,
+                            completed_at = ?, updated_at = ?
+                        WHERE id = ?
+                    ''', (f"Lease expired after {row['attempts']} attempts", now.isoformat(), now.isoformat(), row['id']))
+                    continue
+
+                conn.execute('''
+                    UPDATE pipeline_jobs
+                    SET status = 'RUNNING', lease_owner = ?, lease_expires_at = ?, attempts = attempts + 1,
+                        started_at = COALESCE(started_at, ?), updated_at = ?
+                    WHERE id = ?
+                ''', (
+                    worker_id,
+                    (now + timedelta(seconds=lease_seconds)).isoformat(),
+                    now.isoformat(),
+                    now.isoformat(),
+                    row['id']
+                ))
+                claimed = conn.execute('SELECT * FROM pipeline_jobs WHERE id = ?', (row['id'],)).fetchone()
+                conn.execute('COMMIT')
+                return self._row_to_dict(claimed)
+        except Exception:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+    def renew_lease(self, job_id: str, worker_id: str, lease_seconds: int) -> bool:
+        """Extend a lease. Returns False if the lease was lost or the run is no longer RUNNING."""
+        now = _now()
+        conn = self._connect()
+        try:
+            updated = conn.execute('''
+                UPDATE pipeline_jobs SET lease_expires_at = ?, updated_at = ?
+                WHERE id = ? AND lease_owner = ? AND status = 'RUNNING'
+                  AND run_id IN (SELECT id FROM pipeline_runs WHERE status = 'RUNNING')
+            ''', ((now + timedelta(seconds=lease_seconds)).isoformat(), now.isoformat(), job_id, worker_id)).rowcount
+            return updated == 1
+        finally:
+            conn.close()
+
+    def checkpoint(self, job_id: str, worker_id: str, stage: str, **fields) -> bool:
+        """Persist a completed stage and the IDs it produced.
+
+        Args:
+            job_id: Job being processed
+            worker_id: Lease owner (writes from a worker that lost its lease are ignored)
+            stage: Stage marker, e.g. ANALYSIS_COMPLETED
+            **fields: Checkpoint columns (analysis_id, plan_id, workflow_ids, workflow_count,
+                execution_ids, executed_count, failed_count)
+
+        Returns:
+            True if the checkpoint was written
+
+        Raises:
+            ValueError: Unknown checkpoint field (NO FALLBACK)
+        """
+        allowed = {'analysis_id', 'plan_id', 'workflow_ids', 'workflow_count',
+                   'execution_ids', 'executed_count', 'failed_count'}
+        unknown = set(fields) - allowed
+        if unknown:
+            raise ValueError(f"Unknown checkpoint fields: {sorted(unknown)}")
+
+        assignments = ['stage = ?', 'updated_at = ?']
+        params: List[Any] = [stage, _now().isoformat()]
+        for column, value in fields.items():
+            assignments.append(f'{column} = ?')
+            params.append(json.dumps(value) if column in _JSON_COLUMNS else value)
+        params.extend([job_id, worker_id])
+
+        conn = self._connect()
+        try:
+            updated = conn.execute(f'''
+                UPDATE pipeline_jobs SET {', '.join(assignments)}
+                WHERE id = ? AND lease_owner = ? AND status = 'RUNNING'
+            ''', params).rowcount
+            return updated == 1
+        finally:
+            conn.close()
+
+    def release_job(self, job_id: str, worker_id: str) -> bool:
+        """Put a leased job back in the queue, keeping its checkpoints.
+
+        Used when a worker stops without the run being cancelled (e.g. server
+        shutdown): the next scheduler for the run resumes the job from its last
+        checkpoint. The claim is not counted as an attempt.
+
+        Returns:
+            True if the job was released (False if the lease was already lost)
+        """
+        now = _now().isoformat()
+        conn = self._connect()
+        try:
+            updated = conn.execute('''
+                UPDATE pipeline_jobs
+                SET status = 'QUEUED', lease_owner = NULL, lease_expires_at = NULL,
+                    attempts = MAX(attempts - 1, 0), updated_at = ?
+                WHERE id = ? AND lease_owner = ? AND status = 'RUNNING'
+            ''', (now, job_id, worker_id)).rowcount
+            return updated == 1
+        finally:
+            conn.close()
+
+    def finish_job(self, job_id: str, worker_id: str, status: str,
+                   result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> bool:
+        """Move a leased job to a terminal state and release the lease.
+
+        Raises:
+            ValueError: Non-terminal status (NO FALLBACK)
+        """
+        if status not in TERMINAL_JOB_STATUSES:
+            raise ValueError(f"Invalid terminal status: {status}")
+
+        now = _now().isoformat()
+        conn = self._connect()
+        try:
+            updated = conn.execute('''
+                UPDATE pipeline_jobs
+                SET status = ?, result = ?, error = ?, lease_owner = NULL, lease_expires_at = NULL,
+                    completed_at = ?, updated_at = ?
+                WHERE id = ? AND lease_owner = ? AND status = 'RUNNING'
+            ''', (
+                status,
+                json.dumps(result, default=str) if result is not None else None,
+                error,
+                now,
+                now,
+                job_id,
+                worker_id
+            )).rowcount
+            return updated == 1
+        finally:
+            conn.close()
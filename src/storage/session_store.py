@@ -52,6 +52,17 @@ class SessionStore:
                 schema_sql = f.read()
                 cursor.executescript(schema_sql)
 
+            # Rolling summary of turns older than the verbatim context window
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS session_summaries (
+                    session_id TEXT PRIMARY KEY,
+                    summary TEXT NOT NULL,
+                    summarized_through TEXT,  -- created_at of the newest message folded in
+                    summarized_turns INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
             conn.commit()
 
         except Exception as e:
@@ -344,6 +355,68 @@ class SessionStore:
         finally:
             conn.close()
 
+    def get_conversation_summary(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Get the rolling summary of a session's older messages.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            {summary, summarized_through, summarized_turns} or None if nothing is summarized yet
+        """
+        if not session_id:
+            raise ValueError("session_id cannot be empty")
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                SELECT summary, summarized_through, summarized_turns
+                FROM session_summaries
+                WHERE session_id = ?
+            ''', (session_id,))
+
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+        except Exception as e:
+            raise Exception(f"Conversation summary retrieval failed: {str(e)}")
+        finally:
+            conn.close()
+
+    def save_conversation_summary(self, session_id: str, summary: str,
+                                  summarized_through: str, summarized_turns: int):
+        """Store the rolling summary of a session's older messages.
+
+        Args:
+            session_id: Session identifier
+            summary: Summary text
+            summarized_through: created_at of the newest message folded into the summary
+            summarized_turns: Messages folded into the summary so far
+        """
+        if not session_id:
+            raise ValueError("session_id cannot be empty")
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute('''
+                INSERT OR REPLACE INTO session_summaries
+                (session_id, summary, summarized_through, summarized_turns, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ''', (session_id, summary, summarized_through, summarized_turns))
+
+            conn.commit()
+
+        except Exception as e:
+            conn.rollback()
+            raise Exception(f"Conversation summary update failed: {str(e)}")
+        finally:
+            conn.close()
+
     def update_session_focus_area(self, session_id: str, focus_area: str):
         """Update session focus area determined by agent.
 
@@ -467,6 +540,9 @@ class SessionStore:
             cursor.execute('''
                 DELETE FROM session_messages WHERE session_id = ?
             ''', (session_id,))
+            cursor.execute('''
+                DELETE FROM session_summaries WHERE session_id = ?
+            ''', (session_id,))
 
             # Delete the session
             cursor.execute('''
@@ -0,0 +1,430 @@
+"""SQLite rollup tables for forecasting time series.
+
+Core Principles Applied:
+- NO FALLBACK: Fail fast on invalid metrics or granularities
+- Performance: Hourly and daily buckets hold count, sum and sum of squares
+  per metric (overall, per intent and per advisor), so a series read is
+  O(buckets) instead of a GROUP BY scan over every transcript/analysis row
+- Consistency: Rollups are maintained by triggers on ``transcripts`` and
+  ``analysis``, so every writer (TranscriptStore.store, AnalysisStore.store,
+  the synthetic data generator, deletes and INSERT OR REPLACE overwrites)
+  keeps them exact without application code having to remember to
+- Bulk loads: insert_batch updates the rollups once per batch with a grouped
+  upsert instead of per row
+"""
+import sqlite3
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# Borrower sentiment label → numeric score (unknown labels score 0.5)
+SENTIMENT_SCORES = {
+    'Positive': 1.0,
+    'Neutral': 0.5,
+    'Negative': 0.0,
+    'Frustrated': 0.2,
+    'Angry': 0.0,
+    'Satisfied': 0.9
+}
+
+_SENTIMENT_CASE = (
+    "CASE WHEN {row}.borrower_sentiment IS NULL OR {row}.borrower_sentiment = '' THEN NULL "
+    + ' '.join(f"WHEN {{row}}.borrower_sentiment = '{label}' THEN {score}" for label, score in SENTIMENT_SCORES.items())
+    + " ELSE 0.5 END"
+)
+
+# Rolled-up sources: bucketing time column, metric value expressions and dimensions.
+# A NULL metric value or dimension value is not counted (matches AVG() semantics).
+ROLLUP_SOURCES: Dict[str, Dict[str, Any]] = {
+    'transcripts': {
+        'time': '{row}.timestamp',
+        'metrics': {
+            'calls': '1.0'
+        },
+        'dimensions': {
+            'advisor': "NULLIF({row}.advisor_id, '')"
+        }
+    },
+    'analysis': {
+        'time': '{row}.created_at',
+        'metrics': {
+            'analyses': '1.0',
+            'delinquency_risk': '{row}.delinquency_risk',
+            'churn_risk': '{row}.churn_risk',
+            'complaint_risk': '{row}.complaint_risk',
+            'empathy_score': '{row}.empathy_score',
+            'compliance_adherence': '{row}.compliance_adherence',
+            'solution_effectiveness': '{row}.solution_effectiveness',
+            'escalation': 'CASE WHEN {row}.escalation_needed = 1 THEN 1.0 ELSE 0.0 END',
+            'sentiment': _SENTIMENT_CASE
+        },
+        'dimensions': {
+            'intent': "NULLIF({row}.primary_intent, '')",
+            'advisor': "(SELECT NULLIF(t.advisor_id, '') FROM transcripts t WHERE t.id = {row}.transcript_id)"
+        }
+    }
+}
+
+GRANULARITIES = ('hour', 'day', 'week')
+DIMENSIONS = ('', 'intent', 'advisor')
+
+_BUCKET_FORMATS = {
+    'day': "DATE({time})",
+    'hour': "strftime('%Y-%m-%d %H:00:00', {time})"
+}
+
+
+def _rollup_statement(source: str, row: str, sign: int, source_from: str = '', source_where: str = '') -> str:
+    """Upsert adding (sign=1) or removing (sign=-1) rows of a source into the rollups.
+
+    Args:
+        source: Key of ROLLUP_SOURCES
+        row: Row reference in expressions - NEW/OLD inside triggers, ``src`` for table scans
+        sign: 1 to add, -1 to subtract
+        source_from: FROM item for table scans (e.g. ``analysis AS src,``); empty in triggers
+        source_where: Extra filter on the scanned rows
+    """
+    spec = ROLLUP_SOURCES[source]
+    time = spec['time'].format(row=row)
+    bucket = 'CASE g.column1 ' + ' '.join(
+        f"WHEN '{granularity}' THEN {expr.format(time=time)}" for granularity, expr in _BUCKET_FORMATS.items()
+    ) + ' END'
+    value = 'CASE m.column1 ' + ' '.join(
+        f"WHEN '{metric}' THEN {expr.format(row=row)}" for metric, expr in spec['metrics'].items()
+    ) + ' END'
+    dim_value = "CASE d.column1 WHEN '' THEN '' " + ' '.join(
+        f"WHEN '{dimension}' THEN {expr.format(row=row)}" for dimension, expr in spec['dimensions'].items()
+    ) + ' END'
+    granularities = ', '.join(f"('{granularity}')" for granularity in _BUCKET_FORMATS)
+    metrics = ', '.join(f"('{metric}')" for metric in spec['metrics'])
+    dimensions = ', '.join(f"('{dimension}')" for dimension in ('', *spec['dimensions']))
+
+    return f'''
+        INSERT INTO timeseries_rollups (granularity, bucket, metric, dimension, dim_value, n, value_sum, value_sum_sq)
+        SELECT granularity, bucket, metric, dimension, dim_value,
+               {sign} * COUNT(*), {sign} * SUM(value), {sign} * SUM(value * value)
+        FROM (
+            SELECT g.column1 AS granularity, {bucket} AS bucket,
+                   m.column1 AS metric, {value} AS value,
+                   d.column1 AS dimension, {dim_value} AS dim_value
+            FROM {source_from} (VALUES {granularities}) g, (VALUES {metrics}) m, (VALUES {dimensions}) d
+            {source_where}
+        )
+        WHERE bucket IS NOT NULL AND value IS NOT NULL AND dim_value IS NOT NULL
+        GROUP BY granularity, bucket, metric, dimension, dim_value
+        ON CONFLICT (granularity, bucket, metric, dimension, dim_value) DO UPDATE SET
+            n = n + excluded.n,
+            value_sum = value_sum + excluded.value_sum,
+            value_sum_sq = value_sum_sq + excluded.value_sum_sq
+    '''
+
+
+def _create_triggers(conn: sqlite3.Connection, source: str) -> None:
+    """Install the triggers that keep a source's rollups current."""
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{source}_rollup_insert AFTER INSERT ON {source}
+        BEGIN {_rollup_statement(source, 'NEW', 1)}; END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{source}_rollup_delete AFTER DELETE ON {source}
+        BEGIN {_rollup_statement(source, 'OLD', -1)}; END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{source}_rollup_update AFTER UPDATE ON {source}
+        BEGIN {_rollup_statement(source, 'OLD', -1)}; {_rollup_statement(source, 'NEW', 1)}; END
+    ''')
+    # INSERT OR REPLACE deletes the old row without firing delete triggers - subtract it first
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_{source}_rollup_replace BEFORE INSERT ON {source}
+        WHEN EXISTS (SELECT 1 FROM {source} WHERE id = NEW.id)
+        BEGIN {_rollup_statement(source, 'src', -1, f'{source} AS src,', 'WHERE src.id = NEW.id')}; END
+    ''')
+
+
+def _rebuild_source(conn: sqlite3.Connection, source: str) -> None:
+    """Recompute a source's rollups from its table."""
+    metrics = list(ROLLUP_SOURCES[source]['metrics'])
+    placeholders = ','.join('?' * len(metrics))
+    conn.execute(f'DELETE FROM timeseries_rollups WHERE metric IN ({placeholders})', metrics)
+    conn.execute(_rollup_statement(source, 'src', 1, f'{source} AS src,'))
+
+
+def insert_batch(conn: sqlite3.Connection, source: str, insert_sql: str, rows: List[Tuple[Any, ...]]) -> None:
+    """Bulk insert into a rolled-up source with one set-based rollup update.
+
+    The triggers roll rows up one at a time (one upsert per granularity,
+    metric and dimension of every row). For a batch they are dropped inside
+    the caller's transaction, the rows are inserted, and the rollups are
+    updated with one grouped upsert (previous versions of replaced rows are
+    subtracted first). The triggers are reinstalled before the caller
+    commits, so other connections never see the table without them.
+
+    Args:
+        conn: Connection; the caller commits
+        source: Key of ROLLUP_SOURCES
+        insert_sql: INSERT (OR REPLACE) statement whose first parameter is the row id
+        rows: Parameter tuples for insert_sql
+    """
+    if source not in ROLLUP_SOURCES:
+        raise ValueError(f"Invalid rollup source: {source}")
+    if not rows:
+        return
+
+    if not conn.in_transaction:
+        conn.execute('BEGIN')
+    conn.execute('CREATE TEMP TABLE IF NOT EXISTS rollup_batch (id TEXT PRIMARY KEY)')
+    conn.execute('DELETE FROM temp.rollup_batch')
+    conn.executemany('INSERT OR IGNORE INTO temp.rollup_batch (id) VALUES (?)', ((row[0],) for row in rows))
+
+    batch = 'WHERE src.id IN (SELECT id FROM temp.rollup_batch)'
+    for trigger in ('insert', 'delete', 'update', 'replace'):
+        conn.execute(f'DROP TRIGGER IF EXISTS trg_{source}_rollup_{trigger}')
+    conn.execute(_rollup_statement(source, 'src', -1, f'{source} AS src,', batch))
+    conn.executemany(insert_sql, rows)
+    conn.execute(_rollup_statement(source, 'src', 1, f'{source} AS src,', batch))
+    _create_triggers(conn, source)
+
+
+def ensure_timeseries_rollups(conn: sqlite3.Connection) -> None:
+    """Create the rollup table and triggers for every existing source table.
+
+    A source whose triggers are installed for the first time (existing
+    database) is backfilled from its table. Idempotent; the caller commits.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS timeseries_rollups (
+            granularity TEXT NOT NULL,   -- 'hour' | 'day'
+            bucket TEXT NOT NULL,        -- 'YYYY-MM-DD HH:00:00' | 'YYYY-MM-DD'
+            metric TEXT NOT NULL,
+            dimension TEXT NOT NULL,     -- '' (all) | 'intent' | 'advisor'
+            dim_value TEXT NOT NULL,
+            n INTEGER NOT NULL,
+            value_sum REAL NOT NULL,
+            value_sum_sq REAL NOT NULL,
+            PRIMARY KEY (granularity, metric, dimension, dim_value, bucket)
+        ) WITHOUT ROWID
+    ''')
+
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')")}
+    for source in ROLLUP_SOURCES:
+        if source in existing and f'trg_{source}_rollup_insert' not in existing:
+            _create_triggers(conn, source)
+            _rebuild_source(conn, source)
+
+
+class TimeSeriesRollupStore:
+    """Read access to the hourly/daily rollups (weekly is derived from daily)."""
+
+    def __init__(self, db_path: str):
+        """Initialize store, installing rollups on the database if needed.
+
+        Args:
+            db_path: SQLite database file path
+
+        Raises:
+            ValueError: Empty database path (NO FALLBACK)
+        """
+        if not db_path:
+            raise ValueError("Database path cannot be empty")
+
+        self.db_path = db_path
+        conn = sqlite3.connect(self.db_path)
+        try:
+            ensure_timeseries_rollups(conn)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_series(self, metric: str, granularity: str = 'day', aggregate: str = 'mean',
+                   dimension: str = '', dim_value: Optional[str] = None, dim_value_like: bool = False,
+                   start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Tuple[str, float]]:
+        """Read a metric series.
+
+        Args:
+            metric: Metric name from ROLLUP_SOURCES
+            granularity: 'hour', 'day' or 'week' (week buckets start on Monday)
+            aggregate: 'count' (rows per bucket) or 'mean' (average value per bucket)
+            dimension: '' for all rows, 'intent' or 'advisor'
+            dim_value: Dimension value to select (all values of the dimension when None)
+            dim_value_like: Match dim_value as a substring (case-insensitive LIKE)
+            start_date: First day to include (YYYY-MM-DD)
+            end_date: Last day to include (YYYY-MM-DD)
+
+        Returns:
+            (bucket, value) pairs ordered by bucket
+
+        Raises:
+            ValueError: Unknown metric, granularity, aggregate or dimension (NO FALLBACK)
+        """
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Invalid dimension: {dimension}")
+        self._validate(metric, granularity, aggregate)
+
+        ds_expr, stored_granularity = self._bucket(granularity)
+        query = f'''
+            SELECT {ds_expr} AS ds, {self._aggregate(aggregate)} AS y
+            FROM timeseries_rollups
+            WHERE granularity = ? AND metric = ? AND dimension = ? AND n > 0
+        '''
+        params: List[Any] = [stored_granularity, metric, dimension]
+        if dim_value is not None:
+            query += ' AND dim_value LIKE ?' if dim_value_like else ' AND dim_value = ?'
+            params.append(f'%{dim_value}%' if dim_value_like else dim_value)
+        query, params = self._date_filters(query, params, start_date, end_date)
+        query += ' GROUP BY ds ORDER BY ds'
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+
+    def get_grouped_series(self, metric: str, dimension: str, granularity: str = 'day', aggregate: str = 'count',
+                           start_date: Optional[str] = None,
+                           end_date: Optional[str] = None) -> Dict[str, List[Tuple[str, float]]]:
+        """Read a metric series for every value of a dimension in one grouped query.
+
+        Args:
+            metric: Metric name from ROLLUP_SOURCES
+            dimension: 'intent' or 'advisor'
+            granularity: 'hour', 'day' or 'week'
+            aggregate: 'count' or 'mean'
+            start_date: First day to include (YYYY-MM-DD)
+            end_date: Last day to include (YYYY-MM-DD)
+
+        Returns:
+            Dimension value → (bucket, value) pairs ordered by bucket
+
+        Raises:
+            ValueError: Unknown metric, granularity, aggregate or dimension (NO FALLBACK)
+        """
+        if dimension not in DIMENSIONS or not dimension:
+            raise ValueError(f"Invalid dimension: {dimension}")
+        self._validate(metric, granularity, aggregate)
+
+        ds_expr, stored_granularity = self._bucket(granularity)
+        query = f'''
+            SELECT dim_value, {ds_expr} AS ds, {self._aggregate(aggregate)} AS y
+            FROM timeseries_rollups
+            WHERE granularity = ? AND metric = ? AND dimension = ? AND n > 0
+        '''
+        params: List[Any] = [stored_granularity, metric, dimension]
+        query, params = self._date_filters(query, params, start_date, end_date)
+        query += ' GROUP BY dim_value, ds ORDER BY dim_value, ds'
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+
+        grouped: Dict[str, List[Tuple[str, float]]] = {}
+        for dim_value, ds, y in rows:
+            grouped.setdefault(dim_value, []).append((ds, y))
+        return grouped
+
+    def get_multi_series(self, metrics: Dict[str, str], granularity: str = 'day',
+                         start_date: Optional[str] = None,
+                         end_date: Optional[str] = None) -> Dict[str, List[Tuple[str, float]]]:
+        """Read several metric series in one pass over the rollups.
+
+        Args:
+            metrics: Metric name → aggregate ('count' or 'mean')
+            granularity: 'hour', 'day' or 'week'
+            start_date: First day to include (YYYY-MM-DD)
+            end_date: Last day to include (YYYY-MM-DD)
+
+        Returns:
+            Metric → (bucket, value) pairs ordered by bucket (metrics without
+            data are omitted)
+
+        Raises:
+            ValueError: Unknown metric, granularity or aggregate (NO FALLBACK)
+        """
+        if not metrics:
+            raise ValueError("At least one metric is required")
+        for metric, aggregate in metrics.items():
+            self._validate(metric, granularity, aggregate)
+
+        ds_expr, stored_granularity = self._bucket(granularity)
+        query = f'''
+            SELECT metric, {ds_expr} AS ds, SUM(n), SUM(value_sum)
+            FROM timeseries_rollups
+            WHERE granularity = ? AND dimension = '' AND n > 0
+              AND metric IN ({', '.join('?' * len(metrics))})
+        '''
+        params: List[Any] = [stored_granularity, *metrics]
+        query, params = self._date_filters(query, params, start_date, end_date)
+        query += ' GROUP BY metric, ds ORDER BY metric, ds'
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+
+        series: Dict[str, List[Tuple[str, float]]] = {}
+        for metric, ds, n, value_sum in rows:
+            series.setdefault(metric, []).append((ds, n if metrics[metric] == 'count' else value_sum / n))
+        return series
+
+    @staticmethod
+    def _validate(metric: str, granularity: str, aggregate: str) -> None:
+        if not any(metric in spec['metrics'] for spec in ROLLUP_SOURCES.values()):
+            raise ValueError(f"Invalid metric: {metric}")
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Invalid granularity: {granularity}")
+        if aggregate not in ('count', 'mean'):
+            raise ValueError(f"Invalid aggregate: {aggregate}")
+
+    @staticmethod
+    def _bucket(granularity: str) -> Tuple[str, str]:
+        """(bucket expression, stored granularity) - weeks (starting Monday) are grouped from days."""
+        if granularity == 'week':
+            return "DATE(bucket, 'weekday 0', '-6 days')", 'day'
+        return 'bucket', granularity
+
+    @staticmethod
+    def _aggregate(aggregate: str) -> str:
+        return 'SUM(n)' if aggregate == 'count' else 'SUM(value_sum) / SUM(n)'
+
+    @staticmethod
+    def _date_filters(query: str, params: List[Any], start_date: Optional[str],
+                      end_date: Optional[str]) -> Tuple[str, List[Any]]:
+        if start_date:
+            query += ' AND DATE(bucket) >= ?'
+            params.append(start_date)
+        if end_date:
+            query += ' AND DATE(bucket) <= ?'
+            params.append(end_date)
+        return query, params
+
+    def get_coverage(self, metric: str = 'calls') -> Dict[str, Any]:
+        """Date range, day count and row count covered by a metric's daily rollups."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute('''
+                SELECT MIN(bucket), MAX(bucket), SUM(n), COUNT(*)
+                FROM timeseries_rollups
+                WHERE granularity = 'day' AND metric = ? AND dimension = '' AND n > 0
+            ''', (metric,)).fetchone()
+        finally:
+            conn.close()
+
+        return {
+            'earliest_date': row[0],
+            'latest_date': row[1],
+            'total': row[2] or 0,
+            'days_of_data': row[3]
+        }
+
+    def rebuild(self) -> None:
+        """Recompute every rollup from the source tables."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            for source in ROLLUP_SOURCES:
+                if source in existing:
+                    _rebuild_source(conn, source)
+            conn.commit()
+        finally:
+            conn.close()
@@ -4,6 +4,8 @@ import json
 from typing import List, Optional
 
 from src.models.transcript import Transcript, Message
+from src.storage.data_version_store import ensure_data_versions
+from src.storage.timeseries_rollup_store import ensure_timeseries_rollups
 
 
 class TranscriptStore:
@@ -58,6 +60,10 @@ class TranscriptStore:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_transcript_id ON messages (transcript_id)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_message_text ON messages (text)')
         
+        # Forecasting rollups and data versions are maintained by triggers on transcripts
+        ensure_timeseries_rollups(conn)
+        ensure_data_versions(conn)
+        
         conn.commit()
         conn.close()
     
@@ -11,6 +11,8 @@ import uuid
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
+from src.storage.data_version_store import ensure_data_versions
+
 
 class WorkflowStore:
     """SQLite-based storage for workflow approval management.
@@ -123,6 +125,9 @@ class WorkflowStore:
                     UPDATE workflows SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
                 END
             ''')
+
+            # Version watermark for persona snapshot caching
+            ensure_data_versions(conn)
             
             conn.commit()
             
@@ -482,6 +487,34 @@ class WorkflowStore:
         finally:
             conn.close()
     
+    def delete_bulk(self, workflow_ids: List[str]) -> int:
+        """Delete multiple workflows (and their state transitions) in a single transaction.
+        
+        Args:
+            workflow_ids: Workflow IDs
+            
+        Returns:
+            Number of workflows deleted
+        """
+        if not workflow_ids:
+            return 0
+        
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        try:
+            placeholders = ','.join('?' * len(workflow_ids))
+            cursor.execute(f'DELETE FROM workflow_state_transitions WHERE workflow_id IN ({placeholders})',
+                           list(workflow_ids))
+            cursor.execute(f'DELETE FROM workflows WHERE id IN ({placeholders})', list(workflow_ids))
+            deleted_count = cursor.rowcount
+            conn.commit()
+            
+            return deleted_count
+            
+        finally:
+            conn.close()
+    
     def delete_all(self) -> int:
         """Delete all workflows.
         
@@ -0,0 +1,94 @@
+"""
+Test suite for one-pass extraction of all forecast series
+"""
+import sqlite3
+import pytest
+import pandas as pd
+
+from src.analytics.forecasting.data_aggregator import DataAggregator
+from src.analytics.forecasting.forecast_types import FORECAST_TYPES, ForecastGenerator
+from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+from src.storage.analysis_store import AnalysisStore
+from src.storage.transcript_store import TranscriptStore
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    TranscriptStore(temp_db)
+    AnalysisStore(temp_db)
+    SyntheticDataGenerator(temp_db, seed=9).populate_database(days=20, base_daily_calls=5)
+    return temp_db
+
+
+def count_rollup_reads():
+    """Count SELECTs against timeseries_rollups issued through sqlite3.connect."""
+    reads = []
+    connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(lambda sql: reads.append(sql) if 'FROM timeseries_rollups' in sql else None)
+        return conn
+
+    return reads, tracing_connect
+
+
+class TestBulkSeries:
+    """Bulk series match the per-metric reads"""
+
+    def test_all_series_are_aligned_on_one_index(self, populated_db):
+        aggregator = DataAggregator(populated_db)
+        frame = aggregator.get_all_series({'calls': 'count', 'sentiment': 'mean', 'escalation': 'mean'})
+
+        assert list(frame.columns) == ['calls', 'sentiment', 'escalation']
+        assert frame.index.is_monotonic_increasing and frame.index.name == 'ds'
+
+        sentiment = aggregator.get_sentiment_score_data()
+        pd.testing.assert_series_equal(
+            frame['sentiment'].dropna().reset_index(drop=True), sentiment['y'].astype(float), check_names=False
+        )
+        calls = aggregator.get_call_volume_data()
+        assert frame['calls'].dropna().tolist() == calls['y'].astype(float).tolist()
+
+        with pytest.raises(ValueError, match="Invalid metric"):
+            aggregator.get_all_series({'weather': 'mean'})
+
+    def test_training_data_matches_per_type_reads(self, populated_db):
+        generator = ForecastGenerator(populated_db)
+        bulk = generator.load_training_data(list(FORECAST_TYPES))
+
+        aggregator = generator.data_aggregator
+        expected = {
+            'call_volume_daily': aggregator.get_call_volume_data('daily'),
+            'call_volume_hourly': aggregator.get_call_volume_data('hourly'),
+            'sentiment_trend': aggregator.get_sentiment_score_data(),
+            'delinquency_risk': aggregator.get_risk_score_data('delinquency'),
+            'churn_risk': aggregator.get_risk_score_data('churn'),
+            'escalation_rate': aggregator.get_escalation_rate_data(),
+            'advisor_empathy': aggregator.get_advisor_performance_data('empathy'),
+            'advisor_compliance': aggregator.get_advisor_performance_data('compliance')
+        }
+        for forecast_type, df in expected.items():
+            assert bulk[forecast_type]['ds'].tolist() == df['ds'].tolist(), forecast_type
+            assert bulk[forecast_type]['y'].tolist() == pytest.approx(df['y'].astype(float).tolist()), forecast_type
+
+    def test_full_refresh_reads_rollups_once_per_granularity(self, populated_db, monkeypatch):
+        generator = ForecastGenerator(populated_db)
+        reads, tracing_connect = count_rollup_reads()
+        monkeypatch.setattr(sqlite3, 'connect', tracing_connect)
+
+        generator.load_training_data(list(FORECAST_TYPES))
+        assert len(reads) == 2  # daily + hourly
+
+    def test_generate_all_trains_from_the_bulk_read(self, temp_db):
+        TranscriptStore(temp_db)
+        AnalysisStore(temp_db)
+        SyntheticDataGenerator(temp_db, seed=3).populate_database(days=14, base_daily_calls=4)
+        generator = ForecastGenerator(temp_db)
+
+        results = generator.generate_all(['escalation_rate', 'sentiment_trend'], horizon_days=3)
+        assert results['escalation_rate']['metadata']['engine'] == 'ets'
+        assert len(results['sentiment_trend']['predictions']) == 3
+
+        with pytest.raises(ValueError, match="Invalid forecast types"):
+            generator.load_training_data(['weather'])
@@ -0,0 +1,168 @@
+"""
+Test suite for conversation context compaction
+Recent turns verbatim, older turns in a persisted rolling summary, hard token budget
+"""
+import re
+import pytest
+
+from src.infrastructure.llm.llm_client_v2 import ResponseEnvelope
+from src.infrastructure.llm.token_counter import estimate_message_tokens, estimate_tokens, truncate_to_tokens
+from src.services.conversation_context import ConversationContextManager
+from src.storage.advisor_session_store import AdvisorSessionStore
+from src.storage.session_store import SessionStore
+
+
+class FakeSummaryLLM:
+    """Summarizes by listing the turn numbers it has seen."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def arun(self, messages, options=None, **kwargs):
+        prompt = messages[0]['content']
+        self.prompts.append(prompt)
+        turns_section = prompt.split('TURNS TO FOLD INTO THE SUMMARY (oldest first):')[1].split('YOUR TASK:')[0]
+        previous = prompt.split('CURRENT SUMMARY (may be empty):')[1].split('TURNS TO FOLD')[0].strip()
+        seen = [] if previous == '(none yet)' else previous.replace('Covered turns ', '').split(',')
+        seen += re.findall(r'turn (\d+)', turns_section)
+        return ResponseEnvelope(text='Covered turns ' + ','.join(seen), parsed=None, messages=[],
+                                usage=None, response_id=None, latency_ms=0, raw=None)
+
+
+@pytest.fixture
+def advisor_store(temp_db):
+    return AdvisorSessionStore(temp_db)
+
+
+def history(store, session_id):
+    return store.get_session(session_id)['conversation_history']
+
+
+async def converse(manager, store, session_id, turns, words=20):
+    contexts = []
+    for i in range(turns):
+        query = f"question turn {2 * i} " + 'detail ' * words
+        contexts.append(await manager.build_context(session_id, history(store, session_id), query))
+        store.add_conversation_turn(session_id, 'user', query)
+        store.add_conversation_turn(session_id, 'assistant', f"answer turn {2 * i + 1} " + 'figure ' * words)
+    return contexts
+
+
+class TestTokenCounter:
+    """Local tokenizer estimate"""
+
+    def test_estimate_and_truncate(self):
+        assert estimate_tokens('') == 0
+        assert estimate_tokens('What is churn?') == 5
+        assert estimate_tokens('delinquency') == 3
+
+        text = 'compliance breaches by advisor ' * 50
+        cut = truncate_to_tokens(text, 40)
+        assert estimate_tokens(cut) <= 40 and text.startswith(cut)
+        assert truncate_to_tokens('short', 40) == 'short'
+
+
+class TestConversationContextManager:
+    """Rolling summary and budget"""
+
+    @pytest.mark.asyncio
+    async def test_prompt_tokens_stay_flat_as_conversation_grows(self, advisor_store):
+        llm = FakeSummaryLLM()
+        manager = ConversationContextManager(advisor_store, llm, recent_turns=4, summary_max_tokens=100,
+                                             token_budget=2000)
+        session_id = advisor_store.create_session('ADV-1')
+
+        contexts = await converse(manager, advisor_store, session_id, 15)
+
+        assert [c['recent_turns'][0]['content'].split()[2] for c in contexts[-1:]] == ['24']
+        assert len(contexts[-1]['recent_turns']) == 4
+        assert contexts[-1]['summarized_turns'] == 24
+        assert contexts[-1]['summary'] == 'Covered turns ' + ','.join(str(i) for i in range(24))
+        # The prompt stays bounded by window + summary cap while the transcript keeps growing
+        turn_tokens = estimate_message_tokens({'content': 'question turn 10 ' + 'detail ' * 20})
+        assert all(c['prompt_tokens'] <= (4 + 1) * turn_tokens + 100 + 4 for c in contexts)
+        assert contexts[-1]['prompt_tokens'] < 30 * turn_tokens / 4
+
+        # Incremental: each update folds only the two turns that just left the window
+        assert len(llm.prompts) == 12
+        assert re.findall(r'turn (\d+)', llm.prompts[-1].split('TURNS TO FOLD')[1]) == ['22', '23']
+
+    @pytest.mark.asyncio
+    async def test_summary_is_persisted_with_the_session(self, advisor_store):
+        llm = FakeSummaryLLM()
+        session_id = advisor_store.create_session('ADV-1')
+        await converse(ConversationContextManager(advisor_store, llm, recent_turns=2, token_budget=2000),
+                       advisor_store, session_id, 3)
+
+        stored = advisor_store.get_conversation_summary(session_id)
+        assert stored['summary'] == 'Covered turns 0,1' and stored['summarized_turns'] == 2
+
+        # A new manager (restarted service) continues from the stored summary
+        restarted = ConversationContextManager(advisor_store, llm, recent_turns=2, token_budget=2000)
+        context = await restarted.build_context(session_id, history(advisor_store, session_id), 'next question')
+        assert context['summary'] == 'Covered turns 0,1,2,3' and context['summarized_turns'] == 4
+        assert re.findall(r'turn (\d+)', llm.prompts[-1].split('TURNS TO FOLD')[1]) == ['2', '3']
+
+        advisor_store.delete_session(session_id)
+        assert advisor_store.get_conversation_summary(session_id) is None
+
+    @pytest.mark.asyncio
+    async def test_budget_moves_verbatim_turns_into_summary(self, advisor_store):
+        manager = ConversationContextManager(advisor_store, FakeSummaryLLM(), recent_turns=10,
+                                             summary_max_tokens=50, token_budget=400)
+        session_id = advisor_store.create_session('ADV-1')
+
+        contexts = await converse(manager, advisor_store, session_id, 6, words=60)
+
+        assert all(c['prompt_tokens'] <= 400 for c in contexts)
+        assert len(contexts[-1]['recent_turns']) < 10 and contexts[-1]['summarized_turns'] > 0
+
+        with pytest.raises(ValueError, match="budget is 400"):
+            await manager.build_context(session_id, history(advisor_store, session_id), 'why ' * 400)
+
+    @pytest.mark.asyncio
+    async def test_metrics_report_prompt_tokens_per_turn(self, advisor_store):
+        manager = ConversationContextManager(advisor_store, FakeSummaryLLM(), recent_turns=2, token_budget=2000)
+        session_id = advisor_store.create_session('ADV-1')
+        contexts = await converse(manager, advisor_store, session_id, 3)
+
+        metrics = manager.get_metrics()
+        assert [t['prompt_tokens'] for t in metrics['prompt_tokens_per_turn']] == [c['prompt_tokens'] for c in contexts]
+        assert (metrics['turns'], metrics['summaries_updated'], metrics['turns_summarized']) == (3, 1, 2)
+        assert metrics['max_prompt_tokens'] == max(c['prompt_tokens'] for c in contexts)
+
+    def test_invalid_limits_raise(self, advisor_store):
+        with pytest.raises(ValueError, match="token_budget"):
+            ConversationContextManager(advisor_store, FakeSummaryLLM(), summary_max_tokens=500, token_budget=400)
+
+
+class TestSessionStoreSummary:
+    """Leadership sessions persist their rolling summary"""
+
+    def test_summary_round_trip_and_delete(self, temp_db, tmp_path, monkeypatch):
+        # leadership_sessions normally comes from data/insights_schema.sql
+        (tmp_path / 'data').mkdir()
+        (tmp_path / 'data' / 'insights_schema.sql').write_text('''
+            CREATE TABLE IF NOT EXISTS leadership_sessions (
+                session_id TEXT PRIMARY KEY, executive_id TEXT, executive_role TEXT, focus_area TEXT,
+                started_at TIMESTAMP, last_active TIMESTAMP, status TEXT DEFAULT 'active',
+                context_data TEXT, updated_at TIMESTAMP
+            );
+            CREATE TABLE IF NOT EXISTS session_messages (
+                message_id TEXT PRIMARY KEY, session_id TEXT, role TEXT, content TEXT,
+                query_classification TEXT, data_sources_used TEXT, confidence_score REAL,
+                token_count INTEGER, response_time_ms INTEGER, cache_hit BOOLEAN, created_at TIMESTAMP
+            );
+        ''')
+        monkeypatch.chdir(tmp_path)
+        store = SessionStore(temp_db)
+        session_id = store.create_session('EXEC-1', 'VP')['session_id']
+
+        assert store.get_conversation_summary(session_id) is None
+        store.save_conversation_summary(session_id, 'asked about churn', '2026-01-01 10:00:00', 4)
+        assert store.get_conversation_summary(session_id) == {
+            'summary': 'asked about churn', 'summarized_through': '2026-01-01 10:00:00', 'summarized_turns': 4
+        }
+
+        assert store.delete_session(session_id)
+        assert store.get_conversation_summary(session_id) is None
@@ -0,0 +1,121 @@
+"""
+Test suite for the vectorized ETS forecasting engine
+Series are synthetic trend + weekly season + noise, so forecasts can be scored exactly
+"""
+import subprocess
+import sys
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.analytics.forecasting.backtest import compare_engines, rolling_origin_backtest
+from src.analytics.forecasting.ets_service import ETSService
+from src.analytics.forecasting.forecast_types import FORECAST_TYPES, ForecastGenerator
+from src.analytics.forecasting.prophet_service import create_model_service, generate_forecast
+from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+from src.storage.analysis_store import AnalysisStore
+from src.storage.forecast_model_store import model_key
+from src.storage.transcript_store import TranscriptStore
+
+
+def seasonal_series(days=84, scale=1.0, seed=0):
+    t = np.arange(days)
+    y = 50 + 0.2 * t + 10 * np.sin(2 * np.pi * t / 7) + np.random.default_rng(seed).normal(0, 1, days)
+    return pd.DataFrame({'ds': pd.date_range('2026-01-01', periods=days, freq='D'), 'y': y * scale})
+
+
+class TestETSService:
+    """Holt-Winters fits, batch fits and serialization"""
+
+    def test_recovers_trend_and_weekly_season(self):
+        history = seasonal_series(days=84)
+        result = generate_forecast(history, periods=14, engine='ets')
+
+        t = np.arange(84, 98)
+        truth = 50 + 0.2 * t + 10 * np.sin(2 * np.pi * t / 7)
+        predicted = np.array([p['predicted'] for p in result['predictions']])
+        assert np.mean(np.abs(predicted - truth)) < 1.5
+        assert result['predictions'][0]['date'] == '2026-03-26T00:00:00'
+        assert all(p['lower_bound'] < p['predicted'] < p['upper_bound'] for p in result['predictions'])
+        assert result['metadata']['model_type'] == 'ETS'
+        assert result['components']['trend']['direction'] == 'increasing'
+
+    def test_fit_many_matches_individual_fits(self):
+        series = [seasonal_series(scale=scale, seed=seed) for seed, scale in enumerate((0.5, 1.0, 3.0))]
+        batch = ETSService.fit_many(series)
+
+        for service, df in zip(batch, series):
+            single = ETSService().train(df)
+            assert service.warm_start_params() == single.warm_start_params()
+            assert service.predict(7)['yhat'].values == pytest.approx(single.predict(7)['yhat'].values)
+
+        misaligned = seasonal_series().iloc[1:]
+        with pytest.raises(ValueError, match="same ds index"):
+            ETSService.fit_many([series[0], misaligned])
+
+    def test_json_round_trip_and_warm_start(self):
+        df = seasonal_series()
+        service = ETSService().train(df)
+        restored = ETSService.from_json(service.to_json())
+
+        assert restored.predict(7)['yhat'].values == pytest.approx(service.predict(7)['yhat'].values)
+        warm = ETSService().train(df, init=service.warm_start_params())
+        assert warm.warm_start_params() == service.warm_start_params()
+
+        with pytest.raises(ValueError):
+            create_model_service('daily', engine='arima')
+
+    def test_ets_engine_does_not_import_prophet(self):
+        # Fresh interpreter - other tests in this process may already have imported Prophet
+        code = (
+            "import sys\n"
+            "from src.analytics.forecasting.forecast_types import ForecastGenerator\n"
+            "from src.analytics.forecasting.prophet_service import create_model_service\n"
+            "service = create_model_service('hourly', engine='ets')\n"
+            "assert service.season_length == 24\n"
+            "assert 'prophet' not in sys.modules\n"
+        )
+        assert subprocess.run([sys.executable, '-c', code]).returncode == 0
+
+
+class TestEngineBacktest:
+    """Rolling-origin comparison of engines"""
+
+    def test_backtest_scores_every_fold(self):
+        result = rolling_origin_backtest(seasonal_series(), engine='ets', horizon=7, folds=3)
+        assert result['folds'] == 3
+        assert result['mae'] < 2.0 and result['rmse'] >= result['mae']
+
+        with pytest.raises(ValueError):
+            rolling_origin_backtest(seasonal_series(days=10), engine='ets', horizon=7, folds=3)
+
+    def test_ets_is_faster_with_comparable_accuracy(self):
+        pytest.importorskip("prophet")
+        results = compare_engines(seasonal_series(), model_type='daily',
+                                  prophet_kwargs={'daily_seasonality': False}, horizon=7, folds=2)
+
+        assert results['ets']['fit_ms'] < results['prophet']['fit_ms']
+        assert results['ets']['mae'] < 1.5 * results['prophet']['mae']
+
+
+class TestETSForecastTypes:
+    """Definitions configured with engine='ets' go through the registry"""
+
+    def test_ets_definition_fits_and_reuses_registered_model(self, temp_db):
+        TranscriptStore(temp_db)
+        AnalysisStore(temp_db)
+        SyntheticDataGenerator(temp_db, seed=5).populate_database(days=30, base_daily_calls=6)
+        generator = ForecastGenerator(temp_db)
+        assert FORECAST_TYPES['escalation_rate'].engine == 'ets'
+
+        first = generator.generate('escalation_rate', horizon_days=7)
+        assert first['metadata']['model_type'] == 'ETS'
+        assert first['metadata']['engine'] == 'ets'
+        assert first['metadata']['fit_mode'] == 'cold'
+
+        stored = generator.model_store.get(model_key('escalation_rate', None, None))
+        assert stored['engine'] == 'ets'
+
+        second = generator.generate('escalation_rate', horizon_days=14)
+        assert second['metadata']['fit_mode'] == 'reused'
+        assert len(second['predictions']) == 14
@@ -0,0 +1,170 @@
+"""
+Test suite for forecast backtesting and accuracy tracking
+Backtests use the ETS-configured types so no Prophet fits are needed
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+from src.analytics.forecasting.backtest import accuracy_metrics, rolling_origin_backtest, score_predictions
+from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+from src.services.forecasting_service import ForecastingService, ForecastingServiceError
+from src.storage.analysis_store import AnalysisStore
+from src.storage.transcript_store import TranscriptStore
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    TranscriptStore(temp_db)
+    AnalysisStore(temp_db)
+    SyntheticDataGenerator(temp_db, seed=11).populate_database(days=35, base_daily_calls=6)
+    return temp_db
+
+
+def prediction(date, predicted, width=1.0):
+    return {'date': date, 'predicted': predicted, 'lower_bound': predicted - width,
+            'upper_bound': predicted + width, 'confidence_interval': 2 * width}
+
+
+class TestAccuracyMetrics:
+    """Metric definitions and scoring of stored predictions"""
+
+    def test_metrics_skip_zero_actuals_for_mape(self):
+        metrics = accuracy_metrics(np.array([0.0, 10.0]), np.array([1.0, 12.0]),
+                                   np.array([0.5, 9.0]), np.array([1.5, 11.0]))
+        assert metrics['mae'] == 1.5
+        assert metrics['mape'] == pytest.approx(0.2)
+        assert metrics['coverage'] == 0.5
+
+    def test_score_predictions_matches_arrived_actuals_only(self):
+        actuals = pd.DataFrame({'ds': pd.to_datetime(['2026-03-01', '2026-03-02']), 'y': [10.0, 20.0]})
+        predictions = [prediction('2026-03-01T00:00:00', 11.0, width=2.0),
+                       prediction('2026-03-02T00:00:00', 17.0),
+                       prediction('2026-03-03T00:00:00', 30.0)]
+
+        scored = score_predictions(predictions, actuals)
+        assert scored['points_scored'] == 2 and scored['points_predicted'] == 3
+        assert scored['mae'] == 2.0
+        assert scored['coverage'] == 0.5
+        assert score_predictions(predictions[2:], actuals) is None
+
+    def test_backtest_reports_every_horizon_step(self):
+        t = np.arange(70)
+        df = pd.DataFrame({'ds': pd.date_range('2026-01-01', periods=70, freq='D'),
+                           'y': 20 + 5 * np.sin(2 * np.pi * t / 7)})
+        result = rolling_origin_backtest(df, engine='ets', horizon=5, folds=4)
+
+        assert [step['step'] for step in result['by_horizon']] == [1, 2, 3, 4, 5]
+        assert result['mae'] == pytest.approx(np.mean([step['mae'] for step in result['by_horizon']]))
+        assert 0.0 <= result['coverage'] <= 1.0
+
+
+class TestForecastingServiceAccuracy:
+    """Parallel backtests, stored results and live scoring"""
+
+    @pytest.mark.asyncio
+    async def test_backtests_run_per_type_and_are_reported(self, populated_db):
+        executor = ThreadPoolExecutor(max_workers=2)
+        service = ForecastingService(db_path=populated_db, executor=executor)
+        try:
+            run = await service.run_backtests(['escalation_rate', 'sentiment_trend'], folds=2)
+        finally:
+            executor.shutdown(wait=True)
+
+        assert {r['status'] for r in run['results'].values()} == {'completed'}
+        assert run['results']['escalation_rate']['engine'] == 'ets'
+
+        accuracy = await service.get_forecast_accuracy()
+        backtest = accuracy['backtests']['sentiment_trend']
+        assert backtest['id'] == run['results']['sentiment_trend']['backtest_id']
+        assert len(backtest['by_horizon']) == 7
+        assert backtest['data_version'] == service.get_data_version('sentiment_trend')
+
+    @pytest.mark.asyncio
+    async def test_short_history_is_skipped_not_failed(self, temp_db):
+        TranscriptStore(temp_db)
+        AnalysisStore(temp_db)
+        SyntheticDataGenerator(temp_db, seed=2).populate_database(days=10, base_daily_calls=4)
+        service = ForecastingService(db_path=temp_db, executor=ThreadPoolExecutor(max_workers=1))
+
+        run = await service.run_backtests(['escalation_rate'], folds=3)
+        assert run['results']['escalation_rate']['status'] == 'skipped'
+
+        with pytest.raises(ForecastingServiceError, match="Invalid forecast types"):
+            await service.run_backtests(['weather'])
+        with pytest.raises(ForecastingServiceError):
+            await service.get_forecast_accuracy('weather')
+
+    @pytest.mark.asyncio
+    async def test_past_forecasts_are_scored_against_actuals(self, populated_db):
+        service = ForecastingService(db_path=populated_db)
+        actuals = service.forecast_generator.get_training_data('escalation_rate').tail(3)
+        dates = [ts.isoformat() for ts in actuals['ds']]
+        forecast_id = service.forecast_store.store(
+            forecast_type='escalation_rate',
+            forecast_data={'predictions': [prediction(d, 0.5) for d in dates],
+                           'summary': {'prediction_start': dates[0], 'prediction_end': dates[-1]}},
+            horizon_days=3, data_start='2026-01-01T00:00:00', data_end=dates[0],
+            prediction_start=dates[0], prediction_end=dates[-1], data_points=30
+        )
+
+        accuracy = await service.get_forecast_accuracy('escalation_rate')
+        assert accuracy['newly_scored'] == {'escalation_rate': 1}
+        expected_mae = float(np.mean(np.abs(actuals['y'].values - 0.5)))
+        assert accuracy['live']['escalation_rate']['mae'] == pytest.approx(expected_mae)
+        assert accuracy['live']['escalation_rate']['forecasts_scored'] == 1
+
+        stored = service.forecast_store.get_by_id(forecast_id)
+        assert stored['actual_vs_predicted']['points_scored'] == 3
+        assert stored['actual_vs_predicted']['data_version'] == service.get_data_version('escalation_rate')
+
+        # Fully scored forecasts are not rescored
+        assert (await service.get_forecast_accuracy('escalation_rate'))['newly_scored'] == {'escalation_rate': 0}
+
+    @pytest.mark.asyncio
+    async def test_forecast_superseded_by_new_data_is_still_scored(self, populated_db):
+        executor = ThreadPoolExecutor(max_workers=1)
+        service = ForecastingService(db_path=populated_db, executor=executor)
+        actuals = service.forecast_generator.get_training_data('escalation_rate')
+        end_date = actuals['ds'].iloc[-6].strftime('%Y-%m-%d')
+        try:
+            first = await service.generate_forecast('escalation_rate', end_date=end_date)
+
+            AnalysisStore(populated_db).store({'analysis_id': 'ANALYSIS_NEW', 'transcript_id': 'CALL_NEW',
+                                               'escalation_needed': True})
+            assert service.get_data_version('escalation_rate') != first['data_version']
+
+            second = await service.generate_forecast('escalation_rate', end_date=end_date)
+        finally:
+            executor.shutdown(wait=True)
+
+        assert second['cached'] is False and second['forecast_id'] != first['forecast_id']
+        superseded = service.forecast_store.get_by_id(first['forecast_id'])
+        assert superseded['actual_vs_predicted']['points_scored'] > 0
+
+        accuracy = await service.get_forecast_accuracy('escalation_rate')
+        assert accuracy['live']['escalation_rate']['forecasts_scored'] == 2
+
+    def test_superseded_forecasts_are_pruned_only_once_unscorable(self, populated_db):
+        service = ForecastingService(db_path=populated_db)
+        latest = service.forecast_generator.get_training_data('escalation_rate')['ds'].max()
+
+        def store(start, end, data_version):
+            return service.forecast_store.store(
+                forecast_type='escalation_rate', forecast_data={'predictions': []}, horizon_days=3,
+                data_start='2026-01-01T00:00:00', data_end=start, prediction_start=start,
+                prediction_end=end, data_points=30, data_version=data_version
+            )
+
+        past = (latest - pd.Timedelta(days=3)).isoformat()
+        future = (latest + pd.Timedelta(days=3)).isoformat()
+        closed = store(past, past, 'old')
+        still_open = store(past, future, 'old')
+        current = store(past, past, service.get_data_version('escalation_rate'))
+
+        service.score_forecasts('escalation_rate')
+
+        assert service.forecast_store.get_by_id(closed) is None
+        assert service.forecast_store.get_by_id(still_open) is not None
+        assert service.forecast_store.get_by_id(current) is not None
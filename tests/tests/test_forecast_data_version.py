@@ -0,0 +1,142 @@
+"""
+Test suite for data-version watermarks and forecast cache validation
+Training is replaced by a fake on a thread pool - no Prophet fitting
+"""
+import pytest
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+from src.models.transcript import Message, Transcript
+from src.storage.analysis_store import AnalysisStore
+from src.storage.data_version_store import DataVersionStore
+from src.storage.transcript_store import TranscriptStore
+
+
+def make_transcript(transcript_id, timestamp):
+    return Transcript(
+        id=transcript_id, customer_id='CUST_001', advisor_id='ADV_001', timestamp=timestamp,
+        topic='payment_inquiry', duration=240, messages=[Message('Customer', 'When is my payment due?')]
+    )
+
+
+def make_analysis(analysis_id, transcript_id):
+    return {
+        'analysis_id': analysis_id,
+        'transcript_id': transcript_id,
+        'primary_intent': 'Payment Inquiry',
+        'borrower_sentiment': {'overall': 'Neutral'},
+        'borrower_risks': {'delinquency_risk': 0.3}
+    }
+
+
+class TestDataVersionStore:
+    """Versions bump on every write and track row counts / max timestamps"""
+
+    def test_writes_bump_versions(self, temp_db):
+        transcripts = TranscriptStore(temp_db)
+        analyses = AnalysisStore(temp_db)
+        versions = DataVersionStore(temp_db)
+
+        before = versions.get_versions()
+        transcripts.store(make_transcript('CALL_1', '2026-02-01T09:00:00'))
+        transcripts.store(make_transcript('CALL_2', '2026-02-03T09:00:00'))
+        transcripts.store(make_transcript('CALL_1', '2026-01-15T09:00:00'))  # INSERT OR REPLACE
+
+        after = versions.get_versions()
+        assert after['transcripts']['version'] > before['transcripts']['version']
+        assert after['transcripts']['row_count'] == 2
+        assert after['transcripts']['max_timestamp'] == '2026-02-03T09:00:00'
+        assert after['analysis']['version'] == before['analysis']['version']
+
+        token = versions.get_token(['transcripts', 'analysis'])
+        analyses.store(make_analysis('ANALYSIS_1', 'CALL_1'))
+        assert versions.get_token(['transcripts']) in token
+        assert versions.get_token(['transcripts', 'analysis']) != token
+
+        transcripts.delete('CALL_2')
+        assert versions.get_versions(['transcripts'])['transcripts']['row_count'] == 1
+
+        with pytest.raises(ValueError):
+            versions.get_versions(['messages'])
+
+    def test_existing_tables_are_seeded(self, temp_db):
+        transcripts = TranscriptStore(temp_db)
+        transcripts.store(make_transcript('CALL_1', '2026-02-01T09:00:00'))
+        seeded_version = DataVersionStore(temp_db).get_versions()['transcripts']['version']
+
+        conn = sqlite3.connect(temp_db)
+        for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%_version_%'"
+        ).fetchall():
+            conn.execute(f'DROP TRIGGER {name}')
+        conn.execute("INSERT INTO transcripts (id, customer_id, advisor_id, timestamp, topic, duration) "
+                     "VALUES ('CALL_2', 'CUST_002', 'ADV_001', '2026-02-05T10:00:00', 'escrow', 120)")
+        conn.commit()
+        conn.close()
+
+        reseeded = DataVersionStore(temp_db).get_versions()['transcripts']
+        assert reseeded['row_count'] == 2
+        assert reseeded['max_timestamp'] == '2026-02-05T10:00:00'
+        assert reseeded['version'] > seeded_version
+
+
+class TestForecastCacheWatermark:
+    """Cached forecasts are served while their source data is unchanged"""
+
+    @pytest.fixture
+    def service(self, temp_db, monkeypatch):
+        pytest.importorskip("prophet")
+        from src.services import forecasting_service as forecasting_module
+        from src.services.forecasting_service import ForecastingService
+
+        calls = []
+
+        def fake_train(db_path, forecast_type, horizon_days, start_date, end_date):
+            calls.append(forecast_type)
+            return {
+                'predictions': [{'date': '2026-03-01T00:00:00', 'predicted': 0.4}],
+                'summary': {'prediction_start': '2026-03-01T00:00:00', 'prediction_end': '2026-03-01T00:00:00'},
+                'metadata': {'data_points_used': 20, 'training_start': '2026-02-01T00:00:00',
+                             'training_end': '2026-02-28T00:00:00'}
+            }
+
+        monkeypatch.setattr(forecasting_module, "_train_forecast", fake_train)
+        executor = ThreadPoolExecutor(max_workers=1)
+        TranscriptStore(temp_db)
+        AnalysisStore(temp_db)
+        forecasting = ForecastingService(db_path=temp_db, executor=executor)
+        monkeypatch.setattr(forecasting.forecast_generator, "check_data_readiness",
+                            lambda forecast_type: {'ready': True, 'recommendation': ''})
+        forecasting.train_calls = calls
+        yield forecasting
+        executor.shutdown(wait=True)
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_readiness_check(self, service, monkeypatch):
+        first = await service.generate_forecast('delinquency_risk')
+
+        def no_scan(forecast_type):
+            raise AssertionError("cache hit must not re-check data readiness")
+        monkeypatch.setattr(service.forecast_generator, "check_data_readiness", no_scan)
+
+        second = await service.generate_forecast('delinquency_risk')
+        assert second['cached'] is True
+        assert second['forecast_id'] == first['forecast_id']
+        assert second['data_version'] == service.get_data_version('delinquency_risk')
+
+    @pytest.mark.asyncio
+    async def test_new_data_invalidates_only_dependent_forecasts(self, service):
+        await service.generate_forecast('delinquency_risk')
+        await service.generate_forecast('call_volume_daily')
+
+        # New analysis row: analysis-based forecasts are stale, call volume is not
+        AnalysisStore(service.db_path).store(make_analysis('ANALYSIS_NEW', 'CALL_NEW'))
+
+        assert service.get_cached_forecast('call_volume_daily') is not None
+        assert service.get_cached_forecast('delinquency_risk') is None
+        # The superseded forecast is kept (not served) so it can still be scored
+        assert len(service.forecast_store.get_all_by_type('delinquency_risk')) == 1
+
+        refreshed = await service.generate_forecast('delinquency_risk')
+        assert refreshed['cached'] is False
+        assert service.train_calls == ['delinquency_risk', 'call_volume_daily', 'delinquency_risk']
@@ -0,0 +1,65 @@
+"""
+Test suite for ForecastJobStore - forecast training jobs with request de-duplication
+NO FALLBACK LOGIC - invalid input must fail fast
+"""
+import pytest
+
+from src.storage.forecast_job_store import ForecastJobStore
+
+
+PARAMS = {'horizon_days': 7, 'start_date': None, 'end_date': None, 'ttl_hours': 24}
+
+
+@pytest.fixture
+def job_store(temp_db):
+    return ForecastJobStore(temp_db)
+
+
+class TestForecastJobStore:
+    """Job creation, de-duplication and completion"""
+
+    def test_identical_requests_share_active_job(self, job_store):
+        job, created = job_store.create_or_get_active('call_volume_daily', PARAMS, stale_after_seconds=60)
+        same, joined_created = job_store.create_or_get_active('call_volume_daily', PARAMS, stale_after_seconds=60)
+        other, other_created = job_store.create_or_get_active('call_volume_daily', {**PARAMS, 'horizon_days': 14},
+                                                              stale_after_seconds=60)
+
+        assert created and not joined_created and other_created
+        assert same['id'] == job['id']
+        assert other['id'] != job['id']
+        assert job['status'] == 'QUEUED'
+        assert job['params'] == PARAMS
+
+    def test_finished_job_is_not_joined(self, job_store):
+        job, _ = job_store.create_or_get_active('sentiment_trend', PARAMS, stale_after_seconds=60)
+        job_store.mark_running(job['id'])
+        job_store.complete_job(job['id'], 'FORECAST_1', duration_ms=1200)
+
+        stored = job_store.get_job(job['id'])
+        assert stored['status'] == 'COMPLETED'
+        assert stored['forecast_id'] == 'FORECAST_1'
+        assert stored['started_at'] and stored['completed_at']
+
+        fresh, created = job_store.create_or_get_active('sentiment_trend', PARAMS, stale_after_seconds=60)
+        assert created and fresh['id'] != job['id']
+
+    def test_invalid_transitions_fail_fast(self, job_store):
+        job, _ = job_store.create_or_get_active('churn_risk', PARAMS, stale_after_seconds=60)
+        job_store.fail_job(job['id'], "Prophet training failed: boom")
+
+        with pytest.raises(ValueError):
+            job_store.mark_running(job['id'])
+        with pytest.raises(ValueError):
+            job_store.complete_job(job['id'], 'FORECAST_1', duration_ms=10)
+        with pytest.raises(ValueError):
+            job_store.create_or_get_active('', PARAMS, stale_after_seconds=60)
+        assert job_store.get_job(job['id'])['error'] == "Prophet training failed: boom"
+
+    def test_stale_jobs_are_failed_and_not_joined(self, job_store):
+        job, _ = job_store.create_or_get_active('escalation_rate', PARAMS, stale_after_seconds=60)
+
+        fresh, created = job_store.create_or_get_active('escalation_rate', PARAMS, stale_after_seconds=-1)
+        assert created and fresh['id'] != job['id']
+
+        assert job_store.fail_stale_jobs(stale_after_seconds=-1) == 2
+        assert job_store.list_jobs(status='FAILED', limit=10)[0]['error'].startswith("Forecast job abandoned")
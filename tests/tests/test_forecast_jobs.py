@@ -0,0 +1,128 @@
+"""
+Test suite for forecast generation jobs in ForecastingService
+Training is replaced by a fake on a thread pool - no Prophet fitting
+"""
+import pytest
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+pytest.importorskip("prophet")
+
+from src.services import forecasting_service as forecasting_module
+from src.services.forecasting_service import ForecastingService, ForecastingServiceError
+
+
+def fake_forecast_result(forecast_type):
+    return {
+        'predictions': [{'date': '2026-01-08T00:00:00', 'predicted': 42.0,
+                         'lower_bound': 40.0, 'upper_bound': 44.0, 'confidence_interval': 4.0}],
+        'summary': {'average_predicted': 42.0, 'min_predicted': 42.0, 'max_predicted': 42.0,
+                    'total_periods': 1, 'prediction_start': '2026-01-08T00:00:00',
+                    'prediction_end': '2026-01-08T00:00:00'},
+        'metadata': {'model_type': 'Prophet', 'forecast_type': forecast_type, 'data_points_used': 30,
+                     'training_start': '2025-12-01T00:00:00', 'training_end': '2026-01-07T00:00:00'}
+    }
+
+
+class FakeTrainer:
+    """Blocking stand-in for _train_forecast that counts calls."""
+
+    def __init__(self, delay=0.2, error=None):
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, db_path, forecast_type, horizon_days, start_date, end_date):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)  # CPU-bound fit blocks its worker, never the event loop
+        if self.error:
+            raise Exception(self.error)
+        return fake_forecast_result(forecast_type)
+
+
+@pytest.fixture
+def service(temp_db, monkeypatch):
+    executor = ThreadPoolExecutor(max_workers=2)
+    forecasting = ForecastingService(db_path=temp_db, executor=executor)
+    monkeypatch.setattr(forecasting.forecast_generator, "check_data_readiness",
+                        lambda forecast_type: {'ready': True, 'recommendation': ''})
+    yield forecasting
+    executor.shutdown(wait=True)
+
+
+class TestForecastJobs:
+    """Off-loop training, de-duplication and job results"""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_training_finishes(self, service, monkeypatch):
+        trainer = FakeTrainer(delay=0.2)
+        monkeypatch.setattr(forecasting_module, "_train_forecast", trainer)
+
+        start = time.perf_counter()
+        job = await service.submit_forecast_job('call_volume_daily', horizon_days=7)
+        assert time.perf_counter() - start < 0.1
+        assert job['status'] == 'QUEUED'
+
+        # The event loop keeps running while the model trains
+        ticks = 0
+        while (await service.get_forecast_job(job['id']))['status'] != 'COMPLETED':
+            ticks += 1
+            await asyncio.sleep(0.01)
+        assert ticks > 5
+
+        result = await service.get_forecast_job_result(await service.get_forecast_job(job['id']))
+        assert result['job_id'] == job['id']
+        assert result['summary']['average_predicted'] == 42.0
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_requests_train_once(self, service, monkeypatch):
+        trainer = FakeTrainer(delay=0.1)
+        monkeypatch.setattr(forecasting_module, "_train_forecast", trainer)
+
+        results = await asyncio.gather(*[
+            service.generate_forecast('call_volume_daily', horizon_days=7, use_cache=False)
+            for _ in range(5)
+        ])
+
+        assert trainer.calls == 1
+        assert len({r['forecast_id'] for r in results}) == 1
+        assert all(r['cached'] is False for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cached_forecast_skips_training(self, service, monkeypatch):
+        trainer = FakeTrainer(delay=0)
+        monkeypatch.setattr(forecasting_module, "_train_forecast", trainer)
+
+        first = await service.generate_forecast('sentiment_trend')
+        second = await service.generate_forecast('sentiment_trend')
+
+        assert trainer.calls == 1
+        assert second['cached'] is True
+        assert second['forecast_id'] == first['forecast_id']
+
+    @pytest.mark.asyncio
+    async def test_failed_training_is_recorded(self, service, monkeypatch):
+        monkeypatch.setattr(forecasting_module, "_train_forecast", FakeTrainer(delay=0, error="Prophet training failed: boom"))
+
+        with pytest.raises(ForecastingServiceError, match="boom"):
+            await service.generate_forecast('churn_risk', use_cache=False)
+
+        job = (await service.list_forecast_jobs(limit=1))[0]
+        assert job['status'] == 'FAILED'
+        assert "boom" in job['error']
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_with_active_job(self, service, monkeypatch):
+        monkeypatch.setattr(forecasting_module, "_train_forecast", FakeTrainer(delay=0.3))
+
+        job = await service.submit_forecast_job('escalation_rate')
+        waited = await service.wait_for_forecast_job(job['id'], timeout=0.05)
+
+        assert waited['status'] in ('QUEUED', 'RUNNING')
+        with pytest.raises(ValueError):
+            await service.wait_for_forecast_job('FJOB_MISSING')
+        assert (await service.wait_for_forecast_job(job['id']))['status'] == 'COMPLETED'
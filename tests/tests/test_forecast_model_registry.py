@@ -0,0 +1,108 @@
+"""
+Test suite for the fitted-model registry - reuse, warm-start and cold fits
+Training data is synthetic; models are real Prophet fits
+"""
+import pytest
+import numpy as np
+import pandas as pd
+
+pytest.importorskip("prophet")
+
+from src.analytics.forecasting.forecast_types import ForecastGenerator
+from src.analytics.forecasting.prophet_service import ProphetService
+from src.storage.forecast_model_store import ForecastModelStore, model_key
+
+
+def daily_history(days):
+    ds = pd.date_range('2026-01-01', periods=days, freq='D')
+    return pd.DataFrame({'ds': ds, 'y': 50 + 10 * np.sin(np.arange(days) * 2 * np.pi / 7)})
+
+
+@pytest.fixture
+def generator(temp_db, monkeypatch):
+    generator = ForecastGenerator(temp_db)
+    history = {'df': daily_history(60)}
+    monkeypatch.setattr(generator, "_get_data_for_type", lambda *args: history['df'])
+    generator.history = history
+    return generator
+
+
+class TestForecastModelStore:
+    """Registry rows keyed by forecast type and data window"""
+
+    def test_save_replaces_model_for_key(self, temp_db):
+        store = ForecastModelStore(temp_db)
+        key = model_key('call_volume_daily', None, None)
+        for data_points, fit_mode in ((30, 'cold'), (31, 'warm')):
+            store.save(key, 'call_volume_daily', 'prophet', '{"model": 1}', {'model_type': 'daily'},
+                       '2026-01-01T00:00:00', '2026-01-31T00:00:00', data_points, fit_mode, 120)
+
+        model = store.get(key)
+        assert model['data_points'] == 31
+        assert model['fit_mode'] == 'warm'
+        assert model['model_params'] == {'model_type': 'daily'}
+        assert len(store.list_models()) == 1
+        assert store.get(model_key('call_volume_daily', '2026-01-01', None)) is None
+
+        with pytest.raises(ValueError):
+            store.save(key, 'call_volume_daily', 'prophet', '', {}, '2026-01-01', '2026-01-31', 31, 'cold')
+        assert store.delete_by_type('call_volume_daily') == 1
+
+
+class TestWarmStartForecasting:
+    """ForecastGenerator fits only as much as the data requires"""
+
+    def test_first_forecast_cold_fits_and_registers_model(self, generator):
+        result = generator.generate('call_volume_daily')
+
+        assert result['metadata']['fit_mode'] == 'cold'
+        model = generator.model_store.get(model_key('call_volume_daily', None, None))
+        assert model['data_points'] == 60
+        assert model['training_end'] == result['metadata']['training_end']
+
+    def test_new_horizon_reuses_fitted_model(self, generator, monkeypatch):
+        generator.generate('call_volume_daily', horizon_days=7)
+
+        def no_refit(self, df, **fit_kwargs):
+            raise AssertionError("model must not be refitted")
+        monkeypatch.setattr(ProphetService, "train", no_refit)
+
+        result = generator.generate('call_volume_daily', horizon_days=14)
+
+        assert result['metadata']['fit_mode'] == 'reused'
+        assert len(result['predictions']) == 14
+
+    def test_new_data_warm_starts_from_previous_parameters(self, generator, monkeypatch):
+        generator.generate('call_volume_daily')
+        generator.history['df'] = daily_history(62)
+
+        inits = []
+        original_train = ProphetService.train
+
+        def recording_train(self, df, **fit_kwargs):
+            inits.append(fit_kwargs.get('init'))
+            return original_train(self, df, **fit_kwargs)
+        monkeypatch.setattr(ProphetService, "train", recording_train)
+
+        result = generator.generate('call_volume_daily')
+
+        assert result['metadata']['fit_mode'] == 'warm'
+        assert inits[0] is not None and {'k', 'm', 'delta', 'beta'} <= set(inits[0])
+        assert generator.model_store.get(model_key('call_volume_daily', None, None))['data_points'] == 62
+
+    def test_updated_last_bucket_refits(self, generator):
+        generator.generate('call_volume_daily')
+        history = daily_history(60)
+        history.loc[history.index[-1], 'y'] += 25  # Today's partial bucket filled up
+        generator.history['df'] = history
+
+        result = generator.generate('call_volume_daily')
+
+        assert result['metadata']['fit_mode'] == 'warm'
+        assert generator.generate('call_volume_daily')['metadata']['fit_mode'] == 'reused'
+
+    def test_rewritten_history_cold_fits(self, generator):
+        generator.generate('call_volume_daily')
+        generator.history['df'] = daily_history(60).iloc[1:]  # Same watermark, different history
+
+        assert generator.generate('call_volume_daily')['metadata']['fit_mode'] == 'cold'
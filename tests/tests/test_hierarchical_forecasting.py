@@ -0,0 +1,133 @@
+"""
+Test suite for hierarchical (per-intent / per-advisor) forecasting
+Series come from synthetic data; models are real Prophet fits on a thread pool
+"""
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+pytest.importorskip("prophet")
+
+from src.analytics.forecasting.data_aggregator import DataAggregator
+from src.analytics.forecasting.hierarchical import (
+    HIERARCHICAL_FORECASTS, OTHER_NODE, TOTAL_NODE, load_hierarchy, reconcile
+)
+from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+from src.services.forecasting_service import ForecastingService, ForecastingServiceError
+from src.storage.analysis_store import AnalysisStore
+from src.storage.transcript_store import TranscriptStore
+
+
+def base_forecast(values, variance):
+    return {
+        'predictions': [{'date': f'2026-03-0{i + 1}T00:00:00', 'predicted': v,
+                         'lower_bound': v - 2, 'upper_bound': v + 2, 'confidence_interval': 4}
+                        for i, v in enumerate(values)],
+        'summary': {'prediction_start': '2026-03-01T00:00:00', 'prediction_end': '2026-03-02T00:00:00'},
+        'metadata': {'residual_variance': variance}
+    }
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    TranscriptStore(temp_db)
+    AnalysisStore(temp_db)
+    SyntheticDataGenerator(temp_db, seed=3).populate_database(days=28, base_daily_calls=8)
+    return temp_db
+
+
+class TestReconciliation:
+    """Reconciled child forecasts add up to the total"""
+
+    def test_bottom_up_replaces_total_with_child_sum(self):
+        base = {
+            TOTAL_NODE: base_forecast([100.0, 110.0], 4.0),
+            'a': base_forecast([60.0, 50.0], 1.0),
+            'b': base_forecast([30.0, 45.0], 1.0)
+        }
+        reconciled = reconcile(base, 'bottom_up')
+
+        assert [p['predicted'] for p in reconciled[TOTAL_NODE]['predictions']] == [90.0, 95.0]
+        assert reconciled['a']['predictions'][0]['predicted'] == 60.0
+        assert reconciled[TOTAL_NODE]['predictions'][0]['lower_bound'] == 88.0  # Base width, re-centred
+        assert reconciled[TOTAL_NODE]['metadata']['reconciliation'] == 'bottom_up'
+
+    def test_mint_is_coherent_and_adjusts_noisy_series_most(self):
+        base = {
+            TOTAL_NODE: base_forecast([100.0, 110.0], 1e-6),  # Near-perfect fit
+            'steady': base_forecast([60.0, 50.0], 0.01),
+            'noisy': base_forecast([30.0, 45.0], 25.0)
+        }
+        reconciled = reconcile(base, 'mint')
+
+        values = {node: np.array([p['predicted'] for p in r['predictions']]) for node, r in reconciled.items()}
+        assert values[TOTAL_NODE] == pytest.approx(values['steady'] + values['noisy'])
+        assert values[TOTAL_NODE] == pytest.approx([100.0, 110.0], abs=0.01)
+        assert values['noisy'] == pytest.approx([40.0, 60.0], abs=0.1)
+
+        with pytest.raises(ValueError):
+            reconcile(base, 'top_down')
+
+
+class TestHierarchicalForecasts:
+    """One grouped read, parallel fits and one stored batch"""
+
+    def test_load_hierarchy_zero_fills_and_pools_small_children(self, populated_db):
+        definition = HIERARCHICAL_FORECASTS['advisor_call_volume_daily']
+        series = load_hierarchy(DataAggregator(populated_db), definition, max_children=4)
+
+        assert list(series)[0] == TOTAL_NODE
+        assert len(series) == 5 and OTHER_NODE in series
+        lengths = {len(df) for df in series.values()}
+        assert len(lengths) == 1
+        children_sum = sum(df['y'].values for node, df in series.items() if node != TOTAL_NODE)
+        assert series[TOTAL_NODE]['y'].tolist() == children_sum.tolist()
+        assert series[TOTAL_NODE]['y'].sum() == DataAggregator(populated_db).get_call_volume_data()['y'].sum()
+
+    @pytest.mark.asyncio
+    async def test_generate_reconciles_and_stores_batch(self, populated_db):
+        executor = ThreadPoolExecutor(max_workers=4)
+        service = ForecastingService(db_path=populated_db, executor=executor)
+        try:
+            result = await service.generate_hierarchical_forecast('intent_volume_daily', horizon_days=5)
+        finally:
+            executor.shutdown(wait=True)
+
+        assert result['series_count'] == len(result['children']) + 1 == 9
+        total = np.array([p['predicted'] for p in result['total']['predictions']])
+        children = sum(np.array([p['predicted'] for p in child['predictions']])
+                       for child in result['children'].values())
+        assert total == pytest.approx(children)
+        assert len(total) == 5
+
+        stored = service.forecast_store.get_all_by_type('intent_volume_daily:total')
+        assert [f['id'] for f in stored] == [result['total']['forecast_id']]
+        assert stored[0]['data_version'] == result['data_version']
+        child = next(iter(result['children']))
+        assert service.forecast_store.get_all_by_type(f'intent_volume_daily:{child}')
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests_fail_fast(self, temp_db):
+        service = ForecastingService(db_path=temp_db)
+        with pytest.raises(ForecastingServiceError, match="Invalid hierarchy"):
+            await service.generate_hierarchical_forecast('region_volume')
+        with pytest.raises(ForecastingServiceError, match="reconciliation"):
+            await service.generate_hierarchical_forecast('intent_volume_daily', method='top_down')
+        with pytest.raises(ForecastingServiceError, match="No data"):
+            await service.generate_hierarchical_forecast('intent_volume_daily')
+
+    @pytest.mark.asyncio
+    async def test_ets_hierarchy_fits_all_nodes_in_one_batch(self, populated_db):
+        executor = ThreadPoolExecutor(max_workers=1)
+        service = ForecastingService(db_path=populated_db, executor=executor)
+        try:
+            result = await service.generate_hierarchical_forecast('advisor_call_volume_daily', horizon_days=5)
+        finally:
+            executor.shutdown(wait=True)
+
+        assert HIERARCHICAL_FORECASTS['advisor_call_volume_daily'].engine == 'ets'
+        assert result['total']['metadata']['model_type'] == 'ETS'
+        total = np.array([p['predicted'] for p in result['total']['predictions']])
+        children = sum(np.array([p['predicted'] for p in child['predictions']])
+                       for child in result['children'].values())
+        assert total == pytest.approx(children)
@@ -0,0 +1,94 @@
+"""
+Test suite for InsightGenerator.batch_generate
+Bounded concurrency, per-item timeouts and failures, in-batch deduplication
+"""
+import asyncio
+import pytest
+
+from src.analytics.intelligence.insight_generator import InsightGenerator
+from src.infrastructure.llm.llm_client_v2 import LLMClientV2, LLMProvider, RequestSpec, ResponseEnvelope
+
+
+class FakeProvider(LLMProvider):
+    """Echoes the prompt after a delay; prompts containing SLOW or FAIL misbehave."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def arun(self, spec: RequestSpec) -> ResponseEnvelope:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        prompt = spec.messages[0]['content']
+        try:
+            await asyncio.sleep(5 if 'SLOW' in prompt else self.delay)
+        finally:
+            self.in_flight -= 1
+        if 'FAIL' in prompt:
+            raise RuntimeError("provider unavailable")
+        return ResponseEnvelope(text=prompt, parsed=None, messages=list(spec.messages),
+                                usage=None, response_id=None, latency_ms=0, raw=None)
+
+
+def prompt(audience, forecast='call volume'):
+    return {'prompt_name': 'forecast_summary', 'context': {'audience': audience, 'forecast': forecast}}
+
+
+@pytest.fixture
+def provider():
+    return FakeProvider()
+
+
+@pytest.fixture
+def generator(provider):
+    return InsightGenerator(LLMClientV2(provider=provider))
+
+
+class TestBatchGenerate:
+    """Concurrency, partial results and deduplication"""
+
+    @pytest.mark.asyncio
+    async def test_parallel_batch_is_bounded_and_ordered(self, generator, provider):
+        prompts = [prompt(f"team-{i}") for i in range(12)]
+
+        results = await generator.batch_generate(prompts, parallel=True, max_concurrency=4)
+
+        assert provider.calls == 12 and provider.max_in_flight == 4
+        assert all(r['success'] for r in results)
+        assert all(f"Audience: team-{i}\n" in r['result']['insight']['text'] for i, r in enumerate(results))
+
+    @pytest.mark.asyncio
+    async def test_sequential_batch_runs_one_at_a_time(self, generator, provider):
+        await generator.batch_generate([prompt('a'), prompt('b'), prompt('c')], max_concurrency=8)
+        assert provider.calls == 3 and provider.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_stay_per_item(self, generator, provider):
+        prompts = [prompt('ok-1'), prompt('ops', forecast='SLOW'), prompt('ops', forecast='FAIL'), prompt('ok-2')]
+
+        results = await generator.batch_generate(prompts, parallel=True, item_timeout_seconds=0.5)
+
+        assert [r['success'] for r in results] == [True, False, False, True]
+        assert results[1] == {'success': False, 'prompt_name': 'forecast_summary',
+                              'error': "Insight generation timed out after 0.5s"}
+        assert "provider unavailable" in results[2]['error']
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_generated_once(self, generator, provider):
+        prompts = [prompt('leadership'), prompt('ops'), {**prompt('leadership')}, prompt('leadership', 'churn')]
+
+        results = await generator.batch_generate(prompts, parallel=True)
+
+        assert provider.calls == 3
+        assert results[2]['duplicate_of'] == 0 and 'duplicate_of' not in results[0]
+        assert results[2]['result'] == results[0]['result']
+
+    @pytest.mark.asyncio
+    async def test_invalid_limits_raise(self, generator):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await generator.batch_generate([prompt('a')], parallel=True, max_concurrency=0)
+        with pytest.raises(ValueError, match="item_timeout_seconds"):
+            await generator.batch_generate([prompt('a')], item_timeout_seconds=0)
@@ -0,0 +1,201 @@
+"""
+Test suite for change-driven insight invalidation
+Only cached insights whose recorded dependencies overlap a new transcript, analysis or workflow are touched
+"""
+import asyncio
+import random
+import sqlite3
+import pytest
+
+from src.infrastructure.events import (
+    EventSystem, create_analysis_event, create_transcript_event, create_workflow_created_event
+)
+from src.services.insight_invalidator import InsightInvalidator, change_from_event
+from src.services.precompute_scheduler import PrecomputeScheduler, RefreshTarget
+from src.storage.insight_dependencies import DataChange, DataDependency
+from src.storage.insight_store import InsightStore
+from src.storage.insights_cache_store import InsightsCacheStore
+
+
+@pytest.fixture
+def insight_store(temp_db):
+    return InsightStore(temp_db)
+
+
+@pytest.fixture
+def cache_store(temp_db):
+    # aggregation_cache normally comes from data/insights_schema.sql via SessionStore
+    conn = sqlite3.connect(temp_db)
+    conn.execute('''
+        CREATE TABLE aggregation_cache (
+            cache_key TEXT PRIMARY KEY,
+            query_hash TEXT NOT NULL,
+            aggregated_data TEXT NOT NULL,
+            data_sources TEXT NOT NULL,
+            record_count INTEGER,
+            computation_time_ms INTEGER,
+            created_at TIMESTAMP,
+            expires_at TIMESTAMP,
+            hit_count INTEGER DEFAULT 0,
+            last_accessed TIMESTAMP
+        )
+    ''')
+    conn.commit()
+    conn.close()
+    return InsightsCacheStore(temp_db)
+
+
+def change(table, changed_at='2026-03-10T09:30:00', **attributes):
+    return DataChange(table=table, changed_at=changed_at, attributes=attributes)
+
+
+def cache(store, query, dependencies):
+    return store.store_aggregation(query=query, aggregated_data={'answer': query}, data_sources=['analyses'],
+                                   record_count=1, computation_time_ms=10, dependencies=dependencies)
+
+
+class TestDependencyOverlap:
+    """Table, date range and filters of the recorded footprint"""
+
+    def test_only_overlapping_insights_are_dependents(self, insight_store):
+        insight_store.store('march', 'compliance', 'leadership', {'x': 1}, dependencies=[
+            DataDependency('analysis', date_from='2026-03-01', date_to='2026-03-31')
+        ])
+        insight_store.store('february', 'compliance', 'servicing', {'x': 2}, dependencies=[
+            DataDependency('analysis', date_from='2026-02-01', date_to='2026-02-28')
+        ])
+        insight_store.store('hardship', 'churn', 'marketing', {'x': 3}, dependencies=[
+            DataDependency('transcripts', filters={'topic': ['hardship_assistance', 'payment_inquiry']})
+        ])
+        insight_store.store('untracked', 'roi', 'marketing', {'x': 4})
+
+        assert [d['id'] for d in insight_store.find_dependents(change('analysis'))] == ['march']
+        # Date-only bounds cover the whole day
+        assert [d['id'] for d in insight_store.find_dependents(change('analysis', '2026-03-31T23:59:59'))] == ['march']
+        assert insight_store.find_dependents(change('workflows')) == []
+
+        assert [d['id'] for d in insight_store.find_dependents(change('transcripts', topic='Payment_Inquiry'))] == ['hardship']
+        assert insight_store.find_dependents(change('transcripts', topic='escrow')) == []
+        # A change that doesn't describe the filtered attribute may match it
+        assert [d['id'] for d in insight_store.find_dependents(change('transcripts', urgency='high'))] == ['hardship']
+
+    def test_invalidate_expires_insight_and_its_l1_entry(self, insight_store):
+        insight_store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'stable'},
+                            dependencies=[DataDependency.last_days('transcripts', 30)])
+        assert insight_store.get('leadership_briefing', 'leadership')['summary'] == 'stable'  # now in L1
+
+        assert insight_store.invalidate(['b1']) == 1
+        assert insight_store.get('leadership_briefing', 'leadership') is None
+        assert insight_store.find_dependents(change('transcripts', '2099-01-01T00:00:00')) == []
+        assert insight_store.invalidate(['b1']) == 0
+
+    def test_listing_reports_dependencies(self, insight_store):
+        insight_store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'stable'}, dependencies=[
+            DataDependency('analysis', date_from='2026-03-01', filters={'risk_level': 'high'})
+        ])
+        listed = insight_store.list_cached()
+        assert listed[0]['dependencies'] == [
+            {'table': 'analysis', 'date_from': '2026-03-01', 'date_to': None, 'filters': {'risk_level': 'high'}}
+        ]
+
+        insight_store.clear_cache()
+        conn = sqlite3.connect(insight_store.db_path)
+        assert conn.execute('SELECT COUNT(*) FROM insight_dependencies').fetchone()[0] == 0
+        conn.close()
+
+    def test_cached_answers_expire_only_when_overlapped(self, cache_store):
+        cache(cache_store, 'compliance issues in march?', [DataDependency('analysis', '2026-03-01', '2026-03-31')])
+        cache(cache_store, 'escrow calls?', [DataDependency('transcripts', filters={'topic': 'escrow'})])
+
+        assert cache_store.invalidate_for_change(change('transcripts', topic='payment_inquiry')) == 0
+        assert cache_store.invalidate_for_change(change('analysis')) == 1
+
+        assert cache_store.get_cached_aggregation('compliance issues in march?') is None
+        assert cache_store.get_cached_aggregation('escrow calls?')['aggregated_data'] == {'answer': 'escrow calls?'}
+
+
+class TestInsightInvalidator:
+    """Creation events drive invalidation and background refresh"""
+
+    def test_events_invalidate_only_dependent_insights(self, insight_store):
+        insight_store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'stable'},
+                            dependencies=[DataDependency.last_days('transcripts', 30),
+                                          DataDependency.last_days('analysis', 7)])
+        insight_store.store('w1', 'workflow_backlog', 'servicing', {'open': 3},
+                            dependencies=[DataDependency.last_days('workflows', 7, {'risk_level': 'high'})])
+
+        invalidator = InsightInvalidator(insight_store=insight_store, mode='invalidate')
+        events = EventSystem()
+        invalidator.subscribe(subscriber_name='test_insight_invalidator', event_system=events)
+
+        events.publish(create_workflow_created_event('WF1', 'PLAN1', 'BORROWER', 'pending', 'low', 3))
+        assert insight_store.get('workflow_backlog', 'servicing') is not None
+        assert insight_store.get('leadership_briefing', 'leadership') is not None
+
+        events.publish(create_transcript_event('T1', 'CUST1', 'ADV1', 'payment_inquiry', 'high', 'phone'))
+        assert insight_store.get('leadership_briefing', 'leadership') is None
+        assert insight_store.get('workflow_backlog', 'servicing') is not None
+
+        stats = invalidator.get_stats()
+        assert stats['changes'] == {'workflows': 1, 'transcripts': 1}
+        assert stats['insights_invalidated'] == 1
+
+    def test_refreshable_insights_keep_serving(self, insight_store):
+        insight_store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'stable'},
+                            dependencies=[DataDependency.last_days('analysis', 7)])
+        requested = []
+        invalidator = InsightInvalidator(insight_store=insight_store,
+                                         request_refresh=lambda t: requested.append(t) or True)
+
+        event = create_analysis_event('A1', 'T1', 'CUST1', 'hardship', 'high', 'negative', 0.8)
+        assert change_from_event(event).table == 'analysis'
+        result = invalidator.apply_change(change_from_event(event))
+
+        assert result == {'invalidated': [], 'refreshing': ['leadership_briefing'], 'cache_entries_invalidated': 0}
+        assert requested == ['leadership_briefing']
+        assert insight_store.get('leadership_briefing', 'leadership')['summary'] == 'stable'
+
+    def test_invalid_configuration_fails_fast(self, insight_store):
+        with pytest.raises(ValueError, match="required"):
+            InsightInvalidator()
+        with pytest.raises(ValueError, match="Unknown invalidation mode"):
+            InsightInvalidator(insight_store=insight_store, mode='flush')
+
+
+class TestChangeDrivenRefresh:
+    """Precompute scheduler coalesces change-driven refreshes"""
+
+    @pytest.mark.asyncio
+    async def test_changes_bring_refresh_forward_once(self):
+        refreshes = []
+        gate = asyncio.Event()
+
+        async def refresh():
+            refreshes.append(1)
+            await gate.wait()
+
+        target = RefreshTarget(name='insight:leadership_briefing', ttl_seconds=3600, refresh=refresh,
+                               seconds_to_expiry=lambda: 3000.0)
+        scheduler = PrecomputeScheduler([target], min_interval_seconds=0, change_debounce_seconds=5,
+                                        startup_spread_seconds=0, rng=random.Random(0))
+        assert scheduler.request_refresh('insight:leadership_briefing') is False  # not running yet
+
+        scheduler.start()
+        assert target.next_run_at > scheduler._started_at + 1000
+        assert scheduler.request_refresh('insight:leadership_briefing') is True
+        first_due = target.next_run_at
+        assert first_due <= scheduler._started_at + 6
+        scheduler.request_refresh('insight:leadership_briefing')
+        assert target.next_run_at == first_due  # later changes join the pending refresh
+        assert scheduler.request_refresh('insight:unknown') is False
+
+        target.next_run_at = 0
+        tasks = scheduler.run_due()
+        await asyncio.sleep(0)
+        scheduler.request_refresh('insight:leadership_briefing')  # data changed mid-refresh
+        assert target.stale is True
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        assert refreshes == [1]
+        assert target.next_run_at <= target.last_refresh_at + 5  # rerun for the mid-refresh change
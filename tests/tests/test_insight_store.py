@@ -0,0 +1,157 @@
+"""
+Test suite for InsightStore
+Reads are served from the L1 LRU and never write; access statistics are written behind in batches
+"""
+import sqlite3
+import pytest
+
+from src.storage.insight_store import InsightStore
+
+
+def trace_statements(monkeypatch):
+    """Record every SQL statement issued through sqlite3.connect."""
+    statements = []
+    connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    monkeypatch.setattr(sqlite3, 'connect', tracing_connect)
+    return statements
+
+
+def access_count(db_path, insight_id):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT access_count, last_accessed_at FROM insights WHERE id = ?", (insight_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+
+
+class TestInsightStoreCache:
+    """Two-tier reads and write-behind access statistics"""
+
+    def test_hot_reads_are_served_from_l1(self, temp_db, monkeypatch):
+        store = InsightStore(temp_db, access_flush_hits=1000)
+        store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'stable'})
+
+        first = store.get('leadership_briefing', 'leadership')
+        store.get_by_id('b1')
+        statements = trace_statements(monkeypatch)
+        for _ in range(5):
+            assert store.get('leadership_briefing', 'leadership') == first
+        assert store.get_by_id('b1')['summary'] == 'stable'
+        store.get_by_id('b1')['summary'] = 'mutated'
+
+        assert statements == [s for s in statements if 'insights' not in s]
+        assert store.get_by_id('b1')['summary'] == 'stable'
+
+        stats = store.get_statistics()['l1_cache']
+        assert stats['hits'] == 8 and stats['misses'] == 2 and stats['size'] == 2
+
+    def test_access_counts_are_written_behind_in_one_batch(self, temp_db, monkeypatch):
+        store = InsightStore(temp_db, access_flush_hits=4)
+        store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'a'})
+        store.store('s1', 'marketing_segments', 'marketing', {'segments': []})
+
+        statements = trace_statements(monkeypatch)
+        store.get('leadership_briefing', 'leadership')
+        store.get('leadership_briefing', 'leadership')
+        store.get('marketing_segments', 'marketing')
+        assert not [s for s in statements if s.lstrip().startswith('UPDATE')]
+        assert access_count(temp_db, 'b1')[0] == 0
+
+        store.get_by_id('b1')  # fourth buffered read triggers the flush
+        updates = [s for s in statements if s.lstrip().startswith('UPDATE')]
+        assert len(updates) == 2  # one executemany, one statement per insight
+        assert len([s for s in statements if s == 'BEGIN ']) == 1
+
+        count, last_accessed = access_count(temp_db, 'b1')
+        assert count == 3 and last_accessed
+        assert access_count(temp_db, 's1')[0] == 1
+
+    def test_flush_writes_pending_counts_on_demand(self, temp_db):
+        store = InsightStore(temp_db, access_flush_seconds=3600, access_flush_hits=1000)
+        store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'a'})
+        for _ in range(3):
+            store.get('leadership_briefing', 'leadership')
+
+        assert access_count(temp_db, 'b1')[0] == 0
+        assert store.list_cached()[0]['access_count'] == 3  # reads flush first
+        assert store.flush() == 0
+
+        store.get('leadership_briefing', 'leadership')
+        assert store.flush() == 1
+        assert access_count(temp_db, 'b1')[0] == 4
+
+    def test_writes_invalidate_l1(self, temp_db):
+        store = InsightStore(temp_db, l1_size=2)
+        store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'old'})
+        assert store.get('leadership_briefing', 'leadership')['summary'] == 'old'
+
+        store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'new'})
+        assert store.get('leadership_briefing', 'leadership')['summary'] == 'new'
+        assert store.get_by_id('b1')['summary'] == 'new'
+
+        store.clear_cache(persona='leadership')
+        assert store.get('leadership_briefing', 'leadership') is None
+        assert store.get_by_id('b1') is None
+
+        for i in range(3):
+            store.store(f"m{i}", f"type_{i}", 'marketing', {'i': i})
+            store.get(f"type_{i}", 'marketing')
+        assert store.get_statistics()['l1_cache']['size'] == 2
+
+    @pytest.mark.parametrize('write', ['store', 'invalidate', 'clear_cache'])
+    def test_read_racing_a_write_does_not_repopulate_l1(self, temp_db, monkeypatch, write):
+        store = InsightStore(temp_db)
+        store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'old'})
+        writes = {
+            'store': lambda: store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'new'}),
+            'invalidate': lambda: store.invalidate(['b1']),
+            'clear_cache': lambda: store.clear_cache(),
+        }
+        connect = sqlite3.connect
+        pending = [writes[write]]
+
+        class RacingConnection:
+            """Runs the write after the read's SELECT, before the read populates L1."""
+
+            def __init__(self, conn):
+                self._conn = conn
+
+            def __getattr__(self, name):
+                return getattr(self._conn, name)
+
+            def close(self):
+                self._conn.close()
+                if pending:
+                    pending.pop()()
+
+        monkeypatch.setattr(sqlite3, 'connect', lambda *args, **kwargs: RacingConnection(connect(*args, **kwargs)))
+        assert store.get('leadership_briefing', 'leadership')['summary'] == 'old'  # read before the write
+        monkeypatch.setattr(sqlite3, 'connect', connect)
+
+        assert store.get_statistics()['l1_cache']['size'] == 0
+        current = store.get('leadership_briefing', 'leadership')
+        assert (current or {}).get('summary') == ('new' if write == 'store' else None)
+
+    def test_expired_l1_entries_are_misses(self, temp_db):
+        store = InsightStore(temp_db)
+        store.store('b1', 'leadership_briefing', 'leadership', {'summary': 'a'}, ttl_hours=0)
+        assert store.get('leadership_briefing', 'leadership') is None
+
+        store.store('b2', 'leadership_briefing', 'leadership', {'summary': 'b'})
+        store.get('leadership_briefing', 'leadership')
+        store._l1[('latest', 'leadership_briefing', 'leadership')] = (
+            'b2', '2000-01-01T00:00:00', {'summary': 'stale'}
+        )
+        assert store.get('leadership_briefing', 'leadership')['summary'] == 'b'
+
+    def test_invalid_limits_raise(self, temp_db):
+        with pytest.raises(ValueError, match="access_flush_hits"):
+            InsightStore(temp_db, access_flush_hits=0)
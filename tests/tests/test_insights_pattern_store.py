@@ -0,0 +1,109 @@
+"""
+Test suite for InsightsPatternStore matching
+Indexed lookups rank patterns by token overlap on both index backends
+"""
+import sqlite3
+import pytest
+
+from src.storage.insights_pattern_store import InsightsPatternStore
+
+
+@pytest.fixture
+def patterns_db(temp_db):
+    # insight_patterns normally comes from data/insights_schema.sql via SessionStore
+    conn = sqlite3.connect(temp_db)
+    conn.execute('''
+        CREATE TABLE insight_patterns (
+            pattern_id TEXT PRIMARY KEY,
+            pattern_type TEXT NOT NULL,
+            query_pattern TEXT NOT NULL,
+            successful_approach TEXT NOT NULL,
+            effectiveness_score REAL,
+            usage_count INTEGER DEFAULT 0,
+            executive_roles TEXT,
+            focus_areas TEXT,
+            created_at TIMESTAMP,
+            last_used TIMESTAMP,
+            updated_at TIMESTAMP
+        )
+    ''')
+    conn.commit()
+    conn.close()
+    return temp_db
+
+
+def store(pattern_store, query_pattern, effectiveness=80, **kwargs):
+    return pattern_store.store_pattern('query_classification', query_pattern, {'strategy': query_pattern},
+                                       effectiveness, **kwargs)
+
+
+@pytest.mark.parametrize('backend', ['fts5', 'python'])
+class TestPatternIndex:
+    """Top-k by overlap, maintained on insert, update and delete"""
+
+    def test_patterns_are_ranked_by_overlap(self, patterns_db, backend):
+        patterns = InsightsPatternStore(patterns_db, index_backend=backend)
+        assert patterns.index_backend == backend
+        store(patterns, 'churn risk by segment', effectiveness=60)
+        store(patterns, 'churn trend this month', effectiveness=90)
+        store(patterns, 'advisor coaching needs', effectiveness=95)
+        store(patterns, 'GENERAL', effectiveness=99)
+
+        matches = patterns.get_matching_patterns("What is the churn risk by segment?")
+        assert [(p['query_pattern'], p['match_score']) for p in matches] == [
+            ('churn risk by segment', 1.0),
+            ('churn trend this month', pytest.approx(1 / 3, abs=1e-4)),
+            ('GENERAL', 0.0)
+        ]
+        assert matches[0]['successful_approach'] == {'strategy': 'churn risk by segment'}
+        assert [p['query_pattern'] for p in patterns.get_matching_patterns("churn", limit=1)] == ['churn trend this month']
+
+    def test_role_and_focus_filters_apply_to_indexed_hits(self, patterns_db, backend):
+        patterns = InsightsPatternStore(patterns_db, index_backend=backend)
+        store(patterns, 'compliance breaches by advisor', executive_roles=['CCO'], focus_areas=['compliance'])
+        store(patterns, 'compliance score trend', executive_roles=['VP'])
+        store(patterns, 'compliance summary')
+
+        assert {p['query_pattern'] for p in patterns.get_matching_patterns("compliance", executive_role='CCO')} == {
+            'compliance breaches by advisor', 'compliance summary'
+        }
+        assert {p['query_pattern'] for p in patterns.get_matching_patterns("compliance", focus_area='risk')} == {
+            'compliance score trend', 'compliance summary'
+        }
+
+    def test_index_follows_updates_and_deletes(self, patterns_db, backend):
+        patterns = InsightsPatternStore(patterns_db, index_backend=backend)
+        pattern_id = store(patterns, 'escalation rate by queue', effectiveness=10)
+        for _ in range(5):
+            patterns.update_pattern_usage(pattern_id)
+        assert patterns.get_matching_patterns("escalation queue")[0]['usage_count'] == 5
+
+        conn = sqlite3.connect(patterns_db)
+        conn.execute("UPDATE insight_patterns SET query_pattern = 'handle time by queue' WHERE pattern_id = ?",
+                     (pattern_id,))
+        conn.commit()
+        conn.close()
+        if backend == 'python':
+            patterns = InsightsPatternStore(patterns_db, index_backend=backend)  # other writers: new process
+        assert patterns.get_matching_patterns("escalation") == []
+        assert patterns.get_matching_patterns("handle time")[0]['pattern_id'] == pattern_id
+
+        assert patterns.delete_low_performing_patterns(min_effectiveness=30, min_usage=5) == 1
+        store(patterns, 'first contact resolution')
+        assert patterns.get_matching_patterns("handle time") == []
+        assert len(patterns.get_matching_patterns("first contact resolution")) == 1
+
+
+class TestPatternIndexSetup:
+    """Backend selection and backfill"""
+
+    def test_existing_patterns_are_backfilled_into_fts(self, patterns_db):
+        store(InsightsPatternStore(patterns_db, index_backend='python'), 'churn risk by segment')
+
+        patterns = InsightsPatternStore(patterns_db)
+        assert patterns.index_backend == 'fts5'
+        assert patterns.get_matching_patterns("segment churn")[0]['match_score'] == 1.0
+
+    def test_invalid_backend_raises(self, patterns_db):
+        with pytest.raises(ValueError, match="index_backend"):
+            InsightsPatternStore(patterns_db, index_backend='trigram')
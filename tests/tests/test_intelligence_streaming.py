@@ -0,0 +1,131 @@
+"""
+Test suite for token streaming of intelligence answers
+Answer text arrives as decoded tokens before the completed result, which matches the non-streaming answer
+"""
+import json
+import pytest
+
+from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+from src.analytics.intelligence.insight_generator import InsightGenerator
+from src.infrastructure.llm.fake_provider import FakeStreamingProvider
+from src.infrastructure.llm.json_field_stream import JsonFieldStream
+from src.infrastructure.llm.llm_client_v2 import LLMClientV2, RequestSpec
+from src.services.intelligence_service import IntelligenceService, IntelligenceServiceError
+from src.storage.analysis_store import AnalysisStore
+from src.storage.insight_store import InsightStore
+from src.storage.transcript_store import TranscriptStore
+from src.storage.workflow_store import WorkflowStore
+
+
+STRATEGY = json.dumps({'strategy_type': 'portfolio_risk', 'reasoning': 'Risk is the question.'})
+ANSWER = json.dumps({'content': 'Risk sits in "hardship" calls — up 12%.\nAct now 🚀', 'confidence': 'high'})
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    TranscriptStore(temp_db)
+    AnalysisStore(temp_db)
+    WorkflowStore(temp_db)
+    SyntheticDataGenerator(temp_db, seed=8).populate_database(days=5, base_daily_calls=3)
+    return temp_db
+
+
+class FakeHybridAnalyzer:
+    def __init__(self, provider):
+        self.insight_generator = InsightGenerator(LLMClientV2(provider=provider))
+
+
+def feed_all(stream, text, size):
+    return ''.join(stream.feed(text[i:i + size]) for i in range(0, len(text), size))
+
+
+class TestJsonFieldStream:
+    """Decoding one string field of partial JSON"""
+
+    @pytest.mark.parametrize('size', [1, 2, 3, 7, 1000])
+    def test_decodes_field_across_any_chunking(self, size):
+        stream = JsonFieldStream('content')
+        text = json.dumps({'title': 'x', 'content': 'a "quoted" \\ line\n\tend é 🚀', 'other': 'ignored'})
+        assert feed_all(stream, text, size) == 'a "quoted" \\ line\n\tend é 🚀'
+        assert stream.done
+
+    def test_plain_text_passes_through(self):
+        stream = JsonFieldStream('content')
+        assert feed_all(stream, '  Risk is rising.', 3) == '  Risk is rising.'
+        assert not stream.done
+
+    def test_missing_field_yields_nothing(self):
+        stream = JsonFieldStream('content')
+        assert feed_all(stream, '{"summary": "no content here"}', 4) == ''
+
+
+class TestStreamingGeneration:
+    """Fake provider and InsightGenerator.generate_stream"""
+
+    @pytest.mark.asyncio
+    async def test_fake_provider_streams_chunks(self):
+        provider = FakeStreamingProvider(['hello world'], chunk_chars=4)
+        spec = RequestSpec(messages=[{'role': 'user', 'content': 'hi'}])
+        chunks = [chunk.text async for chunk in provider.astream(spec)]
+        assert chunks == ['hell', 'o wo', 'rld']
+
+        with pytest.raises(RuntimeError, match="no scripted answer"):
+            await provider.arun(spec)
+
+    @pytest.mark.asyncio
+    async def test_stream_result_matches_generate(self):
+        generator = InsightGenerator(LLMClientV2(provider=FakeStreamingProvider(ANSWER, chunk_chars=5)))
+        context = {'query': 'risk?', 'strategy': {}, 'data_result': {}, 'understanding': {}}
+
+        events = [event async for event in generator.generate_stream(
+            'insights/response/strategic_executive_response', context)]
+        generated = await generator.generate('insights/response/strategic_executive_response', context)
+
+        assert [event['type'] for event in events[-1:]] == ['result']
+        assert len(events) > 2
+        assert ''.join(event['text'] for event in events[:-1]) == json.loads(ANSWER)['content']
+        assert events[-1]['result']['insight'] == generated['insight']
+        assert events[-1]['result']['metadata']['time_to_first_token_ms'] is not None
+
+
+class TestAskStream:
+    """IntelligenceService.ask_stream event order and result"""
+
+    @pytest.mark.asyncio
+    async def test_events_arrive_in_order_and_match_ask(self, populated_db):
+        provider = FakeStreamingProvider([STRATEGY, ANSWER, STRATEGY, ANSWER], chunk_chars=3)
+        service = IntelligenceService(FakeHybridAnalyzer(provider), InsightStore(db_path=populated_db),
+                                      db_path=populated_db)
+        try:
+            events = [event async for event in service.ask_stream("Where is risk concentrated?", persona='leadership')]
+            answered = await service.ask("Where is risk concentrated?", persona='leadership')
+        finally:
+            service.snapshot_engine.shutdown()
+
+        types = [event['type'] for event in events]
+        assert types[:2] == ['snapshot_ready', 'strategy']
+        assert set(types[2:-1]) == {'token'} and types[-1] == 'completed'
+
+        assert events[0]['persona'] == 'leadership'
+        assert 'leadership' in events[0]['snapshot_build_ms']
+        assert events[1]['strategy']['strategy_type'] == 'portfolio_risk'
+
+        completed = events[-1]
+        assert ''.join(event['text'] for event in events[2:-1]) == completed['result']['answer']
+        assert completed['result']['answer'] == answered['answer']
+        assert completed['result']['response'] == answered['response']
+        assert completed['timing']['time_to_first_token_ms'] <= completed['timing']['total_ms']
+
+    @pytest.mark.asyncio
+    async def test_generation_failure_raises_service_error(self, populated_db):
+        service = IntelligenceService(FakeHybridAnalyzer(FakeStreamingProvider([STRATEGY])),
+                                      InsightStore(db_path=populated_db), db_path=populated_db)
+        try:
+            events = []
+            with pytest.raises(IntelligenceServiceError, match="Failed to answer"):
+                async for event in service.ask_stream("Where is risk concentrated?", persona='leadership'):
+                    events.append(event['type'])
+        finally:
+            service.snapshot_engine.shutdown()
+
+        assert events == ['snapshot_ready', 'strategy']
@@ -0,0 +1,140 @@
+"""
+Test suite for LeadershipInsightsAgent retrieval modes
+Planned retrieval: one planning LLM call, concurrent source searches, fallback round only when empty
+"""
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.call_center_agents.leadership_insights_agent import LeadershipInsightsAgent
+
+UNDERSTANDING = {'core_intent': 'compliance_review', 'focus_area': 'compliance', 'confidence': 80}
+SUMMARY = {'brief_summary': 'Found compliance issues.', 'content': 'Found compliance issues.', 'confidence': 85}
+
+
+class FakeLLM:
+    """Answers by prompt type and records each call."""
+
+    def __init__(self, plan=None, thoughts=None):
+        self.plan = plan
+        self.thoughts = list(thoughts or [])
+        self.prompts = []
+
+    async def arun(self, messages, options=None):
+        prompt = messages[0]['content']
+        self.prompts.append(prompt)
+        await asyncio.sleep(0.01)
+        if 'planning the data search' in prompt:
+            return SimpleNamespace(text=json.dumps(self.plan))
+        if 'understanding leadership queries' in prompt:
+            return SimpleNamespace(text=json.dumps(UNDERSTANDING))
+        if 'helping search for data' in prompt:
+            return SimpleNamespace(text=json.dumps(self.thoughts.pop(0)))
+        return SimpleNamespace(text=json.dumps(SUMMARY))
+
+
+class FakeDataReader:
+    """Sources that take 50ms each; records search order."""
+
+    def __init__(self, records):
+        self.records = records
+        self.searched = []
+
+    async def _search(self, source, filters):
+        self.searched.append((source, filters))
+        await asyncio.sleep(0.05)
+        return self.records.get(source, [])
+
+    async def get_analyses(self, filters):
+        return await self._search('analyses', filters)
+
+    async def get_transcripts(self, filters):
+        return await self._search('transcripts', filters)
+
+
+def plan(searches, fallback=(), action='search'):
+    return {
+        'understanding': UNDERSTANDING,
+        'narration': '🔍 Checking sources together',
+        'action': action,
+        'searches': [{'source': s, 'filters': {'limit': 10}} for s in searches],
+        'fallback_searches': [{'source': s} for s in fallback],
+        'reason': 'no data source covers this'
+    }
+
+
+class TestPlannedRetrieval:
+    """One planning call, concurrent searches"""
+
+    @pytest.mark.asyncio
+    async def test_planned_sources_are_searched_concurrently_with_two_llm_calls(self):
+        llm = FakeLLM(plan=plan(['analyses', 'transcripts', 'weather']))
+        reader = FakeDataReader({'analyses': [{'id': 1}, {'id': 2}], 'transcripts': [{'id': 3}]})
+        agent = LeadershipInsightsAgent(llm, reader, retrieval_mode='planned')
+
+        started = time.perf_counter()
+        response = await agent.process_query("Any compliance issues this week?", executive_role='CCO')
+        elapsed = time.perf_counter() - started
+
+        assert len(llm.prompts) == 2  # plan + summary
+        assert elapsed < 0.1  # both 50ms searches overlapped (serial: 0.12s)
+        assert sorted(source for source, _ in reader.searched) == ['analyses', 'transcripts']
+        assert reader.searched[0][1] == {'limit': 10}
+
+        metadata = response['metadata']
+        assert metadata['retrieval'] == {'mode': 'planned', 'llm_calls': 2, 'rounds': 1,
+                                         'sources_searched': ['analyses', 'transcripts'],
+                                         'searches': [{'source': 'analyses', 'filters': {'limit': 10}},
+                                                      {'source': 'transcripts', 'filters': {'limit': 10}}]}
+        assert metadata['records_analyzed'] == 3
+        assert metadata['query_understanding']['focus_area'] == 'compliance'
+
+    @pytest.mark.asyncio
+    async def test_fallback_round_runs_only_when_first_round_is_empty(self):
+        reader = FakeDataReader({'transcripts': [{'id': 3}]})
+        agent = LeadershipInsightsAgent(FakeLLM(plan=plan(['analyses'], fallback=['transcripts'])), reader,
+                                        retrieval_mode='planned')
+        response = await agent.process_query("Any compliance issues this week?")
+        assert response['metadata']['retrieval']['rounds'] == 2
+        assert response['metadata']['data_sources_used'] == ['transcripts']
+
+        reader = FakeDataReader({'analyses': [{'id': 1}], 'transcripts': [{'id': 3}]})
+        agent = LeadershipInsightsAgent(FakeLLM(plan=plan(['analyses'], fallback=['transcripts'])), reader,
+                                        retrieval_mode='planned')
+        response = await agent.process_query("Any compliance issues this week?")
+        assert response['metadata']['retrieval']['rounds'] == 1
+        assert [source for source, _ in reader.searched] == ['analyses']
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_plan_stops_before_searching(self):
+        reader = FakeDataReader({})
+        agent = LeadershipInsightsAgent(FakeLLM(plan=plan([], action='fail_fast')), reader, retrieval_mode='planned')
+        with pytest.raises(Exception, match="no data source covers this"):
+            await agent.process_query("What is the weather?")
+        assert reader.searched == []
+
+
+class TestSequentialRetrieval:
+    """Previous one-thought-per-source loop stays available"""
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_pays_one_llm_call_per_source(self):
+        thoughts = [
+            {'narration': '🔍 analyses', 'action': 'search', 'source': 'analyses', 'filters': {}},
+            {'narration': '🔍 transcripts', 'action': 'search', 'source': 'transcripts', 'filters': {}},
+            {'narration': '📊 done', 'action': 'summarize'}
+        ]
+        llm = FakeLLM(thoughts=thoughts)
+        reader = FakeDataReader({'analyses': [{'id': 1}], 'transcripts': [{'id': 3}]})
+        agent = LeadershipInsightsAgent(llm, reader, retrieval_mode='sequential')
+
+        response = await agent.process_query("Any compliance issues this week?")
+        assert response['metadata']['retrieval']['llm_calls'] == len(llm.prompts) == 5
+        assert response['metadata']['data_sources_used'] == ['analyses', 'transcripts']
+
+    def test_invalid_mode_raises(self):
+        with pytest.raises(ValueError, match="retrieval_mode"):
+            LeadershipInsightsAgent(FakeLLM(), FakeDataReader({}), retrieval_mode='parallel')
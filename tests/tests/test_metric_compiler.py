@@ -0,0 +1,121 @@
+"""
+Test suite for persona metric compilation
+Specs over one base relation fuse into a single conditional-aggregate query
+"""
+import sqlite3
+import pytest
+
+from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+from src.analytics.intelligence.hybrid_analyzer import HybridAnalyzer
+from src.analytics.personas.leadership import LeadershipPersona
+from src.analytics.personas.marketing import MarketingPersona
+from src.analytics.personas.metric_compiler import MetricCompiler, MetricSpec, CALLS, ANALYSIS
+from src.storage.analysis_store import AnalysisStore
+from src.storage.transcript_store import TranscriptStore
+from src.storage.workflow_store import WorkflowStore
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    TranscriptStore(temp_db)
+    AnalysisStore(temp_db)
+    WorkflowStore(temp_db)
+    SyntheticDataGenerator(temp_db, seed=5).populate_database(days=10, base_daily_calls=8)
+    return temp_db
+
+
+def query_one(db_path, sql):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql).fetchone()
+    finally:
+        conn.close()
+
+
+class TestMetricCompiler:
+    """SQL generation and validation"""
+
+    def test_specs_fuse_per_base_relation(self):
+        queries = MetricCompiler().compile([
+            MetricSpec('refi', CALLS, 'count_distinct', 't.customer_id', 'a.refinance_likelihood > 0.7'),
+            MetricSpec('recent', ANALYSIS, 'avg', 'churn_risk', "created_at >= '2026-01-01'"),
+            MetricSpec('avg_churn', CALLS, 'avg', 'a.churn_risk'),
+            MetricSpec('recent_count', ANALYSIS, filter="created_at >= '2026-01-01'"),
+        ])
+
+        assert [q.names for q in queries] == [('refi', 'avg_churn'), ('recent', 'recent_count')]
+        assert queries[0].sql == (
+            f"SELECT COUNT(DISTINCT CASE WHEN a.refinance_likelihood > 0.7 THEN t.customer_id END), "
+            f"AVG(a.churn_risk) FROM {CALLS}"
+        )
+        # A filter shared by every spec stays in WHERE
+        assert queries[1].sql == "SELECT AVG(churn_risk), COUNT(*) FROM analysis WHERE created_at >= '2026-01-01'"
+
+    def test_distinct_filters_are_unioned_in_where(self):
+        query, = MetricCompiler().compile([
+            MetricSpec('high_churn', ANALYSIS, filter='churn_risk > 0.7'),
+            MetricSpec('high_delinq', ANALYSIS, 'sum', 'delinquency_risk', 'delinquency_risk > 0.7'),
+        ], group_by='primary_intent')
+
+        assert query.sql == (
+            "SELECT primary_intent, COUNT(CASE WHEN churn_risk > 0.7 THEN 1 END), "
+            "SUM(CASE WHEN delinquency_risk > 0.7 THEN delinquency_risk END) FROM analysis "
+            "WHERE (churn_risk > 0.7) OR (delinquency_risk > 0.7) GROUP BY primary_intent ORDER BY primary_intent"
+        )
+
+    def test_invalid_specs_raise(self):
+        with pytest.raises(ValueError, match="median"):
+            MetricSpec('x', ANALYSIS, 'median', 'churn_risk')
+        with pytest.raises(ValueError, match="only 'count'"):
+            MetricSpec('x', ANALYSIS, 'avg')
+        with pytest.raises(ValueError, match="Duplicate metric name: x"):
+            MetricCompiler().compile([MetricSpec('x', ANALYSIS), MetricSpec('x', CALLS)])
+
+
+class TestFusedPersonaMetrics:
+    """Fused metrics equal their standalone queries, in fewer scans"""
+
+    def test_customer_segments_take_one_query(self, populated_db):
+        marketing = MarketingPersona(populated_db)
+        segments = {s['segment_id']: s for s in marketing.get_customer_segments()}
+
+        assert marketing.get_query_stats() == {'metrics': 9, 'queries_executed': 1, 'queries_fused': 8}
+        at_risk = query_one(populated_db, f"""
+            SELECT COUNT(DISTINCT t.customer_id), AVG(a.churn_risk), AVG(a.delinquency_risk) FROM {CALLS}
+            WHERE a.churn_risk > 0.6 OR a.delinquency_risk > 0.6
+        """)
+        assert (segments['at_risk']['count'], segments['at_risk']['avg_churn_risk'],
+                segments['at_risk']['avg_delinq_risk']) == at_risk
+        refi = query_one(populated_db, f"""
+            SELECT COUNT(DISTINCT t.customer_id), AVG(a.refinance_likelihood) FROM {CALLS}
+            WHERE a.refinance_likelihood > 0.7
+        """)
+        assert (segments['refi_ready']['count'], segments['refi_ready']['avg_score']) == refi
+
+    def test_leadership_metrics_scan_each_table_once(self, populated_db):
+        leadership = LeadershipPersona(populated_db)
+        metrics = leadership.get_key_metrics()
+
+        assert leadership.get_query_stats() == {'metrics': 11, 'queries_executed': 3, 'queries_fused': 8}
+        issues, recent = query_one(populated_db, """
+            SELECT
+                (SELECT SUM(COALESCE(compliance_issues, 0)) FROM analysis
+                 WHERE created_at >= datetime('now', '-30 days')),
+                (SELECT AVG(delinquency_risk) FROM analysis WHERE created_at >= datetime('now', '-7 days'))
+        """)
+        assert metrics['compliance']['issue_count'] == (issues or 0)
+        assert metrics['trend_metrics']['recent_delinquency'] == pytest.approx(recent or 0)
+
+    def test_raw_data_intents_come_from_one_grouped_scan(self, populated_db):
+        analyzer = HybridAnalyzer(forecasting_service=None, llm_client=object(), db_path=populated_db)
+        data = analyzer._get_raw_data('churn_risk')
+
+        conn = sqlite3.connect(populated_db)
+        churn_intents = conn.execute("""
+            SELECT primary_intent, COUNT(*) FROM analysis WHERE churn_risk > 0.5
+            GROUP BY primary_intent ORDER BY COUNT(*) DESC, primary_intent LIMIT 5
+        """).fetchall()
+        conn.close()
+        assert [(i['intent'], i['count']) for i in data['churn_risk_intents']] == churn_intents
+        assert sum(i['count'] for i in data['top_intents']) <= data['transcript_count']
+        assert analyzer.metric_compiler.get_stats() == {'metrics': 2, 'queries_executed': 1, 'queries_fused': 1}
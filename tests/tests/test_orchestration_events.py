@@ -0,0 +1,120 @@
+"""
+Test suite for orchestration run event streaming
+Uses a fake pipeline runner and a temporary job store - no LLM access
+"""
+import pytest
+import asyncio
+
+from src.infrastructure.events import create_workflow_executed_event
+from src.services.orchestration.pipeline_scheduler import PipelineScheduler
+from src.services.orchestration.run_events import OrchestrationEventBroker, stream_run_events
+from src.storage.pipeline_job_store import PipelineJobStore
+
+
+@pytest.fixture
+def job_store(temp_db):
+    return PipelineJobStore(temp_db)
+
+
+@pytest.fixture
+def broker():
+    return OrchestrationEventBroker()
+
+
+async def fake_pipeline(transcript_id, auto_approve, stage_limits=None,
+                        resume_from=None, checkpoint_callback=None):
+    """Reports the same stages as SimplePipeline without doing any work."""
+    checkpoint_callback("ANALYSIS_COMPLETED", {"analysis_id": f"A_{transcript_id}"})
+    await asyncio.sleep(0.01)
+    checkpoint_callback("PLAN_COMPLETED", {"plan_id": f"P_{transcript_id}"})
+    checkpoint_callback("WORKFLOWS_COMPLETED", {"workflow_ids": [f"WF_{transcript_id}"], "workflow_count": 1})
+    checkpoint_callback("EXECUTION_COMPLETED", {"executed_count": 1, "failed_count": 0})
+    checkpoint_callback("COMPLETE", {})
+    return {"transcript_id": transcript_id, "success": True}
+
+
+async def _collect(stream):
+    return [event async for event in stream]
+
+
+class TestOrchestrationEventBroker:
+    """Publishing, replay and workflow event routing"""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_events_in_order(self, broker):
+        queue = broker.subscribe("RUN_1")
+
+        broker.publish("RUN_1", "stage", "CALL_A", stage="ANALYSIS_COMPLETED")
+        broker.publish("RUN_2", "stage", "CALL_B", stage="ANALYSIS_COMPLETED")
+        broker.publish("RUN_1", "stage", "CALL_A", stage="PLAN_COMPLETED")
+
+        first, second = queue.get_nowait(), queue.get_nowait()
+        assert [first["stage"], second["stage"]] == ["ANALYSIS_COMPLETED", "PLAN_COMPLETED"]
+        assert [first["id"], second["id"]] == [1, 2]
+        assert queue.empty()
+
+        broker.unsubscribe("RUN_1", queue)
+        assert broker.subscriber_count("RUN_1") == 0
+
+    @pytest.mark.asyncio
+    async def test_replays_missed_events(self, broker):
+        for stage in ("ANALYSIS_COMPLETED", "PLAN_COMPLETED", "WORKFLOWS_COMPLETED"):
+            broker.publish("RUN_1", "stage", "CALL_A", stage=stage)
+
+        queue = broker.subscribe("RUN_1", last_event_id=1)
+
+        assert [queue.get_nowait()["stage"] for _ in range(2)] == ["PLAN_COMPLETED", "WORKFLOWS_COMPLETED"]
+
+    @pytest.mark.asyncio
+    async def test_routes_workflow_execution_events(self, broker):
+        broker.track_workflows("RUN_1", "CALL_A", ["WF_1"])
+        queue = broker.subscribe("RUN_1")
+
+        for workflow_id, status in (("WF_1", "failed"), ("WF_OTHER", "executed")):
+            event = create_workflow_executed_event(workflow_id, status, None, 0, 0, 5, "tester", error="boom")
+            broker.handle_workflow_event(None, event_type=event.event_type, payload=event.payload)
+
+        routed = queue.get_nowait()
+        assert routed["type"] == "workflow_failed"
+        assert routed["transcript_id"] == "CALL_A"
+        assert routed["error"] == "boom"
+        assert queue.empty()  # untracked workflows are ignored
+
+
+class TestRunEventStream:
+    """Scheduler events consumed through stream_run_events"""
+
+    @pytest.mark.asyncio
+    async def test_stream_follows_run_to_completion(self, job_store, broker):
+        job_store.create_run("RUN_1", ["CALL_A", "CALL_B"], False)
+        scheduler = PipelineScheduler("RUN_1", job_store, max_concurrent=2, pipeline_runner=fake_pipeline,
+                                      poll_interval=0.01, event_broker=broker)
+
+        stream_task = asyncio.create_task(_collect(stream_run_events("RUN_1", job_store, broker=broker)))
+        await asyncio.sleep(0)
+        await scheduler.run()
+        events = await asyncio.wait_for(stream_task, timeout=1)
+
+        stages = [e["stage"] for e in events if e["type"] == "stage" and e["transcript_id"] == "CALL_A"]
+        assert stages == ["ANALYSIS_COMPLETED", "PLAN_COMPLETED", "WORKFLOWS_COMPLETED",
+                          "EXECUTION_COMPLETED", "COMPLETE"]
+        assert sum(1 for e in events if e["type"] == "job_finished" and e["status"] == "COMPLETED") == 2
+        assert events[-1]["type"] == "run_finished"
+        assert events[-1]["summary"]["successful"] == 2
+        assert broker.subscriber_count("RUN_1") == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_for_run_finished_elsewhere(self, job_store, broker):
+        job_store.create_run("RUN_1", ["CALL_A"], False)
+        job_store.cancel_run("RUN_1")
+        job_store.finalize_run_if_done("RUN_1")
+
+        events = await _collect(stream_run_events("RUN_1", job_store, broker=broker))
+
+        assert [e["type"] for e in events] == ["run_finished"]
+        assert events[0]["status"] == "CANCELLED"
+
+    @pytest.mark.asyncio
+    async def test_stream_unknown_run_fails_fast(self, job_store, broker):
+        with pytest.raises(ValueError):
+            await _collect(stream_run_events("RUN_MISSING", job_store, broker=broker))
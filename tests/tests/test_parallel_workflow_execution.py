@@ -0,0 +1,137 @@
+"""
+Test suite for concurrent workflow execution in WorkflowExecutionEngine.
+Workflow execution and adapters are faked - no LLM calls.
+"""
+import pytest
+import asyncio
+import threading
+import time
+
+from src.infrastructure.events import EventSystemError
+from src.services import workflow_execution_engine
+from src.services.workflow_execution_engine import WorkflowExecutionEngine
+
+
+@pytest.fixture
+def execution_engine(temp_db, monkeypatch):
+    """Execution engine with small, explicit concurrency limits."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-api-key-123456")
+    return WorkflowExecutionEngine(
+        temp_db,
+        max_concurrent_workflows=20,
+        adapter_limits={"default": 5, "email": 2}
+    )
+
+
+class SlowAdapter:
+    """Synchronous adapter that records how many calls overlap."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def execute(self, workflow, parameters):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return {"payload": {"ok": True}, "status": "sent"}
+
+
+class TestParallelWorkflowExecution:
+    """Bounded concurrency, error isolation and timing for execute_multiple_workflows."""
+
+    @pytest.mark.asyncio
+    async def test_batch_takes_time_of_slowest_workflow(self, execution_engine, monkeypatch):
+        async def fake_execute(workflow_id, executed_by="system_executor"):
+            await asyncio.sleep(0.1)
+            return {"workflow_id": workflow_id, "status": "executed", "execution_duration_ms": 100}
+
+        monkeypatch.setattr(execution_engine, "execute_workflow", fake_execute)
+
+        ids = [f"wf_{i}" for i in range(20)]
+        result = await execution_engine.execute_multiple_workflows(ids)
+        summary = result["execution_summary"]
+
+        assert summary["success_count"] == 20
+        assert summary["summed_duration_ms"] == 2000
+        assert summary["wall_clock_ms"] < 1000
+        assert [r["workflow_id"] for r in result["successful_executions"]] == ids
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated(self, execution_engine, monkeypatch):
+        async def fake_execute(workflow_id, executed_by="system_executor"):
+            if workflow_id == "wf_bad":
+                raise Exception("adapter exploded")
+            return {"workflow_id": workflow_id, "status": "executed", "execution_duration_ms": 5}
+
+        monkeypatch.setattr(execution_engine, "execute_workflow", fake_execute)
+
+        result = await execution_engine.execute_multiple_workflows(["wf_1", "wf_bad", "wf_2"])
+
+        assert result["execution_summary"]["success_count"] == 2
+        assert result["execution_summary"]["failure_count"] == 1
+        assert result["failed_executions"][0]["workflow_id"] == "wf_bad"
+        assert "adapter exploded" in result["failed_executions"][0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_bounds_batch(self, execution_engine, monkeypatch):
+        active = {"now": 0, "peak": 0}
+
+        async def fake_execute(workflow_id, executed_by="system_executor"):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return {"workflow_id": workflow_id, "status": "executed", "execution_duration_ms": 10}
+
+        monkeypatch.setattr(execution_engine, "execute_workflow", fake_execute)
+
+        await execution_engine.execute_multiple_workflows([f"wf_{i}" for i in range(10)], max_concurrent=3)
+
+        assert active["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_adapter_limit_bounds_in_flight_calls(self, execution_engine):
+        adapter = SlowAdapter()
+        execution_engine.adapters["email"] = adapter
+
+        await asyncio.gather(*[
+            execution_engine._call_adapter("email", {"id": f"wf_{i}"}, {"step_number": 1})
+            for i in range(6)
+        ])
+
+        assert adapter.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_concurrent_fails_fast(self, execution_engine):
+        with pytest.raises(ValueError):
+            await execution_engine.execute_multiple_workflows(["wf_1"], max_concurrent=0)
+
+    @pytest.mark.asyncio
+    async def test_event_publish_error_does_not_fail_executed_workflow(self, execution_engine, monkeypatch):
+        workflow = {
+            "id": "wf_1", "status": "APPROVED", "workflow_type": "BORROWER", "plan_id": "PLAN_1",
+            "workflow_data": {"steps": [{"step_number": 1, "action": "Send email", "tool_needed": "email"}]}
+        }
+        execution_engine.adapters["email"] = SlowAdapter(delay=0)
+        monkeypatch.setattr(execution_engine.workflow_store, "get_by_id", lambda workflow_id: workflow)
+        monkeypatch.setattr(execution_engine.workflow_store, "update_status", lambda **kwargs: True)
+
+        async def create(record):
+            return "EXEC_1"
+
+        def failing_publish(event):
+            raise EventSystemError("subscriber exploded")
+
+        monkeypatch.setattr(execution_engine.execution_store, "create", create)
+        monkeypatch.setattr(workflow_execution_engine, "publish_event", failing_publish)
+
+        result = await execution_engine.execute_workflow("wf_1")
+
+        assert result["status"] == "executed"
+        assert result["successful_steps"] == 1
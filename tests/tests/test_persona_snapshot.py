@@ -0,0 +1,125 @@
+"""
+Test suite for the persona snapshot engine
+Concurrent blocks must match the serial persona calls; memoized blocks follow the data version
+"""
+import sqlite3
+import threading
+import pytest
+
+from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+from src.analytics.personas import base_persona
+from src.analytics.personas.leadership import LeadershipPersona
+from src.analytics.personas.marketing import MarketingPersona
+from src.analytics.personas.servicing_ops import ServicingOpsPersona
+from src.analytics.personas.snapshot import PersonaSnapshotEngine
+from src.services.intelligence_service import IntelligenceService
+from src.storage.analysis_store import AnalysisStore
+from src.storage.insight_store import InsightStore
+from src.storage.transcript_store import TranscriptStore
+from src.storage.workflow_store import WorkflowStore
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    TranscriptStore(temp_db)
+    AnalysisStore(temp_db)
+    WorkflowStore(temp_db)
+    SyntheticDataGenerator(temp_db, seed=8).populate_database(days=10, base_daily_calls=5)
+    return temp_db
+
+
+def personas(db_path):
+    return {'leadership': LeadershipPersona(db_path), 'servicing': ServicingOpsPersona(db_path),
+            'marketing': MarketingPersona(db_path)}
+
+
+class FakeInsightGenerator:
+    async def generate(self, prompt_name, context, **kwargs):
+        return {'insight': {'content': f"answer from {prompt_name}"}}
+
+
+class FakeHybridAnalyzer:
+    insight_generator = FakeInsightGenerator()
+
+
+class TestPersonaSnapshotEngine:
+    """Concurrency, memoization and connection reuse"""
+
+    @pytest.mark.asyncio
+    async def test_blocks_match_serial_persona_calls(self, populated_db):
+        serial = personas(populated_db)
+        engine = PersonaSnapshotEngine(personas(populated_db), populated_db, max_workers=3)
+        try:
+            built = await engine.build(['leadership', 'servicing', 'marketing'])
+        finally:
+            engine.shutdown()
+
+        assert built['personas']['leadership']['metrics'] == serial['leadership'].get_key_metrics()
+        assert built['personas']['servicing']['recommended_actions'] == serial['servicing'].get_recommended_actions()
+        assert built['personas']['marketing']['segments'] == serial['marketing'].get_customer_segments()
+        assert set(built['snapshot_build_ms']) == {'leadership', 'servicing', 'marketing'}
+        assert built['cached_blocks'] == {'leadership': 0, 'servicing': 0, 'marketing': 0}
+
+    @pytest.mark.asyncio
+    async def test_blocks_are_memoized_until_data_changes(self, populated_db):
+        engine = PersonaSnapshotEngine(personas(populated_db), populated_db, max_workers=2)
+        try:
+            first = await engine.build(['leadership'])
+            second = await engine.build(['leadership'])
+            assert second['cached_blocks'] == {'leadership': 2}
+            assert second['data_version'] == first['data_version']
+
+            conn = sqlite3.connect(populated_db)
+            conn.execute("UPDATE analysis SET delinquency_risk = 0.99 WHERE id = (SELECT MIN(id) FROM analysis)")
+            conn.commit()
+            conn.close()
+
+            third = await engine.build(['leadership'])
+            assert third['cached_blocks'] == {'leadership': 0}
+            assert third['data_version'] != first['data_version']
+
+            engine.ttl_seconds = 0
+            assert (await engine.build(['leadership']))['cached_blocks'] == {'leadership': 0}
+        finally:
+            engine.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_pool_threads_reuse_one_connection(self, populated_db, monkeypatch):
+        connects = []
+        connect = sqlite3.connect
+
+        def counting_connect(*args, **kwargs):
+            connects.append(threading.current_thread().name)
+            return connect(*args, **kwargs)
+
+        monkeypatch.setattr(base_persona.sqlite3, 'connect', counting_connect)
+        serial = personas(populated_db)
+        for persona in serial.values():
+            persona.get_key_metrics()
+            persona.get_recommended_actions()
+        serial_connects = len(connects)
+
+        connects.clear()
+        engine = PersonaSnapshotEngine(personas(populated_db), populated_db, max_workers=2)
+        try:
+            await engine.build(['leadership', 'servicing', 'marketing'], blocks=('metrics', 'recommended_actions'))
+        finally:
+            engine.shutdown()
+
+        assert serial_connects > 10
+        # Persona queries open at most one connection per pool thread
+        assert len([name for name in connects if name.startswith('persona-snapshot')]) <= 2
+
+    @pytest.mark.asyncio
+    async def test_ask_reports_snapshot_build_ms_per_persona(self, populated_db):
+        service = IntelligenceService(FakeHybridAnalyzer(), InsightStore(db_path=populated_db), db_path=populated_db)
+        try:
+            result = await service.ask("Where is risk concentrated?", persona='everyone')
+            assert set(result['metadata']['snapshot_build_ms']) == {'leadership', 'servicing', 'marketing'}
+
+            result = await service.ask("What should marketing do next?", persona='growth')
+            assert list(result['metadata']['snapshot_build_ms']) == ['marketing']
+            # metrics and actions were memoized by the cross-persona call; segments are new
+            assert result['metadata']['snapshot_cached_blocks'] == {'marketing': 2}
+        finally:
+            service.snapshot_engine.shutdown()
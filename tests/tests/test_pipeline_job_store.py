@@ -0,0 +1,99 @@
+"""
+Test suite for PipelineJobStore - durable orchestration runs with leased jobs
+NO FALLBACK LOGIC - invalid input must fail fast
+"""
+import pytest
+
+from src.storage.pipeline_job_store import PipelineJobStore
+
+
+@pytest.fixture
+def job_store(temp_db):
+    return PipelineJobStore(temp_db)
+
+
+class TestPipelineJobStore:
+    """Run creation, leasing, checkpoints and finalization"""
+
+    def test_create_run_queues_jobs_in_order(self, job_store):
+        run = job_store.create_run("RUN_1", ["CALL_A", "CALL_B"], True, concurrency={"max_concurrent": 2})
+
+        assert run["status"] == "RUNNING"
+        assert run["auto_approve"] is True
+        assert run["concurrency"] == {"max_concurrent": 2}
+        jobs = job_store.get_jobs("RUN_1")
+        assert [job["transcript_id"] for job in jobs] == ["CALL_A", "CALL_B"]
+        assert all(job["status"] == "QUEUED" for job in jobs)
+
+    def test_invalid_runs_fail_fast(self, job_store):
+        with pytest.raises(ValueError):
+            job_store.create_run("RUN_1", [], False)
+        with pytest.raises(ValueError):
+            job_store.create_run("RUN_1", ["CALL_A", "CALL_A"], False)
+
+    def test_claim_leases_each_job_once(self, job_store):
+        job_store.create_run("RUN_1", ["CALL_A", "CALL_B"], False)
+
+        first = job_store.claim_next_job("RUN_1", "worker-1", lease_seconds=60)
+        second = job_store.claim_next_job("RUN_1", "worker-2", lease_seconds=60)
+
+        assert first["transcript_id"] == "CALL_A"
+        assert second["transcript_id"] == "CALL_B"
+        assert job_store.claim_next_job("RUN_1", "worker-3", lease_seconds=60) is None
+        assert job_store.count_unfinished_jobs("RUN_1") == 2
+        assert job_store.count_unfinished_jobs("RUN_1", exclude_owner="worker-1") == 1
+
+    def test_expired_lease_is_reclaimed(self, job_store):
+        job_store.create_run("RUN_1", ["CALL_A"], False)
+        job = job_store.claim_next_job("RUN_1", "dead-worker", lease_seconds=-1)
+
+        reclaimed = job_store.claim_next_job("RUN_1", "worker-2", lease_seconds=60)
+
+        assert reclaimed["id"] == job["id"]
+        assert reclaimed["lease_owner"] == "worker-2"
+        # The previous owner can no longer write to the job
+        assert not job_store.checkpoint(job["id"], "dead-worker", "PLAN_COMPLETED", plan_id="PLAN_1")
+        assert not job_store.renew_lease(job["id"], "dead-worker", 60)
+
+    def test_job_fails_after_max_attempts(self, job_store):
+        job_store.create_run("RUN_1", ["CALL_A"], False)
+        for _ in range(2):
+            job_store.claim_next_job("RUN_1", "crashing-worker", lease_seconds=-1, max_attempts=2)
+
+        assert job_store.claim_next_job("RUN_1", "worker", lease_seconds=60, max_attempts=2) is None
+        job = job_store.get_jobs("RUN_1")[0]
+        assert job["status"] == "FAILED"
+        assert "2 attempts" in job["error"]
+
+    def test_checkpoint_and_finalize(self, job_store):
+        job_store.create_run("RUN_1", ["CALL_A"], False)
+        job = job_store.claim_next_job("RUN_1", "worker-1", lease_seconds=60)
+
+        assert job_store.checkpoint(job["id"], "worker-1", "WORKFLOWS_COMPLETED",
+                                    workflow_ids=["WF_1", "WF_2"], workflow_count=2)
+        with pytest.raises(ValueError):
+            job_store.checkpoint(job["id"], "worker-1", "COMPLETE", unknown="x")
+        assert not job_store.finalize_run_if_done("RUN_1")
+
+        job_store.finish_job(job["id"], "worker-1", "COMPLETED", result={"success": True})
+
+        assert job_store.finalize_run_if_done("RUN_1")
+        stored = job_store.get_job(job["id"])
+        assert stored["workflow_ids"] == ["WF_1", "WF_2"]
+        assert stored["lease_owner"] is None
+        run = job_store.get_run("RUN_1")
+        assert run["status"] == "COMPLETED"
+        assert run["summary"]["success_rate"] == 1.0
+
+    def test_cancel_run(self, job_store):
+        job_store.create_run("RUN_1", ["CALL_A", "CALL_B"], False)
+        running = job_store.claim_next_job("RUN_1", "worker-1", lease_seconds=60)
+
+        assert job_store.cancel_run("RUN_1") == 1
+        assert job_store.claim_next_job("RUN_1", "worker-2", lease_seconds=60) is None
+        assert not job_store.renew_lease(running["id"], "worker-1", 60)
+        with pytest.raises(ValueError):
+            job_store.cancel_run("RUN_1")
+        with pytest.raises(ValueError):
+            job_store.cancel_run("RUN_MISSING")
+        assert [run["id"] for run in job_store.list_unfinished_runs()] == ["RUN_1"]
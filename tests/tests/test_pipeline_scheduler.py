@@ -0,0 +1,191 @@
+"""
+Test suite for the concurrent orchestration scheduler
+Uses a fake pipeline runner and a temporary job store - no LLM access
+NO FALLBACK LOGIC - invalid limits must fail fast
+"""
+import pytest
+import asyncio
+
+from src.services.orchestration.pipeline_scheduler import PipelineScheduler, resolve_concurrency
+from src.storage.pipeline_job_store import PipelineJobStore
+
+
+class FakePipelineRunner:
+    """Records concurrency and checkpoints while pretending to run SimplePipeline."""
+
+    def __init__(self, delay: float = 0.02, fail_ids=None):
+        self.delay = delay
+        self.fail_ids = set(fail_ids or [])
+        self.active = 0
+        self.peak = 0
+        self.stage_active = 0
+        self.stage_peak = 0
+        self.start_order = []
+        self.resumed_from = {}
+
+    async def __call__(self, transcript_id, auto_approve, stage_limits=None,
+                       resume_from=None, checkpoint_callback=None):
+        self.start_order.append(transcript_id)
+        self.resumed_from[transcript_id] = dict(resume_from or {})
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if not (resume_from or {}).get("analysis_id"):
+                checkpoint_callback("ANALYSIS_COMPLETED", {"analysis_id": f"ANALYSIS_{transcript_id}"})
+            async with stage_limits["workflows"]:
+                self.stage_active += 1
+                self.stage_peak = max(self.stage_peak, self.stage_active)
+                await asyncio.sleep(self.delay)
+                self.stage_active -= 1
+            checkpoint_callback("COMPLETE", {})
+            if transcript_id in self.fail_ids:
+                raise ValueError(f"boom {transcript_id}")
+            return {"transcript_id": transcript_id, "success": True}
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def job_store(temp_db):
+    return PipelineJobStore(temp_db)
+
+
+def _scheduler(job_store, ids, runner, **kwargs):
+    job_store.create_run("RUN_TEST", ids, False)
+    kwargs.setdefault("poll_interval", 0.01)
+    return PipelineScheduler("RUN_TEST", job_store, pipeline_runner=runner, **kwargs)
+
+
+class TestResolveConcurrency:
+    """Concurrency settings validation"""
+
+    def test_overrides_are_applied(self):
+        resolved = resolve_concurrency(3, {"workflows": 1})
+
+        assert resolved["max_concurrent"] == 3
+        assert resolved["stage_limits"]["workflows"] == 1
+        assert set(resolved["stage_limits"]) == {"analysis", "plan", "workflows", "execution"}
+
+    def test_unknown_stage_fails_fast(self):
+        with pytest.raises(ValueError):
+            resolve_concurrency(2, {"transcript": 1})
+
+    def test_non_positive_limit_fails_fast(self):
+        with pytest.raises(ValueError):
+            resolve_concurrency(0)
+        with pytest.raises(ValueError):
+            resolve_concurrency(2, {"analysis": 0})
+
+
+class TestPipelineScheduler:
+    """Bounded worker pool behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_respects_pipeline_and_stage_limits(self, job_store):
+        ids = [f"CALL_{i}" for i in range(8)]
+        runner = FakePipelineRunner()
+        scheduler = _scheduler(job_store, ids, runner, max_concurrent=4, stage_limits={"workflows": 2})
+
+        await scheduler.run()
+
+        assert runner.peak == 4
+        assert runner.stage_peak == 2
+        assert runner.start_order == ids  # FIFO start order
+        jobs = job_store.get_jobs("RUN_TEST")
+        assert all(job["status"] == "COMPLETED" for job in jobs)
+        assert all(job["analysis_id"] == f"ANALYSIS_{job['transcript_id']}" for job in jobs)
+        run = job_store.get_run("RUN_TEST")
+        assert run["status"] == "COMPLETED"
+        assert run["summary"]["successful"] == 8
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated(self, job_store):
+        ids = ["CALL_A", "CALL_B", "CALL_C"]
+        runner = FakePipelineRunner(fail_ids=["CALL_B"])
+        scheduler = _scheduler(job_store, ids, runner, max_concurrent=3)
+
+        await scheduler.run()
+
+        jobs = {job["transcript_id"]: job for job in job_store.get_jobs("RUN_TEST")}
+        assert jobs["CALL_B"]["status"] == "FAILED"
+        assert "boom CALL_B" in jobs["CALL_B"]["error"]
+        assert jobs["CALL_A"]["result"] == {"transcript_id": "CALL_A", "success": True}
+        assert job_store.get_run("RUN_TEST")["summary"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_and_queued(self, job_store):
+        ids = [f"CALL_{i}" for i in range(6)]
+        runner = FakePipelineRunner(delay=1.0)
+        scheduler = _scheduler(job_store, ids, runner, max_concurrent=2)
+
+        run_task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.05)
+        cancelled = scheduler.cancel()
+        await asyncio.wait_for(run_task, timeout=1)
+
+        assert cancelled == {"queued_cancelled": 4, "running_cancelled": 2}
+        assert scheduler.cancelled
+        assert all(job["status"] == "CANCELLED" for job in job_store.get_jobs("RUN_TEST"))
+        run = job_store.get_run("RUN_TEST")
+        assert run["status"] == "CANCELLED"
+        assert run["summary"]["cancelled"] == 6
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_checkpoint_after_crash(self, job_store):
+        job_store.create_run("RUN_TEST", ["CALL_A"], False)
+
+        # A worker that died after the analysis stage, leaving an expired lease
+        job = job_store.claim_next_job("RUN_TEST", "dead-worker", lease_seconds=-1)
+        job_store.checkpoint(job["id"], "dead-worker", "ANALYSIS_COMPLETED", analysis_id="ANALYSIS_OLD")
+
+        runner = FakePipelineRunner()
+        scheduler = PipelineScheduler("RUN_TEST", job_store, pipeline_runner=runner, poll_interval=0.01)
+        await scheduler.run()
+
+        assert runner.resumed_from["CALL_A"]["analysis_id"] == "ANALYSIS_OLD"
+        job = job_store.get_jobs("RUN_TEST")[0]
+        assert job["status"] == "COMPLETED"
+        assert job["analysis_id"] == "ANALYSIS_OLD"
+        assert job["attempts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_cancels_pipeline(self, job_store):
+        runner = FakePipelineRunner(delay=1.0)
+        scheduler = _scheduler(job_store, ["CALL_A"], runner, lease_seconds=0.03)
+
+        run_task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.01)
+        # Another process cancels the run - the heartbeat notices on its next renewal
+        job_store.cancel_run("RUN_TEST")
+        await asyncio.wait_for(run_task, timeout=1)
+
+        assert job_store.get_jobs("RUN_TEST")[0]["status"] == "CANCELLED"
+        assert job_store.get_run("RUN_TEST")["status"] == "CANCELLED"
+
+    @pytest.mark.asyncio
+    async def test_shutdown_requeues_jobs_for_resumption(self, job_store):
+        ids = ["CALL_A", "CALL_B", "CALL_C"]
+        scheduler = _scheduler(job_store, ids, FakePipelineRunner(delay=1.0), max_concurrent=2)
+
+        # Server shutdown cancels the scheduler task, not the run
+        run_task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.05)
+        run_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run_task
+
+        jobs = {job["transcript_id"]: job for job in job_store.get_jobs("RUN_TEST")}
+        assert all(job["status"] == "QUEUED" and job["lease_owner"] is None for job in jobs.values())
+        assert all(job["attempts"] == 0 for job in jobs.values())
+        assert jobs["CALL_A"]["analysis_id"] == "ANALYSIS_CALL_A"
+        assert jobs["CALL_C"]["analysis_id"] is None
+        assert job_store.get_run("RUN_TEST")["status"] == "RUNNING"
+
+        # The scheduler started after the restart resumes from the checkpoints
+        runner = FakePipelineRunner()
+        await PipelineScheduler("RUN_TEST", job_store, pipeline_runner=runner, poll_interval=0.01).run()
+
+        assert runner.start_order == ids
+        assert runner.resumed_from["CALL_B"]["analysis_id"] == "ANALYSIS_CALL_B"
+        assert all(job["status"] == "COMPLETED" for job in job_store.get_jobs("RUN_TEST"))
+        assert job_store.get_run("RUN_TEST")["summary"]["successful"] == 3
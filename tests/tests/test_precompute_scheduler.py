@@ -0,0 +1,158 @@
+"""
+Test suite for the precompute (cache warming) scheduler
+Targets are in-memory fakes; the forecast expiry hook runs against a real database
+"""
+import asyncio
+import random
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+from src.services.forecasting_service import ForecastingService
+from src.services.intelligence_service import IntelligenceService
+from src.services.precompute_scheduler import PrecomputeScheduler, RefreshTarget
+from src.storage.analysis_store import AnalysisStore
+from src.storage.insight_store import InsightStore
+from src.storage.transcript_store import TranscriptStore
+
+
+class FakeCache:
+    """Cached value with a TTL, refreshed by the scheduler"""
+
+    def __init__(self, ttl, fail=False, gate=None):
+        self.ttl = ttl
+        self.fail = fail
+        self.gate = gate
+        self.expires_at = None
+        self.refreshes = 0
+        self.active = 0
+        self.peak = 0
+
+    async def refresh(self):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if self.gate is not None:
+                await self.gate.wait()
+            if self.fail:
+                raise RuntimeError("LLM unavailable")
+            self.refreshes += 1
+            self.expires_at = time.time() + self.ttl
+        finally:
+            self.active -= 1
+
+    def seconds_to_expiry(self):
+        return None if self.expires_at is None else max(0.0, self.expires_at - time.time())
+
+
+def target(name, cache):
+    return RefreshTarget(name=name, ttl_seconds=cache.ttl, refresh=cache.refresh,
+                         seconds_to_expiry=cache.seconds_to_expiry)
+
+
+def scheduler(targets, **kwargs):
+    options = dict(refresh_ahead_fraction=0.2, jitter_fraction=0.1, min_interval_seconds=0,
+                   backoff_base_seconds=10, backoff_max_seconds=25, startup_spread_seconds=0,
+                   rng=random.Random(0))
+    options.update(kwargs)
+    return PrecomputeScheduler(targets, **options)
+
+
+class TestPrecomputeScheduler:
+    """Timing, backoff and concurrency of refreshes"""
+
+    @pytest.mark.asyncio
+    async def test_missing_cache_is_warmed_and_rescheduled_ahead_of_expiry(self):
+        cache = FakeCache(ttl=1000)
+        precompute = scheduler([target('forecast:call_volume_daily', cache)])
+        precompute.start()
+
+        await asyncio.gather(*precompute.run_due())
+
+        state = precompute.targets['forecast:call_volume_daily']
+        assert cache.refreshes == 1 and state.last_status == 'ok'
+        assert state.last_latency_ms is not None
+        # 20-30% of the TTL before expiry
+        lead = cache.expires_at - state.next_run_at
+        assert 200 <= lead <= 300
+        assert precompute.run_due() == []
+
+        status = precompute.get_status()['targets']['forecast:call_volume_daily']
+        assert status['refresh_count'] == 1 and status['next_refresh_at']
+
+    @pytest.mark.asyncio
+    async def test_failures_back_off_exponentially_up_to_the_cap(self):
+        cache = FakeCache(ttl=1000, fail=True)
+        precompute = scheduler([target('insight:leadership_briefing', cache)])
+        precompute.start()
+        state = precompute.targets['insight:leadership_briefing']
+
+        delays = []
+        for _ in range(3):
+            state.next_run_at = 0
+            before = time.time()
+            await asyncio.gather(*precompute.run_due())
+            delays.append(state.next_run_at - before)
+
+        assert 9 <= delays[0] <= 11.5
+        assert 18 <= delays[1] <= 22.5
+        assert 22 <= delays[2] <= 27.6  # Capped at backoff_max_seconds ± jitter
+        assert state.consecutive_failures == 3
+        assert precompute.get_status()['targets']['insight:leadership_briefing']['last_error'] == "LLM unavailable"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_and_min_interval(self):
+        gate = asyncio.Event()
+        caches = [FakeCache(ttl=10, gate=gate) for _ in range(4)]
+        precompute = scheduler([target(f"forecast:t{i}", c) for i, c in enumerate(caches)],
+                               max_concurrency=2, min_interval_seconds=600)
+        precompute.start()
+
+        tasks = precompute.run_due()
+        await asyncio.sleep(0.01)
+        assert sum(c.active for c in caches) == 2
+        assert precompute.get_status()['refreshing'] == 4
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        # TTL of 10s would refresh in ~8s, but the minimum interval holds it back
+        for state in precompute.targets.values():
+            assert state.next_run_at - state.last_refresh_at >= 600
+
+
+class TestPrecomputeHooks:
+    """Service hooks the scheduler uses"""
+
+    @pytest.mark.asyncio
+    async def test_forecast_expiry_tracks_ttl_and_data_version(self, temp_db):
+        TranscriptStore(temp_db)
+        analysis_store = AnalysisStore(temp_db)
+        SyntheticDataGenerator(temp_db, seed=4).populate_database(days=21, base_daily_calls=5)
+        executor = ThreadPoolExecutor(max_workers=1)
+        service = ForecastingService(db_path=temp_db, executor=executor)
+        try:
+            assert service.forecast_seconds_to_expiry('escalation_rate') is None
+            job = await service.refresh_forecast('escalation_rate', ttl_hours=2, timeout=60)
+        finally:
+            executor.shutdown(wait=True)
+
+        assert job['status'] == 'COMPLETED'
+        assert 7100 < service.forecast_seconds_to_expiry('escalation_rate') <= 7200
+
+        analysis = analysis_store.get_all()[0]
+        analysis_store.delete(analysis['analysis_id'])
+        assert service.forecast_seconds_to_expiry('escalation_rate') == 0.0
+
+    @pytest.mark.asyncio
+    async def test_health_reports_precompute_schedule(self, temp_db):
+        insight_store = InsightStore(db_path=temp_db)
+        intelligence = IntelligenceService(hybrid_analyzer=None, insight_store=insight_store, db_path=temp_db)
+        assert intelligence.insight_seconds_to_expiry('leadership_briefing') is None
+
+        insight_store.store('briefing_1', 'leadership_briefing', 'leadership', {'summary': 'ok'}, ttl_hours=1)
+        assert 3500 < intelligence.insight_seconds_to_expiry('leadership_briefing') <= 3600
+
+        intelligence.precompute_scheduler = scheduler([target('insight:leadership_briefing', FakeCache(ttl=3600))])
+        health = await intelligence.get_health()
+        assert health['precompute']['targets']['insight:leadership_briefing']['status'] == 'pending'
@@ -0,0 +1,154 @@
+"""
+Test suite for the leadership semantic query cache
+Paraphrased questions reuse cached answers; thresholds are per executive role
+"""
+import sqlite3
+import sys
+import numpy as np
+import pytest
+
+from src.infrastructure.llm.query_embedder import HashingQueryEmbedder, create_query_embedder
+from src.services.semantic_query_cache import SemanticQueryCache, query_qualifiers
+from src.storage.insights_cache_store import InsightsCacheStore
+
+
+@pytest.fixture
+def cache_store(temp_db):
+    # aggregation_cache normally comes from data/insights_schema.sql via SessionStore
+    conn = sqlite3.connect(temp_db)
+    conn.execute('''
+        CREATE TABLE aggregation_cache (
+            cache_key TEXT PRIMARY KEY,
+            query_hash TEXT NOT NULL,
+            aggregated_data TEXT NOT NULL,
+            data_sources TEXT NOT NULL,
+            record_count INTEGER,
+            computation_time_ms INTEGER,
+            created_at TIMESTAMP,
+            expires_at TIMESTAMP,
+            hit_count INTEGER DEFAULT 0,
+            last_accessed TIMESTAMP
+        )
+    ''')
+    conn.commit()
+    conn.close()
+    return InsightsCacheStore(temp_db)
+
+
+def response(content):
+    return {
+        'content': content,
+        'metadata': {'data_sources_used': ['analysis'], 'records_analyzed': 40,
+                     'total_processing_time_ms': 5200, 'overall_confidence': 0.9}
+    }
+
+
+class TestQueryEmbedder:
+    """Deterministic offline embeddings"""
+
+    def test_hashing_embeddings_are_deterministic_unit_vectors(self):
+        embedder = HashingQueryEmbedder(dimensions=256)
+        vector = embedder.embed("What's our churn this month")
+
+        assert vector.shape == (256,) and vector.dtype == np.float32
+        assert np.linalg.norm(vector) == pytest.approx(1.0)
+        assert np.array_equal(vector, HashingQueryEmbedder(dimensions=256).embed("What's our churn this month"))
+        assert not HashingQueryEmbedder().embed("what is it?").any()
+
+    def test_paraphrases_are_closer_than_other_questions(self):
+        embedder = HashingQueryEmbedder()
+        churn = embedder.embed("What's our churn this month")
+
+        assert churn @ embedder.embed("show me this month's churn") > 0.95
+        assert churn @ embedder.embed("What's our delinquency risk this month") < 0.6
+
+    def test_missing_model_package_uses_hashing(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, 'sentence_transformers', None)
+        assert create_query_embedder('all-MiniLM-L6-v2', dimensions=128).name == 'hashing-128'
+
+
+class TestSemanticQueryCache:
+    """Exact and nearest-neighbour lookups"""
+
+    def test_paraphrase_hits_the_cached_answer(self, cache_store):
+        cache = SemanticQueryCache(cache_store, HashingQueryEmbedder())
+        cache.store("What's our churn this month", response('churn is 4.1%'), 'VP')
+
+        exact = cache.lookup("what's our churn this month ", 'VP')
+        assert exact['match'] == 'exact'
+
+        hit = cache.lookup("show me this month's churn", 'VP')
+        assert hit['match'] == 'semantic' and hit['similarity'] >= 0.85
+        assert hit['matched_query'] == "What's our churn this month"
+        assert hit['entry']['aggregated_data']['content'] == 'churn is 4.1%'
+        assert hit['entry']['hit_count'] == 1
+
+        # Other roles and unrelated questions miss
+        assert cache.lookup("show me this month's churn", 'CCO') is None
+        assert cache.lookup("Which advisors need coaching?", 'VP') is None
+
+    def test_thresholds_are_per_role(self, cache_store):
+        cache = SemanticQueryCache(cache_store, HashingQueryEmbedder(), similarity_threshold=0.75,
+                                   role_thresholds={'CCO': 0.95})
+        for role in ('VP', 'CCO'):
+            cache.store("Top compliance issues last week", response(f"{role} answer"), role)
+
+        assert cache.get_threshold('CCO') == 0.95 and cache.get_threshold('Director') == 0.75
+        assert cache.lookup("Biggest compliance issues last week", 'VP')['entry']['aggregated_data']['content'] == 'VP answer'
+        assert cache.lookup("Biggest compliance issues last week", 'CCO') is None
+
+        with pytest.raises(ValueError, match="CCO"):
+            SemanticQueryCache(cache_store, HashingQueryEmbedder(), role_thresholds={'CCO': 1.5})
+
+    @pytest.mark.parametrize('cached, asked', [
+        ("How many refinance calls this month", "How many non-refinance calls this month"),
+        ("Borrowers with high delinquency risk", "Borrowers without high delinquency risk"),
+        ("Top churn drivers this quarter", "Top churn drivers last quarter"),
+        ("Coaching needs for advisor ADV001", "Coaching needs for advisor ADV002"),
+    ])
+    def test_different_qualifiers_miss_despite_high_similarity(self, cache_store, cached, asked):
+        embedder = HashingQueryEmbedder()
+        assert embedder.embed(cached) @ embedder.embed(asked) >= 0.85
+
+        cache = SemanticQueryCache(cache_store, embedder)
+        cache.store(cached, response('answer'), 'VP')
+        assert cache.lookup(asked, 'VP') is None
+
+    def test_qualifiers_select_among_near_duplicates(self, cache_store):
+        cache = SemanticQueryCache(cache_store, HashingQueryEmbedder())
+        cache.store("Top churn drivers last quarter", response('last quarter'), 'VP')
+        cache.store("Top churn drivers this quarter", response('this quarter'), 'VP')
+
+        hit = cache.lookup("Show the top churn drivers for this quarter", 'VP')
+        assert hit['match'] == 'semantic' and hit['matched_query'] == "Top churn drivers this quarter"
+        assert query_qualifiers("Which loans aren't past due in Q3 2026?") == {'not', 'past', 'q3', '2026'}
+
+    def test_metrics_report_hits_misses_and_similarity(self, cache_store):
+        cache = SemanticQueryCache(cache_store, HashingQueryEmbedder())
+        assert cache.get_metrics()['hit_rate'] is None
+
+        cache.lookup("What's our churn this month", 'VP')
+        cache.store("What's our churn this month", response('churn'), 'VP')
+        cache.lookup("What's our churn this month", 'VP')
+        cache.lookup("show me this month's churn", 'VP')
+        cache.lookup("What's our delinquency risk this month", 'VP')
+
+        metrics = cache.get_metrics()
+        assert (metrics['lookups'], metrics['exact_hits'], metrics['semantic_hits'], metrics['misses']) == (4, 1, 1, 2)
+        assert metrics['hit_rate'] == 0.5
+        assert metrics['avg_semantic_hit_similarity'] >= 0.85
+        assert 0 < metrics['avg_miss_similarity'] < 0.85  # first miss had nothing cached to compare
+        assert metrics['embedding_model'] == 'hashing-512'
+
+    def test_expired_and_cleared_entries_do_not_match(self, cache_store):
+        cache = SemanticQueryCache(cache_store, HashingQueryEmbedder())
+        cache.store("What's our churn this month", response('churn'), 'VP')
+
+        cache_store.invalidate_cache_by_data_source('analysis')
+        assert cache.lookup("show me this month's churn", 'VP') is None
+
+        cache.store("What's our churn this month", response('churn'), 'VP')
+        cache_store.clear_cache()
+        conn = sqlite3.connect(cache_store.db_path)
+        assert conn.execute("SELECT COUNT(*) FROM query_embeddings").fetchone()[0] == 0
+        conn.close()
@@ -1,6 +1,10 @@
 """Tests for the synthetic data generator used in demos and CLI tooling."""
 
-from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+import csv
+import sqlite3
+from datetime import datetime
+
+from src.analytics.forecasting.synthetic_data_generator import GRAPH_TABLES, SyntheticDataGenerator
 
 
 def test_generate_transcripts_have_rich_dialogue():
@@ -41,3 +45,56 @@ def test_generate_analyses_structured_sentiment():
 
     assert sample.get("topics_discussed"), "Expected topics_discussed to be populated"
     assert sample.get("product_opportunities"), "Expected product_opportunities to be populated"
+
+
+def _dataset(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return (
+            conn.execute("SELECT id, timestamp, advisor_id, topic FROM transcripts ORDER BY id").fetchall(),
+            conn.execute("SELECT id, transcript_id, delinquency_risk, created_at FROM analysis ORDER BY id").fetchall(),
+            conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0],
+        )
+    finally:
+        conn.close()
+
+
+def test_stream_database_is_deterministic_across_workers_and_chunks(tmp_path):
+    """Streamed output depends only on the seed, not on how generation is split up."""
+
+    end_date = datetime(2026, 3, 1)
+    single = SyntheticDataGenerator(str(tmp_path / "single.db"), seed=21).stream_database(
+        days=12, base_daily_calls=6, chunk_days=5, workers=1, end_date=end_date
+    )
+    pooled = SyntheticDataGenerator(str(tmp_path / "pooled.db"), seed=21).stream_database(
+        days=12, base_daily_calls=6, chunk_days=2, workers=2, end_date=end_date
+    )
+
+    assert single["transcripts_generated"] == pooled["transcripts_generated"] > 0
+    assert single["date_range"] == "2026-02-17 to 2026-03-01"
+    assert _dataset(str(tmp_path / "single.db")) == _dataset(str(tmp_path / "pooled.db"))
+
+    transcripts, analyses, messages = _dataset(str(tmp_path / "single.db"))
+    assert messages == single["messages_generated"]
+    timestamps = {transcript_id: timestamp for transcript_id, timestamp, _, _ in transcripts}
+    assert all(created_at == timestamps[transcript_id] for _, transcript_id, _, created_at in analyses)
+
+
+def test_stream_database_emits_graph_csvs(tmp_path):
+    """Graph CSVs follow the Kuzu schema column order and cover every streamed row."""
+
+    graph_dir = tmp_path / "graph"
+    summary = SyntheticDataGenerator(str(tmp_path / "graph.db"), seed=3).stream_database(
+        days=3, base_daily_calls=5, include_messages=False, graph_dir=str(graph_dir)
+    )
+
+    assert summary["messages_generated"] == 0
+    rows = {}
+    for table, columns in GRAPH_TABLES.items():
+        with open(graph_dir / f"{table}.csv", newline="", encoding="utf-8") as f:
+            header, *rows[table] = list(csv.reader(f))
+        assert header == columns
+
+    assert len(rows["Transcript"]) == len(rows["TRANSCRIPT_BELONGS_TO"]) == summary["transcripts_generated"]
+    assert len(rows["Analysis"]) == len(rows["ANALYSIS_ANALYZES"]) == summary["analyses_generated"]
+    assert sum(int(row[6]) for row in rows["Customer"]) == summary["transcripts_generated"]
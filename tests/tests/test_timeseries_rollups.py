@@ -0,0 +1,177 @@
+"""
+Test suite for the forecasting time-series rollups
+Rollup-backed DataAggregator series must match a direct GROUP BY over the base tables
+"""
+import sqlite3
+import pytest
+import pandas as pd
+
+from src.analytics.forecasting.data_aggregator import DataAggregator
+from src.analytics.forecasting.synthetic_data_generator import SyntheticDataGenerator
+from src.models.transcript import Message, Transcript
+from src.storage.analysis_store import AnalysisStore
+from src.storage.timeseries_rollup_store import SENTIMENT_SCORES, TimeSeriesRollupStore
+from src.storage.transcript_store import TranscriptStore
+
+
+SENTIMENT_CASE = ' '.join(f"WHEN '{label}' THEN {score}" for label, score in SENTIMENT_SCORES.items())
+
+# Reference queries - the pre-rollup aggregation over the base tables
+REFERENCE_QUERIES = {
+    'calls': "SELECT DATE(timestamp) AS ds, COUNT(*) AS y FROM transcripts GROUP BY ds ORDER BY ds",
+    'calls_hourly': ("SELECT strftime('%Y-%m-%d %H:00:00', timestamp) AS ds, COUNT(*) AS y "
+                     "FROM transcripts GROUP BY ds ORDER BY ds"),
+    'calls_weekly': ("SELECT DATE(timestamp, 'weekday 0', '-6 days') AS ds, COUNT(*) AS y "
+                     "FROM transcripts GROUP BY ds ORDER BY ds"),
+    'delinquency': ("SELECT DATE(created_at) AS ds, AVG(delinquency_risk) AS y FROM analysis "
+                    "WHERE delinquency_risk IS NOT NULL GROUP BY ds ORDER BY ds"),
+    'escalation': ("SELECT DATE(created_at) AS ds, AVG(CASE WHEN escalation_needed = 1 THEN 1.0 ELSE 0.0 END) AS y "
+                   "FROM analysis GROUP BY ds ORDER BY ds"),
+    'sentiment': (f"SELECT DATE(created_at) AS ds, AVG(CASE borrower_sentiment {SENTIMENT_CASE} ELSE 0.5 END) AS y "
+                  "FROM analysis WHERE borrower_sentiment IS NOT NULL AND borrower_sentiment != '' "
+                  "GROUP BY ds ORDER BY ds"),
+    'empathy_weekly': ("SELECT DATE(created_at, 'weekday 0', '-6 days') AS ds, AVG(empathy_score) AS y "
+                       "FROM analysis WHERE empathy_score IS NOT NULL GROUP BY ds ORDER BY ds"),
+}
+
+
+def reference(db_path, name):
+    conn = sqlite3.connect(db_path)
+    try:
+        df = pd.read_sql_query(REFERENCE_QUERIES[name], conn)
+    finally:
+        conn.close()
+    df['ds'] = pd.to_datetime(df['ds'])
+    return df
+
+
+def rollup_series(aggregator):
+    return {
+        'calls': aggregator.get_call_volume_data('daily'),
+        'calls_hourly': aggregator.get_call_volume_data('hourly'),
+        'calls_weekly': aggregator.get_call_volume_data('weekly'),
+        'delinquency': aggregator.get_risk_score_data('delinquency'),
+        'escalation': aggregator.get_escalation_rate_data(),
+        'sentiment': aggregator.get_sentiment_score_data(),
+        'empathy_weekly': aggregator.get_advisor_performance_data('empathy', granularity='weekly'),
+    }
+
+
+def assert_matches_reference(db_path, aggregator):
+    for name, df in rollup_series(aggregator).items():
+        expected = reference(db_path, name)
+        assert list(df['ds']) == list(expected['ds']), name
+        assert df['y'].astype(float).tolist() == pytest.approx(expected['y'].astype(float).tolist()), name
+
+
+@pytest.fixture
+def populated_db(temp_db):
+    TranscriptStore(temp_db)
+    AnalysisStore(temp_db)
+    SyntheticDataGenerator(temp_db, seed=11).populate_database(days=21, base_daily_calls=6)
+    return temp_db
+
+
+class TestTimeSeriesRollups:
+    """Trigger-maintained rollups stay equal to the base-table aggregation"""
+
+    def test_series_match_base_tables_after_bulk_insert(self, populated_db):
+        assert_matches_reference(populated_db, DataAggregator(populated_db))
+
+    def test_replace_update_and_delete_keep_rollups_exact(self, populated_db):
+        conn = sqlite3.connect(populated_db)
+        transcript_id, analysis_id = conn.execute(
+            'SELECT transcript_id, id FROM analysis ORDER BY created_at LIMIT 1'
+        ).fetchone()
+        # INSERT OR REPLACE moves a transcript to another day
+        conn.execute('''
+            INSERT OR REPLACE INTO transcripts (id, customer_id, advisor_id, timestamp, topic, duration)
+            SELECT id, customer_id, advisor_id, '2020-01-01T09:30:00', topic, duration
+            FROM transcripts WHERE id = ?
+        ''', (transcript_id,))
+        conn.execute("UPDATE analysis SET delinquency_risk = 0.99, borrower_sentiment = 'Angry' WHERE id = ?",
+                     (analysis_id,))
+        conn.execute('DELETE FROM analysis WHERE id = (SELECT MAX(id) FROM analysis)')
+        conn.commit()
+        conn.close()
+
+        assert_matches_reference(populated_db, DataAggregator(populated_db))
+
+    def test_store_apis_update_rollups(self, temp_db):
+        transcript_store = TranscriptStore(temp_db)
+        analysis_store = AnalysisStore(temp_db)
+        aggregator = DataAggregator(temp_db)
+
+        transcript = Transcript(
+            id='CALL_ROLLUP1', customer_id='CUST_001', advisor_id='ADV_007', timestamp='2026-03-02T10:15:00',
+            topic='refinance', duration=300, messages=[Message('Customer', 'Can I refinance?')]
+        )
+        transcript_store.store(transcript)
+        analysis_store.store({
+            'analysis_id': 'ANALYSIS_ROLLUP1',
+            'transcript_id': transcript.id,
+            'primary_intent': 'Refinance Inquiry',
+            'borrower_sentiment': {'overall': 'Positive'},
+            'borrower_risks': {'delinquency_risk': 0.2, 'churn_risk': 0.1, 'complaint_risk': 0.0},
+            'advisor_metrics': {'empathy_score': 8.0},
+            'escalation_needed': True
+        })
+
+        assert aggregator.get_call_volume_data()['y'].tolist() == [1]
+        assert aggregator.get_intent_volume_data('refinance')['y'].tolist() == [1]
+        assert aggregator.get_intent_volume_data('payment')['y'].tolist() == []
+        assert aggregator.get_escalation_rate_data()['y'].tolist() == [1.0]
+        assert aggregator.get_advisor_performance_data(
+            'empathy', advisor_id='ADV_007'
+        )['y'].tolist() == [8.0]
+        assert aggregator.get_call_volume_data('hourly')['ds'].tolist() == [pd.Timestamp('2026-03-02 10:00:00')]
+
+        transcript_store.delete(transcript.id)
+        assert aggregator.check_data_sufficiency()['days_of_data'] == 0
+
+    def test_existing_database_is_backfilled(self, populated_db):
+        conn = sqlite3.connect(populated_db)
+        for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+            conn.execute(f'DROP TRIGGER {name}')
+        conn.execute('DROP TABLE timeseries_rollups')
+        conn.commit()
+        conn.close()
+
+        aggregator = DataAggregator(populated_db)
+
+        assert_matches_reference(populated_db, aggregator)
+        sufficiency = aggregator.check_data_sufficiency(min_days=14)
+        assert sufficiency['sufficient'] is True
+        assert sufficiency['days_of_data'] == len(reference(populated_db, 'calls'))
+
+    def test_batch_inserts_match_a_full_rebuild(self, populated_db):
+        # Streaming the same seed again replaces every row through insert_batch
+        SyntheticDataGenerator(populated_db, seed=5).stream_database(days=10, base_daily_calls=6, chunk_days=4)
+        SyntheticDataGenerator(populated_db, seed=5).stream_database(days=10, base_daily_calls=6, chunk_days=3)
+
+        query = ('SELECT granularity, bucket, metric, dimension, dim_value, n, ROUND(value_sum, 6) '
+                 'FROM timeseries_rollups WHERE n != 0 ORDER BY 1, 2, 3, 4, 5')
+        conn = sqlite3.connect(populated_db)
+        try:
+            incremental = conn.execute(query).fetchall()
+            triggers = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_%_rollup_%'").fetchone()[0]
+        finally:
+            conn.close()
+
+        TimeSeriesRollupStore(populated_db).rebuild()
+        conn = sqlite3.connect(populated_db)
+        try:
+            assert conn.execute(query).fetchall() == incremental
+        finally:
+            conn.close()
+        assert triggers == 8  # Reinstalled for both sources
+        assert_matches_reference(populated_db, DataAggregator(populated_db))
+
+    def test_invalid_requests_fail_fast(self, populated_db):
+        rollups = TimeSeriesRollupStore(populated_db)
+        with pytest.raises(ValueError):
+            rollups.get_series('unknown_metric')
+        with pytest.raises(ValueError):
+            rollups.get_series('calls', granularity='month')
+        with pytest.raises(ValueError):
+            DataAggregator(populated_db).get_sentiment_score_data(granularity='hourly')
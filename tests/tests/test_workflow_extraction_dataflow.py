@@ -0,0 +1,187 @@
+"""
+Test suite for dataflow workflow extraction in WorkflowService
+Risk and step agents are faked - no LLM calls
+"""
+import pytest
+import asyncio
+import time
+
+from src.services.workflow_service import WorkflowService
+
+
+PLAN = {
+    'plan_id': 'PLAN_1',
+    'analysis_id': 'ANALYSIS_1',
+    'transcript_id': 'CALL_1',
+    'borrower_plan': {'immediate_actions': [{'action': 'Send payoff quote'}],
+                      'follow_ups': [{'action': 'Call back in 3 days'}]},
+    'advisor_plan': {'next_actions': [{'action': 'Review escrow'}]},
+    'supervisor_plan': {'escalation_items': [{'action': 'Escalate complaint'}]},
+    'leadership_plan': {}
+}
+
+PLAN_SECTIONS = {
+    'BORROWER': ('borrower_plan', ['immediate_actions', 'follow_ups']),
+    'ADVISOR': ('advisor_plan', ['next_actions']),
+    'SUPERVISOR': ('supervisor_plan', ['escalation_items']),
+    'LEADERSHIP': ('leadership_plan', ['resource_allocation'])
+}
+
+
+class FakePlanStore:
+    def get_by_id(self, plan_id):
+        return dict(PLAN) if plan_id == 'PLAN_1' else None
+
+
+class FakeRiskAgent:
+    """Extracts plan items directly and sleeps to stand in for LLM latency."""
+
+    def __init__(self, delay=0.05, fail_on=None, drop_items_for=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.drop_items_for = drop_items_for
+        self.extracted_types = []
+
+    async def extract_individual_action_items(self, plan_data, workflow_type, context):
+        self.extracted_types.append(workflow_type)
+        section, keys = PLAN_SECTIONS[workflow_type]
+        items = [item for key in keys for item in plan_data.get(section, {}).get(key, [])]
+        return items[:-1] if workflow_type == self.drop_items_for else items
+
+    async def assess_action_item_risk(self, action_item, workflow_type, context):
+        await asyncio.sleep(self.delay)
+        if action_item['action'] == self.fail_on:
+            raise RuntimeError("risk model unavailable")
+        return {'risk_level': 'low', 'reasoning': 'routine'}
+
+    async def determine_action_item_approval_routing(self, action_item, risk_assessment, workflow_type, context):
+        await asyncio.sleep(self.delay)
+        return {'requires_human_approval': False, 'initial_status': 'AUTO_APPROVED',
+                'routing_reasoning': 'low risk'}
+
+
+class FakeStepAgent:
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.cancelled = 0
+
+    async def generate_steps_for_action(self, action_item, workflow_type, context):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return {'steps': [{'step_number': 1, 'action': action_item['action']}]}
+
+
+@pytest.fixture
+def workflow_service(temp_db, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-api-key-123456")
+    service = WorkflowService(temp_db)
+    service.action_plan_store = FakePlanStore()
+    service.step_agent = FakeStepAgent()
+    return service
+
+
+class TestDataflowWorkflowExtraction:
+    """Overlapped item processing, incremental writes and compensation"""
+
+    @pytest.mark.asyncio
+    async def test_step_generation_overlaps_risk_assessment(self, workflow_service):
+        workflow_service.risk_agent = FakeRiskAgent(delay=0.05)
+
+        start = time.perf_counter()
+        workflows = await workflow_service.extract_all_workflows_from_plan('PLAN_1')
+        elapsed = time.perf_counter() - start
+
+        # risk (0.05) + routing (0.05) run alongside steps (0.1) instead of after them
+        assert elapsed < 0.18
+        assert [wf['workflow_type'] for wf in workflows] == ['BORROWER', 'BORROWER', 'ADVISOR', 'SUPERVISOR']
+        assert workflows[0]['workflow_data']['action'] == 'Send payoff quote'
+        assert workflows[0]['workflow_data']['steps'][0]['action'] == 'Send payoff quote'
+        # Empty pillars never reach the agent
+        assert 'LEADERSHIP' not in workflow_service.risk_agent.extracted_types
+
+    @pytest.mark.asyncio
+    async def test_failed_item_rolls_back_persisted_workflows(self, workflow_service):
+        workflow_service.risk_agent = FakeRiskAgent(delay=0.01, fail_on='Escalate complaint')
+        workflow_service.step_agent = FakeStepAgent(delay=0.01)
+        # Slow down the failing pillar so the others are already written
+        original_assess = workflow_service.risk_agent.assess_action_item_risk
+
+        async def delayed_assess(action_item, workflow_type, context):
+            if workflow_type == 'SUPERVISOR':
+                await asyncio.sleep(0.1)
+            return await original_assess(action_item, workflow_type, context)
+
+        workflow_service.risk_agent.assess_action_item_risk = delayed_assess
+
+        with pytest.raises(Exception, match="Failed to extract SUPERVISOR workflows"):
+            await workflow_service.extract_all_workflows_from_plan('PLAN_1')
+
+        assert workflow_service.workflow_store.get_all(limit=100) == []
+
+    @pytest.mark.asyncio
+    async def test_item_count_mismatch_fails_fast(self, workflow_service):
+        workflow_service.risk_agent = FakeRiskAgent(drop_items_for='BORROWER')
+
+        with pytest.raises(ValueError, match="Plan-to-workflow mapping failed"):
+            await workflow_service.extract_all_workflows_from_plan('PLAN_1')
+
+        assert workflow_service.workflow_store.get_all(limit=100) == []
+        # Speculative step generation of the other pillars was abandoned
+        assert workflow_service.step_agent.cancelled > 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_plan_fails_fast(self, workflow_service):
+        workflow_service.risk_agent = FakeRiskAgent()
+
+        with pytest.raises(ValueError, match="Action plan not found"):
+            await workflow_service.extract_all_workflows_from_plan('PLAN_MISSING')
+
+    @pytest.mark.asyncio
+    async def test_resume_after_kill_mid_extraction_replaces_partial_set(self, workflow_service, monkeypatch):
+        workflow_service.risk_agent = FakeRiskAgent(delay=0.01)
+        workflow_service.step_agent = FakeStepAgent(delay=0.01)
+        original_assess = workflow_service.risk_agent.assess_action_item_risk
+        hang = asyncio.Event()
+
+        async def hanging_assess(action_item, workflow_type, context):
+            if workflow_type == 'SUPERVISOR':
+                await hang.wait()  # The process dies while this item is with the LLM
+            return await original_assess(action_item, workflow_type, context)
+
+        workflow_service.risk_agent.assess_action_item_risk = hanging_assess
+        store = workflow_service.workflow_store
+        delete_bulk = store.delete_bulk
+        monkeypatch.setattr(store, 'delete_bulk', lambda ids: 0)  # A killed process never compensates
+
+        extraction = asyncio.create_task(workflow_service.extract_all_workflows_from_plan('PLAN_1'))
+        while len(store.get_by_plan_id('PLAN_1')) < 3:
+            await asyncio.sleep(0.01)
+        extraction.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await extraction
+        left_behind = {wf['id'] for wf in store.get_by_plan_id('PLAN_1')}
+        assert len(left_behind) == 3
+
+        # The resumed run extracts the plan again
+        monkeypatch.setattr(store, 'delete_bulk', delete_bulk)
+        workflow_service.risk_agent.assess_action_item_risk = original_assess
+        workflows = await workflow_service.extract_all_workflows_from_plan('PLAN_1')
+
+        assert [wf['workflow_type'] for wf in workflows] == ['BORROWER', 'BORROWER', 'ADVISOR', 'SUPERVISOR']
+        assert sorted(wf['id'] for wf in store.get_by_plan_id('PLAN_1')) == sorted(wf['id'] for wf in workflows)
+        assert not left_behind & {wf['id'] for wf in workflows}
+
+    @pytest.mark.asyncio
+    async def test_complete_set_is_reused(self, workflow_service):
+        workflow_service.risk_agent = FakeRiskAgent(delay=0.01)
+        first = await workflow_service.extract_all_workflows_from_plan('PLAN_1')
+
+        workflow_service.risk_agent = FakeRiskAgent(fail_on='Send payoff quote')  # No LLM work expected
+        second = await workflow_service.extract_all_workflows_from_plan('PLAN_1')
+
+        assert [wf['id'] for wf in second] == [wf['id'] for wf in first]
+        assert workflow_service.risk_agent.extracted_types == []
+        assert len(workflow_service.workflow_store.get_by_plan_id('PLAN_1')) == 4